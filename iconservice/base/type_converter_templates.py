@@ -39,6 +39,9 @@ class ParamType(IntEnum):
     ICX_GET_SCORE_API = 304
     ISE_GET_STATUS = 305
     DEBUG_GET_ACCOUNT = 306
+    ISE_GET_EVENT_LOGS = 307
+    ISE_GET_METRICS = 308
+    DEBUG_GET_SCORE_RESOURCES = 309
 
     WRITE_PRECOMMIT = 400
     # REMOVE_PRECOMMIT = 500
@@ -63,6 +66,8 @@ class ParamType(IntEnum):
     IISS_GET_PREP_LIST = 713
     IISS_SET_GOVERNANCE_VARIABLES = 714
 
+    PROFILE = 800
+
 
 class ValueType(IntEnum):
     IGNORE = 0
@@ -152,18 +157,39 @@ class ConstantKeys:
     TRANSACTIONS = "transactions"
 
     IS_BLOCK_EDITABLE = 'isBlockEditable'
+    RESPONSE_FORMAT = 'responseFormat'
+    STREAM = 'stream'
+    SEQUENCE = 'sequence'
+    TX_RESULTS = 'txResults'
+    TX_RESULT_COUNT = 'txResultCount'
+    CHUNK_COUNT = 'chunkCount'
     PREV_BLOCK_GENERATOR = "prevBlockGenerator"
     PREV_BLOCK_VALIDATORS = "prevBlockValidators"
     PREV_BLOCK_VOTES = "prevBlockVotes"
 
     FILTER = "filter"
 
+    FROM_BLOCK = "fromBlock"
+    TO_BLOCK = "toBlock"
+    SCORE_ADDRESS = "scoreAddress"
+    EVENT = "event"
+    ARG = "arg"
+    LIMIT = "limit"
+
+    COMMAND = "command"
+    BLOCKS = "blocks"
+    THRESHOLD = "threshold"
+    INTERVAL = "interval"
+
     ICX_CALL = "icx_call"
     ICX_GET_BALANCE = "icx_getBalance"
     ICX_GET_TOTAL_SUPPLY = "icx_getTotalSupply"
     ICX_GET_SCORE_API = "icx_getScoreApi"
     ISE_GET_STATUS = "ise_getStatus"
     DEBUG_GET_ACCOUNT = "debug_getAccount"
+    ISE_GET_EVENT_LOGS = "ise_getEventLogs"
+    ISE_GET_METRICS = "ise_getMetrics"
+    DEBUG_GET_SCORE_RESOURCES = "debug_getScoreResources"
 
     DEPOSIT_TERM = "term"
     DEPOSIT_ID = "id"
@@ -277,6 +303,8 @@ type_convert_templates[ParamType.INVOKE] = {
         type_convert_templates[ParamType.INVOKE_TRANSACTION]
     ],
     ConstantKeys.IS_BLOCK_EDITABLE: ValueType.BOOL,
+    ConstantKeys.RESPONSE_FORMAT: ValueType.STRING,
+    ConstantKeys.STREAM: ValueType.BOOL,
     ConstantKeys.PREV_BLOCK_GENERATOR: ValueType.ADDRESS,
     ConstantKeys.PREV_BLOCK_VALIDATORS: [ValueType.ADDRESS],
     ConstantKeys.PREV_BLOCK_VOTES: [
@@ -312,6 +340,24 @@ type_convert_templates[ParamType.DEBUG_GET_ACCOUNT] = {
     ConstantKeys.FILTER: ValueType.INT
 }
 
+type_convert_templates[ParamType.ISE_GET_EVENT_LOGS] = {
+    ConstantKeys.FROM_BLOCK: ValueType.INT,
+    ConstantKeys.TO_BLOCK: ValueType.INT,
+    ConstantKeys.SCORE_ADDRESS: ValueType.ADDRESS,
+    ConstantKeys.EVENT: ValueType.STRING,
+    ConstantKeys.ARG: ValueType.STRING,
+    ConstantKeys.LIMIT: ValueType.INT
+}
+
+type_convert_templates[ParamType.ISE_GET_METRICS] = {
+    ConstantKeys.FILTER: [ValueType.STRING]
+}
+
+type_convert_templates[ParamType.DEBUG_GET_SCORE_RESOURCES] = {
+    ConstantKeys.BLOCK_HEIGHT: ValueType.INT,
+    ConstantKeys.SCORE_ADDRESS: ValueType.ADDRESS
+}
+
 type_convert_templates[ParamType.QUERY] = {
     ConstantKeys.METHOD: ValueType.STRING,
     ConstantKeys.PARAMS: {
@@ -323,6 +369,9 @@ type_convert_templates[ParamType.QUERY] = {
             ConstantKeys.ICX_GET_SCORE_API: type_convert_templates[ParamType.ICX_GET_SCORE_API],
             ConstantKeys.ISE_GET_STATUS: type_convert_templates[ParamType.ISE_GET_STATUS],
             ConstantKeys.DEBUG_GET_ACCOUNT: type_convert_templates[ParamType.DEBUG_GET_ACCOUNT],
+            ConstantKeys.ISE_GET_EVENT_LOGS: type_convert_templates[ParamType.ISE_GET_EVENT_LOGS],
+            ConstantKeys.ISE_GET_METRICS: type_convert_templates[ParamType.ISE_GET_METRICS],
+            ConstantKeys.DEBUG_GET_SCORE_RESOURCES: type_convert_templates[ParamType.DEBUG_GET_SCORE_RESOURCES],
         }
     }
 }
@@ -344,6 +393,13 @@ type_convert_templates[ParamType.VALIDATE_TRANSACTION] = {
     ConstantKeys.PARAMS: type_convert_templates[ParamType.TRANSACTION_PARAMS_DATA]
 }
 
+type_convert_templates[ParamType.PROFILE] = {
+    ConstantKeys.COMMAND: ValueType.STRING,
+    ConstantKeys.BLOCKS: ValueType.INT,
+    ConstantKeys.THRESHOLD: ValueType.INT,
+    ConstantKeys.INTERVAL: ValueType.INT
+}
+
 # DEPOSIT
 type_convert_templates[ParamType.DEPOSIT_DATA] = {
     ConstantKeys.DEPOSIT_ID: ValueType.BYTES,
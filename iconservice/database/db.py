@@ -88,6 +88,17 @@ class KeyValueDatabase(object):
             self._db.close()
             self._db = None
 
+    def compact(self, start: Optional[bytes] = None, stop: Optional[bytes] = None) -> None:
+        """Compact the underlying storage for the specified key range.
+
+        Keys in memtable and write-ahead log of leveldb are flushed to sorted tables as well.
+        The whole key space is compacted if both start and stop are None.
+
+        :param start: the beginning of the key range
+        :param stop: the end of the key range
+        """
+        self._db.compact_range(start=start, stop=stop)
+
     def get_sub_db(self, prefix: bytes) -> 'KeyValueDatabase':
         """Return a new prefixed database.
 
@@ -95,8 +106,15 @@ class KeyValueDatabase(object):
         """
         return KeyValueDatabase(self._db.prefixed_db(prefix))
 
-    def iterator(self) -> iter:
-        return self._db.iterator()
+    def iterator(self, start: Optional[bytes] = None, stop: Optional[bytes] = None) -> iter:
+        """Return an iterator over the key range [start, stop)
+
+        :param start: the first key of the range (inclusive)
+        :param stop: the last key of the range (exclusive)
+        """
+        if start is None and stop is None:
+            return self._db.iterator()
+        return self._db.iterator(start=start, stop=stop)
 
     def write_batch(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
         """Write a batch to the database for the specified states dict.
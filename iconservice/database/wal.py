@@ -24,9 +24,12 @@ __all__ = (
     "WriteAheadLogWriter", "WriteAheadLogReader", "WALogable", "StateWAL", "IissWAL", "WALState", "WALDBType"
 )
 
+import io
+import mmap
 import struct
+import zlib
 from abc import ABCMeta
-from typing import Optional, Tuple, Iterable, List
+from typing import Optional, Tuple, Iterable, List, Union
 import os
 from enum import Enum
 
@@ -43,6 +46,13 @@ from ..database.batch import BlockBatch, TransactionBatchValue
 TAG = "WAL"
 _MAGIC_KEY = b"IWAL"
 _FILE_VERSION = 1
+# Each log is compressed with zlib
+_FILE_VERSION_ZLIB = 2
+_FILE_VERSIONS = {
+    # compression: file version
+    "": _FILE_VERSION,
+    "zlib": _FILE_VERSION_ZLIB
+}
 _HEADER_SIZE = 52
 _HEADER_STRUCT_FORMAT = ">4sIII32sI"
 
@@ -141,6 +151,10 @@ class IissWAL(WALogable):
             value: bytes = iiss_data.make_value()
             yield key, value
 
+            index: Optional[Tuple[bytes, bytes]] = Storage.make_unregistered_prep_index(iiss_data, tx_index)
+            if index is not None:
+                yield index
+
         if tx_index > self._tx_index:
             key: bytes = Storage.KEY_FOR_GETTING_LAST_TRANSACTION_INDEX
             value: bytes = tx_index.to_bytes(8, DATA_BYTE_ORDER)
@@ -165,16 +179,30 @@ class WriteAheadLogWriter(object):
     | block data size(4) | block data | size(4) | data | size(4) | data | ...
 
     Every number is written in big endian format
+    If the file is compressed, each data is compressed and its size is the compressed one
     """
 
-    def __init__(self, revision: int, max_log_count: int, block: 'Block', instant_block_hash: bytes):
+    def __init__(self,
+                 revision: int,
+                 max_log_count: int,
+                 block: 'Block',
+                 instant_block_hash: bytes,
+                 compression: str = ""):
+        """
+        :param compression: "" (no compression) or "zlib"
+            It is recorded as the file version
+        """
         Logger.debug(tag=TAG,
                      msg=f"__init__(revision={revision}, "
                          f"max_log_out={max_log_count}, "
-                         f"block={block} start")
+                         f"block={block}, "
+                         f"compression={compression} start")
+
+        if compression not in _FILE_VERSIONS:
+            raise InvalidParamsException(f"Invalid compression: {compression}")
 
         self._magic_key = _MAGIC_KEY
-        self._version = _FILE_VERSION
+        self._version = _FILE_VERSIONS[compression]
         self._revision: int = revision
         self._state: int = 0
         self._max_log_count: int = max_log_count
@@ -198,6 +226,21 @@ class WriteAheadLogWriter(object):
             self._fp = None
             raise
 
+    def open_memory(self):
+        """Writes wal to memory instead of a file
+
+        The written data can be got with getvalue() before close()
+        """
+        if self._fp is not None:
+            raise InternalServiceErrorException("WAL file pointer is not None")
+
+        self._fp = io.BytesIO()
+        self._write_header()
+        self._write_block()
+
+    def getvalue(self) -> bytes:
+        return self._fp.getvalue()
+
     def _write_header(self) -> int:
         values = [
             self._magic_key,
@@ -243,8 +286,11 @@ class WriteAheadLogWriter(object):
         size = 0
         self._write_uint32(size)
 
-        for key, value in it:
-            size += self._write_key_value(key, value)
+        if self._version == _FILE_VERSION_ZLIB:
+            size += self._write_compressed_key_values(it)
+        else:
+            for key, value in it:
+                size += self._write_key_value(key, value)
 
         # Return to the WALogable start offset, writing its data size
         self._fp.seek(-size - 4, 1)
@@ -264,6 +310,18 @@ class WriteAheadLogWriter(object):
 
         return size
 
+    def _write_compressed_key_values(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
+        packer = msgpack.Packer()
+        compressor = zlib.compressobj()
+        size = 0
+
+        for key, value in it:
+            assert isinstance(key, bytes)
+            size += self._fp.write(compressor.compress(packer.pack([key, value])))
+
+        size += self._fp.write(compressor.flush())
+        return size
+
     def write_state(self, state: int, add: bool = False):
         offset = _OFFSET_STATE
 
@@ -312,6 +370,8 @@ class WriteAheadLogReader(object):
         self._block: Optional['Block'] = None
 
         self._fp = None
+        # Memory-mapped file or bytes which the whole wal is read from
+        self._buf: Optional[Union[mmap.mmap, bytes]] = None
 
     @property
     def magic_key(self) -> Optional[bytes]:
@@ -348,12 +408,32 @@ class WriteAheadLogReader(object):
                f"log_count={self._log_count}, " \
                f"block={self._block}"
 
-    def open(self, path: str):
+    def open(self, path: str, use_mmap: bool = False):
+        """
+        :param path: wal file path
+        :param use_mmap: if True, logs are unpacked from the memory-mapped file
+            without being read in chunks
+        """
         self._fp = open(path, "rb")
         self._read_header()
         self._read_block()
 
+        if use_mmap:
+            self._buf = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def open_bytes(self, data: bytes):
+        """Reads wal from bytes like the ones written with WriteAheadLogWriter.open_memory()
+        """
+        self._fp = io.BytesIO(data)
+        self._read_header()
+        self._read_block()
+        self._buf = data
+
     def close(self):
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._buf = None
+
         if self._fp:
             self._fp.close()
             self._fp = None
@@ -368,9 +448,9 @@ class WriteAheadLogReader(object):
         if magic_key != _MAGIC_KEY:
             raise IllegalFormatException(f"Invalid magic key: {bytes_to_hex(data)}")
 
-        if version != _FILE_VERSION:
+        if version not in _FILE_VERSIONS.values():
             raise IllegalFormatException(
-                f"Invalid version: Actual({version}) != Expected({_FILE_VERSION})")
+                f"Invalid version: Actual({version}) not in Expected({tuple(_FILE_VERSIONS.values())})")
 
         self._magic_key = magic_key
         self._version = version
@@ -399,9 +479,51 @@ class WriteAheadLogReader(object):
         return _bytes_to_uint32(data)
 
     def get_iterator(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
+        if self._buf is not None:
+            return self._get_iterator_from_buffer(index)
+
+        return self._get_iterator_from_file(index)
+
+    def _get_iterator_from_buffer(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
+        """Returns an Unpacker fed with the whole log at once
+
+        Unpacker is iterated in C, so that it can be passed to dict.update() or write_batch() directly
+        """
+        buf = self._buf
+        start: int = self._log_start_offsets[index] + 4
+        data: bytes = buf[start - 4:start]
+        self._check_bytes_data(data, 4)
+
+        size: int = _bytes_to_uint32(data)
+        end: int = start + size
+        if end > len(buf):
+            raise IllegalFormatException(f"Out of data: data_size({len(buf) - start}) != size_to_read({size})")
+
+        # max_buffer_size=0 means no limit on the size of a log
+        unpacker = msgpack.Unpacker(use_list=False, raw=True, max_buffer_size=0)
+        with memoryview(buf) as view:
+            with view[start:end] as log:
+                if self._version == _FILE_VERSION_ZLIB:
+                    unpacker.feed(self._decompress(log))
+                else:
+                    unpacker.feed(log)
+
+        return unpacker
+
+    def _get_iterator_from_file(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
         self._seek_to_log_start_offset(index)
         size: int = self._read_uint32()
 
+        if self._version == _FILE_VERSION_ZLIB:
+            # A compressed log is decompressed at once to verify its checksum before any key-value is returned
+            data: bytes = self._fp.read(size)
+            self._check_bytes_data(data, size)
+
+            unpacker = msgpack.Unpacker(use_list=False, raw=True, max_buffer_size=0)
+            unpacker.feed(self._decompress(data))
+            yield from unpacker
+            return
+
         unpacker = msgpack.Unpacker(use_list=False, raw=True)
 
         while size > 0:
@@ -415,6 +537,13 @@ class WriteAheadLogReader(object):
             for key, value in unpacker:
                 yield key, value
 
+    @staticmethod
+    def _decompress(data: Union[bytes, memoryview]) -> bytes:
+        try:
+            return zlib.decompress(data)
+        except zlib.error as e:
+            raise IllegalFormatException(f"Invalid compressed data: {e}")
+
     def _seek_to_log_start_offset(self, index: int):
         offset = self._log_start_offsets[index]
         self._fp.seek(offset, 0)
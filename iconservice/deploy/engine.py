@@ -14,7 +14,7 @@
 # limitations under the License.
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from iconcommons import Logger
 
@@ -33,6 +33,7 @@ from ..icon_constant import IconServiceFlag, ICON_DEPLOY_LOG_TAG, Revision
 from ..iconscore.icon_score_api_generator import ScoreApiGenerator
 from ..iconscore.icon_score_context_util import IconScoreContextUtil
 from ..iconscore.icon_score_mapper_object import IconScoreInfo
+from ..iconscore.icon_score_resource import track_score_call
 from ..iconscore.icon_score_step import StepType, get_deploy_content_size
 from ..iconscore.typing.conversion import convert_score_parameters
 from ..iconscore.typing.element import check_score_flag
@@ -41,6 +42,7 @@ from ..iconscore.utils import get_score_deploy_path
 from ..utils import is_builtin_score
 
 if TYPE_CHECKING:
+    from .score_package_store import ScorePackageStore
     from .storage import IconScoreDeployInfo
     from .storage import IconScoreDeployTXParams
     from ..iconscore.icon_score_context import IconScoreContext
@@ -309,6 +311,12 @@ class Engine(EngineBase):
                 os.path.join(score_root_path, score_address.to_bytes().hex(), f'0x{tx_hash.hex()}')
             remove_path(score_path)
 
+            store: Optional['ScorePackageStore'] = context.score_package_store
+            if store is not None:
+                # The same package is extracted only once and shared with the other deployments
+                store.link(score_deploy_path, content, revision)
+                return
+
         if revision >= Revision.TWO.value:
             IconScoreDeployer.deploy(score_deploy_path, content, revision)
         else:
@@ -342,4 +350,5 @@ class Engine(EngineBase):
 
             params = convert_score_parameters(params, signatures[deploy_type.value])
 
-        on_init(**params)
+        with track_score_call(context, score.address, on_init.__name__):
+            on_init(**params)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("ScorePackageStore",)
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, List, Optional, Set
+
+from iconcommons.logger import Logger
+
+from .icon_score_deployer import IconScoreDeployer
+from .utils import remove_path
+from ..__version__ import __version__
+from ..icon_constant import ICON_DEPLOY_LOG_TAG
+from ..utils import sha3_256
+
+_TAG = ICON_DEPLOY_LOG_TAG
+
+
+class ScorePackageStore(object):
+    """Content-addressed store of the SCORE packages extracted on the file system
+
+    A package is extracted once into <score_root_path>/.store/<content hash>
+    and the deploy path of each deployment, <score_root_path>/<address>/0x<tx_hash>, is a symbolic link to it.
+    So the SCOREs which share the same code, such as token SCOREs deployed from a template, share one directory.
+
+    The verdict of ScorePackageValidator is kept for each pair of a content hash and an import whitelist
+    and saved in the store, so the same code is validated only once even after restart.
+    Only the packages which pass the validation are kept as verdicts.
+    """
+
+    DIR_NAME = ".store"
+    VERDICTS_FILE = "verdicts.json"
+    _TMP_PREFIX = ".tmp-"
+
+    def __init__(self, score_root_path: str):
+        self._score_root_path: str = score_root_path
+        self._path: str = os.path.join(score_root_path, self.DIR_NAME)
+        # Verdicts depend on the validator and the bytecode of the python which compiled the packages
+        self._validator_version: str = f"{__version__}-py{sys.version_info[0]}.{sys.version_info[1]}"
+        # f"{content hash}:{whitelist digest}"
+        self._verdicts: Set[str] = set()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def open(self):
+        os.makedirs(self._path, exist_ok=True)
+
+        # Remove the packages which were being extracted when iconservice stopped
+        with os.scandir(self._path) as it:
+            for entry in it:
+                if entry.name.startswith(self._TMP_PREFIX):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+        self._load_verdicts()
+        Logger.info(tag=_TAG, msg=f"ScorePackageStore opened: path={self._path} verdicts={len(self._verdicts)}")
+
+    def close(self):
+        self._verdicts.clear()
+
+    def link(self, score_deploy_path: str, content: bytes, revision: int) -> str:
+        """Makes score_deploy_path link to the package of content in the store
+
+        The package is extracted only if the store does not have it yet
+
+        :param score_deploy_path: <score_root_path>/<address>/0x<tx_hash>
+        :param content: zipped SCORE package
+        :param revision:
+        :return: content hash in hex
+        """
+        content_hash: str = sha3_256(content).hex()
+        package_path: str = os.path.join(self._path, content_hash)
+
+        if not os.path.isdir(package_path):
+            self._extract(package_path, content, revision)
+
+        os.makedirs(os.path.dirname(score_deploy_path), exist_ok=True)
+        remove_path(score_deploy_path)
+        # The relative link keeps working after score_root_path is moved
+        os.symlink(os.path.join("..", self.DIR_NAME, content_hash), score_deploy_path, target_is_directory=True)
+
+        return content_hash
+
+    def get_content_hash(self, score_deploy_path: str) -> Optional[str]:
+        """Returns the content hash of the package which score_deploy_path links to
+
+        :return: None if score_deploy_path is not a link to the store
+        """
+        if not os.path.islink(score_deploy_path):
+            return None
+
+        target: str = os.path.join(os.path.dirname(score_deploy_path), os.readlink(score_deploy_path))
+        if os.path.normpath(os.path.dirname(target)) != os.path.normpath(self._path):
+            return None
+
+        return os.path.basename(target)
+
+    def is_validated(self, content_hash: str, whitelist: Dict[str, List[str]]) -> bool:
+        return self._make_verdict_key(content_hash, whitelist) in self._verdicts
+
+    def set_validated(self, content_hash: str, whitelist: Dict[str, List[str]]):
+        key: str = self._make_verdict_key(content_hash, whitelist)
+        if key in self._verdicts:
+            return
+
+        self._verdicts.add(key)
+        try:
+            self._save_verdicts()
+        except BaseException as e:
+            # The package is validated again after restart
+            Logger.warning(tag=_TAG, msg=f"Failed to save SCORE package verdicts: {e}")
+
+    def _extract(self, package_path: str, content: bytes, revision: int):
+        # Extract to a temporary directory first not to leave a partially extracted package
+        tmp_path: str = tempfile.mkdtemp(prefix=self._TMP_PREFIX, dir=self._path)
+        try:
+            IconScoreDeployer.deploy(tmp_path, content, revision)
+            os.rename(tmp_path, package_path)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def _make_verdict_key(content_hash: str, whitelist: Dict[str, List[str]]) -> str:
+        normalized: dict = {name: sorted(items) for name, items in whitelist.items()}
+        digest: str = sha3_256(json.dumps(normalized, sort_keys=True).encode()).hex()
+        return f"{content_hash}:{digest}"
+
+    def _load_verdicts(self):
+        self._verdicts.clear()
+
+        path: str = os.path.join(self._path, self.VERDICTS_FILE)
+        try:
+            with open(path, "r") as f:
+                data: dict = json.load(f)
+        except FileNotFoundError:
+            return
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to load SCORE package verdicts: {e}")
+            return
+
+        if data.get("version") != self._validator_version:
+            Logger.info(tag=_TAG, msg=f"SCORE package verdicts of another version are ignored: {data.get('version')}")
+            return
+
+        self._verdicts.update(data.get("verdicts", []))
+
+    def _save_verdicts(self):
+        # Readers never see a partially written file
+        path: str = os.path.join(self._path, self.VERDICTS_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": self._validator_version, "verdicts": sorted(self._verdicts)}, f)
+        os.replace(tmp_path, path)
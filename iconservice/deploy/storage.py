@@ -16,7 +16,7 @@
 import json
 import warnings
 from struct import pack, unpack
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple, Iterator
 
 from ..base.ComponentBase import StorageBase
 from ..base.address import Address, ICON_EOA_ADDRESS_BYTES_SIZE, ICON_CONTRACT_ADDRESS_BYTES_SIZE
@@ -283,6 +283,18 @@ class Storage(StorageBase):
 
         return IconScoreDeployInfo.from_bytes(data)
 
+    def iter_deploy_infos(self) -> Iterator['IconScoreDeployInfo']:
+        """Iterates over the deploy info of all SCOREs committed to state db in the order of their addresses
+
+        The states of the blocks which are not committed yet are not included
+        """
+        prefix: bytes = self._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX
+        stop: bytes = prefix[:-1] + bytes([prefix[-1] + 1])
+
+        with self._db.key_value_db.iterator(start=prefix, stop=stop) as it:
+            for _, value in it:
+                yield IconScoreDeployInfo.from_bytes(value)
+
     def put_deploy_tx_params(self, context: 'IconScoreContext', deploy_tx_params: 'IconScoreDeployTXParams') -> None:
         """
 
@@ -28,10 +28,11 @@ def get_score_path(score_root_path: str, score_address: 'Address') -> str:
 def remove_path(path: str):
     """Remove the file or directory indicated by path.
     If path is directory, it will be removed recursively.
+    If path is a symbolic link, only the link is removed.
 
     :param path: the path of file or directory
     """
-    if os.path.isfile(path):
+    if os.path.islink(path) or os.path.isfile(path):
         os.remove(path)
     elif os.path.isdir(path):
         shutil.rmtree(path)
@@ -1,51 +1,210 @@
 import enum
+import threading
 import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from iconcommons import Logger
 
+_TAG = "DOS"
 
-def now():
-    return int(time.monotonic())  # unit: second
+# The maximum number of values tracked in a category
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def now() -> float:
+    return time.monotonic()  # unit: second
 
 
 class Category(enum.Enum):
     FROM_ON_TX = 0
+    # Destination SCORE
+    TO_ON_TX = 1
+    # SCORE address and method name
+    METHOD_ON_TX = 2
 
 
-class DoSGuard:
-    def __init__(self, reset_time: int, threshold: int, ban_time: int):
-        Logger.info(f"DoSGuard config: reset_time={reset_time}, threshold={threshold}, ban_time={ban_time}")
-        self._statistics: dict = {c.value: {} for c in Category}
-        self._ban_expired: dict = {c.value: {} for c in Category}
+class _CategoryGuard(object):
+    """Limits the request rate of each value in a category with a token bucket
+
+    A bucket holds up to threshold tokens and is refilled at threshold / window tokens per second,
+    so a value can send threshold requests in any window without a burst at the edges of windows.
+    A value which runs out of tokens is banned for ban_time seconds.
+
+    Buckets and bans are kept in LRU order and the least recently used one is evicted
+    when there are more than max_entries values, so that memory usage is bounded
+    """
 
-        self._reset_time: int = reset_time
+    def __init__(self, category: 'Category', threshold: int, window: int, ban_time: int, max_entries: int):
+        self._category = category
         self._threshold: int = threshold
+        # Tokens refilled per second
+        self._rate: float = threshold / max(window, 1)
         self._ban_time: int = ban_time
-        self._last_reset_time: int = now()
-
-    def run(self, _from: str):
-        cur_time: int = now()
-        if cur_time - self._last_reset_time > self._reset_time:
-            self._reset(cur_time)
-        self._add(cur_time=cur_time, category=Category.FROM_ON_TX, value=_from)
-
-    def _reset(self, cur_time: int):
-        self._statistics = {c.value: {} for c in Category}
-        self._last_reset_time: int = cur_time
-
-    def _add(self, cur_time: int, category: Category, value: str):
-        self._validate(cur_time=cur_time, category=category, value=value)
-
-        category_statistics: dict = self._statistics[category.value]
-        category_statistics[value] = category_statistics.get(value, 0) + 1
-        if category_statistics[value] > self._threshold:
-            self._ban_expired[category.value][value] = cur_time + self._ban_time
-            raise Exception(f"Too many requests: {category.name}({value})")
-
-    def _validate(self, cur_time: int, category: Category, value: str):
-        if value in self._ban_expired[category.value]:
-            if cur_time > self._ban_expired[category.value][value]:
-                del self._ban_expired[category.value][value]
+        self._max_entries: int = max_entries
+
+        # value: [tokens, last updated time]
+        self._buckets: OrderedDict = OrderedDict()
+        # value: ban expiration time
+        self._bans: OrderedDict = OrderedDict()
+
+        self._ban_count: int = 0
+        self._reject_count: int = 0
+        self._evict_count: int = 0
+
+    def check(self, cur_time: float, value: str) -> list:
+        """Refills the bucket of a value and raises an exception if the value is banned or runs out of tokens
+
+        :return: the bucket to take a token from with consume() after every category is checked
+        """
+        expired: Optional[float] = self._bans.get(value)
+        if expired is not None:
+            if cur_time > expired:
+                del self._bans[value]
             else:
-                self._ban_expired[category.value][value] = cur_time + self._ban_time
-                raise Exception(f"(Validate) Too many requests: {category.name}({value})")
+                self._bans[value] = cur_time + self._ban_time
+                self._bans.move_to_end(value)
+                self._reject_count += 1
+                raise Exception(f"(Validate) Too many requests: {self._category.name}({value})")
+
+        bucket: Optional[list] = self._buckets.get(value)
+        if bucket is None:
+            bucket = [self._threshold, cur_time]
+            self._buckets[value] = bucket
+            self._evict(self._buckets)
+        else:
+            self._buckets.move_to_end(value)
+            bucket[0] = min(self._threshold, bucket[0] + (cur_time - bucket[1]) * self._rate)
+            bucket[1] = cur_time
+
+        if bucket[0] < 1:
+            self._ban(cur_time, value)
+            raise Exception(f"Too many requests: {self._category.name}({value})")
+
+        return bucket
+
+    @staticmethod
+    def consume(bucket: list):
+        bucket[0] -= 1
+
+    def _ban(self, cur_time: float, value: str):
+        Logger.info(tag=_TAG, msg=f"Ban: {self._category.name}({value}) ban_time={self._ban_time}")
+
+        # A banned value starts with a full bucket after the ban is over
+        del self._buckets[value]
+        self._bans[value] = cur_time + self._ban_time
+        self._evict(self._bans)
+
+        self._ban_count += 1
+        self._reject_count += 1
+
+    def _evict(self, table: OrderedDict):
+        while len(table) > self._max_entries:
+            table.popitem(last=False)
+            self._evict_count += 1
+
+    def get_status(self) -> dict:
+        return {
+            "threshold": self._threshold,
+            "entries": len(self._buckets),
+            "banned": len(self._bans),
+            "bans": self._ban_count,
+            "rejected": self._reject_count,
+            "evicted": self._evict_count
+        }
+
+
+class DoSGuard:
+    def __init__(self,
+                 reset_time: int,
+                 threshold: int,
+                 ban_time: int,
+                 score_threshold: int = 0,
+                 method_threshold: int = 0,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        :param reset_time: the window in seconds in which a value can send threshold requests
+        :param threshold: the limit of requests from a sender
+        :param ban_time: seconds for which a value exceeding its limit is banned
+        :param score_threshold: the limit of requests to a SCORE, 0 means no limit
+        :param method_threshold: the limit of requests to a method of a SCORE, 0 means no limit
+        :param max_entries: the maximum number of values tracked in each category
+        """
+        Logger.info(f"DoSGuard config: reset_time={reset_time}, threshold={threshold}, ban_time={ban_time}, "
+                    f"score_threshold={score_threshold}, method_threshold={method_threshold}, "
+                    f"max_entries={max_entries}")
+
+        thresholds = {
+            Category.FROM_ON_TX: threshold,
+            Category.TO_ON_TX: score_threshold,
+            Category.METHOD_ON_TX: method_threshold
+        }
+        self._guards: Dict['Category', '_CategoryGuard'] = {
+            category: _CategoryGuard(category, limit, reset_time, ban_time, max_entries)
+            for category, limit in thresholds.items() if limit > 0
+        }
+        # run() is called on the event loop and run_batch() on the validation thread
+        self._lock = threading.Lock()
+
+    def run(self, _from: str, to: Optional[str] = None, method: Optional[str] = None):
+        with self._lock:
+            self._run(now(), _from, to, method)
+
+    def run_with_params(self, params: dict):
+        """Checks the params of an icx_sendTransaction request
+        """
+        with self._lock:
+            self._run(now(), *self._parse_params(params))
+
+    def run_batch(self, params_list: List[dict]) -> List[Optional[Exception]]:
+        """Checks the params of transactions at once
+
+        :param params_list: params of icx_sendTransaction requests
+        :return: the exception for each params or None if it is not limited
+        """
+        cur_time: float = now()
+        errors: List[Optional[Exception]] = []
+
+        with self._lock:
+            for params in params_list:
+                try:
+                    self._run(cur_time, *self._parse_params(params))
+                    errors.append(None)
+                except Exception as e:
+                    errors.append(e)
+
+        return errors
+
+    @staticmethod
+    def _parse_params(params: dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Returns (from, to, method) of an icx_sendTransaction request
+        """
+        method: Optional[str] = None
+
+        data = params.get("data")
+        if params.get("dataType") == "call" and isinstance(data, dict):
+            method = data.get("method")
+
+        return params.get("from"), params.get("to"), method
+
+    def _run(self, cur_time: float, _from: str, to: Optional[str], method: Optional[str]):
+        # A token is taken only if every category accepts the request
+        buckets: List[list] = []
+        self._check(cur_time, Category.FROM_ON_TX, _from, buckets)
+
+        if isinstance(to, str) and to.startswith("cx"):
+            self._check(cur_time, Category.TO_ON_TX, to, buckets)
+            if method is not None:
+                self._check(cur_time, Category.METHOD_ON_TX, f"{to}.{method}", buckets)
+
+        for bucket in buckets:
+            _CategoryGuard.consume(bucket)
+
+    def _check(self, cur_time: float, category: 'Category', value: str, buckets: List[list]):
+        guard: Optional['_CategoryGuard'] = self._guards.get(category)
+        if guard is not None:
+            buckets.append(guard.check(cur_time, value))
+
+    def get_status(self) -> dict:
+        with self._lock:
+            return {category.name: guard.get_status() for category, guard in self._guards.items()}
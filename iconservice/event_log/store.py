@@ -0,0 +1,725 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = "EventLogStore"
+
+import hashlib
+import os
+import threading
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, List, Tuple, Iterable, Dict, Any, BinaryIO
+
+from iconcommons.logger import Logger
+
+from ..base.exception import InvalidParamsException, InvalidRequestException, IconServiceBaseException
+from ..base.type_converter import TypeConverter
+from ..base.type_converter_templates import ValueType
+from ..database.db import KeyValueDatabase
+from ..icon_constant import EVENT_LOG_STORE_LOG_TAG, EVENT_LOG_SEGMENT_SIZE, EVENT_LOG_QUERY_LIMIT, DATA_BYTE_ORDER
+from ..iconscore.icon_score_event_log import EventLogEmitter
+from ..utils.bloom import BloomFilter
+from ..utils.msgpack_for_db import MsgPackForDB
+
+if TYPE_CHECKING:
+    from ..base.address import Address
+    from ..base.block import Block
+    from ..iconscore.icon_score_event_log import EventLog
+    from ..iconscore.icon_score_result import TransactionResult
+
+_TAG = EVENT_LOG_STORE_LOG_TAG
+
+
+class EventLogStore(object):
+    """Append-only store of the event logs in committed blocks
+
+    The event logs of a block are appended to a segment file as one record.
+        record: record size(4 bytes) + msgpack([version, block_height, block_hash, logs_bloom, logs])
+        log: [tx_index, tx_hash, log_index, score_address, indexed, data]
+
+    Segment files are the source of truth and the index db can be rebuilt from them.
+        block key: block height -> the position of the record in segment files and logs bloom of the block
+        log key: digest of (SCORE address[, event signature[, first indexed arg]])
+                 + block height + tx index + log index -> the index of the log in the record
+
+    Blocks are written on a dedicated thread with the tx_results in precommit data
+    so that committing a block is not delayed by the store.
+    A block which is failed to be written is kept in memory and written again before the next block.
+    The ranges of blocks which are failed twice or not passed to the store are kept as gaps
+    and queries over them are rejected instead of returning incomplete results.
+    """
+
+    DIR_NAME = "event_logs"
+    INDEX_DB_NAME = "index"
+    VERSION = 0
+
+    _SEGMENT_SUFFIX = ".seg"
+    _RECORD_SIZE_BYTES = 4
+    _DIGEST_SIZE = 20
+
+    _BLOCK_PREFIX = b"block|"
+    _LOG_PREFIX = b"log|"
+    _LAST_BLOCK_KEY = b"last_block"
+    _GAPS_KEY = b"gaps"
+
+    # Types of the first indexed argument in event signatures, which arg in queries is converted to
+    _ARG_TYPES = {
+        "int": ValueType.INT,
+        "str": ValueType.STRING,
+        "bool": ValueType.BOOL,
+        "Address": ValueType.ADDRESS,
+        "bytes": ValueType.BYTES
+    }
+
+    def __init__(self, path: str, segment_size: int = EVENT_LOG_SEGMENT_SIZE):
+        self._path: str = path
+        self._segment_size: int = segment_size
+
+        self._db: Optional['KeyValueDatabase'] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._future: Optional[Future] = None
+        # Guards the index db, segment files and the states below between the writer and query threads
+        self._lock = threading.Lock()
+
+        # Segment file which records are appended to
+        self._segment_id: int = 0
+        self._segment_file: Optional[BinaryIO] = None
+
+        # The last block height written to the store
+        self._last_block_height: int = -1
+        # [start, end] ranges of the blocks missing in the store in ascending order
+        self._gaps: List[List[int]] = []
+        # Arguments of _write() for the block which is failed to be written and will be written again
+        self._failed_block: Optional[tuple] = None
+
+    @property
+    def last_block_height(self) -> int:
+        return self._last_block_height
+
+    def open(self, last_block_height: int):
+        """Open the store and drop the blocks which are not committed in state db
+
+        :param last_block_height: the height of the last committed block
+        """
+        os.makedirs(self._path, exist_ok=True)
+        self._db = KeyValueDatabase.from_path(os.path.join(self._path, self.INDEX_DB_NAME))
+
+        value: Optional[bytes] = self._db.get(self._GAPS_KEY)
+        if value is not None:
+            self._gaps = MsgPackForDB.loads(value)
+
+        value: Optional[bytes] = self._db.get(self._LAST_BLOCK_KEY)
+        if value is None:
+            if len(self._get_segment_ids()) > 0:
+                self._rebuild_index()
+        else:
+            self._last_block_height = int.from_bytes(value, DATA_BYTE_ORDER)
+            self._remove_unindexed_records()
+
+        if self._last_block_height > last_block_height:
+            self._rollback(last_block_height)
+
+        self._open_segment_file()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        Logger.info(tag=_TAG, msg=f"EventLogStore opened: path={self._path} "
+                                  f"lastBlockHeight={self._last_block_height} segmentId={self._segment_id}")
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._future = None
+
+        if self._failed_block is not None:
+            self._retry_failed_block()
+
+        self._close_segment_file()
+
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def put(self, block: 'Block', tx_results: List['TransactionResult'], logs_bloom: Optional['BloomFilter']):
+        """Write the event logs in a committed block in background
+
+        :param block: committed block
+        :param tx_results: tx_results in precommit data of the block
+        :param logs_bloom: logs bloom of the block
+        """
+        self._future = self._executor.submit(self._write, block.height, block.hash, tx_results, logs_bloom)
+
+    def wait(self):
+        """Wait until all blocks passed to put() are written
+        """
+        if self._future is not None:
+            self._future.result()
+
+    def rollback(self, block_height: int):
+        """Remove the blocks after block_height
+
+        :param block_height: the height of the last block after rollback
+        """
+        self.wait()
+
+        with self._lock:
+            if self._failed_block is not None and self._failed_block[0] > block_height:
+                self._failed_block = None
+
+            if self._last_block_height > block_height:
+                self._close_segment_file()
+                self._rollback(block_height)
+                self._open_segment_file()
+
+    def rebuild_index(self):
+        """Rebuild the index db from segment files
+
+        Gaps are kept as they cannot be found in segment files
+        """
+        with self._lock:
+            self._rebuild_index()
+
+    def _rebuild_index(self):
+        Logger.info(tag=_TAG, msg=f"rebuild_index() start")
+
+        self._db.write_batch([(key, None) for key, _ in self._db.iterator() if key != self._GAPS_KEY])
+        self._last_block_height = -1
+
+        for segment_id in self._get_segment_ids():
+            with open(self._get_segment_path(segment_id), "rb+") as f:
+                for offset, record in self._read_records(f):
+                    if record is None:
+                        Logger.warning(tag=_TAG, msg=f"Truncate an incomplete record: "
+                                                     f"segmentId={segment_id} offset={offset}")
+                        f.truncate(offset)
+                        break
+
+                    _, block_height, block_hash, logs_bloom, logs = record
+                    size: int = f.tell() - offset
+                    self._write_index(block_height, block_hash, logs_bloom, logs, segment_id, offset, size)
+
+        Logger.info(tag=_TAG, msg=f"rebuild_index() end: lastBlockHeight={self._last_block_height}")
+
+    def get_event_logs(self,
+                       from_block: int,
+                       to_block: int,
+                       score_address: Optional['Address'] = None,
+                       event: Optional[str] = None,
+                       arg: Optional[str] = None,
+                       limit: int = EVENT_LOG_QUERY_LIMIT) -> List[dict]:
+        """Returns event logs matched with a given filter in the block range [from_block, to_block]
+
+        Event logs are looked up with the index if score_address is given.
+        Otherwise, only the blocks of which logs bloom contains the event are read.
+
+        :param from_block: the first block height
+        :param to_block: the last block height
+        :param score_address: SCORE address which emitted event logs
+        :param event: event signature. ex) "Transfer(Address,Address,int,bytes)"
+        :param arg: the first indexed argument in JSON-RPC format. ex) "hx..." or "0x1"
+        :param limit: the maximum number of event logs to return
+        :return: event logs in the order of block height, tx index and log index
+        """
+        if from_block < 0 or to_block < from_block:
+            raise InvalidParamsException(f"Invalid block range: {from_block} ~ {to_block}")
+        if not 0 < limit <= EVENT_LOG_QUERY_LIMIT:
+            raise InvalidParamsException(f"Invalid limit: {limit}")
+        if arg is not None and event is None:
+            raise InvalidParamsException("event is required to filter with arg")
+
+        with self._lock:
+            return self._get_event_logs(from_block, to_block, score_address, event, arg, limit)
+
+    def _get_event_logs(self,
+                        from_block: int,
+                        to_block: int,
+                        score_address: Optional['Address'],
+                        event: Optional[str],
+                        arg: Optional[str],
+                        limit: int) -> List[dict]:
+        if to_block > self._last_block_height:
+            raise InvalidRequestException(
+                f"Blocks are not written yet: toBlock={to_block} lastBlockHeight={self._last_block_height}")
+
+        gaps: List[List[int]] = [gap for gap in self._gaps if gap[0] <= to_block and from_block <= gap[1]]
+        if len(gaps) > 0:
+            raise InvalidRequestException(
+                f"Event logs are missing: {', '.join(f'{start} ~ {end}' for start, end in gaps)}")
+
+        if score_address is None:
+            it = self._find_logs_with_bloom(from_block, to_block, event, arg)
+        else:
+            it = self._find_logs_with_index(from_block, to_block, score_address, event, arg)
+
+        event_logs: List[dict] = []
+        segment_files: Dict[int, BinaryIO] = {}
+
+        try:
+            for block_height, meta, log_indexes in it:
+                record: list = self._read_record(segment_files, *meta[:3])
+                _, _, block_hash, _, logs = record
+
+                for i in log_indexes if log_indexes is not None else range(len(logs)):
+                    log: list = logs[i]
+                    if not self._match(log, score_address, event, arg):
+                        continue
+
+                    event_logs.append(self._to_dict(block_height, block_hash, log))
+                    if len(event_logs) >= limit:
+                        return event_logs
+        finally:
+            for f in segment_files.values():
+                f.close()
+
+        return event_logs
+
+    def get_status(self) -> dict:
+        with self._lock:
+            segment_ids: List[int] = self._get_segment_ids()
+
+            return {
+                "lastBlockHeight": self._last_block_height,
+                "segments": len(segment_ids),
+                "size": sum(os.path.getsize(self._get_segment_path(i)) for i in segment_ids),
+                "gaps": self._gaps,
+                "pending": self._future is not None and not self._future.done()
+            }
+
+    def _write(self,
+               block_height: int,
+               block_hash: bytes,
+               tx_results: List['TransactionResult'],
+               logs_bloom: Optional['BloomFilter']):
+        with self._lock:
+            if self._failed_block is not None:
+                self._retry_failed_block()
+
+            if not self._write_block(block_height, block_hash, tx_results, logs_bloom):
+                self._failed_block = block_height, block_hash, tx_results, logs_bloom
+
+    def _retry_failed_block(self):
+        """Write the block which is failed to be written last time again
+
+        It is recorded as a gap if it is failed again
+        """
+        block_height: int = self._failed_block[0]
+        Logger.info(tag=_TAG, msg=f"Retry to write event logs: block_height={block_height}")
+
+        failed_block, self._failed_block = self._failed_block, None
+        if not self._write_block(*failed_block):
+            self._skip_block(block_height)
+
+    def _write_block(self,
+                     block_height: int,
+                     block_hash: bytes,
+                     tx_results: List['TransactionResult'],
+                     logs_bloom: Optional['BloomFilter']) -> bool:
+        """
+        :return: False if it is failed to write the block
+        """
+        # The position in a segment file which a record of the block is appended to
+        position: Optional[Tuple[int, int]] = None
+
+        try:
+            if block_height <= self._last_block_height:
+                Logger.warning(tag=_TAG, msg=f"Block already exists: {block_height} <= {self._last_block_height}")
+                return True
+            if block_height != self._last_block_height + 1:
+                Logger.warning(tag=_TAG, msg=f"Blocks are missing: {self._last_block_height + 1} ~ {block_height - 1}")
+                self._add_gap(self._last_block_height + 1, block_height - 1)
+
+            logs, logs_bloom = self._make_logs(tx_results, logs_bloom)
+
+            if len(logs) == 0:
+                self._db.put(self._LAST_BLOCK_KEY, block_height.to_bytes(8, DATA_BYTE_ORDER))
+                self._last_block_height = block_height
+                return True
+
+            if self._segment_file.tell() >= self._segment_size:
+                self._close_segment_file()
+                self._open_segment_file(self._segment_id + 1)
+
+            record: bytes = MsgPackForDB.dumps([self.VERSION, block_height, block_hash, logs_bloom, logs])
+            offset: int = self._segment_file.tell()
+            position = self._segment_id, offset
+            self._segment_file.write(len(record).to_bytes(self._RECORD_SIZE_BYTES, DATA_BYTE_ORDER))
+            self._segment_file.write(record)
+            self._segment_file.flush()
+
+            size: int = self._RECORD_SIZE_BYTES + len(record)
+            self._write_index(block_height, block_hash, logs_bloom, logs, self._segment_id, offset, size)
+            return True
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=f"Failed to write event logs: block_height={block_height} {e}")
+            self._discard_record(position)
+            return False
+
+    def _discard_record(self, position: Optional[Tuple[int, int]]):
+        """Remove the record of a block which may be written partially
+
+        :param position: (segment id, offset) of the record
+        """
+        try:
+            if position is not None:
+                self._close_segment_file()
+                self._truncate_segments(*position)
+            if self._segment_file is None:
+                self._open_segment_file()
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=f"Failed to discard a record: position={position} {e}")
+
+    def _skip_block(self, block_height: int):
+        """Record a block which is failed to be written as a gap and go on to the next block
+
+        :param block_height: the height of the block
+        """
+        try:
+            self._add_gap(block_height, block_height)
+            self._db.put(self._LAST_BLOCK_KEY, block_height.to_bytes(8, DATA_BYTE_ORDER))
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=f"Failed to skip a block: block_height={block_height} {e}")
+        finally:
+            self._last_block_height = block_height
+
+    def _add_gap(self, start: int, end: int):
+        gaps: List[List[int]] = [gap.copy() for gap in self._gaps]
+        if len(gaps) > 0 and gaps[-1][1] + 1 >= start:
+            gaps[-1][1] = max(gaps[-1][1], end)
+        else:
+            gaps.append([start, end])
+
+        # Gaps are shared with the threads querying event logs, so they are replaced instead of modified
+        self._gaps = gaps
+        self._db.put(self._GAPS_KEY, MsgPackForDB.dumps(gaps))
+
+    @classmethod
+    def _make_logs(cls,
+                   tx_results: List['TransactionResult'],
+                   logs_bloom: Optional['BloomFilter']) -> Tuple[List[list], bytes]:
+        logs: List[list] = []
+        bloom = BloomFilter(int(logs_bloom)) if logs_bloom is not None else BloomFilter()
+
+        for tx_result in tx_results:
+            if not tx_result.event_logs:
+                continue
+
+            for log_index, event_log in enumerate(tx_result.event_logs):
+                logs.append([
+                    tx_result.tx_index,
+                    tx_result.tx_hash,
+                    log_index,
+                    event_log.score_address,
+                    event_log.indexed,
+                    event_log.data
+                ])
+
+                # The logs bloom of a base transaction is not made before Revision.ADD_LOGS_BLOOM_ON_BASE_TX
+                if tx_result.logs_bloom is None:
+                    cls._add_to_bloom(bloom, event_log)
+
+        return logs, bloom.to_bytes()
+
+    @classmethod
+    def _add_to_bloom(cls, bloom: 'BloomFilter', event_log: 'EventLog'):
+        bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+        for i, indexed_item in enumerate(event_log.indexed):
+            bloom.add(EventLogEmitter.get_ordered_bytes(i, indexed_item))
+
+    def _write_index(self,
+                     block_height: int,
+                     block_hash: bytes,
+                     logs_bloom: bytes,
+                     logs: List[list],
+                     segment_id: int,
+                     offset: int,
+                     size: int):
+        height: bytes = block_height.to_bytes(8, DATA_BYTE_ORDER)
+        items: List[Tuple[bytes, bytes]] = [
+            (self._BLOCK_PREFIX + height, MsgPackForDB.dumps([segment_id, offset, size, logs_bloom, block_hash]))
+        ]
+
+        for i, log in enumerate(logs):
+            items.extend(
+                (key, i.to_bytes(4, DATA_BYTE_ORDER)) for key in self._make_log_keys(block_height, log))
+
+        items.append((self._LAST_BLOCK_KEY, height))
+        self._db.write_batch(items)
+        self._last_block_height = block_height
+
+    @classmethod
+    def _make_log_keys(cls, block_height: int, log: list) -> Iterable[bytes]:
+        tx_index, _, log_index, score_address, indexed, _ = log
+        position: bytes = \
+            block_height.to_bytes(8, DATA_BYTE_ORDER) \
+            + tx_index.to_bytes(4, DATA_BYTE_ORDER) \
+            + log_index.to_bytes(4, DATA_BYTE_ORDER)
+
+        for digest in cls._make_digests(score_address, indexed):
+            yield cls._LOG_PREFIX + digest + position
+
+    @classmethod
+    def _make_digests(cls, score_address: 'Address', indexed: list) -> Iterable[bytes]:
+        yield cls._make_digest(score_address)
+
+        if len(indexed) > 0:
+            yield cls._make_digest(score_address, indexed[0])
+
+            if len(indexed) > 1:
+                yield cls._make_digest(score_address, indexed[0], cls._to_arg(indexed[1]))
+
+    @classmethod
+    def _make_digest(cls, *args) -> bytes:
+        return hashlib.sha3_256(MsgPackForDB.dumps(list(args))).digest()[:cls._DIGEST_SIZE]
+
+    @classmethod
+    def _to_arg(cls, value: Any) -> Optional[str]:
+        """Converts an indexed argument to the JSON-RPC format which ise_getEventLogs takes
+        """
+        return TypeConverter.convert_type_reverse(value)
+
+    @classmethod
+    def _from_arg(cls, event: str, arg: str) -> Any:
+        """Converts the first indexed argument in JSON-RPC format to the type in the event signature
+
+        :return: None if the type is unknown or arg cannot be converted to it
+        """
+        try:
+            type_name: str = event[event.index("(") + 1:-1].split(",")[0]
+            return TypeConverter._convert_value(arg, cls._ARG_TYPES[type_name])
+        except (ValueError, KeyError, IconServiceBaseException):
+            return None
+
+    def _find_logs_with_index(self,
+                              from_block: int,
+                              to_block: int,
+                              score_address: 'Address',
+                              event: Optional[str],
+                              arg: Optional[str]) -> Iterable[Tuple[int, list, List[int]]]:
+        if event is None:
+            digest: bytes = self._make_digest(score_address)
+        elif arg is None:
+            digest: bytes = self._make_digest(score_address, event)
+        else:
+            digest: bytes = self._make_digest(score_address, event, arg)
+
+        prefix: bytes = self._LOG_PREFIX + digest
+        start: bytes = prefix + from_block.to_bytes(8, DATA_BYTE_ORDER)
+        stop: bytes = prefix + (to_block + 1).to_bytes(8, DATA_BYTE_ORDER)
+
+        block_height: int = -1
+        log_indexes: List[int] = []
+
+        with self._db.iterator(start=start, stop=stop) as it:
+            for key, value in it:
+                height: int = int.from_bytes(key[len(prefix):len(prefix) + 8], DATA_BYTE_ORDER)
+                if height != block_height:
+                    if len(log_indexes) > 0:
+                        yield block_height, self._get_block_meta(block_height), log_indexes
+
+                    block_height = height
+                    log_indexes = []
+
+                log_indexes.append(int.from_bytes(value, DATA_BYTE_ORDER))
+
+        if len(log_indexes) > 0:
+            yield block_height, self._get_block_meta(block_height), log_indexes
+
+    def _find_logs_with_bloom(self,
+                              from_block: int,
+                              to_block: int,
+                              event: Optional[str],
+                              arg: Optional[str]) -> Iterable[Tuple[int, list, Optional[List[int]]]]:
+        bloom_items: List[bytes] = []
+        if event is not None:
+            bloom_items.append(EventLogEmitter.get_ordered_bytes(0, event))
+
+            value: Any = None if arg is None else self._from_arg(event, arg)
+            if value is not None:
+                bloom_items.append(EventLogEmitter.get_ordered_bytes(1, value))
+
+        start: bytes = self._BLOCK_PREFIX + from_block.to_bytes(8, DATA_BYTE_ORDER)
+        stop: bytes = self._BLOCK_PREFIX + (to_block + 1).to_bytes(8, DATA_BYTE_ORDER)
+
+        with self._db.iterator(start=start, stop=stop) as it:
+            for key, value in it:
+                meta: list = MsgPackForDB.loads(value)
+                if len(bloom_items) > 0:
+                    bloom = BloomFilter(int.from_bytes(meta[3], DATA_BYTE_ORDER))
+                    if any(item not in bloom for item in bloom_items):
+                        continue
+
+                yield int.from_bytes(key[len(self._BLOCK_PREFIX):], DATA_BYTE_ORDER), meta, None
+
+    @classmethod
+    def _match(cls,
+               log: list,
+               score_address: Optional['Address'],
+               event: Optional[str],
+               arg: Optional[str]) -> bool:
+        indexed: list = log[4]
+
+        if score_address is not None and log[3] != score_address:
+            return False
+        if event is not None and (len(indexed) == 0 or indexed[0] != event):
+            return False
+        if arg is not None and (len(indexed) < 2 or cls._to_arg(indexed[1]) != arg):
+            return False
+
+        return True
+
+    @classmethod
+    def _to_dict(cls, block_height: int, block_hash: bytes, log: list) -> dict:
+        tx_index, tx_hash, log_index, score_address, indexed, data = log
+
+        return {
+            "blockHeight": block_height,
+            "blockHash": block_hash,
+            "txIndex": tx_index,
+            "txHash": tx_hash,
+            "logIndex": log_index,
+            "scoreAddress": score_address,
+            "indexed": indexed,
+            "data": data
+        }
+
+    def _get_block_meta(self, block_height: int) -> list:
+        value: bytes = self._db.get(self._BLOCK_PREFIX + block_height.to_bytes(8, DATA_BYTE_ORDER))
+        return MsgPackForDB.loads(value)
+
+    def _read_record(self, segment_files: Dict[int, BinaryIO], segment_id: int, offset: int, size: int) -> list:
+        f: Optional[BinaryIO] = segment_files.get(segment_id)
+        if f is None:
+            f = open(self._get_segment_path(segment_id), "rb")
+            segment_files[segment_id] = f
+
+        f.seek(offset + self._RECORD_SIZE_BYTES)
+        return MsgPackForDB.loads(f.read(size - self._RECORD_SIZE_BYTES))
+
+    @classmethod
+    def _read_records(cls, f: BinaryIO) -> Iterable[Tuple[int, Optional[list]]]:
+        """Read records from the beginning of a segment file
+
+        :return: (offset, record). record is None if it is incomplete
+        """
+        while True:
+            offset: int = f.tell()
+            header: bytes = f.read(cls._RECORD_SIZE_BYTES)
+            if len(header) == 0:
+                return
+
+            size: int = int.from_bytes(header, DATA_BYTE_ORDER)
+            data: bytes = f.read(size)
+            if len(header) < cls._RECORD_SIZE_BYTES or len(data) < size:
+                yield offset, None
+                return
+
+            yield offset, MsgPackForDB.loads(data)
+
+    def _rollback(self, block_height: int):
+        Logger.info(tag=_TAG, msg=f"Rollback: {self._last_block_height} -> {block_height}")
+
+        items: List[Tuple[bytes, Optional[bytes]]] = []
+        start: bytes = self._BLOCK_PREFIX + (block_height + 1).to_bytes(8, DATA_BYTE_ORDER)
+        stop: bytes = self._BLOCK_PREFIX + b"\xff" * 8
+        position: Optional[Tuple[int, int]] = None
+        segment_files: Dict[int, BinaryIO] = {}
+
+        try:
+            with self._db.iterator(start=start, stop=stop) as it:
+                for key, value in it:
+                    height: int = int.from_bytes(key[len(self._BLOCK_PREFIX):], DATA_BYTE_ORDER)
+                    segment_id, offset, size = MsgPackForDB.loads(value)[:3]
+                    if position is None:
+                        position = segment_id, offset
+
+                    logs: List[list] = self._read_record(segment_files, segment_id, offset, size)[4]
+                    items.append((key, None))
+                    for log in logs:
+                        items.extend((log_key, None) for log_key in self._make_log_keys(height, log))
+        finally:
+            for f in segment_files.values():
+                f.close()
+
+        last_block_height: int = max(block_height, -1)
+        last_block_value: Optional[bytes] = \
+            last_block_height.to_bytes(8, DATA_BYTE_ORDER) if last_block_height >= 0 else None
+        items.append((self._LAST_BLOCK_KEY, last_block_value))
+
+        gaps: List[List[int]] = [[start, min(end, block_height)] for start, end in self._gaps if start <= block_height]
+        items.append((self._GAPS_KEY, MsgPackForDB.dumps(gaps) if len(gaps) > 0 else None))
+
+        self._db.write_batch(items)
+        self._last_block_height = last_block_height
+        self._gaps = gaps
+
+        if position is not None:
+            self._truncate_segments(*position)
+
+    def _remove_unindexed_records(self):
+        """Remove the records which have been appended to segment files without their index
+        """
+        segment_id, end = 0, 0
+
+        value: Optional[bytes] = self._get_last_record_meta()
+        if value is not None:
+            segment_id, offset, size = MsgPackForDB.loads(value)[:3]
+            end = offset + size
+
+        self._truncate_segments(segment_id, end)
+
+    def _get_last_record_meta(self) -> Optional[bytes]:
+        meta: Optional[bytes] = None
+
+        with self._db.iterator(start=self._BLOCK_PREFIX, stop=self._BLOCK_PREFIX + b"\xff" * 8) as it:
+            for _, value in it:
+                meta = value
+
+        return meta
+
+    def _truncate_segments(self, segment_id: int, offset: int):
+        for i in self._get_segment_ids():
+            path: str = self._get_segment_path(i)
+            if i > segment_id:
+                os.remove(path)
+            elif i == segment_id and os.path.getsize(path) > offset:
+                with open(path, "rb+") as f:
+                    f.truncate(offset)
+
+    def _open_segment_file(self, segment_id: Optional[int] = None):
+        """Open a segment file to append records to
+
+        :param segment_id: the last segment file is opened if it is None
+        """
+        if segment_id is None:
+            segment_ids: List[int] = self._get_segment_ids()
+            segment_id = segment_ids[-1] if len(segment_ids) > 0 else 0
+
+        self._segment_id = segment_id
+        self._segment_file = open(self._get_segment_path(segment_id), "ab")
+
+    def _close_segment_file(self):
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+
+    def _get_segment_ids(self) -> List[int]:
+        return sorted(
+            int(name[:-len(self._SEGMENT_SUFFIX)])
+            for name in os.listdir(self._path)
+            if name.endswith(self._SEGMENT_SUFFIX))
+
+    def _get_segment_path(self, segment_id: int) -> str:
+        return os.path.join(self._path, f"{segment_id:08d}{self._SEGMENT_SUFFIX}")
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("DepositIndex", "DepositIndexContainer")
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from ..base.address import Address
+
+_NONE = -1
+
+
+class DepositIndex(object):
+    """In-memory index of the deposit linked list of a SCORE
+
+    It keeps the ids of deposits in the order of the linked list with a max segment tree of their expires,
+    so that the first unexpired deposit and the max expires after a given deposit are found in O(log n)
+    without loading every deposit from the state DB.
+
+    Only ids and expires are indexed. They change on add and withdraw but not on charging fees.
+    A DepositIndex shared by containers is never modified. Modify its copy instead.
+    """
+
+    __slots__ = ("_ids", "_positions", "_size", "_tree", "_removed")
+
+    def __init__(self):
+        # Removed deposits leave None in their position until the index is compacted
+        self._ids: List[Optional[bytes]] = []
+        self._positions: Dict[bytes, int] = {}
+        # The number of leaves in the tree, which is a power of 2
+        self._size: int = 1
+        self._tree: List[int] = [_NONE, _NONE]
+        self._removed: int = 0
+
+    @classmethod
+    def from_deposits(cls, deposits: Iterable[tuple]) -> 'DepositIndex':
+        """
+        :param deposits: (deposit_id, expires) in the order of the linked list
+        """
+        ids: List[bytes] = []
+        expires: List[int] = []
+        for deposit_id, deposit_expires in deposits:
+            ids.append(deposit_id)
+            expires.append(deposit_expires)
+
+        index = DepositIndex()
+        index._build(ids, expires)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._ids) - self._removed
+
+    def __contains__(self, deposit_id: bytes) -> bool:
+        return deposit_id in self._positions
+
+    def __iter__(self) -> Iterable[bytes]:
+        return (deposit_id for deposit_id in self._ids if deposit_id is not None)
+
+    def copy(self) -> 'DepositIndex':
+        index = DepositIndex.__new__(DepositIndex)
+        index._ids = self._ids.copy()
+        index._positions = self._positions.copy()
+        index._size = self._size
+        index._tree = self._tree.copy()
+        index._removed = self._removed
+        return index
+
+    def append(self, deposit_id: bytes, expires: int):
+        """Appends a deposit to the tail"""
+        if len(self._ids) == self._size:
+            self._compact(extra=1)
+
+        position: int = len(self._ids)
+        self._ids.append(deposit_id)
+        self._positions[deposit_id] = position
+        self._set(position, expires)
+
+    def remove(self, deposit_id: bytes):
+        position: int = self._positions.pop(deposit_id)
+        self._ids[position] = None
+        self._set(position, _NONE)
+        self._removed += 1
+
+        if self._removed > len(self):
+            self._compact()
+
+    def get_next_unexpired(self, start_id: Optional[bytes], block_height: int) -> Optional[bytes]:
+        """Returns the id of the first deposit which has not expired from start_id to the tail
+
+        The same as next(filter(lambda d: block_height < d.expires, Engine._deposit_generator(start_id)))
+        """
+        if start_id is None:
+            return None
+
+        tree: List[int] = self._tree
+        i: int = self._positions[start_id] + self._size
+        while tree[i] <= block_height:
+            # Move to the next subtree on the right
+            while i & 1:
+                if i == 1:
+                    return None
+                i >>= 1
+            i += 1
+
+        while i < self._size:
+            i <<= 1
+            if tree[i] <= block_height:
+                i += 1
+
+        return self._ids[i - self._size]
+
+    def get_max_expires(self, start_id: Optional[bytes]) -> int:
+        """Returns the max expires of the deposits from start_id to the tail or -1 if there is none
+
+        The same as max(map(lambda d: d.expires, Engine._deposit_generator(start_id)), default=-1)
+        """
+        if start_id is None:
+            return _NONE
+
+        tree: List[int] = self._tree
+        ret: int = _NONE
+        left: int = self._positions[start_id] + self._size
+        right: int = len(self._ids) + self._size
+        while left < right:
+            if left & 1:
+                ret = max(ret, tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                ret = max(ret, tree[right])
+            left >>= 1
+            right >>= 1
+
+        return ret
+
+    def _set(self, position: int, expires: int):
+        tree: List[int] = self._tree
+        i: int = position + self._size
+        tree[i] = expires
+        i >>= 1
+        while i > 0:
+            tree[i] = max(tree[i * 2], tree[i * 2 + 1])
+            i >>= 1
+
+    def _compact(self, extra: int = 0):
+        """Rebuilds the tree without removed deposits, with room for extra deposits"""
+        size: int = self._size
+        ids: List[bytes] = []
+        expires: List[int] = []
+        for position, deposit_id in enumerate(self._ids):
+            if deposit_id is not None:
+                ids.append(deposit_id)
+                expires.append(self._tree[position + size])
+
+        self._build(ids, expires, extra)
+
+    def _build(self, ids: List[bytes], expires: List[int], extra: int = 0):
+        size: int = 1
+        while size < len(ids) + extra:
+            size <<= 1
+
+        tree: List[int] = [_NONE] * (size * 2)
+        tree[size:size + len(expires)] = expires
+        for i in range(size - 1, 0, -1):
+            tree[i] = max(tree[i * 2], tree[i * 2 + 1])
+
+        self._ids = ids
+        self._positions = {deposit_id: position for position, deposit_id in enumerate(ids)}
+        self._size = size
+        self._tree = tree
+        self._removed = 0
+
+
+class DepositIndexContainer(object):
+    """DepositIndexes of SCOREs which reflect the state of a block
+
+    It is carried from a block to the next block in PrecommitData
+    and changes made by a transaction are applied or discarded with the tx batch.
+    """
+
+    def __init__(self, indices: Optional[Dict['Address', 'DepositIndex']] = None):
+        self._indices: Dict['Address', 'DepositIndex'] = {} if indices is None else indices
+        self._tx_indices: Dict['Address', 'DepositIndex'] = {}
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def get(self, score_address: 'Address') -> Optional['DepositIndex']:
+        index: Optional['DepositIndex'] = self._tx_indices.get(score_address)
+        if index is None:
+            index = self._indices.get(score_address)
+        return index
+
+    def get_mutable(self, score_address: 'Address') -> Optional['DepositIndex']:
+        """Returns the index which is modified only in the current transaction
+        """
+        index: Optional['DepositIndex'] = self._tx_indices.get(score_address)
+        if index is None:
+            index = self._indices.get(score_address)
+            if index is not None:
+                index = index.copy()
+                self._tx_indices[score_address] = index
+        return index
+
+    def put(self, score_address: 'Address', index: 'DepositIndex'):
+        self._tx_indices[score_address] = index
+
+    def update_batch(self):
+        self._indices.update(self._tx_indices)
+        self._tx_indices.clear()
+
+    def clear_batch(self):
+        self._tx_indices.clear()
+
+    def copy(self) -> 'DepositIndexContainer':
+        """Returns a container for the next block
+
+        DepositIndexes are shared with the new container because they are copied before modification
+        """
+        return DepositIndexContainer(self._indices.copy())
@@ -20,6 +20,7 @@ from enum import IntEnum
 from typing import List, Dict, Optional
 
 from .deposit import Deposit
+from .deposit_index import DepositIndex, DepositIndexContainer
 from .deposit_meta import DepositMeta
 from ..base.ComponentBase import EngineBase
 from ..base.exception import InvalidRequestException, InvalidParamsException
@@ -32,6 +33,7 @@ if typing.TYPE_CHECKING:
     from ..base.address import Address
     from ..deploy.storage import IconScoreDeployInfo
     from ..iconscore.icon_score_context import IconScoreContext
+    from ..precommit_data_manager import PrecommitData
 
 FIXED_TERM = True
 FIXED_RATIO_PER_MONTH = '0.08'
@@ -87,6 +89,19 @@ class Engine(EngineBase):
     _MIN_DEPOSIT_TERM = BLOCKS_IN_ONE_MONTH
     _MAX_DEPOSIT_TERM = _MIN_DEPOSIT_TERM if FIXED_TERM else BLOCKS_IN_ONE_MONTH * 24
 
+    def __init__(self):
+        super().__init__()
+        # Deposit indices after the last committed block
+        self.deposit_indices = DepositIndexContainer()
+
+    def commit(self, _context: 'IconScoreContext', precommit_data: 'PrecommitData'):
+        if precommit_data.deposit_indices is not None:
+            self.deposit_indices = precommit_data.deposit_indices
+
+    def rollback(self, _context: 'IconScoreContext', _block_height: int, _block_hash: bytes):
+        # Deposit indices are loaded from the state DB again on demand
+        self.deposit_indices = DepositIndexContainer()
+
     def get_deposit_info(self,
                          context: 'IconScoreContext',
                          score_address: 'Address',
@@ -177,6 +192,7 @@ class Engine(EngineBase):
         """
 
         deposit_meta = self._get_or_create_deposit_meta(context, deposit.score_address)
+        index = self._get_deposit_index(context, deposit.score_address, deposit_meta, mutable=True)
 
         deposit.prev_id = deposit_meta.tail_id
         context.storage.fee.put_deposit(context, deposit)
@@ -206,6 +222,9 @@ class Engine(EngineBase):
         deposit_meta.tail_id = deposit.id
         context.storage.fee.put_deposit_meta(context, deposit.score_address, deposit_meta)
 
+        if index is not None:
+            index.append(deposit.id, deposit.expires)
+
     def withdraw_deposit(self,
                          context: 'IconScoreContext',
                          sender: 'Address',
@@ -277,16 +296,17 @@ class Engine(EngineBase):
         deposit_meta = context.storage.fee.get_deposit_meta(context, deposit.score_address)
         deposit_meta_changed = False
 
+        index = self._get_deposit_index(context, deposit.score_address, deposit_meta, mutable=True)
+        if index is not None and deposit.id in index:
+            # The deposit is still linked from deposit_meta if it is the head
+            index.remove(deposit.id)
+
         if deposit_meta.head_id == deposit.id:
             deposit_meta.head_id = deposit.next_id
             deposit_meta_changed = True
 
         if deposit.id in (deposit_meta.available_head_id_of_virtual_step, deposit_meta.available_head_id_of_deposit):
-            gen = self._deposit_generator(context, deposit.next_id)
-            next_available_deposit = \
-                next(filter(lambda d: block_height < d.expires, gen), None)
-            next_deposit_id = \
-                next_available_deposit.id if next_available_deposit is not None else None
+            next_deposit_id = self._get_next_unexpired_deposit_id(context, deposit.next_id, block_height, index)
 
             if deposit_meta.available_head_id_of_virtual_step == deposit.id:
                 # Search for next deposit id which is available to use virtual step
@@ -299,14 +319,12 @@ class Engine(EngineBase):
             deposit_meta_changed = True
 
         if deposit_meta.expires_of_virtual_step == deposit.expires:
-            gen = self._deposit_generator(context, deposit_meta.available_head_id_of_virtual_step)
-            max_expires = max(map(lambda d: d.expires, gen), default=-1)
+            max_expires = self._get_max_expires(context, deposit_meta.available_head_id_of_virtual_step, index)
             deposit_meta.expires_of_virtual_step = max_expires if max_expires > block_height else -1
             deposit_meta_changed = True
 
         if deposit_meta.expires_of_deposit == deposit.expires:
-            gen = self._deposit_generator(context, deposit_meta.available_head_id_of_deposit)
-            max_expires = max(map(lambda d: d.expires, gen), default=-1)
+            max_expires = self._get_max_expires(context, deposit_meta.available_head_id_of_deposit, index)
             deposit_meta.expires_of_deposit = max_expires if max_expires > block_height else -1
             deposit_meta_changed = True
 
@@ -432,13 +450,14 @@ class Engine(EngineBase):
         score_used_step = 0
 
         if required_step > 0:
+            index = self._get_deposit_index(context, score_address, deposit_meta)
             score_used_step, deposit_meta_changed = self._charge_fee_from_virtual_step(
-                context, deposit_meta, required_step, block_height)
+                context, deposit_meta, required_step, block_height, index)
 
             if score_used_step < required_step:
                 required_icx = (required_step - score_used_step) * step_price
                 charged_icx, deposit_indices_changed = self._charge_fee_from_deposit(
-                    context, deposit_meta, required_icx, block_height)
+                    context, deposit_meta, required_icx, block_height, index)
 
                 score_used_step += charged_icx // step_price
                 deposit_meta_changed: bool = deposit_meta_changed or deposit_indices_changed
@@ -453,7 +472,8 @@ class Engine(EngineBase):
                                       context: 'IconScoreContext',
                                       deposit_meta: 'DepositMeta',
                                       required_step: int,
-                                      block_height: int) -> (int, bytes):
+                                      block_height: int,
+                                      index: Optional['DepositIndex'] = None) -> (int, bytes):
         """
         Charges fees from available virtual STEPs
         Returns total charged amount and whether the properties of 'deposit_meta' are changed
@@ -462,8 +482,8 @@ class Engine(EngineBase):
         should_update_expire = False
         last_paid_deposit = None
 
-        gen = self._deposit_generator(context, deposit_meta.available_head_id_of_virtual_step)
-        for deposit in filter(lambda d: block_height < d.expires, gen):
+        for deposit in self._unexpired_deposit_generator(
+                context, deposit_meta.available_head_id_of_virtual_step, block_height, index):
             available_virtual_step = deposit.remaining_virtual_step
 
             if required_step < available_virtual_step:
@@ -488,7 +508,7 @@ class Engine(EngineBase):
                     break
 
         indices_changed = self._update_virtual_step_indices(
-            context, deposit_meta, last_paid_deposit, should_update_expire, block_height)
+            context, deposit_meta, last_paid_deposit, should_update_expire, block_height, index)
 
         return charged_step, indices_changed
 
@@ -497,19 +517,19 @@ class Engine(EngineBase):
                                      deposit_meta: 'DepositMeta',
                                      last_paid_deposit: 'Deposit',
                                      should_update_expire: bool,
-                                     block_height: int) -> bool:
+                                     block_height: int,
+                                     index: Optional['DepositIndex'] = None) -> bool:
         """
         Updates indices of virtual steps to DepositMeta and returns whether there exist changes.
         """
-        next_available_deposit = last_paid_deposit
+        next_available_deposit_id = last_paid_deposit.id if last_paid_deposit else None
 
         if last_paid_deposit is not None and last_paid_deposit.remaining_virtual_step == 0:
             # All virtual steps have been consumed in the current deposit
             # so should find the next available virtual steps
-            gen = self._deposit_generator(context, last_paid_deposit.next_id)
-            next_available_deposit = next(filter(lambda d: block_height < d.expires, gen), None)
+            next_available_deposit_id = self._get_next_unexpired_deposit_id(
+                context, last_paid_deposit.next_id, block_height, index)
 
-        next_available_deposit_id = next_available_deposit.id if next_available_deposit else None
         next_expires = deposit_meta.expires_of_virtual_step
 
         if next_available_deposit_id is None:
@@ -517,8 +537,7 @@ class Engine(EngineBase):
             next_expires = -1
         elif should_update_expire:
             # Finds next max expires. Sets to -1 if not exist.
-            gen = self._deposit_generator(context, next_available_deposit_id)
-            next_expires = max(map(lambda d: d.expires, gen), default=-1)
+            next_expires = self._get_max_expires(context, next_available_deposit_id, index)
 
         if deposit_meta.available_head_id_of_virtual_step != next_available_deposit_id \
                 or deposit_meta.expires_of_virtual_step != next_expires:
@@ -533,7 +552,8 @@ class Engine(EngineBase):
                                  context: 'IconScoreContext',
                                  deposit_meta: 'DepositMeta',
                                  required_icx: int,
-                                 block_height: int) -> (int, bool):
+                                 block_height: int,
+                                 index: Optional['DepositIndex'] = None) -> (int, bool):
         """
         Charges fees from available deposit ICXs
         Returns total charged amount and whether the properties of 'deposit_meta' are changed
@@ -548,8 +568,8 @@ class Engine(EngineBase):
         last_paid_deposit = None
 
         # Search for next available deposit id
-        gen = self._deposit_generator(context, deposit_meta.available_head_id_of_deposit)
-        for deposit in filter(lambda d: block_height < d.expires, gen):
+        for deposit in self._unexpired_deposit_generator(
+                context, deposit_meta.available_head_id_of_deposit, block_height, index):
             available_deposit = deposit.remaining_deposit - deposit.min_remaining_deposit
 
             if remaining_required_icx < available_deposit:
@@ -573,8 +593,7 @@ class Engine(EngineBase):
 
         if remaining_required_icx > 0:
             # Charges all remaining fee regardless of the minimum remaining amount.
-            gen = self._deposit_generator(context, deposit_meta.head_id)
-            for deposit in filter(lambda d: block_height < d.expires, gen):
+            for deposit in self._unexpired_deposit_generator(context, deposit_meta.head_id, block_height, index):
                 charged_icx = min(remaining_required_icx, deposit.remaining_deposit)
 
                 if charged_icx > 0:
@@ -586,7 +605,7 @@ class Engine(EngineBase):
                         break
 
         indices_changed = self._update_deposit_indices(
-            context, deposit_meta, last_paid_deposit, should_update_expire, block_height)
+            context, deposit_meta, last_paid_deposit, should_update_expire, block_height, index)
 
         return required_icx - remaining_required_icx, indices_changed
 
@@ -595,20 +614,20 @@ class Engine(EngineBase):
                                 deposit_meta: 'DepositMeta',
                                 last_paid_deposit: 'Deposit',
                                 should_update_expire: bool,
-                                block_height: int) -> bool:
+                                block_height: int,
+                                index: Optional['DepositIndex'] = None) -> bool:
         """
         Updates indices of deposit to deposit_meta and returns whether there exist changes.
         """
 
-        next_available_deposit = last_paid_deposit
+        next_available_deposit_id = last_paid_deposit.id
 
         if last_paid_deposit.remaining_deposit <= last_paid_deposit.min_remaining_deposit:
             # All available deposits have been consumed in the current deposit
             # so should find the next available deposits
-            gen = self._deposit_generator(context, last_paid_deposit.next_id)
-            next_available_deposit = next(filter(lambda d: block_height < d.expires, gen), None)
+            next_available_deposit_id = self._get_next_unexpired_deposit_id(
+                context, last_paid_deposit.next_id, block_height, index)
 
-        next_available_deposit_id = next_available_deposit.id if next_available_deposit else None
         next_expires = deposit_meta.expires_of_deposit
 
         if next_available_deposit_id is None:
@@ -616,8 +635,7 @@ class Engine(EngineBase):
             next_expires = -1
         elif should_update_expire:
             # Finds next max expires. Sets to -1 if not exist.
-            gen = self._deposit_generator(context, next_available_deposit_id)
-            next_expires = max(map(lambda d: d.expires, gen), default=-1)
+            next_expires = self._get_max_expires(context, next_available_deposit_id, index)
 
         if deposit_meta.available_head_id_of_deposit != next_available_deposit_id \
                 or deposit_meta.expires_of_deposit != next_expires:
@@ -638,6 +656,82 @@ class Engine(EngineBase):
             yield deposit
             next_id = deposit.next_id
 
+    def _unexpired_deposit_generator(self,
+                                     context: 'IconScoreContext',
+                                     start_id: Optional[bytes],
+                                     block_height: int,
+                                     index: Optional['DepositIndex']):
+        """
+        Yields the deposits which have not expired from start_id.
+        Expired deposits are skipped without being loaded if the index is given.
+        """
+        if index is None or (start_id is not None and start_id not in index):
+            gen = self._deposit_generator(context, start_id)
+            yield from filter(lambda d: block_height < d.expires, gen)
+            return
+
+        next_id = index.get_next_unexpired(start_id, block_height)
+        while next_id is not None:
+            deposit = context.storage.fee.get_deposit(context, next_id)
+            if deposit is None:
+                break
+
+            yield deposit
+            if deposit.next_id is not None and deposit.next_id not in index:
+                # Never happens unless the index does not reflect the state
+                yield from self._unexpired_deposit_generator(context, deposit.next_id, block_height, None)
+                break
+            next_id = index.get_next_unexpired(deposit.next_id, block_height)
+
+    def _get_next_unexpired_deposit_id(self,
+                                       context: 'IconScoreContext',
+                                       start_id: Optional[bytes],
+                                       block_height: int,
+                                       index: Optional['DepositIndex']) -> Optional[bytes]:
+        if index is not None and (start_id is None or start_id in index):
+            return index.get_next_unexpired(start_id, block_height)
+
+        gen = self._deposit_generator(context, start_id)
+        deposit = next(filter(lambda d: block_height < d.expires, gen), None)
+        return deposit.id if deposit is not None else None
+
+    def _get_max_expires(self,
+                         context: 'IconScoreContext',
+                         start_id: Optional[bytes],
+                         index: Optional['DepositIndex']) -> int:
+        """
+        Returns the max expires of the deposits from start_id to the tail. Returns -1 if not exist.
+        """
+        if index is not None and (start_id is None or start_id in index):
+            return index.get_max_expires(start_id)
+
+        gen = self._deposit_generator(context, start_id)
+        return max(map(lambda d: d.expires, gen), default=-1)
+
+    def _get_deposit_index(self,
+                           context: 'IconScoreContext',
+                           score_address: 'Address',
+                           deposit_meta: Optional['DepositMeta'],
+                           mutable: bool = False) -> Optional['DepositIndex']:
+        """
+        Returns the deposit index of the SCORE on invoke.
+        It is built from the state DB when the SCORE is charged or deposited for the first time
+        after iconservice starts.
+        """
+        deposit_indices: Optional['DepositIndexContainer'] = context.deposit_indices
+        if deposit_indices is None:
+            return None
+
+        index: Optional['DepositIndex'] = \
+            deposit_indices.get_mutable(score_address) if mutable else deposit_indices.get(score_address)
+        if index is None:
+            head_id = deposit_meta.head_id if deposit_meta is not None else None
+            index = DepositIndex.from_deposits(
+                (deposit.id, deposit.expires) for deposit in self._deposit_generator(context, head_id))
+            deposit_indices.put(score_address, index)
+
+        return index
+
     def _get_score_deploy_info(self, context: 'IconScoreContext', score_address: 'Address') -> 'IconScoreDeployInfo':
         deploy_info: 'IconScoreDeployInfo' = context.storage.deploy.get_deploy_info(context, score_address)
 
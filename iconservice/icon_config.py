@@ -74,13 +74,49 @@ default_icon_config = {
     ConfigKey.STEP_TRACE_FLAG: False,
     ConfigKey.PRECOMMIT_DATA_LOG_FLAG: False,
     ConfigKey.BACKUP_FILES: BACKUP_FILES,
+    ConfigKey.BACKUP_COMPRESSION: "",
+    ConfigKey.BACKUP_SEGMENT_SIZE: 0,
     ConfigKey.BLOCK_INVOKE_TIMEOUT: BLOCK_INVOKE_TIMEOUT_S,
     ConfigKey.TBEARS_MODE: False,
     ConfigKey.UNSTAKE_SLOT_MAX: UNSTAKE_SLOT_MAX,
+    ConfigKey.EVENT_LOG_STORE: False,
+    ConfigKey.INVOKE_STREAM: {
+        ConfigKey.ENABLE: False,
+        ConfigKey.CHUNK_SIZE: 100,
+        # milliseconds
+        ConfigKey.CHUNK_INTERVAL: 50,
+    },
+    ConfigKey.METRICS: {
+        ConfigKey.ENABLE: True,
+        # 0: no HTTP endpoint
+        ConfigKey.METRICS_PORT: 0,
+        # "": no file
+        ConfigKey.METRICS_FILE_PATH: "",
+        # seconds
+        ConfigKey.METRICS_FILE_INTERVAL: 10,
+    },
+    ConfigKey.SCORE_RESOURCE: {
+        ConfigKey.ENABLE: False,
+        ConfigKey.SCORE_RESOURCE_RECENT_BLOCKS: 100,
+        # "": no file
+        ConfigKey.SCORE_RESOURCE_DUMP_PATH: "",
+    },
+    ConfigKey.SCORE_PACKAGE_STORE: True,
+    ConfigKey.SCORE_WARM_UP: {
+        ConfigKey.ENABLE: False,
+        # 0: all active SCOREs
+        ConfigKey.SCORE_WARM_UP_MAX_SCORES: 0,
+        # 0: the number of CPUs, 1: no process pool
+        ConfigKey.SCORE_WARM_UP_WORKERS: 0,
+    },
     ConfigKey.DOS_GUARD: {
         ConfigKey.RESET_TIME: 5,
         ConfigKey.THRESHOLD: 200,
         ConfigKey.BAN_TIME: 300,
+        # 0: no limit on requests to a SCORE or a method of a SCORE
+        ConfigKey.SCORE_THRESHOLD: 0,
+        ConfigKey.METHOD_THRESHOLD: 0,
+        ConfigKey.MAX_ENTRIES: 100_000,
     }
 }
 
@@ -26,6 +26,11 @@ STEP_LOG_TAG = "STEP"
 WAL_LOG_TAG = "WAL"
 ROLLBACK_LOG_TAG = "ROLLBACK"
 BACKUP_LOG_TAG = "BACKUP"
+EVENT_LOG_STORE_LOG_TAG = "EVENTLOG"
+SNAPSHOT_LOG_TAG = "SNAPSHOT"
+METRICS_LOG_TAG = "METRICS"
+SCORE_RESOURCE_LOG_TAG = "SCORE_RESOURCE"
+PROFILER_LOG_TAG = "PROFILER"
 
 JSONRPC_VERSION = '2.0'
 CHARSET_ENCODING = 'utf-8'
@@ -51,6 +56,7 @@ PACKAGE_JSON_FILE = 'package.json'
 ICX_TRANSFER_EVENT_LOG = 'ICXTransfer(Address,Address,int)'
 
 ICON_SCORE_QUEUE_NAME_FORMAT = "IconScore.{channel_name}.{amqp_key}"
+INVOKE_STREAM_QUEUE_NAME_FORMAT = "IconScoreInvokeStream.{channel_name}.{amqp_key}"
 ICON_SERVICE_PROCTITLE_FORMAT = "icon_service." \
                                 "{scoreRootPath}." \
                                 "{stateDbRootPath}." \
@@ -190,6 +196,9 @@ class ConfigKey:
     RESET_TIME = "resetTIme"
     THRESHOLD = "threshold"
     BAN_TIME = "banTime"
+    SCORE_THRESHOLD = "scoreThreshold"
+    METHOD_THRESHOLD = "methodThreshold"
+    MAX_ENTRIES = "maxEntries"
 
     # log
     LOG = 'log'
@@ -230,6 +239,10 @@ class ConfigKey:
 
     # The maximum number of backup files for rollback
     BACKUP_FILES = "backupFiles"
+    # Backup file compression: "" or "zlib"
+    BACKUP_COMPRESSION = "backupCompression"
+    # The number of blocks in a backup segment file, 0 means a backup file per block
+    BACKUP_SEGMENT_SIZE = "backupSegmentSize"
 
     # Block invoke timeout in second
     BLOCK_INVOKE_TIMEOUT = "blockInvokeTimeout"
@@ -240,6 +253,41 @@ class ConfigKey:
     # containing invalid expired unstakes to remove
     INVALID_EXPIRED_UNSTAKES_PATH = "invalidExpiredUnstakesPath"
 
+    # Store event logs of committed blocks for ise_getEventLogs
+    EVENT_LOG_STORE = "eventLogStore"
+
+    # Send tx results to loopchain in chunks while a block is invoked
+    INVOKE_STREAM = "invokeStream"
+    ENABLE = "enable"
+    CHUNK_SIZE = "chunkSize"
+    CHUNK_INTERVAL = "chunkInterval"
+
+    # Latency metrics of invoke and commit phases for ise_getMetrics
+    METRICS = "metrics"
+    # Port of a local HTTP endpoint serving metrics in Prometheus text format
+    METRICS_PORT = "port"
+    # File to which metrics are written in Prometheus text format
+    METRICS_FILE_PATH = "filePath"
+    METRICS_FILE_INTERVAL = "fileInterval"
+
+    # Wall time, steps, DB accesses and event logs of each SCORE method for debug_getScoreResources
+    SCORE_RESOURCE = "scoreResource"
+    # The number of recent blocks whose usages are kept
+    SCORE_RESOURCE_RECENT_BLOCKS = "recentBlocks"
+    # File to which the usages of each committed block are appended in JSON lines
+    SCORE_RESOURCE_DUMP_PATH = "dumpPath"
+
+    # Share one extracted directory among the deployments of the same SCORE package
+    # and keep the verdicts of SCORE package validation
+    SCORE_PACKAGE_STORE = "scorePackageStore"
+
+    # Load the classes of active SCOREs on startup
+    SCORE_WARM_UP = "scoreWarmUp"
+    # The number of the most recently used SCOREs to load. 0 means all active SCOREs
+    SCORE_WARM_UP_MAX_SCORES = "maxScores"
+    # The number of processes compiling SCOREs. 0 means the number of CPUs
+    SCORE_WARM_UP_WORKERS = "workers"
+
 
 class EnableThreadFlag(IntFlag):
     INVOKE = 1
@@ -366,9 +414,29 @@ BASE_TRANSACTION_VERSION = 3
 PREP_PENALTY_SIGNATURE = "PenaltyImposed(Address,int,int)"
 
 BACKUP_FILES = 10
+# The maximum number of jobs waiting for the background backup cleaner
+BACKUP_CLEANER_QUEUE_SIZE = 1024
+# The background backup cleaner removes stale backup files at once when there are this many
+BACKUP_CLEANER_BATCH_SIZE = 10
 
 BLOCK_INVOKE_TIMEOUT_S = 15
 
+# The maximum number of addresses whose queryIScore results are cached
+ISCORE_CACHE_SIZE = 10_000
+
+# The maximum size of a segment file in the event log store
+EVENT_LOG_SEGMENT_SIZE = 64 * 1024 * 1024
+
+# The payload size of a chunk in a state snapshot file
+SNAPSHOT_CHUNK_SIZE = 4 * 1024 * 1024
+# The maximum number of event logs returned by ise_getEventLogs
+EVENT_LOG_QUERY_LIMIT = 1_000
+
+# The maximum length of INVOKE request and response logs
+INVOKE_LOG_MAX_SIZE = 64 * 1024
+# txResults in INVOKE response are packed with msgpack if the request has responseFormat: "msgpack"
+RESPONSE_FORMAT_MSGPACK = "msgpack"
+
 
 class RCStatus(IntEnum):
     NOT_READY = 0
@@ -481,10 +549,13 @@ class RPCMethod:
     ICX_GET_TOTAL_SUPPLY = 'icx_getTotalSupply'
     ICX_GET_SCORE_API = 'icx_getScoreApi'
     ISE_GET_STATUS = 'ise_getStatus'
+    ISE_GET_EVENT_LOGS = 'ise_getEventLogs'
+    ISE_GET_METRICS = 'ise_getMetrics'
     ICX_CALL = 'icx_call'
     ICX_SEND_TRANSACTION = 'icx_sendTransaction'
     DEBUG_ESTIMATE_STEP = "debug_estimateStep"
     DEBUG_GET_ACCOUNT = "debug_getAccount"
+    DEBUG_GET_SCORE_RESOURCES = "debug_getScoreResources"
 
 
 class DataType:
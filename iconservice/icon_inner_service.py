@@ -13,23 +13,31 @@
 # limitations under the License.
 
 import asyncio
-import json
+import os
 import time
+from concurrent.futures import Future
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import Any, TYPE_CHECKING, Optional
+from typing import Any, TYPE_CHECKING, Optional, List
 
-from earlgrey import message_queue_task, MessageQueueStub, MessageQueueService
+import msgpack
+from earlgrey import message_queue_task, MessageQueueStub, MessageQueueService, MessageQueueType
 
 from iconcommons.logger import Logger
 from iconservice.base.address import Address
 from iconservice.base.block import Block
 from iconservice.base.exception import ExceptionCode, IconServiceBaseException, InvalidBaseTransactionException, \
-    FatalException, ServiceNotReadyException
+    FatalException, ServiceNotReadyException, InvalidParamsException
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.base.type_converter_templates import ConstantKeys
-from iconservice.icon_constant import EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod
+from iconservice.icon_constant import (
+    EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod, INVOKE_LOG_MAX_SIZE, RESPONSE_FORMAT_MSGPACK,
+    ConfigKey, INVOKE_STREAM_QUEUE_NAME_FORMAT
+)
 from iconservice.icon_service_engine import IconServiceEngine
-from iconservice.utils import check_error_response, to_camel_case, BytesToHexJSONEncoder, bytes_to_hex
+from iconservice.metrics import Phase, StartupPhase
+from iconservice.sampling_profiler import SamplingProfiler
+from iconservice.tx_result_stream import TxResultStream
+from iconservice.utils import check_error_response, bytes_to_hex, JSONLogMessage
 
 if TYPE_CHECKING:
     from earlgrey import RobustConnection
@@ -48,6 +56,9 @@ QUERY_THREAD_MAPPER = {
     RPCMethod.ICX_CALL: THREAD_QUERY,
     RPCMethod.DEBUG_ESTIMATE_STEP: THREAD_ESTIMATE,
     RPCMethod.DEBUG_GET_ACCOUNT: THREAD_QUERY,
+    RPCMethod.ISE_GET_EVENT_LOGS: THREAD_QUERY,
+    RPCMethod.ISE_GET_METRICS: THREAD_STATUS,
+    RPCMethod.DEBUG_GET_SCORE_RESOURCES: THREAD_STATUS,
 }
 
 _TAG = "MQ"
@@ -61,6 +72,15 @@ class IconScoreInnerTask(object):
         self._icon_service_engine = IconServiceEngine()
         self._open()
 
+        # Turned on by profile() for debugging
+        self._profiler = SamplingProfiler()
+
+        # Sends tx_results to loopchain while a block is invoked
+        self._invoke_stream_stub: Optional['InvokeStreamStub'] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Futures of the chunks sent during invoke, which are awaited before the INVOKE response
+        self._tx_result_futures: List['Future'] = []
+
         self._thread_pool = {
             THREAD_INVOKE: ThreadPoolExecutor(1),
             THREAD_STATUS: ThreadPoolExecutor(1),
@@ -93,12 +113,15 @@ class IconScoreInnerTask(object):
         ready_future = self._icon_service_engine.get_ready_future()
         await ready_future
 
+        await self._open_invoke_stream()
+
         if self._is_thread_flag_on(EnableThreadFlag.INVOKE):
             loop = asyncio.get_event_loop()
             ret = await loop.run_in_executor(self._thread_pool[THREAD_INVOKE], self._hello)
         else:
             ret = self._hello()
 
+        self._icon_service_engine.startup_timer.mark(StartupPhase.READY)
         Logger.info(tag=_TAG, msg='hello() end')
 
         return ret
@@ -106,9 +129,47 @@ class IconScoreInnerTask(object):
     def _hello(self):
         return self._icon_service_engine.hello()
 
+    async def _open_invoke_stream(self):
+        stream_conf: dict = self._conf[ConfigKey.INVOKE_STREAM]
+        if not stream_conf[ConfigKey.ENABLE] or self._invoke_stream_stub is not None:
+            return
+
+        queue_name: str = INVOKE_STREAM_QUEUE_NAME_FORMAT.format(
+            channel_name=self._conf[ConfigKey.CHANNEL], amqp_key=self._conf[ConfigKey.AMQP_KEY])
+        Logger.info(tag=_TAG, msg=f"Open invoke stream: {queue_name}")
+
+        stub = InvokeStreamStub(self._conf[ConfigKey.AMQP_TARGET], queue_name)
+        await stub.connect()
+
+        self._loop = asyncio.get_event_loop()
+        self._invoke_stream_stub = stub
+
+    def _send_tx_results(self, chunk: dict):
+        """Called on invoke thread to send a chunk of tx_results without waiting
+        """
+        future: 'Future' = asyncio.run_coroutine_threadsafe(
+            self._invoke_stream_stub.async_task().tx_results(chunk), self._loop)
+        self._tx_result_futures.append(future)
+
+    async def _wait_for_tx_results_sent(self) -> bool:
+        """Wait until all chunks of tx_results are sent to loopchain
+
+        :return: False if any of them is failed to be sent
+        """
+        futures, self._tx_result_futures = self._tx_result_futures, []
+        results: list = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures), return_exceptions=True)
+
+        errors: List[BaseException] = [result for result in results if isinstance(result, BaseException)]
+        for e in errors:
+            Logger.error(tag=_TAG, msg=f"Failed to send tx_results: {e}")
+
+        return len(errors) == 0
+
     def cleanup(self):
         Logger.info(tag=_TAG, msg="cleanup() start")
 
+        self._profiler.stop()
+
         # shutdown thread pool executors
         for executor in self._thread_pool.values():
             executor.shutdown()
@@ -145,6 +206,10 @@ class IconScoreInnerTask(object):
         else:
             ret: dict = self._invoke(request)
 
+        # The streamed tx_results have to reach loopchain before the INVOKE response
+        if len(self._tx_result_futures) > 0 and not await self._wait_for_tx_results_sent():
+            ret = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, "Failed to send tx_results")
+
         Logger.debug(tag=_TAG, msg=f'invoke() end')
         return ret
 
@@ -155,10 +220,12 @@ class IconScoreInnerTask(object):
         :return:
         """
 
-        Logger.info(tag=_TAG, msg=f'INVOKE Request: {request}')
+        Logger.info(tag=_TAG, msg=JSONLogMessage('INVOKE Request: ', request, INVOKE_LOG_MAX_SIZE))
 
         try:
+            convert_start: float = time.perf_counter()
             params = TypeConverter.convert(request, ParamType.INVOKE)
+            self._icon_service_engine.metrics.observe(Phase.CONVERT, time.perf_counter() - convert_start)
             converted_block_params = params['block']
             block = Block.from_dict(converted_block_params)
             Logger.info(tag=_TAG, msg=f'INVOKE: BH={block.height}')
@@ -166,30 +233,50 @@ class IconScoreInnerTask(object):
             converted_tx_requests = params['transactions']
 
             convert_tx_result_to_dict: bool = 'isBlockEditable' in params
+            pack_tx_results: bool = params.get(ConstantKeys.RESPONSE_FORMAT) == RESPONSE_FORMAT_MSGPACK
 
             converted_is_block_editable = params.get('isBlockEditable', False)
             converted_prev_block_generator = params.get('prevBlockGenerator')
             converted_prev_block_validators = params.get('prevBlockValidators')
             converted_prev_votes = params.get('prevBlockVotes')
 
-            tx_results, state_root_hash, added_transactions, next_preps, is_shutdown = \
-                self._icon_service_engine.invoke(
-                    block=block,
-                    tx_requests=converted_tx_requests,
-                    prev_block_generator=converted_prev_block_generator,
-                    prev_block_validators=converted_prev_block_validators,
-                    prev_block_votes=converted_prev_votes,
-                    is_block_editable=converted_is_block_editable
-                )
-
-            if convert_tx_result_to_dict:
-                convert_tx_results = [tx_result.to_dict(to_camel_case) for tx_result in tx_results]
+            # If the stream is requested, tx_results are sent in chunks during invoke
+            # and the response only has the number of them instead of txResults
+            stream: Optional['TxResultStream'] = None
+            if params.get(ConstantKeys.STREAM) and self._invoke_stream_stub is not None:
+                stream_conf: dict = self._conf[ConfigKey.INVOKE_STREAM]
+                stream = TxResultStream(block,
+                                        self._send_tx_results,
+                                        stream_conf[ConfigKey.CHUNK_SIZE],
+                                        stream_conf[ConfigKey.CHUNK_INTERVAL])
+
+            with self._profiler.profile(block):
+                tx_results, state_root_hash, added_transactions, next_preps, is_shutdown = \
+                    self._icon_service_engine.invoke(
+                        block=block,
+                        tx_requests=converted_tx_requests,
+                        prev_block_generator=converted_prev_block_generator,
+                        prev_block_validators=converted_prev_block_validators,
+                        prev_block_votes=converted_prev_votes,
+                        is_block_editable=converted_is_block_editable,
+                        on_tx_result=None if stream is None else stream.append
+                    )
+
+            # tx_results are converted to JSON-RPC format in one pass without MakeResponse
+            if stream is not None:
+                stream.flush()
+                convert_tx_results = None
+            elif convert_tx_result_to_dict:
+                convert_tx_results = [tx_result.to_response_dict() for tx_result in tx_results]
             else:
                 # old version
-                convert_tx_results = {bytes.hex(tx_result.tx_hash): tx_result.to_dict(to_camel_case)
+                convert_tx_results = {bytes.hex(tx_result.tx_hash): tx_result.to_response_dict()
                                       for tx_result in tx_results}
+
+            if pack_tx_results:
+                convert_tx_results = msgpack.packb(convert_tx_results, use_bin_type=True)
+
             results = {
-                'txResults': convert_tx_results,
                 'stateRootHash': bytes.hex(state_root_hash),
                 'addedTransactions': added_transactions
             }
@@ -199,7 +286,12 @@ class IconScoreInnerTask(object):
             if is_shutdown:
                 results["is_shutdown"] = True
 
-            response = MakeResponse.make_response(results)
+            if stream is None:
+                response = {'txResults': convert_tx_results, **MakeResponse.make_response(results)}
+            else:
+                response = MakeResponse.make_response(results)
+                response[ConstantKeys.TX_RESULT_COUNT] = hex(stream.tx_result_count)
+                response[ConstantKeys.CHUNK_COUNT] = hex(stream.chunk_count)
         except FatalException as e:
             self._log_exception(e, _TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
@@ -217,7 +309,7 @@ class IconScoreInnerTask(object):
             if self._icon_service_engine:
                 self._icon_service_engine.clear_context_stack()
 
-        Logger.info(tag=_TAG, msg=f'INVOKE Response: {json.dumps(response, cls=BytesToHexJSONEncoder)}')
+        Logger.info(tag=_TAG, msg=JSONLogMessage('INVOKE Response: ', response, INVOKE_LOG_MAX_SIZE))
         return response
 
     @message_queue_task
@@ -452,6 +544,82 @@ class IconScoreInnerTask(object):
         self._icon_service_engine.clear_context_stack()
         return response
 
+    @message_queue_task
+    async def validate_transactions(self, requests: list):
+        """Validates a batch of transactions at once
+
+        The requests limited by DoSGuard are rejected without being validated
+
+        :param requests: the same requests as the ones of validate_transaction
+        :return: the responses in the same order as requests
+            each of them is the same as the response of validate_transaction
+        """
+        try:
+            self._check_icon_service_ready()
+        except ServiceNotReadyException as e:
+            return [MakeResponse.make_error_response(e.code, str(e))] * len(requests)
+
+        if self._is_thread_flag_on(EnableThreadFlag.VALIDATE):
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._thread_pool[THREAD_VALIDATE],
+                                              self._validate_transactions, requests)
+        else:
+            return self._validate_transactions(requests)
+
+    def _validate_transactions(self, requests: list) -> list:
+        Logger.info(tag=_TAG, msg=f'validate_transactions Request: count={len(requests)}')
+
+        responses: list = [None] * len(requests)
+        indices: List[int] = []
+        converted_requests: List[dict] = []
+        origin_requests: List[dict] = []
+
+        dos_guard_errors: List[Optional[Exception]] = \
+            self._icon_service_engine.dos_guard.run_batch([request.get("params", {}) for request in requests])
+
+        for i, request in enumerate(requests):
+            if dos_guard_errors[i] is not None:
+                responses[i] = self._make_validate_error_response(dos_guard_errors[i])
+                continue
+
+            try:
+                converted_requests.append(TypeConverter.convert(request, ParamType.VALIDATE_TRANSACTION))
+                origin_requests.append(request)
+                indices.append(i)
+            except (IconServiceBaseException, Exception) as e:
+                responses[i] = self._make_validate_error_response(e)
+
+        try:
+            errors: List[Optional[BaseException]] = \
+                self._icon_service_engine.validate_transactions(converted_requests, origin_requests)
+        except (FatalException, IconServiceBaseException, Exception) as e:
+            self._log_exception(e, _TAG)
+            for i in indices:
+                responses[i] = self._make_validate_error_response(e)
+            errors = []
+
+        for i, e in zip(indices, errors):
+            if e is None:
+                responses[i] = MakeResponse.make_response(ExceptionCode.OK)
+            else:
+                if not isinstance(e, IconServiceBaseException):
+                    self._log_exception(e, _TAG)
+                responses[i] = self._make_validate_error_response(e)
+
+        self._icon_service_engine.clear_context_stack()
+
+        invalid: int = sum(1 for response in responses if check_error_response(response))
+        Logger.info(tag=_TAG, msg=f'validate_transactions Response: count={len(responses)} invalid={invalid}')
+        return responses
+
+    @staticmethod
+    def _make_validate_error_response(e: BaseException) -> dict:
+        if isinstance(e, FatalException):
+            return MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+        if isinstance(e, IconServiceBaseException):
+            return MakeResponse.make_error_response(e.code, e.message)
+        return MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+
     @message_queue_task
     async def change_block_hash(self, _params):
         try:
@@ -470,13 +638,60 @@ class IconScoreInnerTask(object):
             return MakeResponse.make_error_response(e.code, str(e))
 
         try:
-            self._icon_service_engine.dos_guard.run(_from=params["from"])
+            self._icon_service_engine.dos_guard.run_with_params(params)
             response = MakeResponse.make_response(ExceptionCode.OK)
         except Exception as e:
             self._log_exception(e, _TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
         return response
 
+    @message_queue_task
+    async def profile(self, params: dict) -> dict:
+        """Turns on or off the sampling profiler of the invoke thread
+
+        Profiles are written in collapsed stack format to the "profile" directory in the log directory
+
+        :param params:
+            command: "start", "stop" or "status"
+            blocks: the number of profiles to write before stopping. 0 means no limit (default: 1)
+            threshold: only the blocks which take longer than it in milliseconds are written (default: 0)
+            interval: sampling interval in milliseconds (default: 5)
+        :return: status of the profiler
+        """
+        Logger.info(tag=_TAG, msg=f"profile: params: {params}")
+
+        # Stopping the profiler waits for its sampler thread, which should not block the event loop
+        if self._is_thread_flag_on(EnableThreadFlag.QUERY):
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._thread_pool[THREAD_STATUS], self._profile, params)
+        else:
+            return self._profile(params)
+
+    def _profile(self, params: dict) -> dict:
+        try:
+            converted_params: dict = TypeConverter.convert(params, ParamType.PROFILE)
+            command: str = converted_params.get(ConstantKeys.COMMAND)
+
+            if command == "start":
+                log_dir: str = os.path.dirname(self._conf[ConfigKey.LOG].get(ConfigKey.LOG_FILE_PATH, "./"))
+                self._profiler.start(log_dir,
+                                     blocks=converted_params.get(ConstantKeys.BLOCKS, 1),
+                                     threshold_ms=converted_params.get(ConstantKeys.THRESHOLD, 0),
+                                     interval_ms=converted_params.get(ConstantKeys.INTERVAL, 5))
+            elif command == "stop":
+                self._profiler.stop()
+            elif command != "status":
+                raise InvalidParamsException(f"Invalid command: {command}")
+
+            response = MakeResponse.make_response(self._profiler.get_status())
+        except IconServiceBaseException as icon_e:
+            self._log_exception(icon_e, _TAG)
+            response = MakeResponse.make_error_response(icon_e.code, icon_e.message)
+        except Exception as e:
+            self._log_exception(e, _TAG)
+            response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+        return response
+
 
 class MakeResponse:
     @staticmethod
@@ -509,3 +724,23 @@ class IconScoreInnerStub(MessageQueueStub[IconScoreInnerTask]):
 
     def _callback_connection_close(self, sender, exc: Optional[BaseException], *args, **kwargs):
         Logger.error(tag=_TAG, msg=f"[Inner Stub] connection closed. {exc}")
+
+
+class InvokeStreamTask(object):
+    """Message queue task served by loopchain to receive tx_results while a block is invoked
+
+    The chunks of a block are followed by INVOKE response
+    which has txResultCount and chunkCount instead of txResults.
+    If INVOKE fails, the chunks of the block have to be discarded.
+    """
+
+    @message_queue_task(type_=MessageQueueType.Worker)
+    async def tx_results(self, chunk: dict):
+        pass
+
+
+class InvokeStreamStub(MessageQueueStub[InvokeStreamTask]):
+    TaskType = InvokeStreamTask
+
+    def _callback_connection_close(self, sender, exc: Optional[BaseException], *args, **kwargs):
+        Logger.error(tag=_TAG, msg=f"[InvokeStream Stub] connection closed. {exc}")
@@ -13,11 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from enum import IntEnum
-from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Union, Any
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Union, Any, Callable
 
 from iconcommons.logger import Logger
 
@@ -27,6 +29,7 @@ from iconservice.rollback.backup_manager import BackupManager
 from iconservice.rollback.rollback_manager import RollbackManager
 from iconservice.score_loader.icon_builtin_score_loader import IconBuiltinScoreLoader
 from iconservice.score_loader.icon_score_class_loader import IconScoreClassLoader
+from iconservice.score_loader.icon_score_warm_up import IconScoreWarmUp
 from .base.address import Address
 from .base.address import GOVERNANCE_SCORE_ADDRESS
 from .base.address import SYSTEM_SCORE_ADDRESS
@@ -40,6 +43,7 @@ from .base.exception import (
     DatabaseException,
     InvalidBalanceException,
     InvalidParamsException,
+    InvalidRequestException,
 )
 from .base.message import Message
 from .base.transaction import Transaction
@@ -49,13 +53,14 @@ from .database.factory import ContextDatabaseFactory
 from .database.wal import WriteAheadLogReader, WALDBType
 from .database.wal import WriteAheadLogWriter, IissWAL, StateWAL, WALState
 from .deploy import DeployEngine, DeployStorage
+from .deploy.score_package_store import ScorePackageStore
 from .fee import FeeEngine, FeeStorage, DepositHandler
 from .icon_constant import (
     ICON_DEX_DB_NAME, IconServiceFlag, ConfigKey,
     Revision, BASE_TRANSACTION_INDEX,
     IISS_DB, STEP_LOG_TAG, BlockVoteStatus, WAL_LOG_TAG, ROLLBACK_LOG_TAG,
     BLOCK_INVOKE_TIMEOUT_S, RevisionChangedFlag, RPCMethod,
-    DataType
+    DataType, EVENT_LOG_QUERY_LIMIT
 )
 from .iconscore.context.context import ContextContainer
 from .iconscore.icon_pre_validator import IconPreValidator
@@ -65,6 +70,7 @@ from .iconscore.icon_score_context_util import IconScoreContextUtil
 from .iconscore.icon_score_engine import IconScoreEngine
 from .iconscore.icon_score_event_log import EventLogEmitter
 from .iconscore.icon_score_mapper import IconScoreMapper
+from .iconscore.icon_score_resource import ScoreResourceAccountant, ScoreResourceTracker
 from .iconscore.icon_score_result import TransactionResult
 from .iconscore.icon_score_step import StepType, get_input_data_size, \
     get_deploy_content_size
@@ -78,6 +84,7 @@ from .icx.unstake_patcher import UnstakePatcher
 from .iiss import check_decentralization_condition
 from .iiss.engine import Engine as IISSEngine
 from .iiss.reward_calc import RewardCalcStorage
+from .iiss.reward_calc.finalizer import IissDBFinalizer
 from .iiss.reward_calc.storage import IissDBNameRefactor
 from .iiss.reward_calc.storage import RewardCalcDBInfo
 from .iiss.storage import Storage as IISSStorage
@@ -91,12 +98,15 @@ from .rollback.metadata import Metadata as RollbackMetadata
 from .utils import print_log_with_level
 from .utils import sha3_256, int_to_bytes, ContextEngine, ContextStorage
 from .utils import to_camel_case, bytes_to_hex
-from .utils.bloom import BloomFilter
+from .utils.bloom import BloomFilter, BLOOM_BITS_CACHE_SIZE, clear_bloom_bits_cache
 from .utils.timer import Timer
 from .utils.test_env import is_under_testing
 from .dosguard import DoSGuard
+from .event_log import EventLogStore
+from .metrics import Metrics, MetricsExporter, Phase, Counter, StartupPhase, StartupTimer
 
 if TYPE_CHECKING:
+    from .fee.deposit_index import DepositIndexContainer
     from .iconscore.icon_score_event_log import EventLog
     from .prep.data import Term
 
@@ -126,6 +136,10 @@ class IconServiceEngine(ContextContainer):
         self._wal_reader: Optional['WriteAheadLogReader'] = None
         self._backup_manager: Optional[BackupManager] = None
         self._backup_cleaner: Optional[BackupCleaner] = None
+        self._iiss_db_finalizer: Optional[IissDBFinalizer] = None
+        self._event_log_store: Optional[EventLogStore] = None
+        self._score_resource_accountant: Optional[ScoreResourceAccountant] = None
+        self._score_warm_up: Optional[IconScoreWarmUp] = None
         self._conf: Optional[Dict[str, Union[str, int]]] = None
         self._block_invoke_timeout_s: int = BLOCK_INVOKE_TIMEOUT_S
         self._log_dir: str = "."
@@ -139,18 +153,33 @@ class IconServiceEngine(ContextContainer):
             RPCMethod.ICX_CALL: self._handle_icx_call,
             RPCMethod.DEBUG_ESTIMATE_STEP: self._handle_estimate_step,
             RPCMethod.ICX_SEND_TRANSACTION: self._handle_icx_send_transaction,
-            RPCMethod.DEBUG_GET_ACCOUNT: self._handle_debug_get_account
+            RPCMethod.DEBUG_GET_ACCOUNT: self._handle_debug_get_account,
+            RPCMethod.ISE_GET_EVENT_LOGS: self._handle_ise_get_event_logs,
+            RPCMethod.ISE_GET_METRICS: self._handle_ise_get_metrics,
+            RPCMethod.DEBUG_GET_SCORE_RESOURCES: self._handle_debug_get_score_resources
         }
 
         self._precommit_data_manager = PrecommitDataManager()
         self._precommit_data_writer: Optional['PrecommitDataWriter'] = None
         self.dos_guard: Optional[DoSGuard] = None
+        self._metrics = Metrics()
+        self._metrics_exporter: Optional[MetricsExporter] = None
+        self._startup_timer = StartupTimer()
+
+    @property
+    def metrics(self) -> 'Metrics':
+        return self._metrics
+
+    @property
+    def startup_timer(self) -> 'StartupTimer':
+        return self._startup_timer
 
     def open(self, conf: dict):
         """Get necessary parameters and initialize diverse objects
 
         :param conf:
         """
+        startup_timer = self._startup_timer = StartupTimer()
 
         service_config_flag = self._make_service_flag(conf[ConfigKey.SERVICE])
         score_root_path: str = conf[ConfigKey.SCORE_ROOT_PATH].rstrip('/')
@@ -168,7 +197,8 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(backup_root_path, exist_ok=True)
 
         # Share one context db with all SCORE
-        ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
+        with startup_timer.measure(StartupPhase.OPEN_DB):
+            ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
         self._state_db_root_path = state_db_root_path
         self._rc_data_path = rc_data_path
         self._backup_root_path = backup_root_path
@@ -178,11 +208,27 @@ class IconServiceEngine(ContextContainer):
 
         self._deposit_handler = DepositHandler()
         self._icon_pre_validator = IconPreValidator()
-        self._backup_manager = BackupManager(backup_root_path, rc_data_path)
-        self._backup_cleaner = BackupCleaner(backup_root_path, conf[ConfigKey.BACKUP_FILES])
+        self._backup_manager = BackupManager(backup_root_path,
+                                             rc_data_path,
+                                             compression=conf[ConfigKey.BACKUP_COMPRESSION],
+                                             segment_size=conf[ConfigKey.BACKUP_SEGMENT_SIZE])
+        self._backup_cleaner = BackupCleaner(backup_root_path,
+                                             conf[ConfigKey.BACKUP_FILES],
+                                             segment_size=conf[ConfigKey.BACKUP_SEGMENT_SIZE])
+        self._iiss_db_finalizer = IissDBFinalizer()
+        if conf[ConfigKey.EVENT_LOG_STORE]:
+            self._event_log_store = EventLogStore(os.path.join(state_db_root_path, EventLogStore.DIR_NAME))
+        score_resource_conf: dict = conf[ConfigKey.SCORE_RESOURCE]
+        if score_resource_conf[ConfigKey.ENABLE]:
+            self._score_resource_accountant = ScoreResourceAccountant(
+                recent_blocks=score_resource_conf[ConfigKey.SCORE_RESOURCE_RECENT_BLOCKS],
+                dump_path=score_resource_conf[ConfigKey.SCORE_RESOURCE_DUMP_PATH])
 
         IconScoreClassLoader.init(score_root_path)
         IconScoreContext.score_root_path = score_root_path
+        if conf[ConfigKey.SCORE_PACKAGE_STORE]:
+            IconScoreContext.score_package_store = ScorePackageStore(score_root_path)
+            IconScoreContext.score_package_store.open()
         IconScoreContext.icon_score_mapper = IconScoreMapper(is_threadsafe=True)
         IconScoreContext.icon_service_flag = service_config_flag
         IconScoreContext.legacy_tbears_mode = conf[ConfigKey.TBEARS_MODE]
@@ -198,17 +244,24 @@ class IconServiceEngine(ContextContainer):
         self._init_component_context()
 
         # Recover incomplete state on wal and rollback process
-        self._recover_dbs(rc_data_path)
+        with startup_timer.measure(StartupPhase.RECOVER_DBS):
+            self._recover_dbs(rc_data_path)
 
         # load last_block_info
         context = IconScoreContext(IconScoreContextType.DIRECT)
-        self._init_last_block_info(context)
+        with startup_timer.measure(StartupPhase.LOAD_LAST_BLOCK):
+            self._init_last_block_info(context)
+
+        if self._event_log_store is not None:
+            with startup_timer.measure(StartupPhase.OPEN_EVENT_LOG_STORE):
+                self._event_log_store.open(context.block.height if context.block else -1)
 
         # Remove revision from iiss_rc_db name
         IissDBNameRefactor.run(self._rc_data_path)
 
-        # Clean up stale backup files
-        self._backup_cleaner.run_on_init(context.block.height)
+        # Clean up stale backup files in background
+        self._backup_cleaner.start()
+        self._backup_cleaner.put_on_init(context.block.height)
 
         self._open_component_context(context,
                                      log_dir,
@@ -216,34 +269,105 @@ class IconServiceEngine(ContextContainer):
                                      rc_socket_path,
                                      conf[ConfigKey.IISS_META_DATA],
                                      conf[ConfigKey.IISS_CALCULATE_PERIOD],
-                                     conf[ConfigKey.TERM_PERIOD],
-                                     conf[ConfigKey.INITIAL_IREP],
                                      conf[ConfigKey.PREP_REGISTRATION_FEE],
-                                     conf[ConfigKey.PENALTY_GRACE_PERIOD],
-                                     conf[ConfigKey.LOW_PRODUCTIVITY_PENALTY_THRESHOLD],
-                                     conf[ConfigKey.BLOCK_VALIDATION_PENALTY_THRESHOLD],
                                      conf[ConfigKey.IPC_TIMEOUT],
                                      conf[ConfigKey.ICON_RC_DIR_PATH],
-                                     conf[ConfigKey.ICON_RC_MONITOR])
-
-        self._load_builtin_scores(context,
-                                  Address.from_string(conf[ConfigKey.BUILTIN_SCORE_OWNER]))
+                                     conf[ConfigKey.ICON_RC_MONITOR],
+                                     startup_timer)
+
+        # P-Reps are loaded in another thread while builtin SCOREs, revisions and active SCOREs are loaded
+        # because none of them depends on P-Reps
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="PRepLoader") as executor:
+            prep_future = executor.submit(self._open_prep_engine,
+                                          context.block,
+                                          conf[ConfigKey.TERM_PERIOD],
+                                          conf[ConfigKey.INITIAL_IREP],
+                                          conf[ConfigKey.PENALTY_GRACE_PERIOD],
+                                          conf[ConfigKey.LOW_PRODUCTIVITY_PENALTY_THRESHOLD],
+                                          conf[ConfigKey.BLOCK_VALIDATION_PENALTY_THRESHOLD],
+                                          startup_timer)
+
+            with startup_timer.measure(StartupPhase.LOAD_BUILTIN_SCORES):
+                self._load_builtin_scores(context,
+                                          Address.from_string(conf[ConfigKey.BUILTIN_SCORE_OWNER]))
+
+            with startup_timer.measure(StartupPhase.LOAD_INV):
+                context.engine.inv.load_inv_container(context)
+
+            self._set_block_invoke_timeout(conf)
+
+            self.dos_guard = DoSGuard(
+                reset_time=conf[ConfigKey.DOS_GUARD][ConfigKey.RESET_TIME],
+                threshold=conf[ConfigKey.DOS_GUARD][ConfigKey.THRESHOLD],
+                ban_time=conf[ConfigKey.DOS_GUARD][ConfigKey.BAN_TIME],
+                score_threshold=conf[ConfigKey.DOS_GUARD][ConfigKey.SCORE_THRESHOLD],
+                method_threshold=conf[ConfigKey.DOS_GUARD][ConfigKey.METHOD_THRESHOLD],
+                max_entries=conf[ConfigKey.DOS_GUARD][ConfigKey.MAX_ENTRIES]
+            )
 
-        context.engine.inv.load_inv_container(context)
+            self._open_metrics(conf[ConfigKey.METRICS])
 
-        self._set_block_invoke_timeout(conf)
+            score_warm_up_conf: dict = conf[ConfigKey.SCORE_WARM_UP]
+            if score_warm_up_conf[ConfigKey.ENABLE]:
+                self._score_warm_up = IconScoreWarmUp(
+                    os.path.join(state_db_root_path, IconScoreWarmUp.FILE_NAME),
+                    max_scores=score_warm_up_conf[ConfigKey.SCORE_WARM_UP_MAX_SCORES],
+                    workers=score_warm_up_conf[ConfigKey.SCORE_WARM_UP_WORKERS])
+                with startup_timer.measure(StartupPhase.SCORE_WARM_UP):
+                    self._warm_up_scores(context)
 
-        self.dos_guard = DoSGuard(
-            reset_time=conf[ConfigKey.DOS_GUARD][ConfigKey.RESET_TIME],
-            threshold=conf[ConfigKey.DOS_GUARD][ConfigKey.THRESHOLD],
-            ban_time=conf[ConfigKey.DOS_GUARD][ConfigKey.BAN_TIME]
-        )
+            prep_future.result()
 
         # DO NOT change the values in conf
         self._conf = conf
         self._precommit_data_writer = PrecommitDataWriter(log_dir)
         self._log_dir = log_dir
 
+        startup_timer.mark(StartupPhase.OPEN)
+        Logger.info(tag=_TAG, msg=f"Startup phases(us): {startup_timer.to_dict()}")
+
+    @staticmethod
+    def _open_prep_engine(block: 'Block',
+                          term_period: int,
+                          irep: int,
+                          penalty_grace_period: int,
+                          low_productivity_penalty_threshold: int,
+                          block_validation_penalty_threshold: int,
+                          startup_timer: 'StartupTimer'):
+        """Loads P-Reps and the current term from state db
+
+        It is called on another thread than the one opening the others, so it has its own context
+        """
+        context = IconScoreContext(IconScoreContextType.DIRECT)
+        context.block = block
+
+        with startup_timer.measure(StartupPhase.LOAD_PREPS):
+            IconScoreContext.engine.prep.open(context,
+                                              term_period,
+                                              irep,
+                                              penalty_grace_period,
+                                              low_productivity_penalty_threshold,
+                                              block_validation_penalty_threshold)
+
+    def _warm_up_scores(self, context: 'IconScoreContext'):
+        try:
+            self._push_context(context)
+            self._score_warm_up.run(context, self._metrics)
+        finally:
+            self._pop_context()
+
+    def _open_metrics(self, conf: dict):
+        self._metrics = Metrics(enable=conf[ConfigKey.ENABLE], startup_timer=self._startup_timer)
+
+        port: int = conf[ConfigKey.METRICS_PORT]
+        file_path: str = conf[ConfigKey.METRICS_FILE_PATH]
+        if self._metrics.enable and (port > 0 or file_path):
+            self._metrics_exporter = MetricsExporter(self._metrics,
+                                                     port=port,
+                                                     file_path=file_path,
+                                                     interval=conf[ConfigKey.METRICS_FILE_INTERVAL])
+            self._metrics_exporter.start()
+
     def _init_component_context(self):
         engine: 'ContextEngine' = ContextEngine(deploy=DeployEngine(),
                                                 fee=FeeEngine(),
@@ -279,44 +403,42 @@ class IconServiceEngine(ContextContainer):
                                 rc_socket_path: str,
                                 iiss_meta_data: dict,
                                 calc_period: int,
-                                term_period: int,
-                                irep: int,
                                 prep_reg_fee: int,
-                                penalty_grace_period: int,
-                                low_productivity_penalty_threshold: int,
-                                block_validation_penalty_threshold: int,
                                 ipc_timeout: int,
                                 icon_rc_path: str,
-                                icon_rc_monitor: bool):
+                                icon_rc_monitor: bool,
+                                startup_timer: 'StartupTimer'):
+        """Opens storages and engines except prep engine which is opened by _open_prep_engine()
+        """
         # storages MUST be prepared prior to engines because engines use them on open()
-        IconScoreContext.storage.deploy.open(context)
-        IconScoreContext.storage.fee.open(context)
-        IconScoreContext.storage.icx.open(context)
-        IconScoreContext.storage.iiss.open(context, iiss_meta_data, calc_period)
-        IconScoreContext.storage.prep.open(context, prep_reg_fee)
-        IconScoreContext.storage.issue.open(context)
-        IconScoreContext.storage.meta.open(context)
-        IconScoreContext.storage.rc.open(context, rc_data_path)
-        IconScoreContext.storage.inv.open(context)
-
-        IconScoreContext.engine.deploy.open(context)
-        IconScoreContext.engine.fee.open(context)
-        IconScoreContext.engine.icx.open(context)
-        IconScoreContext.engine.iiss.open(context,
-                                          log_dir,
-                                          rc_data_path,
-                                          rc_socket_path,
-                                          ipc_timeout,
-                                          icon_rc_path,
-                                          icon_rc_monitor)
-        IconScoreContext.engine.prep.open(context,
-                                          term_period,
-                                          irep,
-                                          penalty_grace_period,
-                                          low_productivity_penalty_threshold,
-                                          block_validation_penalty_threshold)
-        IconScoreContext.engine.issue.open(context)
-        IconScoreContext.engine.inv.open(context)
+        with startup_timer.measure(StartupPhase.OPEN_STORAGES):
+            IconScoreContext.storage.deploy.open(context)
+            IconScoreContext.storage.fee.open(context)
+            IconScoreContext.storage.icx.open(context)
+            IconScoreContext.storage.iiss.open(context, iiss_meta_data, calc_period)
+            IconScoreContext.storage.prep.open(context, prep_reg_fee)
+            IconScoreContext.storage.issue.open(context)
+            IconScoreContext.storage.meta.open(context)
+            IconScoreContext.storage.rc.open(context, rc_data_path)
+            IconScoreContext.storage.inv.open(context)
+
+        # The reward calculator is launched prior to the other engines
+        # so that it starts up while the others are being loaded
+        with startup_timer.measure(StartupPhase.LAUNCH_RC):
+            IconScoreContext.engine.iiss.open(context,
+                                              log_dir,
+                                              rc_data_path,
+                                              rc_socket_path,
+                                              ipc_timeout,
+                                              icon_rc_path,
+                                              icon_rc_monitor)
+
+        with startup_timer.measure(StartupPhase.OPEN_ENGINES):
+            IconScoreContext.engine.deploy.open(context)
+            IconScoreContext.engine.fee.open(context)
+            IconScoreContext.engine.icx.open(context)
+            IconScoreContext.engine.issue.open(context)
+            IconScoreContext.engine.inv.open(context)
 
     @classmethod
     def _close_component_context(cls, context: 'IconScoreContext'):
@@ -374,17 +496,42 @@ class IconServiceEngine(ContextContainer):
         """Free all resources occupied by IconServiceEngine
         including db, memory and so on
         """
+        # Wait for iiss_db finalization before closing rc_db
+        if self._iiss_db_finalizer is not None:
+            self._iiss_db_finalizer.close()
+            self._iiss_db_finalizer = None
+
+        # Write the event logs of the blocks committed already
+        if self._event_log_store is not None:
+            self._event_log_store.close()
+            self._event_log_store = None
+
+        if self._backup_cleaner is not None:
+            self._backup_cleaner.close()
+
+        if self._metrics_exporter is not None:
+            self._metrics_exporter.stop()
+            self._metrics_exporter = None
+
         context = IconScoreContext(IconScoreContextType.DIRECT)
         context.block = self._precommit_data_manager.last_block
         try:
             self._push_context(context)
 
+            if self._score_warm_up is not None:
+                self._score_warm_up.save(IconScoreContext.icon_score_mapper)
+                self._score_warm_up = None
+
             IconScoreContext.icon_score_mapper.close()
             IconScoreContext.icon_score_mapper = None
 
             self._close_component_context(context)
 
             IconScoreClassLoader.close(context.score_root_path)
+
+            if IconScoreContext.score_package_store is not None:
+                IconScoreContext.score_package_store.close()
+                IconScoreContext.score_package_store = None
         finally:
             self._pop_context()
             ContextDatabaseFactory.close()
@@ -396,7 +543,9 @@ class IconServiceEngine(ContextContainer):
                prev_block_generator: Optional['Address'] = None,
                prev_block_validators: Optional[List['Address']] = None,
                prev_block_votes: Optional[List[Tuple['Address', int]]] = None,
-               is_block_editable: bool = False) -> Tuple[List['TransactionResult'], bytes, dict, Optional[dict], bool]:
+               is_block_editable: bool = False,
+               on_tx_result: Optional[Callable[['TransactionResult'], None]] = None) \
+            -> Tuple[List['TransactionResult'], bytes, dict, Optional[dict], bool]:
 
         """Process transactions in a block sent by loopchain
 
@@ -406,6 +555,7 @@ class IconServiceEngine(ContextContainer):
         :param prev_block_validators: previous block validators (legacy)
         :param prev_block_votes: previous block vote info
         :param is_block_editable: boolean which imply whether creating base transaction or not
+        :param on_tx_result: called with each tx_result as soon as its transaction is processed
         :return: (TransactionResult[], bytes, added transaction{}, main prep as dict{}, is_shutdown)
         """
         # If the block has already been processed,
@@ -422,8 +572,19 @@ class IconServiceEngine(ContextContainer):
                             msg=f"Block result already exists: \n"
                                 f"state_root_hash={bytes_to_hex(precommit_data.state_root_hash)}")
 
+            if on_tx_result is not None:
+                for tx_result in precommit_data.block_result:
+                    on_tx_result(tx_result)
+
+            self._metrics.increase(Counter.ALREADY_INVOKED_BLOCKS)
             return _get_invoke_result_from_precommit_data(precommit_data)
 
+        invoke_timer = Timer()
+        invoke_timer.start()
+
+        # CALCULATE for the previous calc period has to reach RC before START_BLOCK and CLAIM of this block
+        self._iiss_db_finalizer.wait()
+
         # Check for block validation before invoke
         self._precommit_data_manager.validate_block_to_invoke(block)
 
@@ -431,6 +592,9 @@ class IconServiceEngine(ContextContainer):
             IconScoreContextType.INVOKE,
             block=block,
             prev_block_batches=self._precommit_data_manager.get_block_batches(block.prev_hash))
+        if self._score_resource_accountant is not None:
+            context.resource_tracker = ScoreResourceTracker()
+        context.deposit_indices = self._get_deposit_indices(block.prev_hash).copy()
 
         # TODO: prev_block_votes must be support to low version about prev_block_validators by using meta storage.
         prev_block_votes: Optional[List[Tuple['Address', int]]] = \
@@ -446,16 +610,21 @@ class IconServiceEngine(ContextContainer):
 
         block_result = []
         added_transactions = {}
+        # Bloom filter of all event logs in a block made by OR-ing the ones of tx_results
+        # It is accumulated as int and converted to BloomFilter once after all txs
+        logs_bloom_value: int = 0
+        _clear_logs_bloom_cache()
 
         if not is_under_testing():
             IconScoreContext.engine.iiss.send_start_block(block.height, block.hash)
 
-        self._before_transaction_process(context,
-                                         is_block_editable,
-                                         tx_requests,
-                                         added_transactions,
-                                         prev_block_generator,
-                                         prev_block_votes)
+        with self._metrics.measure(Phase.BEFORE_TX):
+            self._before_transaction_process(context,
+                                             is_block_editable,
+                                             tx_requests,
+                                             added_transactions,
+                                             prev_block_generator,
+                                             prev_block_votes)
 
         if block.height == 0:
             # Assume that there is only one tx in genesis_block
@@ -463,6 +632,9 @@ class IconServiceEngine(ContextContainer):
             block_result.append(tx_result)
             context.block_batch.update(context.tx_batch)
             context.tx_batch.clear()
+
+            if on_tx_result is not None:
+                on_tx_result(tx_result)
         else:
             one_tx_timer = Timer()
             tx_timer = Timer()
@@ -492,7 +664,12 @@ class IconServiceEngine(ContextContainer):
 
                 self._log_step_trace(context)
                 block_result.append(tx_result)
-                context.update_batch()
+                if tx_result.logs_bloom is not None:
+                    logs_bloom_value |= int(tx_result.logs_bloom)
+                if tx_result.status == TransactionResult.FAILURE:
+                    self._metrics.increase(Counter.FAILED_TRANSACTIONS)
+                with self._metrics.measure(Phase.TX_BATCH_UPDATE):
+                    context.update_batch()
 
                 # for migration governance SCORE
                 context.engine.inv.update_inv_container_by_result(context, tx_result)
@@ -515,6 +692,9 @@ class IconServiceEngine(ContextContainer):
                 else:
                     method: str = "NOT_CALL_DATA_TYPE"
 
+                tx_duration: float = one_tx_timer.duration
+                self._metrics.observe(Phase.TX, tx_duration)
+
                 Logger.info(
                     tag=_TAG,
                     msg=f"TX_END: "
@@ -522,11 +702,16 @@ class IconServiceEngine(ContextContainer):
                         f"txIndex={tx_result.tx_index} "
                         f"to={tx_result.to} "
                         f"method={method} "
-                        f"duration={one_tx_timer.duration}"
+                        f"duration={tx_duration}"
                 )
 
                 Logger.debug(tag=_TAG, msg=f"INVOKE txResult: {tx_result}")
 
+                if on_tx_result is not None:
+                    on_tx_result(tx_result)
+
+        logs_bloom = BloomFilter(logs_bloom_value)
+
         if self._check_end_block_height_of_calc(context):
             context.revision_changed_flag |= RevisionChangedFlag.IISS_CALC
             if check_decentralization_condition(context):
@@ -538,34 +723,52 @@ class IconServiceEngine(ContextContainer):
                 # change the reward calculation period from 43200 to 43120 which is the same as term_period
                 context.storage.iiss.put_calc_period(context, context.term_period)
 
-        next_preps, term, rc_state_hash = self._after_transaction_process(context,
-                                                                          rc_db_revision,
-                                                                          prev_block_generator,
-                                                                          prev_block_votes)
+        with self._metrics.measure(Phase.AFTER_TX):
+            next_preps, term, rc_state_hash = self._after_transaction_process(context,
+                                                                              rc_db_revision,
+                                                                              prev_block_generator,
+                                                                              prev_block_votes)
 
         # Save precommit data
         # It will be written to levelDB on commit
-        precommit_data = PrecommitData(context.revision,
-                                       rc_db_revision,
-                                       context.inv_container,
-                                       context.block_batch,
-                                       block_result,
-                                       context.rc_block_batch,
-                                       context.preps,
-                                       term,
-                                       prev_block_generator,
-                                       prev_block_validators,
-                                       context.new_icon_score_mapper,
-                                       rc_state_hash,
-                                       added_transactions,
-                                       next_preps,
-                                       context.prep_address_converter,
-                                       context.is_shutdown())
-        if context.precommitdata_log_flag:
-            Logger.info(tag=_TAG, msg=f"Created precommit_data: \n{precommit_data}")
-        self._precommit_data_manager.push(precommit_data)
+        with self._metrics.measure(Phase.PRECOMMIT):
+            precommit_data = PrecommitData(context.revision,
+                                           rc_db_revision,
+                                           context.inv_container,
+                                           context.block_batch,
+                                           block_result,
+                                           context.rc_block_batch,
+                                           context.preps,
+                                           term,
+                                           prev_block_generator,
+                                           prev_block_validators,
+                                           context.new_icon_score_mapper,
+                                           rc_state_hash,
+                                           added_transactions,
+                                           next_preps,
+                                           context.prep_address_converter,
+                                           context.is_shutdown(),
+                                           logs_bloom,
+                                           context.resource_tracker,
+                                           context.deposit_indices)
+            if context.precommitdata_log_flag:
+                Logger.info(tag=_TAG, msg=f"Created precommit_data: \n{precommit_data}")
+            self._precommit_data_manager.push(precommit_data)
+
+        self._metrics.observe(Phase.INVOKE, invoke_timer.duration)
         return _get_invoke_result_from_precommit_data(precommit_data)
 
+    def _get_deposit_indices(self, prev_block_hash: bytes) -> 'DepositIndexContainer':
+        """Returns the deposit indices of SCOREs after the previous block
+
+        The previous block is either the last committed block or a block which has been invoked but not committed
+        """
+        precommit_data: Optional['PrecommitData'] = self._precommit_data_manager.get(prev_block_hash)
+        if precommit_data is not None and precommit_data.deposit_indices is not None:
+            return precommit_data.deposit_indices
+
+        return IconScoreContext.engine.fee.deposit_indices
+
     @classmethod
     def _get_rc_db_revision_before_process_transactions(cls, context: 'IconScoreContext') -> int:
 
@@ -1133,39 +1336,76 @@ class IconServiceEngine(ContextContainer):
         """
         assert self._get_context_stack_size() == 0
 
-        method = request['method']
-        assert method in ('icx_sendTransaction', 'debug_estimateStep')
-        assert 'params' in request
+        context = self._context_factory.create(IconScoreContextType.QUERY, self._get_last_block())
+        context.set_step_counter()
 
-        params: dict = request['params']
-        to: 'Address' = params.get('to')
+        try:
+            self._push_context(context)
+            self._validate_transaction(context, request, origin_request)
+        finally:
+            self._pop_context()
+
+    def validate_transactions(self,
+                              requests: List[dict],
+                              origin_requests: List[dict]) -> List[Optional[BaseException]]:
+        """Validate a batch of JSON-RPC transaction requests
+        before putting them into transaction pool
+
+        All requests are validated with one context on the last block
+        and share the balances and SCORE states read while validating them.
+        Each request gets the same result as it is validated with validate_transaction()
+
+        :param requests: JSON-RPC requests converted to original format
+        :param origin_requests: JSON-RPC original requests in the same order as requests
+        :return: the exception raised on validating each request or None if the request is valid
+        """
+        assert self._get_context_stack_size() == 0
+        assert len(requests) == len(origin_requests)
 
         context = self._context_factory.create(IconScoreContextType.QUERY, self._get_last_block())
         context.set_step_counter()
 
-        origin_params = origin_request['params']
+        errors: List[Optional[BaseException]] = []
 
         try:
             self._push_context(context)
 
-            step_price: int = context.step_counter.step_price
-            minimum_step: int = context.inv_container.step_costs.get(StepType.DEFAULT, 0)
+            with self._icon_pre_validator.batch():
+                for request, origin_request in zip(requests, origin_requests):
+                    try:
+                        self._validate_transaction(context, request, origin_request)
+                        errors.append(None)
+                    except (IconServiceBaseException, Exception) as e:
+                        errors.append(e)
+        finally:
+            self._pop_context()
 
-            if 'data' in params:
-                # minimum_step is the sum of
-                # default STEP cost and input STEP costs if data field exists
-                data = params['data']
-                input_size = get_input_data_size(context.revision, data)
-                minimum_step += input_size * context.inv_container.step_costs.get(StepType.INPUT, 0)
-            self._icon_pre_validator.origin_request_execute(origin_params, context.revision)
-            self._icon_pre_validator.execute(context, params, step_price, minimum_step)
+        return errors
 
-            if to.is_contract:
-                # SCORE updating is not blocked by SCORE blacklist
-                IconScoreContextUtil.validate_score_blacklist(context, to)
+    def _validate_transaction(self, context: 'IconScoreContext', request: dict, origin_request: dict):
+        method = request['method']
+        assert method in ('icx_sendTransaction', 'debug_estimateStep')
+        assert 'params' in request
 
-        finally:
-            self._pop_context()
+        params: dict = request['params']
+        to: 'Address' = params.get('to')
+        origin_params = origin_request['params']
+
+        step_price: int = context.step_counter.step_price
+        minimum_step: int = context.inv_container.step_costs.get(StepType.DEFAULT, 0)
+
+        if 'data' in params:
+            # minimum_step is the sum of
+            # default STEP cost and input STEP costs if data field exists
+            data = params['data']
+            input_size = get_input_data_size(context.revision, data)
+            minimum_step += input_size * context.inv_container.step_costs.get(StepType.INPUT, 0)
+        self._icon_pre_validator.origin_request_execute(origin_params, context.revision)
+        self._icon_pre_validator.execute(context, params, step_price, minimum_step)
+
+        if to.is_contract:
+            # SCORE updating is not blocked by SCORE blacklist
+            IconScoreContextUtil.validate_score_blacklist(context, to)
 
     def _call(self,
               context: 'IconScoreContext',
@@ -1287,12 +1527,13 @@ class IconServiceEngine(ContextContainer):
             context.func_type = IconScoreFuncType.WRITABLE
 
             # Charge a fee to from account
-            step_used_details, final_step_price = \
-                self._charge_transaction_fee(
-                    context,
-                    params,
-                    tx_result.status,
-                    context.step_counter.step_used)
+            with self._get_tx_metrics(context).measure(Phase.TX_FEE_CHARGE):
+                step_used_details, final_step_price = \
+                    self._charge_transaction_fee(
+                        context,
+                        params,
+                        tx_result.status,
+                        context.step_counter.step_used)
 
             # Finalize tx_result
             tx_result.step_price = final_step_price
@@ -1329,32 +1570,40 @@ class IconServiceEngine(ContextContainer):
 
         :param params: JSON-RPC params
         """
-        # Checks the balance only on the invoke context(skip estimate context)
-        if context.type == IconScoreContextType.INVOKE:
-            tmp_context: 'IconScoreContext' = IconScoreContext(IconScoreContextType.QUERY)
-            tmp_context.block = self._get_last_block()
-            # Check if from account can charge a tx fee
-            self._icon_pre_validator.execute_to_check_out_of_balance(
-                context if context.revision >= Revision.THREE.value else tmp_context,
-                params,
-                step_price=context.step_counter.step_price)
-
-        # Every send_transaction are calculated DEFAULT STEP at first
-        context.step_counter.apply_step(StepType.DEFAULT, 1)
-        input_size = get_input_data_size(context.revision, params.get('data', None))
-        context.step_counter.apply_step(StepType.INPUT, input_size)
+        metrics: 'Metrics' = self._get_tx_metrics(context)
+
+        with metrics.measure(Phase.TX_PRE_VALIDATION):
+            # Checks the balance only on the invoke context(skip estimate context)
+            if context.type == IconScoreContextType.INVOKE:
+                tmp_context: 'IconScoreContext' = IconScoreContext(IconScoreContextType.QUERY)
+                tmp_context.block = self._get_last_block()
+                # Check if from account can charge a tx fee
+                self._icon_pre_validator.execute_to_check_out_of_balance(
+                    context if context.revision >= Revision.THREE.value else tmp_context,
+                    params,
+                    step_price=context.step_counter.step_price)
 
-        to: Address = params['to']
-        data_type: Optional[str] = params.get('dataType')
+            # Every send_transaction are calculated DEFAULT STEP at first
+            context.step_counter.apply_step(StepType.DEFAULT, 1)
+            input_size = get_input_data_size(context.revision, params.get('data', None))
+            context.step_counter.apply_step(StepType.INPUT, input_size)
 
-        self._validate_data_type(context, to, data_type)
+            to: Address = params['to']
+            data_type: Optional[str] = params.get('dataType')
 
-        # Can't transfer ICX to system SCORE
-        if data_type in (None, DataType.CALL, DataType.MESSAGE):
-            self._transfer_coin(context, params)
+            self._validate_data_type(context, to, data_type)
 
-        if to.is_contract:
-            tx_result.score_address = self._handle_score_invoke(context, to, params)
+        with metrics.measure(Phase.TX_EXECUTION):
+            # Can't transfer ICX to system SCORE
+            if data_type in (None, DataType.CALL, DataType.MESSAGE):
+                self._transfer_coin(context, params)
+
+            if to.is_contract:
+                tx_result.score_address = self._handle_score_invoke(context, to, params)
+
+    def _get_tx_metrics(self, context: 'IconScoreContext') -> 'Metrics':
+        # Transactions are measured only when a block is invoked, not on step estimation
+        return self._metrics if context.type == IconScoreContextType.INVOKE else _NO_METRICS
 
     def _validate_data_type(
             self, context: 'IconScoreContext', to: 'Address', data_type: Optional[str]
@@ -1555,9 +1804,9 @@ class IconServiceEngine(ContextContainer):
         logs_bloom = BloomFilter()
 
         for event_log in event_logs:
-            logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+            logs_bloom.add(_get_ordered_bytes_for_bloom(0xff, event_log.score_address))
             for i, indexed_item in enumerate(event_log.indexed):
-                indexed_bytes = EventLogEmitter.get_ordered_bytes(i, indexed_item)
+                indexed_bytes = _get_ordered_bytes_for_bloom(i, indexed_item)
                 logs_bloom.add(indexed_bytes)
 
         return logs_bloom
@@ -1584,8 +1833,70 @@ class IconServiceEngine(ContextContainer):
         if not bool(params) or params.get('filter'):
             last_block_status = self._make_last_block_status()
             response['lastBlock'] = last_block_status
+        if not bool(params) or 'iscoreCache' in params.get('filter', ()):
+            response['iscoreCache'] = IconScoreContext.engine.iiss.get_iscore_cache_status()
+        if not bool(params) or 'iissDBFinalizer' in params.get('filter', ()):
+            response['iissDBFinalizer'] = self._iiss_db_finalizer.get_status()
+        if self._event_log_store is not None and (not bool(params) or 'eventLogStore' in params.get('filter', ())):
+            response['eventLogStore'] = self._event_log_store.get_status()
+        if self.dos_guard is not None and (not bool(params) or 'dosGuard' in params.get('filter', ())):
+            response['dosGuard'] = self.dos_guard.get_status()
+        if self._backup_cleaner is not None and (not bool(params) or 'backupCleaner' in params.get('filter', ())):
+            response['backupCleaner'] = self._backup_cleaner.get_status()
         return response
 
+    def _handle_ise_get_event_logs(self, _context: 'IconScoreContext', params: dict) -> List[dict]:
+        """Returns the event logs in committed blocks which are matched with a given filter
+
+        :param _context:
+        :param params: fromBlock, toBlock, scoreAddress, event, arg, limit
+        :return: event logs
+        """
+        if self._event_log_store is None:
+            raise InvalidRequestException("Event log store is disabled")
+
+        params = params if params else {}
+        for key in (ConstantKeys.FROM_BLOCK, ConstantKeys.TO_BLOCK):
+            if not isinstance(params.get(key), int):
+                raise InvalidParamsException(f"Invalid params: {key}")
+
+        return self._event_log_store.get_event_logs(
+            from_block=params[ConstantKeys.FROM_BLOCK],
+            to_block=params[ConstantKeys.TO_BLOCK],
+            score_address=params.get(ConstantKeys.SCORE_ADDRESS),
+            event=params.get(ConstantKeys.EVENT),
+            arg=params.get(ConstantKeys.ARG),
+            limit=params.get(ConstantKeys.LIMIT, EVENT_LOG_QUERY_LIMIT))
+
+    def _handle_ise_get_metrics(self, _context: 'IconScoreContext', params: dict) -> dict:
+        """Returns the counters and latency histograms of the phases of invoke and commit
+        and the durations of the startup phases
+
+        :param _context:
+        :param params: filter: phases to return
+        :return: durations are in microseconds
+        """
+        return self._metrics.get_metrics(params.get(ConstantKeys.FILTER) if params else None)
+
+    def _handle_debug_get_score_resources(self, _context: 'IconScoreContext', params: dict) -> dict:
+        """Returns wall time, steps, DB accesses and event logs of each SCORE method
+
+        :param _context:
+        :param params: blockHeight: one of recent blocks, the sum of committed blocks without it
+                       scoreAddress: SCORE to return
+        :return: times are in microseconds
+        """
+        if self._score_resource_accountant is None:
+            raise InvalidRequestException("SCORE resource accounting is disabled")
+
+        params = params if params else {}
+        block_height: Optional[int] = params.get(ConstantKeys.BLOCK_HEIGHT)
+        try:
+            return self._score_resource_accountant.get_usages(block_height=block_height,
+                                                              score_address=params.get(ConstantKeys.SCORE_ADDRESS))
+        except KeyError:
+            raise InvalidParamsException(f"SCORE resource usages not found: blockHeight={block_height}")
+
     def _make_last_block_status(self) -> Optional[dict]:
         block = self._get_last_block()
         if block is None:
@@ -1627,54 +1938,96 @@ class IconServiceEngine(ContextContainer):
 
         context = self._context_factory.create(IconScoreContextType.DIRECT, block=precommit_data.block)
 
-        if precommit_data.revision < Revision.IISS.value:
-            self._commit_before_iiss(context, precommit_data)
-        else:
-            self._commit_after_iiss(context, precommit_data, instant_block_hash)
+        with self._metrics.measure(Phase.COMMIT):
+            if precommit_data.revision < Revision.IISS.value:
+                self._commit_before_iiss(context, precommit_data)
+            else:
+                self._commit_after_iiss(context, precommit_data, instant_block_hash)
+
+        # Event logs are written in background after the block is committed
+        if self._event_log_store is not None:
+            self._event_log_store.put(precommit_data.block, precommit_data.block_result, precommit_data.logs_bloom)
+
+        if self._score_resource_accountant is not None and precommit_data.resource_tracker is not None:
+            self._score_resource_accountant.commit(precommit_data.block, precommit_data.resource_tracker)
 
     def _commit_before_iiss(self, context: 'IconScoreContext', precommit_data: 'PrecommitData'):
         state_wal: 'StateWAL' = StateWAL(precommit_data.block_batch)
-        self._process_state_commit(context, precommit_data, state_wal)
+        with self._metrics.measure(Phase.STATE_DB_WRITE):
+            self._process_state_commit(context, precommit_data, state_wal)
 
     def _commit_after_iiss(self,
                            context: 'IconScoreContext',
                            precommit_data: 'PrecommitData',
                            instant_block_hash: bytes):
+        # rc_db and WAL file are not available until iiss_db of the previous calc period is finalized
+        self._iiss_db_finalizer.wait()
+
         # Check if this block is the start block of a calculation period
         start_calc_block_height: int = context.engine.iiss.get_start_block_of_calc(context)
         is_calc_period_start_block: bool = context.block.height == start_calc_block_height
 
-        wal_writer, state_wal, iiss_wal = \
-            self._process_wal(context, precommit_data, is_calc_period_start_block, instant_block_hash)
-        wal_writer.flush()
+        with self._metrics.measure(Phase.WAL_WRITE):
+            wal_writer, state_wal, iiss_wal = \
+                self._process_wal(context, precommit_data, is_calc_period_start_block, instant_block_hash)
+        self._flush_write_ahead_log(wal_writer)
 
         # Backup the previous block state
-        self._backup_manager.run(
-            icx_db=self._icx_context_db.key_value_db,
-            rc_db=context.storage.rc.key_value_db,
-            revision=context.revision,
-            prev_block=self._get_last_block(),
-            block_batch=precommit_data.block_batch,
-            iiss_wal=iiss_wal,
-            is_calc_period_start_block=is_calc_period_start_block,
-            instant_block_hash=instant_block_hash)
-
-        # Clean up the oldest backup file
-        self._backup_cleaner.run_on_commit(context.block.height)
+        with self._metrics.measure(Phase.BACKUP):
+            self._backup_manager.run(
+                icx_db=self._icx_context_db.key_value_db,
+                rc_db=context.storage.rc.key_value_db,
+                revision=context.revision,
+                prev_block=self._get_last_block(),
+                block_batch=precommit_data.block_batch,
+                iiss_wal=iiss_wal,
+                is_calc_period_start_block=is_calc_period_start_block,
+                instant_block_hash=instant_block_hash)
+
+        # Clean up the oldest backup files in background
+        self._backup_cleaner.put_on_commit(context.block.height)
 
         # Write iiss_wal to rc_db
-        standby_db_info: Optional['RewardCalcDBInfo'] = \
-            self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
+        with self._metrics.measure(Phase.RC_DB_WRITE):
+            standby_db_info: Optional['RewardCalcDBInfo'] = \
+                self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
         wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
-        wal_writer.flush()
+        self._flush_write_ahead_log(wal_writer)
 
         # Write state_wal to state_db
-        self._process_state_commit(context, precommit_data, state_wal)
+        with self._metrics.measure(Phase.STATE_DB_WRITE):
+            self._process_state_commit(context, precommit_data, state_wal)
         wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
-        wal_writer.flush()
+        self._flush_write_ahead_log(wal_writer)
 
         # send IPC
-        self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
+        with self._metrics.measure(Phase.RC_IPC):
+            self._process_ipc(context, wal_writer, precommit_data, instant_block_hash)
+
+        if standby_db_info is None:
+            self._close_write_ahead_log(wal_writer)
+        else:
+            # Finalize iiss_db in background and send CALCULATE to RC after that
+            self._iiss_db_finalizer.run(standby_db_info,
+                                        context.storage.rc.key_value_db,
+                                        functools.partial(self._send_calculate, wal_writer))
+
+    def _flush_write_ahead_log(self, wal_writer: 'WriteAheadLogWriter'):
+        with self._metrics.measure(Phase.FSYNC):
+            wal_writer.flush()
+
+    def _send_calculate(self, wal_writer: 'WriteAheadLogWriter', iiss_db_path: str, calc_end_block_height: int):
+        """Called on IissDBFinalizer thread after iiss_db has been finalized
+
+        :param wal_writer:
+        :param iiss_db_path: finalized iiss_db to send to RC
+        :param calc_end_block_height: the end block height of the previous calc period
+        """
+        IconScoreContext.engine.iiss.send_calculate(iiss_db_path, calc_end_block_height)
+        wal_writer.write_state(WALState.SEND_CALCULATE.value, add=True)
+        self._close_write_ahead_log(wal_writer)
+
+    def _close_write_ahead_log(self, wal_writer: 'WriteAheadLogWriter'):
         wal_writer.close()
 
         try:
@@ -1733,6 +2086,7 @@ class IconServiceEngine(ContextContainer):
         self._icx_context_db.write_batch(context, state_wal)
         context.storage.icx.set_last_block(precommit_data.block_batch.block)
         context.engine.inv.commit(context, precommit_data)
+        context.engine.fee.commit(context, precommit_data)
         self._precommit_data_manager.commit(precommit_data.block_batch.block)
 
     @staticmethod
@@ -1750,7 +2104,6 @@ class IconServiceEngine(ContextContainer):
         """
         assert precommit_data.revision >= Revision.IISS.value
         assert isinstance(iiss_wal, IissWAL)
-        calc_end_block_height: int = -1
         standby_db_info: Optional['RewardCalcDBInfo'] = None
 
         if is_calc_period_start_block:
@@ -1760,17 +2113,13 @@ class IconServiceEngine(ContextContainer):
         context.engine.prep.commit(context, precommit_data)
         context.storage.rc.commit(iiss_wal)
 
-        if is_calc_period_start_block:
-            RewardCalcStorage.finalize_iiss_db(calc_end_block_height,
-                                               context.storage.rc.key_value_db,
-                                               standby_db_info.path)
+        # standby_db is finalized by IissDBFinalizer
         return standby_db_info
 
     @staticmethod
     def _process_ipc(context: 'IconScoreContext',
                      wal_writer: 'WriteAheadLogWriter',
                      precommit_data: 'PrecommitData',
-                     standby_db_info: Optional['RewardCalcDBInfo'],
                      instant_block_hash: bytes):
         assert precommit_data.revision >= Revision.IISS.value
 
@@ -1784,11 +2133,6 @@ class IconServiceEngine(ContextContainer):
         wal_writer.write_state(WALState.SEND_COMMIT_BLOCK.value, add=True)
         wal_writer.flush()
 
-        if standby_db_info is not None:
-            iiss_db_path: str = context.storage.rc.rename_standby_db_to_iiss_db(standby_db_info.path)
-            context.engine.iiss.send_calculate(iiss_db_path, standby_db_info.block_height)
-            wal_writer.write_state(WALState.SEND_CALCULATE.value, add=True)
-
     def rollback(self, block_height: int, block_hash: bytes) -> dict:
         """Rollback the current confirmed state to the old one indicated by block_height
 
@@ -1799,6 +2143,9 @@ class IconServiceEngine(ContextContainer):
         Logger.info(tag=ROLLBACK_LOG_TAG,
                     msg=f"rollback() start: height={block_height} hash={bytes_to_hex(block_hash)}")
 
+        # rc_db and iiss_dbs are not available until iiss_db of the previous calc period is finalized
+        self._iiss_db_finalizer.wait()
+
         last_block: 'Block' = self._get_last_block()
         Logger.info(tag=_TAG, msg=f"last_block={last_block}")
 
@@ -1819,7 +2166,13 @@ class IconServiceEngine(ContextContainer):
                 context = self._context_factory.create(IconScoreContextType.DIRECT, block=last_block)
                 self._rollback(context, block_height, block_hash, term_start_block_height)
 
+                if self._event_log_store is not None:
+                    self._event_log_store.rollback(block_height)
+                if self._score_resource_accountant is not None:
+                    self._score_resource_accountant.rollback(block_height)
+
                 self._remove_rollback_metadata()
+                self._metrics.increase(Counter.ROLLBACKS)
 
         except BaseException as e:
             Logger.error(tag=ROLLBACK_LOG_TAG, msg=str(e))
@@ -2249,6 +2602,21 @@ class IconServiceEngine(ContextContainer):
         return raw_data
 
 
+# SCORE addresses and event signatures are repeated in the event logs of a block.
+# typed=True not to mix up the values of different types which are equal to each other like True and 1
+_get_ordered_bytes_for_bloom = functools.lru_cache(
+    maxsize=BLOOM_BITS_CACHE_SIZE, typed=True)(EventLogEmitter.get_ordered_bytes)
+
+
+# Used not to measure transactions processed on step estimation
+_NO_METRICS = Metrics(enable=False)
+
+
+def _clear_logs_bloom_cache():
+    _get_ordered_bytes_for_bloom.cache_clear()
+    clear_bloom_bits_cache()
+
+
 def _get_invoke_result_from_precommit_data(
         precommit_data: PrecommitData) -> Tuple[List['TransactionResult'], bytes, dict, Optional[dict], bool]:
     return (
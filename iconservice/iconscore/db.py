@@ -279,6 +279,10 @@ class IconScoreDatabase(ContextGetter):
         if observer:
             observer.on_get(self._context, self._to_key_body(final_key), value)
 
+        tracker = self._context.resource_tracker
+        if tracker is not None:
+            tracker.on_db_get(value)
+
         return value
 
     def _get(
@@ -323,6 +327,13 @@ class IconScoreDatabase(ContextGetter):
                 # If new value is None, then deletes the field
                 observer.on_delete(self._context, key_body, prev_value)
 
+        tracker = self._context.resource_tracker
+        if tracker is not None:
+            if value:
+                tracker.on_db_put(value)
+            else:
+                tracker.on_db_delete()
+
         self._context_db.put(self._context, final_key, value)
 
     def get_sub_db(self, prefix: Union[bytes, Key]) -> IconScoreDatabase:
@@ -362,6 +373,10 @@ class IconScoreDatabase(ContextGetter):
             if value:
                 observer.on_delete(self._context, self._to_key_body(final_key), value)
 
+        tracker = self._context.resource_tracker
+        if tracker is not None:
+            tracker.on_db_delete()
+
         self._context_db_delete(old_kv_pair.key)
         self._context_db_delete(new_kv_pair.key)
 
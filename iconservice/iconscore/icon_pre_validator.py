@@ -14,7 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Optional, Dict
 
 from iconcommons.logger import Logger
 
@@ -75,6 +77,20 @@ ADDR_PARAMS = (
 )
 
 
+class _BatchCache(object):
+    """State lookups shared by the transactions which are validated in a batch
+
+    The cached values do not depend on the nonce and the order of the transactions,
+    so each transaction gets the same result as it is validated alone
+    """
+
+    def __init__(self):
+        self.balances: Dict['Address', int] = {}
+        self.inactive_scores: Dict['Address', bool] = {}
+        # None if the SCORE is available, otherwise the exception raised on checking it
+        self.score_availabilities: Dict['Address', Optional[InvalidRequestException]] = {}
+
+
 class IconPreValidator:
     """Validate only icx_sendTransaction request before putting it into tx pool
 
@@ -84,7 +100,23 @@ class IconPreValidator:
     def __init__(self) -> None:
         """Constructor
         """
-        pass
+        # A batch cache is only visible to the thread which validates the batch
+        self._local = threading.local()
+
+    @contextmanager
+    def batch(self):
+        """Shares balances and SCORE states among the transactions validated in this block
+
+        All transactions in the batch should be validated with the same context
+        """
+        self._local.cache = _BatchCache()
+        try:
+            yield
+        finally:
+            self._local.cache = None
+
+    def _get_batch_cache(self) -> Optional['_BatchCache']:
+        return getattr(self._local, "cache", None)
 
     def origin_request_execute(self, params: dict, revision: int):
         if revision < Revision.IMPROVED_PRE_VALIDATOR.value:
@@ -324,7 +356,24 @@ class IconPreValidator:
             # Check if the SCORE can be called when fee-sharing ON.
             # If data_type is None or message and the recipient is SCORE,
             # it works like `call`.(calling fallback)
+            self._check_score_available(context, to)
+
+    def _check_score_available(self, context: 'IconScoreContext', to: 'Address'):
+        cache: Optional['_BatchCache'] = self._get_batch_cache()
+        if cache is None:
             context.engine.fee.check_score_available(context, to, context.block.height)
+            return
+
+        if to not in cache.score_availabilities:
+            try:
+                context.engine.fee.check_score_available(context, to, context.block.height)
+                cache.score_availabilities[to] = None
+            except InvalidRequestException as e:
+                cache.score_availabilities[to] = e
+
+        e: Optional[InvalidRequestException] = cache.score_availabilities[to]
+        if e is not None:
+            raise e
 
     @staticmethod
     def validate_data_type(
@@ -436,9 +485,8 @@ class IconPreValidator:
         except BaseException as e:
             raise e
 
-    @classmethod
-    def _check_balance(cls, context: 'IconScoreContext', from_: 'Address', value: int, fee: int):
-        balance = context.engine.icx.get_balance(context, from_)
+    def _check_balance(self, context: 'IconScoreContext', from_: 'Address', value: int, fee: int):
+        balance = self._get_balance(context, from_)
 
         if context.revision >= Revision.LOCK_ADDRESS.value and is_address_locked(from_):
             Logger.warning(
@@ -454,12 +502,32 @@ class IconPreValidator:
 
             raise OutOfBalanceException(msg)
 
+    def _get_balance(self, context: 'IconScoreContext', address: 'Address') -> int:
+        cache: Optional['_BatchCache'] = self._get_batch_cache()
+        if cache is None:
+            return context.engine.icx.get_balance(context, address)
+
+        balance: Optional[int] = cache.balances.get(address)
+        if balance is None:
+            balance = context.engine.icx.get_balance(context, address)
+            cache.balances[address] = balance
+
+        return balance
+
     def _is_inactive_score(self, context: 'IconScoreContext', address: 'Address') -> bool:
-        return (
-            address.is_contract
-            and address != SYSTEM_SCORE_ADDRESS
-            and not self._is_score_active(context, address)
-        )
+        if not address.is_contract or address == SYSTEM_SCORE_ADDRESS:
+            return False
+
+        cache: Optional['_BatchCache'] = self._get_batch_cache()
+        if cache is None:
+            return not self._is_score_active(context, address)
+
+        inactive: Optional[bool] = cache.inactive_scores.get(address)
+        if inactive is None:
+            inactive = not self._is_score_active(context, address)
+            cache.inactive_scores[address] = inactive
+
+        return inactive
 
     @classmethod
     def _is_score_active(cls, context: 'IconScoreContext', address: 'Address') -> bool:
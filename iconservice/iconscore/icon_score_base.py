@@ -37,7 +37,6 @@ from .icon_score_constant import (
 )
 from .icon_score_context_util import IconScoreContextUtil
 from .icon_score_event_log import EventLogEmitter
-from .icon_score_step import StepType
 from .icx import Icx
 from .internal_call import InternalCall
 from .typing.definition import get_score_api
@@ -494,7 +493,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
             length = 1
             if value:
                 length = len(value)
-            context.step_counter.apply_step(StepType.GET, length)
+            context.step_counter.apply_get_step(length)
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -516,12 +515,10 @@ class IconScoreBase(IconScoreObject, ContextGetter,
         if context and context.step_counter and not context.readonly:
             if old_value:
                 # modifying a value
-                context.step_counter.apply_step(
-                    StepType.REPLACE, len(new_value))
+                context.step_counter.apply_replace_step(len(new_value))
             else:
                 # newly storing a value
-                context.step_counter.apply_step(
-                    StepType.SET, len(new_value))
+                context.step_counter.apply_set_step(len(new_value))
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -538,8 +535,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
         """
 
         if context and context.step_counter and not context.readonly:
-            context.step_counter.apply_step(
-                StepType.DELETE, len(old_value))
+            context.step_counter.apply_delete_step(len(old_value))
 
     @property
     def msg(self) -> 'Message':
@@ -21,8 +21,6 @@ from enum import IntEnum
 from typing import TYPE_CHECKING, Optional, Any, Callable
 from typing import Tuple, List
 
-from coincurve import PublicKey
-
 from .icon_score_constant import FORMAT_IS_NOT_DERIVED_OF_OBJECT, T
 from ..base.address import Address, AddressPrefix
 from ..base.exception import InvalidParamsException, IconScoreException, InvalidInstanceException
@@ -314,6 +312,9 @@ def _convert_key(public_key: bytes, compressed: bool) -> Optional[bytes]:
     :param public_key: compressed or uncompressed key
     :return: the counterpart key of a given public_key
     """
+    # coincurve is imported on the first use to reduce the startup time
+    from coincurve import PublicKey
+
     public_key_object = PublicKey(public_key)
     return public_key_object.format(compressed=not compressed)
 
@@ -345,6 +346,8 @@ def _recover_key(msg_hash: bytes, signature: bytes, compressed: bool) -> Optiona
             and len(msg_hash) == 32 \
             and isinstance(signature, bytes) \
             and len(signature) == 65:
+        from coincurve import PublicKey
+
         return PublicKey.from_signature_and_message(signature, msg_hash, hasher=None).format(compressed)
 
     return None
@@ -38,8 +38,11 @@ from ..icx.issue.regulator import Regulator
 if TYPE_CHECKING:
     from .icon_score_base import IconScoreBase
     from .icon_score_event_log import EventLog
+    from .icon_score_resource import ScoreResourceTracker
 
     from ..base.address import Address
+    from ..deploy.score_package_store import ScorePackageStore
+    from ..fee.deposit_index import DepositIndexContainer
     from ..prep.data import PRep, PRepContainer, Term
     from ..utils import ContextEngine, ContextStorage
     from ..prep.prep_address_converter import PRepAddressConverter
@@ -51,6 +54,7 @@ class IconScoreContext(ABC):
     TAG = "CTX"
 
     score_root_path: str = None
+    score_package_store: Optional['ScorePackageStore'] = None
     icon_score_mapper: 'IconScoreMapper' = None
     icon_service_flag: int = 0
     legacy_tbears_mode: bool = False
@@ -98,6 +102,10 @@ class IconScoreContext(ABC):
         self.traces: Optional[List['Trace']] = None
         self.fee_sharing_proportion = 0  # The proportion of fee by SCORE in percent (0-100)
         self.step_counter: Optional['IconScoreStepCounter'] = None
+        # Set on invoke only when SCORE resource accounting is enabled
+        self.resource_tracker: Optional['ScoreResourceTracker'] = None
+        # Set on invoke only. Deposits are looked up from the state DB without it
+        self.deposit_indices: Optional['DepositIndexContainer'] = None
 
         self.msg_stack = []
         self.event_log_stack = []
@@ -207,6 +215,8 @@ class IconScoreContext(ABC):
         self.update_dirty_prep_batch()
         self.update_state_db_batch()
         self.update_rc_db_batch()
+        if self.deposit_indices is not None:
+            self.deposit_indices.update_batch()
 
     def update_state_db_batch(self):
         self.block_batch.update(self.tx_batch)
@@ -221,17 +231,21 @@ class IconScoreContext(ABC):
 
         Caution: call update_dirty_prep_batch before update_state_db_batch()
         """
+        if not self._tx_dirty_preps:
+            return
+
         for dirty_prep in self._tx_dirty_preps.values():
             if self._term is not None:
                 self._update_term(dirty_prep)
 
             self._update_prep_address_converter(dirty_prep=dirty_prep)
 
-            self._preps.replace(dirty_prep)
             # Write serialized dirty_prep data into tx_batch
             self.storage.prep.put_prep(self, dirty_prep)
             dirty_prep.freeze()
 
+        # Each of the steps above refers to the old P-Rep of its own address only
+        self._preps.replace_all(self._tx_dirty_preps.values())
         self._tx_dirty_preps.clear()
 
     def _update_prep_address_converter(self, dirty_prep: 'PRep'):
@@ -316,6 +330,8 @@ class IconScoreContext(ABC):
             self.rc_tx_batch.clear()
         if self._tx_dirty_preps:
             self._tx_dirty_preps.clear()
+        if self.deposit_indices is not None:
+            self.deposit_indices.clear_batch()
 
     def get_prep(self, address: 'Address', mutable: bool = False) -> Optional['PRep']:
         prep: Optional['PRep'] = None
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 import warnings
 from typing import TYPE_CHECKING, Optional, Tuple
 
@@ -33,6 +34,7 @@ if TYPE_CHECKING:
     from .icon_score_context import IconScoreContext
     from .icon_score_base import IconScoreBase
     from .icon_score_mapper import IconScoreMapper
+    from ..deploy.score_package_store import ScorePackageStore
     from ..deploy.storage import IconScoreDeployTXParams, IconScoreDeployInfo
 
 
@@ -128,15 +130,17 @@ class IconScoreContextUtil(object):
             raise FatalException(
                 f'scoreInfo.txHash(0x{score_info.tx_hash.hex()}) != txHash(0x{current_tx_hash.hex()})')
 
+        score_info.last_used = time.monotonic()
         return score_info
 
     @staticmethod
     def create_score_info(
             context: 'IconScoreContext', score_address: 'Address',
-            tx_hash: bytes, score_db: 'IconScoreDatabase' = None) -> 'IconScoreInfo':
+            tx_hash: bytes, score_db: 'IconScoreDatabase' = None,
+            invalidate_caches: bool = True) -> 'IconScoreInfo':
 
         score_class: type = IconScoreClassLoader.run(
-            score_address, tx_hash, context.score_root_path)
+            score_address, tx_hash, context.score_root_path, invalidate_caches)
 
         if score_db is None:
             context_db = ContextDatabaseFactory.create_by_address(score_address)
@@ -159,8 +163,17 @@ class IconScoreContextUtil(object):
         if is_builtin_score(str(address)):
             import_whitelist.update(BUILTIN_SCORE_IMPORT_WHITE_LIST)
 
+        # The same package is validated only once with the same import white list
+        store: Optional['ScorePackageStore'] = context.score_package_store
+        content_hash: Optional[str] = store.get_content_hash(score_deploy_path) if store is not None else None
+        if content_hash is not None and store.is_validated(content_hash, import_whitelist):
+            return
+
         ScorePackageValidator.execute(import_whitelist, score_deploy_path, score_package_name)
 
+        if content_hash is not None:
+            store.set_validated(content_hash, import_whitelist)
+
     @staticmethod
     def validate_score_blacklist(context: 'IconScoreContext', score_address: 'Address') -> None:
         """Prevent SCOREs in blacklist
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING, Any
 from .icon_score_constant import STR_FALLBACK, ATTR_SCORE_GET_API, ATTR_SCORE_CALL
 from .icon_score_context import IconScoreContext
 from .icon_score_context_util import IconScoreContextUtil
+from .icon_score_resource import track_score_call
 from .typing.conversion import convert_score_parameters, ConvertOption
 from .typing.element import (
     ScoreElementMetadata,
@@ -115,7 +116,8 @@ class IconScoreEngine(object):
         context.current_address = icon_score_address
 
         score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        ret = score_func(func_name=func_name, kw_params=converted_params)
+        with track_score_call(context, icon_score_address, func_name):
+            ret = score_func(func_name=func_name, kw_params=converted_params)
 
         # No problem even though ret is None
         return deepcopy(ret)
@@ -151,7 +153,8 @@ class IconScoreEngine(object):
         icon_score = IconScoreEngine._get_icon_score(context, score_address)
 
         score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        score_func(STR_FALLBACK)
+        with track_score_call(context, score_address, STR_FALLBACK):
+            score_func(STR_FALLBACK)
 
     @staticmethod
     def _get_icon_score(context: 'IconScoreContext', icon_score_address: 'Address'):
@@ -16,7 +16,6 @@
 
 from typing import TYPE_CHECKING, List, Optional, Any
 
-from .icon_score_step import StepType
 from ..base.address import Address, ICON_ADDRESS_BYTES_SIZE, ICON_ADDRESS_BODY_SIZE
 from ..base.exception import InvalidEventLogException
 from ..icon_constant import DATA_BYTE_ORDER, Revision
@@ -116,11 +115,14 @@ class EventLogEmitter:
 
         # Counting steps only if fee_charge is True
         if fee_charge:
-            context.step_counter.apply_step(StepType.EVENT_LOG, event_size)
+            context.step_counter.apply_event_log_step(event_size)
 
         event = EventLog(score_address, indexed, data)
         context.event_logs.append(event)
 
+        if context.resource_tracker is not None:
+            context.resource_tracker.on_event_log()
+
     @classmethod
     def __get_byte_length(cls,
                           context: 'IconScoreContext',
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from threading import Lock
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Tuple
 
 from .icon_score_mapper_object import IconScoreMapperObject
 
@@ -78,6 +78,13 @@ class IconScoreMapper(object):
         with self._lock:
             return self._score_mapper.get(key)
 
+    def items(self) -> List[Tuple['Address', 'IconScoreInfo']]:
+        if self._lock is None:
+            return list(self._score_mapper.items())
+
+        with self._lock:
+            return list(self._score_mapper.items())
+
     def update(self, mapper: 'IconScoreMapper'):
         if self._lock is None:
             self._score_mapper.update(mapper._score_mapper)
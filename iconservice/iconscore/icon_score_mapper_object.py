@@ -43,6 +43,8 @@ class IconScoreInfo(object):
         self._score_class = score_class
         self._score_db = score_db
         self._score = None
+        # time.monotonic() when it was used last. 0 means that it has not been used
+        self.last_used: float = 0.0
 
     @property
     def tx_hash(self) -> bytes:
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("ScoreResourceUsage", "ScoreResourceTracker", "ScoreResourceAccountant", "track_score_call")
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from ..icon_constant import SCORE_RESOURCE_LOG_TAG
+
+if TYPE_CHECKING:
+    from .icon_score_context import IconScoreContext
+    from ..base.address import Address
+    from ..base.block import Block
+
+_TAG = SCORE_RESOURCE_LOG_TAG
+
+
+class ScoreResourceUsage(object):
+    """Resources used by an external method of a SCORE
+
+    Times are in microseconds.
+    Inclusive values contain the ones of the other SCOREs called in the method and exclusive ones do not.
+    """
+
+    __slots__ = (
+        "calls", "inclusive_time", "exclusive_time", "inclusive_steps", "exclusive_steps",
+        "db_gets", "db_get_bytes", "db_puts", "db_put_bytes", "db_deletes", "event_logs"
+    )
+
+    def __init__(self):
+        self.calls: int = 0
+        self.inclusive_time: int = 0
+        self.exclusive_time: int = 0
+        self.inclusive_steps: int = 0
+        self.exclusive_steps: int = 0
+        self.db_gets: int = 0
+        self.db_get_bytes: int = 0
+        self.db_puts: int = 0
+        self.db_put_bytes: int = 0
+        self.db_deletes: int = 0
+        self.event_logs: int = 0
+
+    def merge(self, other: 'ScoreResourceUsage'):
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "inclusiveTime": self.inclusive_time,
+            "exclusiveTime": self.exclusive_time,
+            "inclusiveSteps": self.inclusive_steps,
+            "exclusiveSteps": self.exclusive_steps,
+            "dbGets": self.db_gets,
+            "dbGetBytes": self.db_get_bytes,
+            "dbPuts": self.db_puts,
+            "dbPutBytes": self.db_put_bytes,
+            "dbDeletes": self.db_deletes,
+            "eventLogs": self.event_logs
+        }
+
+
+class _Frame(object):
+    """A call to an external method of a SCORE which is being processed
+    """
+
+    __slots__ = ("tracker", "usage", "step_counter", "start_time", "start_steps", "child_time", "child_steps")
+
+    def __init__(self, tracker: 'ScoreResourceTracker', usage: 'ScoreResourceUsage', step_counter):
+        self.tracker = tracker
+        self.usage = usage
+        self.step_counter = step_counter
+        self.start_time: float = 0.0
+        self.start_steps: int = 0
+        self.child_time: float = 0.0
+        self.child_steps: int = 0
+
+    def _get_step_used(self) -> int:
+        return self.step_counter.step_used if self.step_counter is not None else 0
+
+    def __enter__(self):
+        self.tracker._frames.append(self)
+        self.start_steps = self._get_step_used()
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration: float = time.perf_counter() - self.start_time
+        steps: int = self._get_step_used() - self.start_steps
+
+        frames: List['_Frame'] = self.tracker._frames
+        frames.pop()
+        if frames:
+            parent: '_Frame' = frames[-1]
+            parent.child_time += duration
+            parent.child_steps += steps
+
+        usage: 'ScoreResourceUsage' = self.usage
+        usage.calls += 1
+        usage.inclusive_time += int(duration * 1_000_000)
+        usage.exclusive_time += int((duration - self.child_time) * 1_000_000)
+        usage.inclusive_steps += steps
+        usage.exclusive_steps += steps - self.child_steps
+
+
+class _NoFrame(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NO_FRAME = _NoFrame()
+
+
+class ScoreResourceTracker(object):
+    """Accumulates the resources used by SCOREs while a block is invoked
+
+    DB accesses and event logs are charged to the SCORE method on the top of the call stack
+    """
+
+    def __init__(self):
+        self._usages: Dict[Tuple['Address', str], 'ScoreResourceUsage'] = {}
+        self._frames: List['_Frame'] = []
+
+    @property
+    def usages(self) -> Dict[Tuple['Address', str], 'ScoreResourceUsage']:
+        return self._usages
+
+    def call(self, address: 'Address', method: str, step_counter=None) -> '_Frame':
+        """Returns a context manager which measures a call to an external method of a SCORE
+        """
+        key = (address, method)
+        usage: Optional['ScoreResourceUsage'] = self._usages.get(key)
+        if usage is None:
+            usage = self._usages[key] = ScoreResourceUsage()
+
+        return _Frame(self, usage, step_counter)
+
+    def on_db_get(self, value: Optional[bytes]):
+        if self._frames:
+            usage: 'ScoreResourceUsage' = self._frames[-1].usage
+            usage.db_gets += 1
+            if value:
+                usage.db_get_bytes += len(value)
+
+    def on_db_put(self, value: bytes):
+        if self._frames:
+            usage: 'ScoreResourceUsage' = self._frames[-1].usage
+            usage.db_puts += 1
+            usage.db_put_bytes += len(value)
+
+    def on_db_delete(self):
+        if self._frames:
+            self._frames[-1].usage.db_deletes += 1
+
+    def on_event_log(self):
+        if self._frames:
+            self._frames[-1].usage.event_logs += 1
+
+    def merge(self, other: 'ScoreResourceTracker'):
+        for key, usage in other.usages.items():
+            mine: Optional['ScoreResourceUsage'] = self._usages.get(key)
+            if mine is None:
+                mine = self._usages[key] = ScoreResourceUsage()
+            mine.merge(usage)
+
+    def to_list(self, score_address: Optional['Address'] = None) -> List[dict]:
+        """Returns usages in descending order of exclusive time
+        """
+        ret: List[dict] = []
+        for (address, method), usage in self._usages.items():
+            if score_address is not None and address != score_address:
+                continue
+            item = {"scoreAddress": address, "method": method}
+            item.update(usage.to_dict())
+            ret.append(item)
+
+        ret.sort(key=lambda x: x["exclusiveTime"], reverse=True)
+        return ret
+
+
+def track_score_call(context: 'IconScoreContext', address: 'Address', method: str):
+    """Returns a context manager which charges the resources used in it to a SCORE method
+
+    It does nothing if resource accounting is disabled or the context is not for invoke
+    """
+    tracker: Optional['ScoreResourceTracker'] = context.resource_tracker
+    if tracker is None:
+        return _NO_FRAME
+    return tracker.call(address, method, context.step_counter)
+
+
+class ScoreResourceAccountant(object):
+    """Keeps the SCORE resource usages of committed blocks
+
+    The usages of recent blocks and their sum since iconservice started are kept
+    and each block can be dumped to a file in JSON lines.
+    """
+
+    def __init__(self, recent_blocks: int = 100, dump_path: str = ""):
+        """
+        :param recent_blocks: the number of recent blocks whose usages are kept
+        :param dump_path: file to which the usages of each block are appended, "" means no file
+        """
+        self._recent_blocks: int = recent_blocks
+        self._dump_path: str = dump_path
+
+        self._lock = threading.Lock()
+        self._total = ScoreResourceTracker()
+        self._total_blocks: int = 0
+        # block_height: (block, tracker)
+        self._blocks: OrderedDict[int, Tuple['Block', 'ScoreResourceTracker']] = OrderedDict()
+
+    def commit(self, block: 'Block', tracker: 'ScoreResourceTracker'):
+        with self._lock:
+            self._total.merge(tracker)
+            self._total_blocks += 1
+
+            self._blocks[block.height] = block, tracker
+            while len(self._blocks) > self._recent_blocks:
+                self._blocks.popitem(last=False)
+
+        if self._dump_path:
+            try:
+                self._dump(block, tracker)
+            except BaseException as e:
+                Logger.warning(tag=_TAG, msg=f"Failed to dump SCORE resource usages: {e}")
+
+    def rollback(self, block_height: int):
+        """Forgets the recent blocks above block_height
+        """
+        with self._lock:
+            for height in [height for height in self._blocks if height > block_height]:
+                del self._blocks[height]
+
+    def get_usages(self,
+                   block_height: Optional[int] = None,
+                   score_address: Optional['Address'] = None) -> dict:
+        """Returns the usages of a recent block or the sum of all committed blocks
+
+        :param block_height: a recent block. The sum of all blocks is returned if it is None
+        :param score_address: SCORE to return. All SCOREs are returned if it is None
+        """
+        with self._lock:
+            if block_height is None:
+                return {
+                    "blocks": self._total_blocks,
+                    "scores": self._total.to_list(score_address)
+                }
+
+            item: Optional[tuple] = self._blocks.get(block_height)
+            if item is None:
+                raise KeyError(block_height)
+
+            block, tracker = item
+            return {
+                "blockHeight": block.height,
+                "blockHash": block.hash,
+                "scores": tracker.to_list(score_address)
+            }
+
+    def _dump(self, block: 'Block', tracker: 'ScoreResourceTracker'):
+        scores: List[dict] = tracker.to_list()
+        for item in scores:
+            item["scoreAddress"] = str(item["scoreAddress"])
+
+        line: str = json.dumps({
+            "blockHeight": block.height,
+            "blockHash": block.hash.hex(),
+            "scores": scores
+        })
+
+        dir_path: str = os.path.dirname(self._dump_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        with open(self._dump_path, "a") as f:
+            f.write(f"{line}\n")
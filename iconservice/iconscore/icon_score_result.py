@@ -14,14 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Any
 
 from .icon_score_event_log import EventLog
 from ..base.address import Address
 from ..base.block import Block
 from ..base.exception import ExceptionCode
-from ..icon_constant import DATA_BYTE_ORDER
-from ..utils import bytes_to_hex
+from ..base.type_converter import TypeConverter
+from ..icon_constant import HASH_TYPE_TABLE
+from ..utils import bytes_to_hex, to_camel_case
 from ..utils.bloom import BloomFilter
 
 if TYPE_CHECKING:
@@ -32,6 +33,16 @@ class TransactionResult(object):
     """ A DataClass of a transaction result.
     """
 
+    # Camel case keys of the properties used in JSON-RPC responses
+    CAMEL_CASE_KEYS = {
+        key: to_camel_case(key)
+        for key in (
+            "tx_hash", "block_height", "block_hash", "tx_index", "to", "score_address",
+            "step_used", "step_price", "cumulative_step_used", "event_logs", "logs_bloom",
+            "status", "step_used_details", "failure", "traces"
+        )
+    }
+
     SUCCESS = 1
     FAILURE = 0
 
@@ -123,7 +134,7 @@ class TransactionResult(object):
                 new_dict[new_key] = [v.to_dict(casing) for v in value if
                                      isinstance(v, EventLog)]
             elif isinstance(value, BloomFilter):
-                new_dict[new_key] = int(value).to_bytes(256, byteorder=DATA_BYTE_ORDER)
+                new_dict[new_key] = value.to_bytes()
             elif key == 'failure':
                 if self.status == self.FAILURE:
                     new_dict[new_key] = {
@@ -144,3 +155,76 @@ class TransactionResult(object):
                 new_dict[new_key] = value
 
         return new_dict
+
+    def to_response_dict(self) -> dict:
+        """Returns properties as `dict` in JSON-RPC format
+
+        The result is the same as TypeConverter.convert_type_reverse(self.to_dict(to_camel_case))
+        but it is made in one pass and event logs are not modified.
+        :return: a dict
+        """
+        new_dict = {}
+        for key, value in self.__dict__.items():
+            # Excludes properties which have `None` value
+            if value is None:
+                continue
+
+            new_key = self.CAMEL_CASE_KEYS.get(key) or to_camel_case(key)
+            if key == 'event_logs':
+                new_dict[new_key] = [
+                    {
+                        'scoreAddress': str(v.score_address),
+                        'indexed': [_convert_value(item) for item in v.indexed],
+                        'data': [_convert_value(item) for item in v.data]
+                    }
+                    for v in value if isinstance(v, EventLog)
+                ]
+            elif isinstance(value, BloomFilter):
+                new_dict[new_key] = f'0x{value.to_bytes().hex()}'
+            elif key == 'failure':
+                if self.status == self.FAILURE:
+                    new_dict[new_key] = {
+                        'code': hex(value.code),
+                        'message': value.message
+                    }
+            elif key == 'step_used_details':
+                assert isinstance(value, dict)
+                new_dict[new_key] = {
+                    str(address): _convert_value(value[address]) for address in value
+                }
+            elif key == 'traces':
+                # traces are excluded from dict property
+                continue
+            elif isinstance(value, bytes):
+                # txHash and blockHash exclude '0x' prefix
+                new_dict[new_key] = value.hex() if new_key in HASH_TYPE_TABLE else f'0x{value.hex()}'
+            else:
+                new_dict[new_key] = _convert_value(value)
+
+        return new_dict
+
+
+def _convert_bytes(value: bytes) -> str:
+    return f'0x{value.hex()}'
+
+
+# Converters of the types in TransactionResult and EventLog to JSON-RPC format
+_VALUE_CONVERTERS = {
+    int: hex,
+    bool: hex,
+    str: None,
+    type(None): None,
+    bytes: _convert_bytes,
+    Address: str,
+}
+
+
+def _convert_value(value: Any) -> Any:
+    """Converts a value in the same way as TypeConverter.convert_type_reverse() without type checks
+    """
+    try:
+        converter = _VALUE_CONVERTERS[type(value)]
+    except KeyError:
+        return TypeConverter.convert_type_reverse(value)
+
+    return value if converter is None else converter(value)
@@ -254,6 +254,14 @@ class IconScoreStepCounter(object):
         self._max_step_used: int = 0
         self._step_tracer: Optional[StepTracer] = StepTracer() if step_trace_flag else None
 
+        # Step costs charged on every DB access and event log are looked up only once in a transaction
+        self._default_step_cost: int = step_costs.get(StepType.DEFAULT, 0)
+        self._get_step_cost: int = step_costs.get(StepType.GET, 0)
+        self._set_step_cost: int = step_costs.get(StepType.SET, 0)
+        self._replace_step_cost: int = step_costs.get(StepType.REPLACE, 0)
+        self._delete_step_cost: int = step_costs.get(StepType.DELETE, 0)
+        self._event_log_step_cost: int = step_costs.get(StepType.EVENT_LOG, 0)
+
     @property
     def step_price(self) -> int:
         """
@@ -276,8 +284,7 @@ class IconScoreStepCounter(object):
         Returns used steps in the transaction
         :return: used steps in the transaction
         """
-        return max(self._step_used,
-                   self._step_costs.get(StepType.DEFAULT, 0))
+        return max(self._step_used, self._default_step_cost)
 
     @property
     def max_step_used(self) -> int:
@@ -304,10 +311,31 @@ class IconScoreStepCounter(object):
 
         return self.consume_step(step_type, step)
 
+    def apply_get_step(self, size: int) -> int:
+        """The same as apply_step(StepType.GET, size)"""
+        return self.consume_step(StepType.GET, self._get_step_cost * size)
+
+    def apply_set_step(self, size: int) -> int:
+        """The same as apply_step(StepType.SET, size)"""
+        return self.consume_step(StepType.SET, self._set_step_cost * size)
+
+    def apply_replace_step(self, size: int) -> int:
+        """The same as apply_step(StepType.REPLACE, size)"""
+        return self.consume_step(StepType.REPLACE, self._replace_step_cost * size)
+
+    def apply_delete_step(self, size: int) -> int:
+        """The same as apply_step(StepType.DELETE, size)"""
+        return self.consume_step(StepType.DELETE, self._delete_step_cost * size)
+
+    def apply_event_log_step(self, size: int) -> int:
+        """The same as apply_step(StepType.EVENT_LOG, size)"""
+        return self.consume_step(StepType.EVENT_LOG, self._event_log_step_cost * size)
+
     def consume_step(self, step_type: StepType, step: int) -> int:
         step_used: int = self._step_used + step
 
-        self._max_step_used = max(self._max_step_used, step_used)
+        if step_used > self._max_step_used:
+            self._max_step_used = step_used
 
         if step_used > self._step_limit:
             step_used = self._step_used
@@ -317,14 +345,14 @@ class IconScoreStepCounter(object):
 
         self._step_used = step_used
 
-        # Save the step info to StepTracer to trace step cost
-        self._trace_step(step_type, step)
+        if self._step_tracer is not None:
+            # Save the step info to StepTracer to trace step cost
+            self._trace_step(step_type, step)
 
         return step_used
 
     def _trace_step(self, step_type: StepType, step: int):
-        if self._step_tracer is not None:
-            self._step_tracer.add(step_type, step, self._step_used)
+        self._step_tracer.add(step_type, step, self._step_used)
 
     def get_step_cost(self, step_type: StepType) -> int:
         return self._step_costs.get(step_type, 0)
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING, Optional, Any
 from .icon_score_constant import STR_FALLBACK, ATTR_SCORE_CALL
 from .icon_score_context_util import IconScoreContextUtil
 from .icon_score_event_log import EventLogEmitter
+from .icon_score_resource import track_score_call
 from .icon_score_step import StepType
 from .icon_score_trace import Trace, TraceType
 from .typing.element import (
@@ -156,7 +157,8 @@ class InternalCall(object):
                 metadata: ScoreElementMetadata = get_score_element_metadata(icon_score, func_name)
                 verify_internal_call_arguments(metadata.signature, arg_params, kw_params)
 
-            return score_func(func_name=func_name, arg_params=arg_params, kw_params=kw_params)
+            with track_score_call(context, addr_to, func_name):
+                return score_func(func_name=func_name, arg_params=arg_params, kw_params=kw_params)
         finally:
             context.func_type = prev_func_type
             context.current_address = addr_from
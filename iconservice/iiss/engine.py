@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING, Any, Optional, List, Dict, Tuple
 from iconcommons.logger import Logger
 
 from iconservice.iiss.listener import EngineListener as IISSEngineListener
+from .iscore_cache import IScoreCache
 from .reward_calc.data_creator import DataCreator as RewardCalcDataCreator
 from .reward_calc.ipc.message import CalculateDoneNotification, ReadyNotification
 from .reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
@@ -108,6 +109,7 @@ class Engine(EngineBase):
 
         self._reward_calc_proxy: Optional['RewardCalcProxy'] = None
         self._listeners: List['IISSEngineListener'] = []
+        self._iscore_cache = IScoreCache()
 
     def open(self, context: 'IconScoreContext',
              log_dir: str, data_path: str, socket_path: str, ipc_timeout: int,
@@ -224,6 +226,7 @@ class Engine(EngineBase):
         self.check_calculate_request_block_height(cb_data.block_height, latest_calculate_bh)
 
         IconScoreContext.storage.rc.put_calc_response_from_rc(cb_data.iscore, cb_data.block_height, cb_data.state_hash)
+        self._iscore_cache.clear()
         Logger.info(tag=_TAG, msg=f"calculate done callback called with {cb_data}")
 
     def _init_reward_calc_proxy(self, log_dir: str, data_path: str, socket_path: str, ipc_timeout: int,
@@ -403,11 +406,15 @@ class Engine(EngineBase):
         # Check whether voting power is enough to delegate
         self._check_voting_power_is_enough(context, sender, total_delegating, cached_accounts)
 
-        # Get old delegations from delegating accounts
-        self._get_old_delegations_from_sender_account(context, sender, cached_accounts)
+        if context.revision >= Revision.OPTIMIZE_DIRTY_PREP_UPDATE.value:
+            # Load only the accounts whose delegated amounts are changed
+            self._calc_delegated_offsets(context, sender, new_delegations, cached_accounts)
+        else:
+            # Get old delegations from delegating accounts
+            self._get_old_delegations_from_sender_account(context, sender, cached_accounts)
 
-        # Calculate delegations with old and new delegations
-        self._calc_delegations(context, new_delegations, cached_accounts)
+            # Calculate delegations with old and new delegations
+            self._calc_delegations(context, new_delegations, cached_accounts)
 
         # Put updated delegation data to stateDB
         updated_accounts: List['Account'] = \
@@ -557,6 +564,53 @@ class Engine(EngineBase):
 
             cached_accounts[address] = account, new_delegated + old_delegated
 
+    @classmethod
+    def _calc_delegated_offsets(cls,
+                                context: 'IconScoreContext',
+                                sender: 'Address',
+                                new_delegations: List[Tuple['Address', int]],
+                                cached_accounts: Dict['Address', Tuple['Account', int]]):
+        """Calculate net delegated amount offsets for each address with old and new delegations
+        and load only the accounts whose offsets are not zero
+
+        The order of cached_accounts is the same as the one made by
+        _get_old_delegations_from_sender_account() and _calc_delegations()
+        so that the order of state db writes is not changed.
+        An unchanged account is skipped, as it is neither written to state db
+        nor updates the P-Rep since Revision.OPTIMIZE_DIRTY_PREP_UPDATE
+
+        :param context:
+        :param sender:
+        :param new_delegations:
+        :param cached_accounts:
+        :return:
+        """
+        sender_account: 'Account' = cached_accounts[sender][0]
+        offsets: Dict['Address', int] = OrderedDict()
+
+        for address, old_delegated in sender_account.delegations or ():
+            assert old_delegated > 0
+            offsets[address] = -old_delegated
+
+        for address, new_delegated in new_delegations:
+            assert new_delegated > 0
+            offsets[address] = offsets.get(address, 0) + new_delegated
+
+        icx_storage = context.storage.icx
+
+        for address, offset in offsets.items():
+            if offset == 0:
+                continue
+
+            cached: Tuple['Account', int] = cached_accounts.get(address)
+            if cached is None:
+                account: 'Account' = icx_storage.get_account(context, address, Intent.DELEGATED)
+            else:
+                account: 'Account' = cached[0]
+
+            assert account.delegated_amount + offset >= 0
+            cached_accounts[address] = account, offset
+
     @classmethod
     def _put_delegation_to_state_db(cls,
                                     context: 'IconScoreContext',
@@ -584,8 +638,10 @@ class Engine(EngineBase):
         for account, delegated_offset in cached_accounts.values():
             if delegated_offset != 0:
                 account.delegation_part.delegated_amount += delegated_offset
+                icx_storage.put_account(context, account)
+            elif account is sender_account:
+                icx_storage.put_account(context, account)
 
-            icx_storage.put_account(context, account)
             updated_accounts.append(account)
 
         return updated_accounts
@@ -691,6 +747,7 @@ class Engine(EngineBase):
         block: 'Block' = context.block
         tx: 'Transaction' = context.tx
         success = True
+        self._iscore_cache.on_claim(address)
 
         try:
             icx: int = self._iscore_to_icx(iscore)
@@ -717,7 +774,7 @@ class Engine(EngineBase):
 
         tx_hash = context.tx.hash if isinstance(context.tx, Transaction) else None
         block = context.block if isinstance(context.block, Block) else None
-        iscore, block_height = self._reward_calc_proxy.query_iscore(address, block, tx_hash)
+        iscore, block_height = self._query_iscore(address, block, tx_hash)
 
         data = {
             "iscore": iscore,
@@ -727,6 +784,24 @@ class Engine(EngineBase):
 
         return data
 
+    def _query_iscore(self, address: 'Address', block: Optional['Block'], tx_hash: Optional[bytes]) -> Tuple[int, int]:
+        # queryIScore in a transaction should be sent to reward calculator to keep the ordering of messages
+        if tx_hash is not None:
+            return self._reward_calc_proxy.query_iscore(address, block, tx_hash)
+
+        cached: Optional[Tuple[int, int]] = self._iscore_cache.get(address)
+        if cached is not None:
+            return cached
+
+        generation: int = self._iscore_cache.generation
+        iscore, block_height = self._reward_calc_proxy.query_iscore(address, block, tx_hash)
+        self._iscore_cache.put(generation, address, iscore, block_height)
+
+        return iscore, block_height
+
+    def get_iscore_cache_status(self) -> dict:
+        return self._iscore_cache.get_status()
+
     def update_db(self,
                   context: 'IconScoreContext',
                   term: Optional['Term'],
@@ -787,6 +862,7 @@ class Engine(EngineBase):
 
     def send_commit(self, block_height: int, block_hash: bytes):
         self._reward_calc_proxy.commit_block(True, block_height, block_hash)
+        self._iscore_cache.on_commit()
 
     def send_calculate(self, iiss_db_path: str, block_height: int):
         self._reward_calc_proxy.calculate(iiss_db_path, block_height)
@@ -947,6 +1023,7 @@ class Engine(EngineBase):
                         f"height={block_height} hash={bytes_to_hex(block_hash)}")
 
         _success, _height, _hash = self._reward_calc_proxy.rollback(block_height, block_hash)
+        self._iscore_cache.clear()
         Logger.info(tag=ROLLBACK_LOG_TAG,
                     msg=f"RewardCalculator response: "
                         f"success={_success} height={_height} hash={bytes_to_hex(_hash)}")
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = "IScoreCache"
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple, Set
+
+from ..icon_constant import ISCORE_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from ..base.address import Address
+
+
+class IScoreCache(object):
+    """Bounded LRU cache for queryIScore results from reward calculator
+
+    I-Score of an address changes only when a calculation is done, the address claims or state is rolled back.
+    A generation number is increased on every invalidation
+    so that a result fetched before invalidation is never cached after it.
+
+    It is accessed by query, invoke and IPC threads at the same time.
+    """
+
+    def __init__(self, max_size: int = ISCORE_CACHE_SIZE):
+        assert max_size > 0
+
+        self._max_size: int = max_size
+        # address: (iscore, block_height)
+        self._cache: OrderedDict['Address', Tuple[int, int]] = OrderedDict()
+        # addresses which have claimed in blocks which are not committed yet
+        self._claimed: Set['Address'] = set()
+        self._generation: int = 0
+        self._lock = threading.Lock()
+
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, address: 'Address') -> Optional[Tuple[int, int]]:
+        with self._lock:
+            value: Optional[Tuple[int, int]] = self._cache.get(address)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._cache.move_to_end(address)
+
+            return value
+
+    def put(self, generation: int, address: 'Address', iscore: int, block_height: int):
+        """Cache a result only if no invalidation has happened since generation was read
+
+        :param generation: the generation read before requesting queryIScore to reward calculator
+        :param address:
+        :param iscore:
+        :param block_height:
+        """
+        with self._lock:
+            if generation != self._generation or address in self._claimed:
+                return
+
+            self._cache[address] = iscore, block_height
+            self._cache.move_to_end(address)
+
+            if len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+
+    def on_claim(self, address: 'Address'):
+        """Called when an address claims I-Score on invoke
+
+        The address is not cached until the block containing the claim is committed or rolled back
+        """
+        with self._lock:
+            self._generation += 1
+            self._cache.pop(address, None)
+            self._claimed.add(address)
+
+    def on_commit(self):
+        with self._lock:
+            if len(self._claimed) == 0:
+                return
+
+            self._generation += 1
+            for address in self._claimed:
+                self._cache.pop(address, None)
+            self._claimed.clear()
+
+    def clear(self):
+        """Called when a calculation is done or state is rolled back
+        """
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            self._claimed.clear()
+
+    def get_status(self) -> dict:
+        with self._lock:
+            total: int = self._hits + self._misses
+            return {
+                "size": len(self._cache),
+                "maxSize": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRatio": self._hits / total if total > 0 else 0.0
+            }
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = "IissDBFinalizer"
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Callable
+
+from iconcommons.logger import Logger
+
+from .storage import Storage
+from ...icon_constant import IISS_LOG_TAG
+
+if TYPE_CHECKING:
+    from .storage import RewardCalcDBInfo
+    from ...database.db import KeyValueDatabase
+
+_TAG = IISS_LOG_TAG
+
+
+class IissDBFinalizer(object):
+    """Finalizes standby_rc_db at the start block of a calc period in background
+
+    Moving the last block produce info, compacting and renaming the db take a few seconds for a large db.
+    They are done on a dedicated thread instead of the commit path,
+    and then the db is handed over to reward calculator with the given callback which sends CALCULATE.
+
+    Only one db is finalized at a time.
+    The caller has to wait for the previous finalization before it touches rc_db or write-ahead log again
+    and before it invokes the next block so that RC receives CALCULATE ahead of the IPC messages of the block.
+    """
+
+    STAGE_FINALIZE = "finalize"
+    STAGE_RENAME = "rename"
+    STAGE_CALCULATE = "calculate"
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+        # Progress metrics of the last finalization
+        self._block_height: int = -1
+        self._stage: Optional[str] = None
+        self._compacted_ranges: int = 0
+        self._total_ranges: int = 0
+        self._durations: dict = {}
+        self._count: int = 0
+
+    @property
+    def running(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def run(self,
+            standby_db_info: 'RewardCalcDBInfo',
+            current_db: 'KeyValueDatabase',
+            on_finalized: Callable[[str, int], None]) -> Future:
+        """Finalize standby_rc_db in background
+
+        :param standby_db_info: standby_rc_db to finalize
+        :param current_db: current_db which has the block produce info of the last block in the previous calc period
+        :param on_finalized: called with (iiss_db_path, calc_end_block_height) after finalization is done
+        :return: future which is done when on_finalized returns
+        """
+        assert not self.running
+
+        with self._lock:
+            self._block_height = standby_db_info.block_height
+            self._stage = None
+            self._compacted_ranges = 0
+            self._total_ranges = 0
+            self._durations = {}
+
+        self._future = self._executor.submit(self._run, standby_db_info, current_db, on_finalized)
+        return self._future
+
+    def _run(self,
+             standby_db_info: 'RewardCalcDBInfo',
+             current_db: 'KeyValueDatabase',
+             on_finalized: Callable[[str, int], None]):
+        Logger.info(tag=_TAG, msg=f"Finalize iiss_db start: {standby_db_info}")
+        start: float = time.monotonic()
+
+        try:
+            self._run_stage(self.STAGE_FINALIZE,
+                            Storage.finalize_iiss_db,
+                            standby_db_info.block_height, current_db, standby_db_info.path, self._on_progress)
+            iiss_db_path: str = self._run_stage(self.STAGE_RENAME,
+                                                Storage.rename_standby_db_to_iiss_db,
+                                                standby_db_info.path)
+            self._run_stage(self.STAGE_CALCULATE,
+                            on_finalized,
+                            iiss_db_path, standby_db_info.block_height)
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=f"Failed to finalize iiss_db: stage={self._stage} {e}")
+            raise
+
+        with self._lock:
+            self._stage = None
+            self._count += 1
+
+        Logger.info(tag=_TAG, msg=f"Finalize iiss_db end: elapsed={time.monotonic() - start:.3f}s")
+
+    def _run_stage(self, stage: str, func: callable, *args):
+        with self._lock:
+            self._stage = stage
+
+        start: float = time.monotonic()
+        ret = func(*args)
+        elapsed: float = time.monotonic() - start
+
+        with self._lock:
+            self._durations[stage] = elapsed
+
+        Logger.info(tag=_TAG, msg=f"Finalize iiss_db: stage={stage} elapsed={elapsed:.3f}s")
+        return ret
+
+    def _on_progress(self, compacted_ranges: int, total_ranges: int):
+        with self._lock:
+            self._compacted_ranges = compacted_ranges
+            self._total_ranges = total_ranges
+
+        Logger.debug(tag=_TAG, msg=f"Compact iiss_db: {compacted_ranges}/{total_ranges}")
+
+    def wait(self):
+        """Wait until the running finalization is done
+
+        The exception raised in background is raised again
+        so that nothing is committed on top of a calc period which has not been handed over to reward calculator.
+        The write-ahead log of the block is left as it is and the rest is done by recovery on the next startup.
+        """
+        if self._future is not None:
+            self._future.result()
+
+    def close(self):
+        try:
+            self.wait()
+        except BaseException as e:
+            Logger.error(tag=_TAG, msg=f"Close iiss_db finalizer with an error: {e}")
+        finally:
+            self._executor.shutdown(wait=True)
+            self._future = None
+
+    def get_status(self) -> dict:
+        with self._lock:
+            if self._future is None:
+                state = "idle"
+            elif not self._future.done():
+                state = "running"
+            elif self._future.exception() is not None:
+                state = "failed"
+            else:
+                state = "done"
+
+            return {
+                "state": state,
+                "blockHeight": self._block_height,
+                "stage": self._stage,
+                "compaction": {
+                    "done": self._compacted_ranges,
+                    "total": self._total_ranges
+                },
+                "durations": dict(self._durations),
+                "count": self._count
+            }
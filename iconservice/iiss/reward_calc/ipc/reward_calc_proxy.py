@@ -174,7 +174,7 @@ class RewardCalcProxy(object):
     def calculate(self, db_path: str, block_height: int) -> int:
         """Request RewardCalculator to calculate IScore for every account
 
-        It is called on invoke thread
+        It is called on iiss_db finalizer thread
 
         :param db_path: the absolute path of iiss database
         :param block_height: The blockHeight when this request are sent to RewardCalculator
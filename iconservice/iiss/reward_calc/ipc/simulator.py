@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pure python reward calculator simulator
+
+It speaks the same IPC protocol as the external reward calculator (icon_rc) over the unix domain socket
+which is served by IPCServer, so that invoke -> commit -> calculate loops can be driven in tests and benchmarks
+without the external service.
+
+I-Score is approximated with the delegation reward (beta3) only and kept in memory.
+Do not use it for anything which requires consensus-accurate I-Score.
+"""
+
+__all__ = ("RewardCalcSimulator", "IScoreCalculator", "main")
+
+import argparse
+import asyncio
+import bisect
+import threading
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, Any
+
+import msgpack
+from iconcommons.logger import Logger
+
+from .message import MessageType
+from ..msg_data import GovernanceVariable, TxData, TxType
+from ....database.db import KeyValueDatabase
+from ....icon_constant import (
+    ISCORE_EXCHANGE_RATE, IISS_ANNUAL_BLOCK, IISS_MAX_REWARD_RATE, RCCalculateResult
+)
+from ....utils import int_to_bytes, sha3_256, bytes_to_hex
+from ....utils.msgpack_for_ipc import MsgPackForIpc, TypeTag
+
+if TYPE_CHECKING:
+    from ..msg_data import DelegationTx
+    from ....base.address import Address
+
+_TAG = "RCS"
+
+SIMULATOR_VERSION = 1
+NOTIFICATION_MSG_ID = 0
+
+
+class IScoreCalculator(object):
+    """Calculates I-Score from iiss_db made by reward_calc.storage.Storage
+
+    Delegations are carried over calculation periods until the delegator changes them.
+    """
+
+    def __init__(self):
+        # delegator -> (total delegated amount, block height from which the amount is accrued)
+        self._delegations: Dict['Address', Tuple[int, int]] = {}
+        # sorted governance variables: [block_height], [reward_rep]
+        self._gv_heights: List[int] = []
+        self._gv_rreps: List[int] = []
+        self._prev_end_block_height: int = -1
+
+    def run(self, db_path: str, end_block_height: int) -> Dict['Address', int]:
+        """Calculate I-Score issued from the previous calculation up to end_block_height
+
+        :param db_path: the path of iiss_db to calculate
+        :param end_block_height: the last block height of this calculation period
+        :return: I-Score issued in this period for each address
+        """
+        db = KeyValueDatabase.from_path(db_path, create_if_missing=False)
+        try:
+            self._load_gv(db)
+            iscores: Dict['Address', int] = self._calculate_delegation_rewards(db, end_block_height)
+        finally:
+            db.close()
+
+        self._prev_end_block_height = end_block_height
+        return iscores
+
+    def _load_gv(self, db: 'KeyValueDatabase'):
+        for key, value in db.get_sub_db(GovernanceVariable.PREFIX).iterator():
+            gv: 'GovernanceVariable' = GovernanceVariable.from_bytes(GovernanceVariable.PREFIX + key, value)
+            index: int = bisect.bisect_left(self._gv_heights, gv.block_height)
+            if index < len(self._gv_heights) and self._gv_heights[index] == gv.block_height:
+                self._gv_rreps[index] = gv.reward_rep
+            else:
+                self._gv_heights.insert(index, gv.block_height)
+                self._gv_rreps.insert(index, gv.reward_rep)
+
+    def _calculate_delegation_rewards(self,
+                                      db: 'KeyValueDatabase',
+                                      end_block_height: int) -> Dict['Address', int]:
+        iscores: Dict['Address', int] = {}
+
+        # TX keys are sorted by tx_index, which means they are sorted by block height as well
+        for _, value in db.get_sub_db(TxData.PREFIX).iterator():
+            tx: 'TxData' = TxData.from_bytes(value)
+            if tx.type != TxType.DELEGATION:
+                continue
+
+            self._accrue(iscores, tx.address, tx.block_height)
+
+            data: 'DelegationTx' = tx.data
+            amount: int = sum(info.value for info in data.delegation_info)
+            self._delegations[tx.address] = amount, tx.block_height
+
+        for address in list(self._delegations):
+            self._accrue(iscores, address, end_block_height + 1)
+            amount, _ = self._delegations[address]
+            if amount == 0:
+                del self._delegations[address]
+
+        return iscores
+
+    def _accrue(self, iscores: Dict['Address', int], address: 'Address', block_height: int):
+        amount, start = self._delegations.get(address, (0, block_height))
+        start = max(start, self._prev_end_block_height + 1)
+
+        if amount > 0 and block_height > start:
+            iscore: int = self._get_reward(amount, start, block_height)
+            if iscore > 0:
+                iscores[address] = iscores.get(address, 0) + iscore
+
+        self._delegations[address] = amount, block_height
+
+    def _get_reward(self, amount: int, start: int, end: int) -> int:
+        """Returns the delegation reward for [start, end)
+
+        I-Score = delegated * rrep * blocks * ISCORE_EXCHANGE_RATE / (IISS_ANNUAL_BLOCK * IISS_MAX_REWARD_RATE)
+        """
+        reward_rate_sum: int = 0
+
+        index: int = max(0, bisect.bisect_left(self._gv_heights, start) - 1)
+        while index < len(self._gv_heights):
+            # GV is applied from the next block of the one where it was calculated
+            seg_start: int = max(start, self._gv_heights[index] + 1)
+            seg_end: int = self._gv_heights[index + 1] + 1 if index + 1 < len(self._gv_heights) else end
+            seg_end = min(seg_end, end)
+
+            if seg_end > seg_start:
+                reward_rate_sum += self._gv_rreps[index] * (seg_end - seg_start)
+            if seg_end >= end:
+                break
+            index += 1
+
+        return amount * reward_rate_sum * ISCORE_EXCHANGE_RATE // (IISS_ANNUAL_BLOCK * IISS_MAX_REWARD_RATE)
+
+
+class RewardCalcSimulator(object):
+    """Simulates the external reward calculator on its own thread and event loop
+
+    Usage:
+        simulator = RewardCalcSimulator(latency=0.001)
+        simulator.start(sock_path)
+        ...
+        simulator.stop()
+    """
+
+    def __init__(self,
+                 latency: float = 0.0,
+                 calculate_latency: float = 0.0,
+                 block_height: int = 0,
+                 block_hash: bytes = bytes(32)):
+        """
+        :param latency: seconds to wait before replying to each request
+        :param calculate_latency: seconds to wait before sending CALCULATE_DONE notification
+        :param block_height: the last committed block height on start
+        :param block_hash: the last committed block hash on start
+        """
+        self._latency: float = latency
+        self._calculate_latency: float = calculate_latency
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._started = threading.Event()
+
+        self._calculator = IScoreCalculator()
+        self._iscores: Dict['Address', int] = {}
+
+        # claims which are not committed yet: (address, block_height, block_hash, tx_index) -> claimed iscore
+        self._pending_claims: Dict[tuple, int] = {}
+        # committed changes in order: (block_height, {address: iscore_offset})
+        self._journal: List[Tuple[int, Dict['Address', int]]] = []
+
+        self._block_height: int = block_height
+        self._block_hash: bytes = block_hash
+
+        self._calc_status: int = RCCalculateResult.SUCCESS
+        self._calc_block_height: int = 0
+        # block_height -> (total issued iscore, state_hash)
+        self._calc_results: Dict[int, Tuple[int, bytes]] = {}
+
+        self._handlers: dict = {
+            MessageType.VERSION: self._handle_version,
+            MessageType.CLAIM: self._handle_claim,
+            MessageType.QUERY: self._handle_query,
+            MessageType.CALCULATE: self._handle_calculate,
+            MessageType.COMMIT_BLOCK: self._handle_commit_block,
+            MessageType.COMMIT_CLAIM: self._handle_commit_claim,
+            MessageType.QUERY_CALCULATE_STATUS: self._handle_query_calculate_status,
+            MessageType.QUERY_CALCULATE_RESULT: self._handle_query_calculate_result,
+            MessageType.ROLLBACK: self._handle_rollback,
+            MessageType.INIT: self._handle_init,
+            MessageType.START_BLOCK: self._handle_start_block,
+        }
+
+    @property
+    def block_height(self) -> int:
+        return self._block_height
+
+    def get_iscore(self, address: 'Address') -> int:
+        return self._iscores.get(address, 0)
+
+    def start(self, sock_path: str, timeout: Optional[float] = None):
+        """Connect to IPCServer on a new thread and send READY notification
+
+        IPCServer should be started before calling this method
+        """
+        assert self._thread is None
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(sock_path,), name="RewardCalcSimulator", daemon=True)
+        self._thread.start()
+        self._started.wait(timeout)
+
+    def join(self):
+        """Wait until IPCServer closes the connection
+        """
+        if self._thread is not None:
+            self._thread.join()
+
+    def stop(self):
+        if self._thread is None:
+            return
+
+        if self._writer is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._writer.close)
+            except RuntimeError:
+                # IPCServer has already closed the connection and the loop is closed
+                pass
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, sock_path: str):
+        Logger.info(tag=_TAG, msg=f"_run() start: sock_path={sock_path}")
+
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._serve(sock_path))
+        finally:
+            self._loop.close()
+
+        Logger.info(tag=_TAG, msg="_run() end")
+
+    async def _serve(self, sock_path: str):
+        try:
+            reader, self._writer = await asyncio.open_unix_connection(sock_path)
+        finally:
+            self._started.set()
+
+        self._send((MessageType.READY, NOTIFICATION_MSG_ID, (SIMULATOR_VERSION, self._block_height, self._block_hash)))
+
+        unpacker = msgpack.Unpacker(raw=True)
+        while True:
+            data: bytes = await reader.read(1024)
+            if not isinstance(data, bytes) or len(data) == 0:
+                break
+
+            unpacker.feed(data)
+            for request in unpacker:
+                await self._on_request(request)
+
+        self._writer.close()
+
+    async def _on_request(self, request: list):
+        msg_type = MessageType(request[0])
+        msg_id: int = request[1]
+        payload: Any = request[2] if len(request) > 2 else None
+
+        Logger.debug(tag=_TAG, msg=f"_on_request(): {msg_type.name}({msg_id}, {payload})")
+
+        if msg_type == MessageType.NONE:
+            return
+
+        if self._latency > 0:
+            await asyncio.sleep(self._latency)
+
+        handler = self._handlers[msg_type]
+        response_payload: Optional[tuple] = handler(payload)
+
+        if response_payload is None:
+            self._send((msg_type, msg_id))
+        else:
+            self._send((msg_type, msg_id, response_payload))
+
+    def _send(self, message: tuple):
+        self._writer.write(msgpack.dumps(message))
+
+    def _handle_version(self, _payload) -> tuple:
+        return SIMULATOR_VERSION, self._block_height
+
+    def _handle_claim(self, payload: list) -> tuple:
+        address_bytes, block_height, block_hash, tx_index, tx_hash = payload
+        address: 'Address' = MsgPackForIpc.decode(TypeTag.ADDRESS, address_bytes)
+
+        claim_key: tuple = (address, block_height, block_hash, tx_index)
+        iscore: int = self._pending_claims.get(claim_key)
+        if iscore is None:
+            # Remainder under ISCORE_EXCHANGE_RATE is kept as the reward calculator does
+            claimable: int = self.get_iscore(address)
+            iscore = claimable - claimable % ISCORE_EXCHANGE_RATE
+            self._pending_claims[claim_key] = iscore
+
+        return address_bytes, block_height, block_hash, tx_index, tx_hash, int_to_bytes(iscore)
+
+    def _handle_commit_claim(self, payload: list) -> None:
+        success, address_bytes, block_height, block_hash, tx_index, _ = payload
+        address: 'Address' = MsgPackForIpc.decode(TypeTag.ADDRESS, address_bytes)
+
+        iscore: Optional[int] = self._pending_claims.pop((address, block_height, block_hash, tx_index), None)
+        if success and iscore:
+            self._apply(block_height, {address: -iscore})
+
+    def _handle_query(self, payload: list) -> tuple:
+        address_bytes = payload[0]
+        address: 'Address' = MsgPackForIpc.decode(TypeTag.ADDRESS, address_bytes)
+
+        return address_bytes, int_to_bytes(self.get_iscore(address)), self._block_height
+
+    def _handle_calculate(self, payload: list) -> tuple:
+        db_path: str = payload[0].decode()
+        block_height: int = payload[1]
+
+        if self._calc_status == RCCalculateResult.IN_PROGRESS:
+            return RCCalculateResult.IN_PROGRESS, block_height
+
+        self._calc_status = RCCalculateResult.IN_PROGRESS
+        self._calc_block_height = block_height
+        asyncio.ensure_future(self._calculate(db_path, block_height))
+
+        return RCCalculateResult.SUCCESS, block_height
+
+    async def _calculate(self, db_path: str, block_height: int):
+        Logger.info(tag=_TAG, msg=f"_calculate() start: db_path={db_path} block_height={block_height}")
+
+        success = True
+        issued: int = 0
+        try:
+            iscores: Dict['Address', int] = \
+                await self._loop.run_in_executor(None, self._calculator.run, db_path, block_height)
+            if self._calculate_latency > 0:
+                await asyncio.sleep(self._calculate_latency)
+
+            self._apply(block_height, iscores)
+            issued = sum(iscores.values())
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=str(e))
+            success = False
+
+        state_hash: bytes = self._make_state_hash()
+        self._calc_results[block_height] = issued, state_hash
+        self._calc_status = RCCalculateResult.SUCCESS if success else RCCalculateResult.FAIL
+
+        self._send((MessageType.CALCULATE_DONE, NOTIFICATION_MSG_ID,
+                    (success, block_height, int_to_bytes(issued), state_hash)))
+
+        Logger.info(tag=_TAG, msg=f"_calculate() end: issued={issued} state_hash={bytes_to_hex(state_hash)}")
+
+    def _handle_commit_block(self, payload: list) -> tuple:
+        success, block_height, block_hash = payload
+
+        if success:
+            self._block_height = block_height
+            self._block_hash = block_hash
+
+        return success, block_height, block_hash
+
+    def _handle_query_calculate_status(self, _payload) -> tuple:
+        return self._calc_status, self._calc_block_height
+
+    def _handle_query_calculate_result(self, block_height: int) -> tuple:
+        if self._calc_status == RCCalculateResult.IN_PROGRESS and block_height == self._calc_block_height:
+            return RCCalculateResult.IN_PROGRESS, block_height, int_to_bytes(0), b''
+
+        result: Optional[Tuple[int, bytes]] = self._calc_results.get(block_height)
+        if result is None:
+            return RCCalculateResult.INVALID_BLOCK_HEIGHT, block_height, int_to_bytes(0), b''
+
+        return RCCalculateResult.SUCCESS, block_height, int_to_bytes(result[0]), result[1]
+
+    def _handle_rollback(self, payload: list) -> tuple:
+        block_height, block_hash = payload
+
+        while len(self._journal) > 0 and self._journal[-1][0] > block_height:
+            _, offsets = self._journal.pop()
+            for address, offset in offsets.items():
+                self._add_iscore(address, -offset)
+
+        self._pending_claims.clear()
+        for calc_block_height in [bh for bh in self._calc_results if bh > block_height]:
+            del self._calc_results[calc_block_height]
+
+        self._block_height = block_height
+        self._block_hash = block_hash
+
+        return True, block_height, block_hash
+
+    def _handle_init(self, block_height: int) -> tuple:
+        return self._block_height == block_height, self._block_height
+
+    @staticmethod
+    def _handle_start_block(payload: list) -> tuple:
+        block_height, block_hash = payload
+        return block_height, block_hash
+
+    def _apply(self, block_height: int, offsets: Dict['Address', int]):
+        for address, offset in offsets.items():
+            self._add_iscore(address, offset)
+        self._journal.append((block_height, offsets))
+
+    def _add_iscore(self, address: 'Address', offset: int):
+        iscore: int = self._iscores.get(address, 0) + offset
+        if iscore > 0:
+            self._iscores[address] = iscore
+        else:
+            self._iscores.pop(address, None)
+
+    def _make_state_hash(self) -> bytes:
+        items = [(address.to_bytes_including_prefix(), int_to_bytes(iscore))
+                 for address, iscore in self._iscores.items()]
+        items.sort()
+        return sha3_256(msgpack.dumps(items))
+
+
+def main():
+    """Drop-in replacement for icon_rc executable
+
+    Set iconRcPath in iconservice configuration to the path of this command
+    """
+    parser = argparse.ArgumentParser(prog="icon_rc_simulator", description="Reward calculator simulator")
+    parser.add_argument("-client", action="store_true")
+    parser.add_argument("-db-count", type=int, default=16)
+    parser.add_argument("-db", type=str, default="")
+    parser.add_argument("-iissdata", type=str, default="")
+    parser.add_argument("-ipc-addr", type=str, required=True)
+    parser.add_argument("-log-file", type=str, default="")
+    parser.add_argument("-monitor", action="store_true")
+    parser.add_argument("-latency", type=float, default=0.0, help="seconds to wait before each response")
+    parser.add_argument("-calc-latency", type=float, default=0.0, help="seconds to wait before CALCULATE_DONE")
+    args = parser.parse_args()
+
+    simulator = RewardCalcSimulator(latency=args.latency, calculate_latency=args.calc_latency)
+    simulator.start(args.ipc_addr)
+    simulator.join()
+
+
+if __name__ == "__main__":
+    main()
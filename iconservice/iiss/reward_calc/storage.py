@@ -17,10 +17,14 @@
 import os
 import shutil
 from collections import namedtuple
-from typing import TYPE_CHECKING, Optional, Tuple, List, Set
+from typing import TYPE_CHECKING, Optional, Tuple, List, Set, Callable
 
 from iconcommons import Logger
-from ..reward_calc.msg_data import Header, TxData, PRepsData, TxType, make_block_produce_info_key
+from ..reward_calc.msg_data import (
+    Header, TxData, PRepsData, GovernanceVariable, BlockProduceInfoData, PRepUnregisterTx,
+    make_block_produce_info_key
+)
+from ...base.address import Address
 from ...base.exception import DatabaseException, InternalServiceErrorException
 from ...database.db import KeyValueDatabase
 from ...icon_constant import (
@@ -32,7 +36,6 @@ from ...utils import bytes_to_hex
 from ...utils.msgpack_for_db import MsgPackForDB
 
 if TYPE_CHECKING:
-    from ...base.address import Address
     from ...database.wal import IissWAL
     from ..reward_calc.msg_data import Data, DelegationInfo
     from ...iconscore.icon_score_context import IconScoreContext
@@ -74,6 +77,26 @@ class Storage(object):
     KEY_FOR_CALC_RESPONSE_FROM_RC = b'calc_response_from_rc'
     KEY_FOR_VERSION_AND_REVISION = b'version_and_revision'
 
+    # Secondary index of P-Reps unregistered in the current calc period which is not sent to RC
+    # KEY_PREFIX_FOR_UNREGISTERED_PREP + address: index of PREP_UNREGISTER tx
+    KEY_PREFIX_FOR_UNREGISTERED_PREP = b'unregistered_prep|'
+    # Marks that the index above is complete. It is absent in db made by previous icon service version
+    KEY_FOR_UNREGISTERED_PREP_INDEX = b'unregistered_prep_index'
+    UNREGISTERED_PREP_INDEX_VERSION = 0
+    # The index has been written along with txs since current_db was created
+    UNREGISTERED_PREP_INDEX_MAINTAINED = 0
+    # The index has been built by scanning txs, which is not covered by backups for rollback
+    UNREGISTERED_PREP_INDEX_BUILT = 1
+
+    # Sorted key prefixes of iiss data used as the boundaries of range compaction
+    COMPACTION_KEY_PREFIXES = tuple(sorted((
+        Header.PREFIX,
+        GovernanceVariable.PREFIX,
+        BlockProduceInfoData.PREFIX,
+        PRepsData.PREFIX,
+        TxData.PREFIX
+    )))
+
     def __init__(self):
         self._path: str = ""
         self._db: Optional['KeyValueDatabase'] = None
@@ -110,6 +133,8 @@ class Storage(object):
         self._db_iiss_tx_index = self._load_last_transaction_index()
         Logger.info(tag=IISS_LOG_TAG, msg=f"last_transaction_index on open={self._db_iiss_tx_index}")
 
+        self._remove_built_unregistered_prep_index()
+
         Logger.info(tag=ROLLBACK_LOG_TAG, msg="rollback() end")
 
     @property
@@ -158,11 +183,84 @@ class Storage(object):
         if isinstance(iiss_data, TxData):
             key: bytes = iiss_data.make_key(tx_index)
             value: bytes = iiss_data.make_value()
+
+            index: Optional[Tuple[bytes, bytes]] = self.make_unregistered_prep_index(iiss_data, tx_index)
+            if index is not None:
+                self._db.put(*index)
         else:
             key: bytes = iiss_data.make_key()
             value: bytes = iiss_data.make_value()
         self._db.put(key, value)
 
+    @classmethod
+    def make_unregistered_prep_index(cls, iiss_data: 'Data', tx_index: int) -> Optional[Tuple[bytes, bytes]]:
+        """Make a key-value pair of unregistered P-Rep index which is written along with iiss_data
+
+        :param iiss_data:
+        :param tx_index: index of iiss_data if it is TxData
+        :return: None if iiss_data is not a PREP_UNREGISTER tx
+        """
+        if not isinstance(iiss_data, TxData) or not isinstance(iiss_data.data, PRepUnregisterTx):
+            return None
+
+        key: bytes = cls.KEY_PREFIX_FOR_UNREGISTERED_PREP + iiss_data.address.to_bytes_including_prefix()
+        return key, tx_index.to_bytes(8, DATA_BYTE_ORDER)
+
+    @classmethod
+    def _make_unregistered_prep_index_marker(cls, built: bool = False) -> bytes:
+        kind: int = cls.UNREGISTERED_PREP_INDEX_BUILT if built else cls.UNREGISTERED_PREP_INDEX_MAINTAINED
+        return cls.UNREGISTERED_PREP_INDEX_VERSION.to_bytes(1, DATA_BYTE_ORDER) + kind.to_bytes(1, DATA_BYTE_ORDER)
+
+    def _build_unregistered_prep_index(self):
+        """Build the index of unregistered P-Reps for current_db made by previous icon service version
+
+        It scans every tx only once and does nothing if the index has been built.
+        """
+        if self._db.get(self.KEY_FOR_UNREGISTERED_PREP_INDEX) is not None:
+            return
+
+        batch: List[Tuple[bytes, bytes]] = []
+        db = self._db.get_sub_db(TxData.PREFIX)
+        for k, v in db.iterator():
+            data: 'TxData' = TxData.from_bytes(v)
+            index: Optional[Tuple[bytes, bytes]] = \
+                self.make_unregistered_prep_index(data, int.from_bytes(k, DATA_BYTE_ORDER))
+            if index is not None:
+                batch.append(index)
+
+        batch.append((self.KEY_FOR_UNREGISTERED_PREP_INDEX, self._make_unregistered_prep_index_marker(built=True)))
+        self._db.write_batch(batch)
+
+        Logger.info(tag=IISS_LOG_TAG, msg=f"Build unregistered P-Rep index: count={len(batch) - 1}")
+
+    def _remove_built_unregistered_prep_index(self):
+        """Remove the index built by scanning txs after rollback
+
+        Backups only restore the index entries written along with txs,
+        so the index built by scanning may have the entries of txs which have been rolled back.
+        It is built again on the next use.
+        """
+        if self._db.get(self.KEY_FOR_UNREGISTERED_PREP_INDEX) == self._make_unregistered_prep_index_marker(built=True):
+            self._remove_unregistered_prep_index(self._db)
+            Logger.info(tag=ROLLBACK_LOG_TAG, msg="Remove unregistered P-Rep index built by scanning txs")
+
+    def get_unregistered_preps(self) -> Set['Address']:
+        """Returns P-Reps which have been unregistered in the current calc period
+        """
+        self._build_unregistered_prep_index()
+
+        db = self._db.get_sub_db(self.KEY_PREFIX_FOR_UNREGISTERED_PREP)
+        return {Address.from_bytes_including_prefix(k) for k, _ in db.iterator()}
+
+    def get_first_preps(self) -> Optional['PRepsData']:
+        """Returns the first PRepsData in the current calc period
+        """
+        db = self._db.get_sub_db(PRepsData.PREFIX)
+        for k, v in db.iterator():
+            return PRepsData.from_bytes(k, v)
+
+        return None
+
     def close(self):
         """Close the embedded database.
         """
@@ -252,6 +350,8 @@ class Storage(object):
 
         standby_db_path: str = self.rename_current_db_to_standby_db(self._path, block_height)
         self._db = self.create_current_db(self._path)
+        # Nothing to index in the new current_db
+        self._db.put(self.KEY_FOR_UNREGISTERED_PREP_INDEX, self._make_unregistered_prep_index_marker())
 
         return RewardCalcDBInfo(standby_db_path, block_height)
 
@@ -259,24 +359,30 @@ class Storage(object):
     def finalize_iiss_db(cls,
                          prev_end_bh: int,
                          current_db: 'KeyValueDatabase',
-                         prev_db_path: str):
+                         prev_db_path: str,
+                         on_progress: Optional[Callable[[int, int], None]] = None):
         """
         Finalize iiss db before sending to reward calculator (i.e. RC). Process is below
             1. Move last Block produce data to previous iiss_db which is to be sent to RC
-            2. db compaction
+            2. Remove the index of unregistered P-Reps which is only used by icon service
+            3. db compaction
 
         :param prev_end_bh: end block height of previous term
         :param current_db: newly created db
         :param prev_db_path: iiss_db path which is to be finalized and sent to RC (must has been closed)
+        :param on_progress: called with (compacted ranges, total ranges) whenever a key range is compacted
         :return:
         """
         bp_key: bytes = make_block_produce_info_key(prev_end_bh)
         prev_db: 'KeyValueDatabase' = KeyValueDatabase.from_path(prev_db_path)
-        cls._move_data_from_current_db_to_prev_db(bp_key,
-                                                  current_db,
-                                                  prev_db)
-        prev_db.close()
-        cls._process_db_compaction(prev_db_path)
+        try:
+            cls._move_data_from_current_db_to_prev_db(bp_key,
+                                                      current_db,
+                                                      prev_db)
+            cls._remove_unregistered_prep_index(prev_db)
+            cls._process_db_compaction(prev_db, on_progress)
+        finally:
+            prev_db.close()
 
     @classmethod
     def _move_data_from_current_db_to_prev_db(cls,
@@ -291,15 +397,35 @@ class Storage(object):
         prev_db.put(key, value)
 
     @classmethod
-    def _process_db_compaction(cls, path: str):
+    def _remove_unregistered_prep_index(cls, db: 'KeyValueDatabase'):
+        prefix: bytes = cls.KEY_PREFIX_FOR_UNREGISTERED_PREP
+        keys: List[bytes] = [prefix + k for k, _ in db.get_sub_db(prefix).iterator()]
+        keys.append(cls.KEY_FOR_UNREGISTERED_PREP_INDEX)
+
+        db.write_batch((key, None) for key in keys)
+
+    @classmethod
+    def _process_db_compaction(cls,
+                               db: 'KeyValueDatabase',
+                               on_progress: Optional[Callable[[int, int], None]] = None):
         """
         There is compatibility issue between C++ levelDB and go levelDB.
         To solve it, should make DB being compacted before reading (from RC).
-        :param path: DB path to compact
+
+        The key space is compacted range by range split on the prefixes of iiss data
+        so that a large db is not compacted in a single call and the progress can be reported.
+
+        :param db: DB to compact
+        :param on_progress: called with (compacted ranges, total ranges)
         :return:
         """
-        db = KeyValueDatabase.from_path(path)
-        db.close()
+        bounds: List[Optional[bytes]] = [None, *cls.COMPACTION_KEY_PREFIXES, None]
+        total: int = len(bounds) - 1
+
+        for i in range(total):
+            db.compact(start=bounds[i], stop=bounds[i + 1])
+            if on_progress is not None:
+                on_progress(i + 1, total)
 
     @classmethod
     def create_current_db(cls, rc_data_path: str) -> 'KeyValueDatabase':
@@ -338,19 +464,10 @@ class Storage(object):
         and not used any more after revision is set to 7.
         """
 
-        unreg_preps: Set['Address'] = set()
-        db = self._db.get_sub_db(TxData.PREFIX)
-        for k, v in db.iterator():
-            data: 'TxData' = TxData.from_bytes(v)
-            if data.type == TxType.PREP_UNREGISTER:
-                unreg_preps.add(data.address)
+        unreg_preps: Set['Address'] = self.get_unregistered_preps()
 
-        db = self._db.get_sub_db(PRepsData.PREFIX)
-        preps: Optional[List['DelegationInfo']] = None
-        for k, v in db.iterator():
-            data: 'PRepsData' = PRepsData.from_bytes(k, v)
-            preps = data.prep_list
-            break
+        data: Optional['PRepsData'] = self.get_first_preps()
+        preps: Optional[List['DelegationInfo']] = data.prep_list if data else None
 
         ret = 0
         if preps:
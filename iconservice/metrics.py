@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("Phase", "Counter", "Histogram", "Metrics", "MetricsExporter", "StartupPhase", "StartupTimer")
+
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Optional, Iterable
+
+from iconcommons.logger import Logger
+
+from .icon_constant import METRICS_LOG_TAG
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+_TAG = METRICS_LOG_TAG
+
+
+class Phase:
+    """Phases of invoke and commit of which latencies are measured
+    """
+    # Converting an INVOKE request with TypeConverter
+    CONVERT = "convert"
+    # IconServiceEngine.invoke()
+    INVOKE = "invoke"
+    BEFORE_TX = "beforeTx"
+    # A transaction from the start to the end of processing in a block
+    TX = "tx"
+    # Balance check and default and input steps
+    TX_PRE_VALIDATION = "txPreValidation"
+    # Coin transfer and SCORE invocation or deployment
+    TX_EXECUTION = "txExecution"
+    TX_FEE_CHARGE = "txFeeCharge"
+    # Moving the states changed by a transaction from tx_batch to block_batch
+    TX_BATCH_UPDATE = "txBatchUpdate"
+    AFTER_TX = "afterTx"
+    # Creating PrecommitData
+    PRECOMMIT = "precommit"
+
+    # IconServiceEngine.commit()
+    COMMIT = "commit"
+    WAL_WRITE = "walWrite"
+    # Flushing the write-ahead log to the disk
+    FSYNC = "fsync"
+    BACKUP = "backup"
+    RC_DB_WRITE = "rcDbWrite"
+    STATE_DB_WRITE = "stateDbWrite"
+    # Sending COMMIT_BLOCK to the reward calculator
+    RC_IPC = "rcIpc"
+
+    # Loading SCOREs on startup
+    SCORE_WARM_UP = "scoreWarmUp"
+
+    ALL = (
+        CONVERT, INVOKE, BEFORE_TX, TX, TX_PRE_VALIDATION, TX_EXECUTION, TX_FEE_CHARGE, TX_BATCH_UPDATE, AFTER_TX,
+        PRECOMMIT, COMMIT, WAL_WRITE, FSYNC, BACKUP, RC_DB_WRITE, STATE_DB_WRITE, RC_IPC, SCORE_WARM_UP
+    )
+
+
+class Counter:
+    FAILED_TRANSACTIONS = "failedTransactions"
+    # Blocks whose results were returned from PrecommitDataManager without being invoked again
+    ALREADY_INVOKED_BLOCKS = "alreadyInvokedBlocks"
+    ROLLBACKS = "rollbacks"
+    # SCOREs loaded on startup
+    WARMED_UP_SCORES = "warmedUpScores"
+
+    ALL = (FAILED_TRANSACTIONS, ALREADY_INVOKED_BLOCKS, ROLLBACKS, WARMED_UP_SCORES)
+
+
+class StartupPhase:
+    """Steps of IconServiceEngine.open() which are measured once on startup
+    """
+    OPEN_DB = "openDb"
+    # Recovering the databases with the write-ahead log or the rollback metadata
+    RECOVER_DBS = "recoverDbs"
+    LOAD_LAST_BLOCK = "loadLastBlock"
+    OPEN_EVENT_LOG_STORE = "openEventLogStore"
+    OPEN_STORAGES = "openStorages"
+    # Launching the reward calculator. Its handshake is done asynchronously
+    LAUNCH_RC = "launchRc"
+    OPEN_ENGINES = "openEngines"
+    # Loading P-Reps runs in another thread concurrently with the phases below
+    LOAD_PREPS = "loadPreps"
+    LOAD_BUILTIN_SCORES = "loadBuiltinScores"
+    LOAD_INV = "loadInv"
+    SCORE_WARM_UP = "scoreWarmUp"
+    # From the start to the end of IconServiceEngine.open()
+    OPEN = "open"
+    # From the start of IconServiceEngine.open() until the first hello() is answered
+    # after the reward calculator gets ready
+    READY = "ready"
+
+    ALL = (
+        OPEN_DB, RECOVER_DBS, LOAD_LAST_BLOCK, OPEN_EVENT_LOG_STORE, OPEN_STORAGES, LAUNCH_RC, OPEN_ENGINES,
+        LOAD_PREPS, LOAD_BUILTIN_SCORES, LOAD_INV, SCORE_WARM_UP, OPEN, READY
+    )
+
+
+# Upper bounds of histogram buckets in microseconds
+BUCKET_BOUNDS: List[int] = [
+    10, 25, 50,
+    100, 250, 500,
+    1_000, 2_500, 5_000,
+    10_000, 25_000, 50_000,
+    100_000, 250_000, 500_000,
+    1_000_000, 2_500_000, 5_000_000,
+    10_000_000
+]
+
+
+class Histogram(object):
+    """Latency histogram with fixed buckets
+
+    observe() is called on the invoke thread while snapshot() can be called on others
+    """
+
+    def __init__(self, bounds: List[int] = BUCKET_BOUNDS):
+        """
+        :param bounds: upper bounds of buckets in microseconds in ascending order
+        """
+        self._bounds: List[int] = bounds
+        self._lock = threading.Lock()
+        # The last bucket is for the values greater than the last bound
+        self._buckets: List[int] = [0] * (len(bounds) + 1)
+        self._count: int = 0
+        self._sum: int = 0
+        self._max: int = 0
+
+    def observe(self, duration_s: float):
+        duration: int = int(duration_s * 1_000_000)
+        index: int = bisect_left(self._bounds, duration)
+
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._sum += duration
+            if duration > self._max:
+                self._max = duration
+
+    def snapshot(self) -> dict:
+        """Returns count, sum and max in microseconds and cumulative bucket counts
+
+        buckets[i] is the number of values not greater than bounds[i]
+        and the last one is the number of all values
+        """
+        with self._lock:
+            buckets: List[int] = list(self._buckets)
+            count, sum_, max_ = self._count, self._sum, self._max
+
+        for i in range(1, len(buckets)):
+            buckets[i] += buckets[i - 1]
+
+        return {
+            "count": count,
+            "sum": sum_,
+            "max": max_,
+            "buckets": buckets
+        }
+
+
+class _Measurement(object):
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: 'Histogram'):
+        self._histogram = histogram
+        self._start: float = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class _NoMeasurement(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NO_MEASUREMENT = _NoMeasurement()
+
+
+class _StartupMeasurement(object):
+    __slots__ = ("_timer", "_phase", "_start")
+
+    def __init__(self, timer: 'StartupTimer', phase: str):
+        self._timer = timer
+        self._phase: str = phase
+        self._start: float = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._timer.observe(self._phase, time.perf_counter() - self._start)
+
+
+class StartupTimer(object):
+    """Durations of the startup phases
+
+    Each phase is measured once and measure() can be called on several threads at the same time
+
+    with startup_timer.measure(StartupPhase.RECOVER_DBS):
+        ...
+    """
+
+    def __init__(self):
+        self._start: float = time.perf_counter()
+        self._lock = threading.Lock()
+        self._durations: Dict[str, float] = {}
+
+    def measure(self, phase: str) -> '_StartupMeasurement':
+        return _StartupMeasurement(self, phase)
+
+    def observe(self, phase: str, duration_s: float):
+        with self._lock:
+            self._durations[phase] = duration_s
+
+    def mark(self, phase: str):
+        """Records the time elapsed since the timer was created
+
+        Only the first call for each phase is recorded
+        """
+        duration: float = time.perf_counter() - self._start
+        with self._lock:
+            self._durations.setdefault(phase, duration)
+
+    def get(self, phase: str) -> Optional[float]:
+        """Returns the duration of a phase in seconds or None if it has not been measured
+        """
+        with self._lock:
+            return self._durations.get(phase)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Returns the durations of the measured phases in microseconds
+        """
+        with self._lock:
+            durations = dict(self._durations)
+
+        return {phase: int(durations[phase] * 1_000_000) for phase in StartupPhase.ALL if phase in durations}
+
+
+class Metrics(object):
+    """Counters and latency histograms of the phases of invoke and commit
+
+    with metrics.measure(Phase.INVOKE):
+        ...
+    """
+
+    def __init__(self, enable: bool = True, startup_timer: Optional['StartupTimer'] = None):
+        """
+        :param enable: if False, nothing is measured or counted
+        :param startup_timer: durations of the startup phases which are exported together
+        """
+        self._enable: bool = enable
+        self._startup_timer: Optional['StartupTimer'] = startup_timer
+        self._histograms: Dict[str, 'Histogram'] = {phase: Histogram() for phase in Phase.ALL}
+        self._counters: Dict[str, int] = {counter: 0 for counter in Counter.ALL}
+        self._counter_lock = threading.Lock()
+
+    @property
+    def enable(self) -> bool:
+        return self._enable
+
+    def measure(self, phase: str):
+        """Returns a context manager which measures the time taken in it
+        """
+        if not self._enable:
+            return _NO_MEASUREMENT
+        return _Measurement(self._histograms[phase])
+
+    def observe(self, phase: str, duration_s: float):
+        if self._enable:
+            self._histograms[phase].observe(duration_s)
+
+    def increase(self, counter: str, value: int = 1):
+        if self._enable:
+            with self._counter_lock:
+                self._counters[counter] += value
+
+    def get_metrics(self, phases: Optional[Iterable[str]] = None) -> dict:
+        """Returns the metrics for ise_getMetrics
+
+        Durations are in microseconds
+
+        :param phases: phases to return. All phases are returned if it is None
+        :return: {
+            "enable": True,
+            "bounds": [10, 25, ...],
+            "phases": {"invoke": {"count": 1, "sum": 1000, "max": 1000, "buckets": [0, 0, ...]}, ...},
+            "counters": {"failedTransactions": 0, ...},
+            "startup": {"openDb": 1000, ..., "open": 100000}
+        }
+        """
+        if phases is None:
+            phases = Phase.ALL
+
+        with self._counter_lock:
+            counters = dict(self._counters)
+
+        return {
+            "enable": self._enable,
+            "bounds": list(BUCKET_BOUNDS),
+            "phases": {phase: self._histograms[phase].snapshot() for phase in phases if phase in self._histograms},
+            "counters": counters,
+            "startup": self._startup_timer.to_dict() if self._startup_timer else {}
+        }
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in Prometheus text exposition format
+
+        Durations are in seconds
+        """
+        lines: List[str] = []
+        name = "iconservice_phase_duration_seconds"
+        les: List[str] = [_format_seconds(bound) for bound in BUCKET_BOUNDS] + ["+Inf"]
+
+        lines.append(f"# HELP {name} Latency of each phase of invoke and commit")
+        lines.append(f"# TYPE {name} histogram")
+        for phase in Phase.ALL:
+            snapshot: dict = self._histograms[phase].snapshot()
+            for le, count in zip(les, snapshot["buckets"]):
+                lines.append(f'{name}_bucket{{phase="{phase}",le="{le}"}} {count}')
+            lines.append(f'{name}_sum{{phase="{phase}"}} {_format_seconds(snapshot["sum"])}')
+            lines.append(f'{name}_count{{phase="{phase}"}} {snapshot["count"]}')
+
+        with self._counter_lock:
+            counters = dict(self._counters)
+
+        for counter, value in counters.items():
+            counter_name = f"iconservice_{_to_snake_case(counter)}_total"
+            lines.append(f"# TYPE {counter_name} counter")
+            lines.append(f"{counter_name} {value}")
+
+        if self._startup_timer is not None:
+            name = "iconservice_startup_phase_duration_seconds"
+            lines.append(f"# HELP {name} Duration of each phase of startup")
+            lines.append(f"# TYPE {name} gauge")
+            for phase, duration in self._startup_timer.to_dict().items():
+                lines.append(f'{name}{{phase="{phase}"}} {_format_seconds(duration)}')
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _format_seconds(microseconds: int) -> str:
+    return f"{microseconds / 1_000_000:.6f}".rstrip("0").rstrip(".")
+
+
+def _to_snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class MetricsExporter(object):
+    """Exports metrics in Prometheus text format
+    through a local HTTP endpoint, a file written periodically or both
+    """
+
+    def __init__(self, metrics: 'Metrics', port: int = 0, file_path: str = "", interval: int = 10):
+        """
+        :param metrics:
+        :param port: port of the HTTP endpoint listening on localhost, 0 means no endpoint
+        :param file_path: path of the file to which metrics are written, "" means no file
+        :param interval: seconds between writing the file
+        """
+        self._metrics = metrics
+        self._port: int = port
+        self._file_path: str = file_path
+        self._interval: int = interval
+
+        self._server: Optional['ThreadingHTTPServer'] = None
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+
+    @property
+    def port(self) -> int:
+        """The port which the HTTP endpoint is bound to
+        """
+        return self._server.server_address[1] if self._server else self._port
+
+    def start(self):
+        if self._port > 0:
+            # http.server is imported only when the endpoint is used to reduce the startup time
+            from http.server import ThreadingHTTPServer
+
+            self._server = ThreadingHTTPServer(("127.0.0.1", self._port), self._make_handler())
+            self._server.daemon_threads = True
+            self._start_thread("MetricsServer", self._server.serve_forever)
+            Logger.info(tag=_TAG, msg=f"Metrics endpoint: http://127.0.0.1:{self.port}/metrics")
+
+        if self._file_path:
+            self._start_thread("MetricsFileWriter", self._run_file_writer)
+            Logger.info(tag=_TAG, msg=f"Metrics file: {self._file_path}")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def _start_thread(self, name: str, target):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _run_file_writer(self):
+        while True:
+            stopped: bool = self._stop_event.wait(self._interval)
+            try:
+                self.write_file()
+            except BaseException as e:
+                Logger.warning(tag=_TAG, msg=f"Failed to write metrics: {e}")
+
+            if stopped:
+                break
+
+    def write_file(self):
+        # Readers never see a partially written file
+        tmp_path = f"{self._file_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self._metrics.to_prometheus())
+        os.replace(tmp_path, self._file_path)
+
+    def _make_handler(self):
+        from http.server import BaseHTTPRequestHandler
+
+        metrics = self._metrics
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+
+                body: bytes = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return _Handler
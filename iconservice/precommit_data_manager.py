@@ -32,7 +32,10 @@ from . import __version__
 
 if TYPE_CHECKING:
     from .base.address import Address
+    from .fee.deposit_index import DepositIndexContainer
     from .prep.data import PRepContainer, Term
+    from .utils.bloom import BloomFilter
+    from .iconscore.icon_score_resource import ScoreResourceTracker
 
 _TAG = "PRECOMMIT"
 
@@ -136,12 +139,18 @@ class PrecommitData(object):
                  added_transactions: dict,
                  next_preps: Optional[dict],
                  prep_address_converter: 'PRepAddressConverter',
-                 is_shutdown: bool):
+                 is_shutdown: bool,
+                 logs_bloom: Optional['BloomFilter'] = None,
+                 resource_tracker: Optional['ScoreResourceTracker'] = None,
+                 deposit_indices: Optional['DepositIndexContainer'] = None):
         """
 
         :param block_batch: changed states for a block
         :param block_result: tx_results made from transactions in a block
         :param score_mapper: newly deployed scores in a block
+        :param logs_bloom: bloom filter of all event logs in a block
+        :param resource_tracker: resources used by SCOREs in a block
+        :param deposit_indices: deposit indices of SCOREs after a block is invoked
 
         """
         # Todo: check if remove the revision
@@ -168,6 +177,9 @@ class PrecommitData(object):
 
         self.prep_address_converter: 'PRepAddressConverter' = prep_address_converter
         self.is_shutdown = is_shutdown
+        self.logs_bloom: Optional['BloomFilter'] = logs_bloom
+        self.resource_tracker: Optional['ScoreResourceTracker'] = resource_tracker
+        self.deposit_indices: Optional['DepositIndexContainer'] = deposit_indices
 
         # To prevent redundant precommit data logging
         self.already_exists = False
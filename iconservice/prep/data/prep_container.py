@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+from typing import List, Optional, Iterable
 
 from iconcommons import Logger
 from .prep import PRep, PRepStatus
@@ -147,6 +147,36 @@ class PRepContainer(object):
 
         return old_prep
 
+    def replace_all(self, new_preps: Iterable['PRep']):
+        """Replace old_preps with new_preps in one sorted pass
+
+        The result is the same as the one made by calling replace() for each P-Rep in turn
+
+        :param new_preps:
+        :return:
+        """
+        self._check_access_permission()
+
+        active_preps: List['PRep'] = []
+
+        for new_prep in new_preps:
+            old_prep: Optional['PRep'] = self._prep_dict.get(new_prep.address)
+            if id(old_prep) == id(new_prep):
+                Logger.debug(tag=self._TAG, msg="No need to replace the same P-Rep")
+                continue
+
+            self._remove(new_prep.address)
+            self._prep_dict[new_prep.address] = new_prep
+
+            if new_prep.status == PRepStatus.ACTIVE:
+                active_preps.append(new_prep)
+                self._total_prep_delegated += new_prep.delegated
+
+            self._flags |= PRepContainerFlag.DIRTY
+
+        self._active_prep_list.merge(active_preps)
+        assert self._total_prep_delegated >= 0
+
     def contains(self, address: 'Address', active_prep_only: bool = True) -> bool:
         """Check whether the P-Rep is contained regardless of its PRepStatus
 
@@ -33,16 +33,41 @@ class SortedList(object):
         :param new_item:
         :return:
         """
-        index = 0
-        order = new_item.order()
+        index: int = self._upper_bound(new_item.order())
+        self._items.insert(index, new_item)
 
-        for item in self._items:
-            if order < item.order():
-                break
+    def merge(self, new_items: Iterable['Sortable']):
+        """Add new items in one sorted pass
+
+        The result is the same as the one made by calling add() for each item in turn
 
+        :param new_items:
+        :return:
+        """
+        index = 0
+
+        for new_item in sorted(new_items, key=lambda x: x.order()):
+            index = self._upper_bound(new_item.order(), index)
+            self._items.insert(index, new_item)
             index += 1
 
-        self._items.insert(index, new_item)
+    def _upper_bound(self, order, left: int = 0) -> int:
+        """Returns the index after the last item whose order is not more than the given order
+
+        :param order:
+        :param left: the index to start searching from
+        :return:
+        """
+        right: int = len(self._items)
+
+        while left < right:
+            i = (left + right) // 2
+            if order < self._items[i].order():
+                right = i
+            else:
+                left = i + 1
+
+        return left
 
     def get(self, index: int) -> Optional['Sortable']:
         try:
@@ -154,8 +154,13 @@ class Term(object):
             and self._merkle_root_hash == other._merkle_root_hash
 
     def is_main_prep(self, address: 'Address') -> bool:
+        # Main and sub P-Reps share the same PRepSnapshot objects with self._preps_dict
+        snapshot: Optional['PRepSnapshot'] = self._preps_dict.get(address)
+        if snapshot is None:
+            return False
+
         for prep_snapshot in self._main_preps:
-            if address == prep_snapshot.address:
+            if prep_snapshot is snapshot:
                 return True
 
         return False
@@ -41,10 +41,13 @@ def check_backup_exists(backup_root_path: str, current_block_height: int, rollba
             rollback_block_height > current_block_height:
         return False
 
+    from .segment import BackupSegments
+    segments = BackupSegments(backup_root_path)
+
     for block_height in range(current_block_height - 1, rollback_block_height - 1, -1):
         filename = get_backup_filename(block_height)
         path = os.path.join(backup_root_path, filename)
-        if not os.path.isfile(path):
+        if not os.path.isfile(path) and not segments.contains(block_height):
             return False
 
     return True
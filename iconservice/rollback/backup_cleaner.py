@@ -16,60 +16,275 @@
 __all__ = "BackupCleaner"
 
 import os
+import queue
 import re
+import threading
+from typing import Optional, Set, List, Tuple, Callable, Iterable
 
 from iconcommons.logger import Logger
 from . import get_backup_filename
-from ..icon_constant import BACKUP_LOG_TAG, BACKUP_FILES
+from .segment import BackupSegment, get_segment_filename, get_segment_start_block_height, is_segment_filename
+from ..icon_constant import BACKUP_LOG_TAG, BACKUP_FILES, BACKUP_CLEANER_QUEUE_SIZE, BACKUP_CLEANER_BATCH_SIZE
+from ..utils.msgpack_for_db import MsgPackForDB
 
 _TAG = BACKUP_LOG_TAG
 
+_MAX_BLOCK_HEIGHT = 2 ** 64 - 1
+
 
 class BackupCleaner(object):
     """Remove old backup files to rollback
 
+    The existing backups are indexed in memory by run_on_init() and the index is updated on every commit,
+    so that stale backups are found without scanning the backup directory again.
+    The index is saved to INDEX_FILENAME on close() and loaded by the next run_on_init() instead of a full scan.
+    The file is removed on loading, so the directory is scanned again if iconservice is not closed normally.
+
+    After start(), put_on_init() and put_on_commit() hand over the jobs to a background thread
+    through a bounded queue instead of removing files on the commit path.
+    The thread removes stale backup files in batches of batch_size files.
+    A job is dropped if the queue is full, which is harmless because the next job removes all stale backups in the index.
     """
 
-    def __init__(self, backup_root_path: str, backup_files: int):
+    INDEX_FILENAME = "backup_cleaner.idx"
+    _INDEX_VERSION = 0
+
+    def __init__(self,
+                 backup_root_path: str,
+                 backup_files: int,
+                 segment_size: int = 0,
+                 queue_size: int = BACKUP_CLEANER_QUEUE_SIZE,
+                 batch_size: int = BACKUP_CLEANER_BATCH_SIZE):
         """
 
         :param backup_root_path: the directory where backup files are placed
         :param backup_files: the maximum backup files to keep
+        :param segment_size: the number of blocks in a segment file
+            A segment file is removed when all of its blocks are out of backup_files blocks
+        :param queue_size: the maximum number of jobs waiting for the background thread
+        :param batch_size: the minimum number of stale backup files which the background thread removes at once
         """
         self._backup_root_path = backup_root_path
         self._backup_files = backup_files if backup_files > 0 else BACKUP_FILES
-        self._regex_object = re.compile("^[\d]{10}.bak$")
+        self._segment_size = segment_size
+        self._batch_size = max(batch_size, 1)
+        self._regex_object = re.compile(r"^\d{10}\.bak$")
+
+        # The block heights of backup files and the start block heights of segment files
+        # None means that the backup directory has not been scanned yet
+        self._block_heights: Optional[Set[int]] = None
+        self._segment_start_block_heights: Set[int] = set()
+        # The next block height which will be added to the index on commit
+        self._next_block_height: int = -1
+        self._lock = threading.Lock()
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+        self._removed_files: int = 0
+        self._dropped_jobs: int = 0
+
+    def start(self):
+        """Start a background thread which runs the jobs passed to put_on_init() and put_on_commit()
+        """
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run_jobs, name="BackupCleaner", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop the background thread after all jobs in the queue are done and save the index
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        self._save_index()
+
+    def put_on_init(self, current_block_height: int):
+        """Run run_on_init() in background
+
+        The queue is empty on startup, so the job is never dropped.
+        Unlike run_on_init(), the backups from current_block_height are kept
+        because the blocks committed after startup can write them before the job runs.
+        They are overwritten by new blocks anyway.
+        """
+        self._put(self._run_on_init_in_background, current_block_height)
+
+    def put_on_commit(self, current_block_height: int):
+        """Run run_on_commit() in background
+        """
+        self._put(self._run_on_commit_in_batch, current_block_height)
+
+    def _put(self, func: Callable[[int], int], current_block_height: int):
+        if self._thread is None:
+            func(current_block_height)
+            return
+
+        try:
+            self._queue.put_nowait((func, current_block_height))
+        except queue.Full:
+            with self._lock:
+                self._dropped_jobs += 1
+            Logger.debug(tag=_TAG, msg=f"Drop a job: {func.__name__}({current_block_height})")
+
+    def _run_jobs(self):
+        Logger.info(tag=_TAG, msg="BackupCleaner thread start")
+
+        while True:
+            job: Optional[Tuple[Callable[[int], int], int]] = self._queue.get()
+            if job is None:
+                break
+
+            func, current_block_height = job
+            try:
+                func(current_block_height)
+            except BaseException as e:
+                Logger.exception(tag=_TAG, msg=f"Failed to clean up backups: {e}")
+
+        Logger.info(tag=_TAG, msg="BackupCleaner thread end")
 
     def run_on_init(self, current_block_height: int) -> int:
         """Clean up all stale backup files on iconservice startup
 
+        The backups to keep are indexed in memory
+
         :param current_block_height:
         :return:
         """
-        Logger.debug(tag=_TAG, msg=f"run_on_init() start")
+        return self._run_on_init(current_block_height, in_background=False)
+
+    def _run_on_init_in_background(self, current_block_height: int) -> int:
+        return self._run_on_init(current_block_height, in_background=True)
+
+    def _run_on_init(self, current_block_height: int, in_background: bool) -> int:
+        Logger.debug(tag=_TAG, msg=f"run_on_init() start: in_background={in_background}")
 
         ret = 0
         start_block_height = max(0, current_block_height - self._backup_files)
-
-        with os.scandir(self._backup_root_path) as it:
-            for entry in it:
-                # backup filename: ex) 0000012345.bak
-                if entry.is_file() and self._is_backup_filename_valid(entry.name):
-                    block_height: int = self._get_block_height_from_filename(entry.name)
-                    if block_height < 0:
+        block_heights: Set[int] = set()
+        segment_start_block_heights: Set[int] = set()
+
+        for name, path in self._list_backup_files(current_block_height):
+            # backup filename: ex) 0000012345.bak
+            if self._is_backup_filename_valid(name):
+                block_height: int = self._get_block_height_from_filename(name)
+                if block_height < 0:
+                    continue
+
+                # Do nothing for the latest backup files
+                if start_block_height <= block_height < current_block_height or \
+                        (in_background and block_height >= current_block_height):
+                    block_heights.add(block_height)
+                    continue
+
+                # Remove stale backup files
+                if self._remove_file(path):
+                    ret += 1
+            elif is_segment_filename(name):
+                segment = BackupSegment(path)
+
+                if in_background:
+                    # Backups can be appended to a segment file at the same time,
+                    # so only the segment files containing stale backups only are removed
+                    index, _ = segment.read_index()
+                    if len(index) == 0 or max(index) < start_block_height:
+                        if self._remove_file(path):
+                            ret += 1
                         continue
+                else:
+                    # Remove stale backups in a segment file
+                    if start_block_height > 0:
+                        ret += segment.remove(0, start_block_height - 1)
+                    ret += segment.remove(current_block_height, _MAX_BLOCK_HEIGHT)
 
-                    # Do nothing for the latest backup files
-                    if start_block_height <= block_height < current_block_height:
-                        continue
+                if os.path.exists(path):
+                    segment_start_block_heights.add(int(name[:10]))
 
-                    # Remove stale backup files
-                    if self._remove_file(entry.path):
-                        ret += 1
+        with self._lock:
+            self._block_heights = block_heights
+            self._segment_start_block_heights = segment_start_block_heights
+            self._next_block_height = current_block_height
+            self._removed_files += ret
 
         Logger.debug(tag=_TAG, msg=f"run_on_init() end: ret={ret}")
         return ret
 
+    def _list_backup_files(self, current_block_height: int) -> Iterable[Tuple[str, str]]:
+        """Returns the backup files in the index saved on close() or in the backup directory if there is no index
+
+        :return: (filename, path)
+        """
+        index: Optional[list] = self._load_index()
+
+        if index is None:
+            with os.scandir(self._backup_root_path) as it:
+                for entry in it:
+                    if entry.is_file():
+                        yield entry.name, entry.path
+            return
+
+        _, next_block_height, block_heights, segment_start_block_heights = index
+
+        # The backups written after the index was saved
+        for block_height in range(next_block_height, current_block_height):
+            if self._segment_size > 0:
+                segment_start_block_heights.append(get_segment_start_block_height(block_height, self._segment_size))
+            else:
+                block_heights.append(block_height)
+
+        names: List[str] = [get_backup_filename(h) for h in set(block_heights)]
+        names.extend(get_segment_filename(h) for h in set(segment_start_block_heights))
+        for name in names:
+            path: str = os.path.join(self._backup_root_path, name)
+            if os.path.isfile(path):
+                yield name, path
+
+    def _load_index(self) -> Optional[list]:
+        path: str = os.path.join(self._backup_root_path, self.INDEX_FILENAME)
+
+        try:
+            with open(path, "rb") as f:
+                index: list = MsgPackForDB.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to load the index: {e}")
+            index = None
+        finally:
+            self._remove_file(path)
+
+        if index is None or index[0] != self._INDEX_VERSION:
+            return None
+
+        Logger.info(tag=_TAG, msg=f"Load the index: nextBlockHeight={index[1]}")
+        return index
+
+    def _save_index(self):
+        with self._lock:
+            if self._block_heights is None:
+                return
+
+            index: list = [
+                self._INDEX_VERSION,
+                self._next_block_height,
+                sorted(self._block_heights),
+                sorted(self._segment_start_block_heights)
+            ]
+
+        path: str = os.path.join(self._backup_root_path, self.INDEX_FILENAME)
+        tmp_path: str = f"{path}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(MsgPackForDB.dumps(index))
+            os.replace(tmp_path, path)
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to save the index: {e}")
+            self._remove_file(tmp_path)
+
     @staticmethod
     def _get_block_height_from_filename(filename: str) -> int:
         try:
@@ -85,6 +300,8 @@ class BackupCleaner(object):
     def run_on_commit(self, current_block_height: int) -> int:
         """Remove the oldest backup file on commit
 
+        If the backups are indexed, all stale ones in the index are removed
+
         :param: current_block_height
         :param: func: function to remove a file with path
         :return: the number of removed files
@@ -93,19 +310,89 @@ class BackupCleaner(object):
                      msg=f"run() start: current_block_height={current_block_height} "
                          f"backup_files={self._backup_files}")
 
+        if self._block_heights is not None:
+            ret = self._remove_stale_backups(current_block_height, min_count=1)
+            Logger.debug(tag=_TAG, msg="run() end")
+            return ret
+
         # Remove the oldest backup file only
+        # Segment files are not rewritten on every commit but removed at once below
         start_block_height = current_block_height - self._backup_files - 1
-        ret = self.run(start_block_height, end_block_height=start_block_height)
+        ret = self.run(start_block_height, end_block_height=start_block_height, include_segments=False)
+
+        # Remove the oldest segment file if the oldest backup is the last one in it
+        if self._segment_size > 0 and start_block_height >= 0 and (start_block_height + 1) % self._segment_size == 0:
+            filename: str = get_segment_filename(start_block_height + 1 - self._segment_size)
+            if self._remove_file(os.path.join(self._backup_root_path, filename)):
+                ret += 1
 
         Logger.debug(tag=_TAG, msg="run() end")
 
         return ret
 
-    def run(self, start_block_height: int, end_block_height: int) -> int:
+    def _run_on_commit_in_batch(self, current_block_height: int) -> int:
+        if self._block_heights is None:
+            return self.run_on_commit(current_block_height)
+
+        return self._remove_stale_backups(current_block_height, min_count=self._batch_size)
+
+    def _remove_stale_backups(self, current_block_height: int, min_count: int) -> int:
+        """Index the backups written until current_block_height and remove stale ones in the index
+
+        :param current_block_height:
+        :param min_count: files are not removed until the number of stale files reaches it
+        :return: the number of removed files
+        """
+        # The backup of the previous block has been written on commit
+        # The blocks of the dropped jobs are also indexed here
+        end_block_height: int = current_block_height - self._backup_files - 1
+        paths: List[str] = []
+
+        with self._lock:
+            next_block_height = self._next_block_height
+            if not (0 <= next_block_height < current_block_height):
+                next_block_height = max(current_block_height - 1, 0)
+
+            for block_height in range(next_block_height, current_block_height):
+                if self._segment_size > 0:
+                    self._segment_start_block_heights.add(
+                        get_segment_start_block_height(block_height, self._segment_size))
+                else:
+                    self._block_heights.add(block_height)
+            self._next_block_height = current_block_height
+
+            stale_block_heights: List[int] = [h for h in self._block_heights if h <= end_block_height]
+            stale_segments: List[int] = [
+                h for h in self._segment_start_block_heights if h + self._segment_size - 1 <= end_block_height
+            ]
+            if len(stale_block_heights) + len(stale_segments) < min_count:
+                return 0
+
+            self._block_heights.difference_update(stale_block_heights)
+            self._segment_start_block_heights.difference_update(stale_segments)
+
+        for block_height in sorted(stale_block_heights):
+            paths.append(os.path.join(self._backup_root_path, get_backup_filename(block_height)))
+        for start_block_height in sorted(stale_segments):
+            paths.append(os.path.join(self._backup_root_path, get_segment_filename(start_block_height)))
+
+        ret = 0
+        for path in paths:
+            if self._remove_file(path):
+                ret += 1
+
+        with self._lock:
+            self._removed_files += ret
+
+        Logger.debug(tag=_TAG, msg=f"Remove stale backups: end={end_block_height} count={ret}")
+        return ret
+
+    def run(self, start_block_height: int, end_block_height: int, include_segments: bool = True) -> int:
         """Remove block backup files ranging from start_block_height to end_block_height inclusive
 
         :param start_block_height:
         :param end_block_height:
+        :param include_segments: whether to remove the backups in segment files too
         :return: The number of removed files
         """
         Logger.debug(tag=_TAG, msg=f"run() start: start={start_block_height} end={end_block_height}")
@@ -126,6 +413,17 @@ class BackupCleaner(object):
             if self._remove_file(path):
                 ret += 1
 
+        with self._lock:
+            if self._block_heights is not None:
+                self._block_heights.difference_update(range(start_block_height, end_block_height + 1))
+
+        # Remove block backups in segment files
+        if include_segments:
+            ret += self._remove_from_segments(start_block_height, end_block_height)
+
+        with self._lock:
+            self._removed_files += ret
+
         Logger.info(tag=_TAG,
                     msg=f"Clean up old backup files: "
                         f"start={start_block_height} end={end_block_height} count={ret}")
@@ -133,6 +431,25 @@ class BackupCleaner(object):
 
         return ret
 
+    def _remove_from_segments(self, start_block_height: int, end_block_height: int) -> int:
+        ret = 0
+
+        with os.scandir(self._backup_root_path) as it:
+            for entry in it:
+                if not (entry.is_file() and is_segment_filename(entry.name)):
+                    continue
+
+                # A segment file cannot contain the blocks before its start block height
+                if int(entry.name[:10]) > end_block_height:
+                    continue
+
+                try:
+                    ret += BackupSegment(entry.path).remove(start_block_height, end_block_height)
+                except BaseException as e:
+                    Logger.warning(tag=_TAG, msg=str(e))
+
+        return ret
+
     @staticmethod
     def _remove_file(path: str) -> bool:
         try:
@@ -144,3 +461,14 @@ class BackupCleaner(object):
             Logger.warning(tag=_TAG, msg=str(e))
 
         return False
+
+    def get_status(self) -> dict:
+        with self._lock:
+            return {
+                "running": self._thread is not None,
+                "queued": self._queue.qsize(),
+                "indexed": -1 if self._block_heights is None else len(self._block_heights),
+                "segments": len(self._segment_start_block_heights),
+                "removed": self._removed_files,
+                "dropped": self._dropped_jobs
+            }
@@ -22,6 +22,7 @@ from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogWriter
 from iconservice.icon_constant import ROLLBACK_LOG_TAG
 from iconservice.rollback import get_backup_filename
+from iconservice.rollback.segment import BackupSegment, get_segment_filename, get_segment_start_block_height
 
 if TYPE_CHECKING:
     from iconservice.database.wal import IissWAL
@@ -40,18 +41,36 @@ class BackupManager(object):
 
     """
 
-    def __init__(self, backup_root_path: str, rc_data_path: str):
+    def __init__(self, backup_root_path: str, rc_data_path: str, compression: str = "", segment_size: int = 0):
+        """
+
+        :param backup_root_path:
+        :param rc_data_path:
+        :param compression: "" (no compression) or "zlib"
+        :param segment_size: the number of blocks in a segment file
+            0 means that the backup of each block is written to its own file
+        """
         Logger.debug(tag=TAG,
                      msg=f"__init__() start: "
                          f"backup_root_path={backup_root_path}, "
-                         f"rc_data_path={rc_data_path}")
+                         f"rc_data_path={rc_data_path}, "
+                         f"compression={compression}, "
+                         f"segment_size={segment_size}")
 
         self._rc_data_path = rc_data_path
         self._backup_root_path = backup_root_path
+        self._compression = compression
+        self._segment_size = segment_size
+        # The number of bytes written in the last backup
+        self._last_backup_size = 0
 
         Logger.info(tag=TAG, msg=f"backup_root_path={self._backup_root_path}")
         Logger.debug(tag=TAG, msg="__init__() end")
 
+    @property
+    def last_backup_size(self) -> int:
+        return self._last_backup_size
+
     def _get_backup_file_path(self, block_height: int) -> str:
         """
 
@@ -86,12 +105,24 @@ class BackupManager(object):
         """
         Logger.debug(tag=TAG, msg="backup() start")
 
-        path: str = self._get_backup_file_path(prev_block.height)
+        if self._segment_size > 0:
+            start_block_height: int = get_segment_start_block_height(prev_block.height, self._segment_size)
+            path: str = os.path.join(self._backup_root_path, get_segment_filename(start_block_height))
+        else:
+            path: str = self._get_backup_file_path(prev_block.height)
         Logger.info(tag=TAG, msg=f"backup_file_path={path}")
 
         writer = WriteAheadLogWriter(
-            revision, max_log_count=2, block=prev_block, instant_block_hash=instant_block_hash)
-        writer.open(path)
+            revision,
+            max_log_count=2,
+            block=prev_block,
+            instant_block_hash=instant_block_hash,
+            compression=self._compression)
+
+        if self._segment_size > 0:
+            writer.open_memory()
+        else:
+            writer.open(path)
 
         if is_calc_period_start_block:
             writer.write_state(WALBackupState.CALC_PERIOD_END_BLOCK.value)
@@ -99,7 +130,12 @@ class BackupManager(object):
         self._backup_rc_db(writer, rc_db, iiss_wal)
         self._backup_state_db(writer, icx_db, block_batch)
 
-        writer.close()
+        if self._segment_size > 0:
+            self._last_backup_size = BackupSegment(path).append(prev_block.height, writer.getvalue())
+            writer.close()
+        else:
+            writer.close()
+            self._last_backup_size = os.path.getsize(path)
 
         Logger.debug(tag=TAG, msg="backup() end")
 
@@ -15,10 +15,12 @@
 
 import os
 import shutil
+from operator import itemgetter
 from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
 from iconcommons.logger import Logger
 from .backup_manager import get_backup_filename
+from .segment import BackupSegments
 from ..base.exception import InvalidParamsException, InternalServiceErrorException
 from ..database.db import KeyValueDatabase
 from ..database.wal import WriteAheadLogReader, WALDBType
@@ -63,16 +65,22 @@ class RollbackManager(object):
             self._term_change_exists(last_block_height, rollback_block_height, term_start_block_height)
         calc_end_block_height = term_start_block_height - 1
         reader = WriteAheadLogReader()
+        segments = BackupSegments(self._backup_root_path)
         state_db_batch = {}
         iiss_db_batch = {}
 
         for block_height in range(last_block_height - 1, rollback_block_height - 1, -1):
             # Make backup file with a given block_height
             path: str = self._get_backup_file_path(block_height)
-            if not os.path.isfile(path):
-                raise InternalServiceErrorException(f"Backup file not found: {path}")
+            if os.path.isfile(path):
+                reader.open(path, use_mmap=True)
+            else:
+                # The backup can be in a segment file
+                data: Optional[bytes] = segments.read(block_height)
+                if data is None:
+                    raise InternalServiceErrorException(f"Backup file not found: {path}")
 
-            reader.open(path)
+                reader.open_bytes(data)
 
             # Merge backup data into state_db_batch
             self._write_batch(reader.get_iterator(WALDBType.STATE.value), state_db_batch)
@@ -117,12 +125,14 @@ class RollbackManager(object):
 
     @staticmethod
     def _write_batch(it: Iterable[Tuple[bytes, Optional[bytes]]], batch: dict):
-        for key, value in it:
-            batch[key] = value
+        # Backup files are merged from the latest one to the oldest one,
+        # so the value in the oldest backup file overwrites the others
+        batch.update(it)
 
     @staticmethod
     def _commit_batch(batch: dict, db: 'KeyValueDatabase'):
-        db.write_batch(batch.items())
+        # LevelDB writes a large batch much faster when its keys are sorted
+        db.write_batch(sorted(batch.items(), key=itemgetter(0)))
 
     def _get_backup_file_path(self, block_height: int) -> str:
         """
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = (
+    "BackupSegment", "BackupSegments",
+    "get_segment_filename", "get_segment_start_block_height", "is_segment_filename"
+)
+
+import bisect
+import os
+import re
+import struct
+from typing import Dict, Tuple, Optional, List
+
+from iconcommons.logger import Logger
+
+from ..icon_constant import BACKUP_LOG_TAG
+
+_TAG = BACKUP_LOG_TAG
+
+# block_height(8) | size(4)
+_RECORD_HEADER_FORMAT = ">QI"
+_RECORD_HEADER_SIZE = struct.calcsize(_RECORD_HEADER_FORMAT)
+
+_SEGMENT_FILENAME_REGEX = re.compile(r"^\d{10}\.seg$")
+
+
+def get_segment_filename(start_block_height: int) -> str:
+    """
+
+    :param start_block_height: the first block height which a segment can contain
+    :return:
+    """
+    return f"{start_block_height:010d}.seg"
+
+
+def get_segment_start_block_height(block_height: int, segment_size: int) -> int:
+    return block_height - block_height % segment_size
+
+
+def is_segment_filename(filename: str) -> bool:
+    return bool(_SEGMENT_FILENAME_REGEX.match(filename))
+
+
+class BackupSegment(object):
+    """A file containing the backups of several blocks
+
+    | block_height(8) | size(4) | backup | block_height(8) | size(4) | backup | ...
+
+    A backup is the same as the content of a backup file of a block.
+    The record headers are the index of a segment.
+    Records are only appended, so the last one wins if there are several records of the same block.
+    An incomplete record at the end of a file, which a crash leaves, is ignored and overwritten.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def read_index(self) -> Tuple[Dict[int, Tuple[int, int]], int]:
+        """Reads record headers
+
+        :return: ({block_height: (offset, size)}, the end offset of valid records)
+        """
+        index: Dict[int, Tuple[int, int]] = {}
+        end = 0
+
+        try:
+            with open(self._path, "rb") as f:
+                file_size: int = os.fstat(f.fileno()).st_size
+
+                while end + _RECORD_HEADER_SIZE <= file_size:
+                    f.seek(end)
+                    block_height, size = struct.unpack(_RECORD_HEADER_FORMAT, f.read(_RECORD_HEADER_SIZE))
+
+                    offset: int = end + _RECORD_HEADER_SIZE
+                    if offset + size > file_size:
+                        break
+
+                    index[block_height] = (offset, size)
+                    end = offset + size
+        except FileNotFoundError:
+            pass
+
+        return index, end
+
+    def append(self, block_height: int, data: bytes) -> int:
+        """Appends the backup of a block
+
+        :return: the number of bytes written
+        """
+        _, end = self.read_index()
+        mode = "r+b" if os.path.isfile(self._path) else "wb"
+
+        with open(self._path, mode) as f:
+            f.seek(end)
+            f.truncate()
+            ret = f.write(struct.pack(_RECORD_HEADER_FORMAT, block_height, len(data)))
+            ret += f.write(data)
+
+        return ret
+
+    def read(self, block_height: int, index: Optional[Dict[int, Tuple[int, int]]] = None) -> Optional[bytes]:
+        """
+
+        :param block_height:
+        :param index: the index read with read_index() to avoid reading it again
+        :return: the backup of a given block or None if it does not exist
+        """
+        if index is None:
+            index, _ = self.read_index()
+
+        if block_height not in index:
+            return None
+
+        offset, size = index[block_height]
+        with open(self._path, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    def remove(self, start_block_height: int, end_block_height: int) -> int:
+        """Removes the backups ranging from start_block_height to end_block_height inclusive
+
+        The segment file is removed if no backup remains
+
+        :return: the number of removed backups
+        """
+        index, _ = self.read_index()
+        removed: List[int] = [
+            block_height for block_height in index if start_block_height <= block_height <= end_block_height
+        ]
+        if len(removed) == 0:
+            return 0
+
+        if len(removed) == len(index):
+            os.remove(self._path)
+            return len(removed)
+
+        tmp_path = f"{self._path}.tmp"
+        with open(self._path, "rb") as src, open(tmp_path, "wb") as dst:
+            for block_height, (offset, size) in sorted(index.items(), key=lambda item: item[1][0]):
+                if start_block_height <= block_height <= end_block_height:
+                    continue
+
+                src.seek(offset)
+                dst.write(struct.pack(_RECORD_HEADER_FORMAT, block_height, size))
+                dst.write(src.read(size))
+
+        os.replace(tmp_path, self._path)
+        return len(removed)
+
+
+class BackupSegments(object):
+    """Finds the backup of a block in the segment files in a directory
+
+    Segment indexes are cached, so it is supposed to be used during a rollback only
+    """
+
+    def __init__(self, backup_root_path: str):
+        self._backup_root_path = backup_root_path
+        self._start_block_heights: List[int] = []
+        self._indexes: Dict[int, Dict[int, Tuple[int, int]]] = {}
+
+        try:
+            with os.scandir(backup_root_path) as it:
+                for entry in it:
+                    if entry.is_file() and is_segment_filename(entry.name):
+                        self._start_block_heights.append(int(entry.name[:10]))
+        except FileNotFoundError:
+            pass
+
+        self._start_block_heights.sort()
+
+    def _get_segment(self, block_height: int) -> Tuple[Optional['BackupSegment'], Dict[int, Tuple[int, int]]]:
+        # Usually the segment with the largest start block height not greater than block_height
+        # contains the block, but earlier ones are also searched in case segment size has been changed
+        i: int = bisect.bisect_right(self._start_block_heights, block_height)
+
+        for start_block_height in reversed(self._start_block_heights[:i]):
+            segment = BackupSegment(os.path.join(self._backup_root_path, get_segment_filename(start_block_height)))
+
+            index: Optional[Dict[int, Tuple[int, int]]] = self._indexes.get(start_block_height)
+            if index is None:
+                index, _ = segment.read_index()
+                self._indexes[start_block_height] = index
+
+            if block_height in index:
+                return segment, index
+
+        return None, {}
+
+    def contains(self, block_height: int) -> bool:
+        _, index = self._get_segment(block_height)
+        return block_height in index
+
+    def read(self, block_height: int) -> Optional[bytes]:
+        segment, index = self._get_segment(block_height)
+        if segment is None:
+            return None
+
+        Logger.debug(tag=_TAG, msg=f"Read a backup from a segment: {segment.path} block_height={block_height}")
+        return segment.read(block_height, index)
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("SamplingProfiler",)
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from .base.exception import InvalidParamsException
+from .icon_constant import PROFILER_LOG_TAG
+
+if TYPE_CHECKING:
+    from types import CodeType, FrameType
+    from .base.block import Block
+
+_TAG = PROFILER_LOG_TAG
+
+# Stack frames from the root to the leaf
+_StackKey = Tuple['CodeType', ...]
+
+
+class _Profile(object):
+    """Samples the stack of a thread while a block is invoked on it
+    """
+
+    __slots__ = ("_profiler", "_block")
+
+    def __init__(self, profiler: 'SamplingProfiler', block: 'Block'):
+        self._profiler = profiler
+        self._block = block
+
+    def __enter__(self):
+        self._profiler._begin()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler._end(self._block)
+
+
+class _NoProfile(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NO_PROFILE = _NoProfile()
+
+
+class SamplingProfiler(object):
+    """Sampling profiler for block invocation which is turned on and off at runtime
+
+    A sampler thread takes the stack of the invoke thread at a fixed interval with sys._current_frames()
+    and the samples of each block are written in collapsed stack format
+    which flamegraph.pl and speedscope can read.
+
+    Nothing runs while it is stopped.
+
+    with profiler.profile(block):
+        engine.invoke(block, ...)
+    """
+
+    DIR_NAME = "profile"
+    # The maximum time to wait for the sampler thread to exit on stop()
+    JOIN_TIMEOUT = 1.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._enable: bool = False
+        self._output_dir: str = ""
+        self._interval: float = 0.0
+        # The number of profiles to write. 0 means no limit
+        self._blocks: int = 0
+        # Only the blocks which take longer than it are written
+        self._threshold: float = 0.0
+        self._written: int = 0
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        # Set while a block is being invoked
+        self._sampling = threading.Event()
+        self._target_thread_id: int = 0
+        self._start_time: float = 0.0
+        self._samples: Dict[_StackKey, int] = Counter()
+
+    @property
+    def enable(self) -> bool:
+        return self._enable
+
+    def start(self, output_dir: str, blocks: int = 1, threshold_ms: int = 0, interval_ms: int = 5):
+        """Profiles the blocks invoked from now on
+
+        :param output_dir: directory where profiles are written
+        :param blocks: the number of profiles to write before stopping. 0 means no limit
+        :param threshold_ms: only the blocks which take longer than it are written
+        :param interval_ms: sampling interval
+            Samples are not taken more often than sys.getswitchinterval() while the invoke thread holds the GIL
+        """
+        if blocks < 0 or threshold_ms < 0 or interval_ms <= 0:
+            raise InvalidParamsException(
+                f"Invalid profiler params: blocks={blocks} threshold={threshold_ms} interval={interval_ms}")
+        if blocks == 0 and threshold_ms == 0:
+            raise InvalidParamsException("Either blocks or threshold is required")
+
+        self.stop()
+
+        with self._lock:
+            self._output_dir = os.path.join(output_dir, self.DIR_NAME)
+            self._blocks = blocks
+            self._threshold = threshold_ms / 1000
+            self._interval = interval_ms / 1000
+            self._written = 0
+            # A sampler thread stopped on the invoke thread may not have exited yet
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop_event,), name="SamplingProfiler", daemon=True)
+            self._thread.start()
+            self._enable = True
+
+        Logger.info(tag=_TAG, msg=f"Profiler started: {self.get_status()}")
+
+    def stop(self):
+        """Stops the sampler thread and waits for it to exit up to JOIN_TIMEOUT
+
+        It blocks the calling thread, so it should not be called on the event loop
+        """
+        with self._lock:
+            self._enable = False
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+            written: int = self._written
+
+        if thread is not None:
+            thread.join(timeout=self.JOIN_TIMEOUT)
+            if thread.is_alive():
+                Logger.warning(tag=_TAG, msg="Sampler thread is still running")
+            Logger.info(tag=_TAG, msg=f"Profiler stopped: written={written}")
+
+    def get_status(self) -> dict:
+        with self._lock:
+            return {
+                "enable": self._enable,
+                "outputDir": self._output_dir,
+                "blocks": self._blocks,
+                "thresholdMs": int(self._threshold * 1000),
+                "intervalMs": int(self._interval * 1000),
+                "written": self._written
+            }
+
+    def profile(self, block: 'Block'):
+        """Returns a context manager which profiles the current thread while a block is invoked in it
+        """
+        if not self._enable:
+            return _NO_PROFILE
+        return _Profile(self, block)
+
+    def _begin(self):
+        with self._lock:
+            self._samples = Counter()
+            self._target_thread_id = threading.get_ident()
+            self._start_time = time.perf_counter()
+            self._sampling.set()
+
+    def _end(self, block: 'Block'):
+        with self._lock:
+            self._sampling.clear()
+            duration: float = time.perf_counter() - self._start_time
+            samples, self._samples = self._samples, Counter()
+
+        if duration < self._threshold:
+            return
+
+        try:
+            path: str = self._write(block, duration, samples)
+            Logger.info(tag=_TAG,
+                        msg=f"Profile written: BH={block.height} duration={duration * 1000:.1f}ms "
+                            f"samples={sum(samples.values())} path={path}")
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to write a profile: BH={block.height} {e}")
+            return
+
+        with self._lock:
+            self._written += 1
+            written: int = self._written
+            done: bool = 0 < self._blocks <= written
+            if done:
+                # Stop on the invoke thread without waiting for the sampler thread
+                self._enable = False
+                self._thread = None
+                self._stop_event.set()
+
+        if done:
+            Logger.info(tag=_TAG, msg=f"Profiler stopped: written={written}")
+
+    def _run(self, stop_event: 'threading.Event'):
+        while not stop_event.is_set():
+            if not self._sampling.wait(timeout=0.1):
+                continue
+
+            frame: Optional['FrameType'] = sys._current_frames().get(self._target_thread_id)
+            if frame is not None:
+                key: _StackKey = self._get_stack_key(frame)
+                with self._lock:
+                    if self._sampling.is_set():
+                        self._samples[key] += 1
+            del frame
+
+            stop_event.wait(self._interval)
+
+    @staticmethod
+    def _get_stack_key(frame: 'FrameType') -> _StackKey:
+        codes: List['CodeType'] = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return tuple(codes)
+
+    def _write(self, block: 'Block', duration: float, samples: Dict[_StackKey, int]) -> str:
+        os.makedirs(self._output_dir, exist_ok=True)
+        path: str = os.path.join(
+            self._output_dir,
+            f"{block.height}-{block.hash.hex()[:8]}-{int(duration * 1000)}ms.collapsed")
+
+        names: Dict['CodeType', str] = {}
+        with open(path, "w") as f:
+            for key, count in samples.items():
+                stack: str = ";".join(self._get_name(code, names) for code in key)
+                f.write(f"{stack} {count}\n")
+
+        return path
+
+    @staticmethod
+    def _get_name(code: 'CodeType', names: Dict['CodeType', str]) -> str:
+        name: Optional[str] = names.get(code)
+        if name is None:
+            # Semicolons separate frames in collapsed stack format
+            name = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})".replace(";", ":")
+            names[code] = name
+        return name
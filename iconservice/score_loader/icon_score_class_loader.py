@@ -75,12 +75,14 @@ class IconScoreClassLoader:
         return main_module, main_score
 
     @classmethod
-    def run(cls, score_address: 'Address', tx_hash: bytes, score_root_path: str) -> type:
+    def run(cls, score_address: 'Address', tx_hash: bytes, score_root_path: str,
+            invalidate_caches: bool = True) -> type:
         """Load a IconScoreBase subclass and return it
 
         :param score_address:
         :param tx_hash:
         :param score_root_path:
+        :param invalidate_caches: False if no SCORE has been written since importlib.invalidate_caches() was called
         :return: subclass derived from IconScoreBase
         """
         score_deploy_path: str = utils.get_score_deploy_path(score_root_path, score_address, tx_hash)
@@ -90,7 +92,8 @@ class IconScoreClassLoader:
         main_module, main_score = IconScoreClassLoader._get_package_info(package_json)
 
         # In order for the new module to be noticed by the import system
-        importlib.invalidate_caches()
+        if invalidate_caches:
+            importlib.invalidate_caches()
         module = importlib.import_module(f".{main_module}", package_name)
 
         return getattr(module, main_score)
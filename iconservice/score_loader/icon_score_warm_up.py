@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("IconScoreWarmUp",)
+
+import importlib
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from iconcommons.logger import Logger
+
+from iconservice.base.address import Address
+from iconservice.icon_constant import DeployState, ICON_LOADER_LOG_TAG
+from iconservice.iconscore.icon_score_context_util import IconScoreContextUtil
+from iconservice.iconscore.utils import get_score_deploy_path
+from iconservice.metrics import Counter, Phase
+
+if TYPE_CHECKING:
+    from iconservice.deploy.storage import IconScoreDeployInfo
+    from iconservice.iconscore.icon_score_context import IconScoreContext
+    from iconservice.iconscore.icon_score_mapper import IconScoreMapper
+    from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+    from iconservice.metrics import Metrics
+
+_TAG = ICON_LOADER_LOG_TAG
+
+
+def _compile_dir(path: str) -> bool:
+    import compileall
+
+    return compileall.compile_dir(path, quiet=1)
+
+
+class IconScoreWarmUp(object):
+    """Loads the classes of active SCOREs into IconScoreMapper before the first block is invoked
+
+    Otherwise the SCOREs are imported when they are called for the first time after iconservice starts
+    and the first blocks take much longer than the others.
+
+    1. Active SCOREs are read from deploy storage.
+       If the number of SCOREs is limited, the most recently used ones before the last shutdown come first.
+    2. The bytecode of the SCOREs is compiled in a process pool.
+    3. The SCORE classes are imported in the current process and put into IconScoreMapper.
+
+    A SCORE which fails to be loaded is skipped and loaded on its first call as before.
+    """
+
+    FILE_NAME = "score_warm_up.json"
+
+    def __init__(self, path: str, max_scores: int = 0, workers: int = 0):
+        """
+        :param path: file where the most recently used SCOREs are saved on shutdown
+        :param max_scores: the number of SCOREs to load. 0 means all active SCOREs
+        :param workers: the number of processes compiling bytecode.
+            0 means the number of CPUs and 1 means compiling in the current process
+        """
+        self._path: str = path
+        self._max_scores: int = max_scores
+        self._workers: int = workers if workers > 0 else (os.cpu_count() or 1)
+
+    def run(self, context: 'IconScoreContext', metrics: Optional['Metrics'] = None) -> dict:
+        """Loads SCOREs into context.icon_score_mapper
+
+        :return: stats
+        """
+        start: float = time.monotonic()
+
+        deploy_infos: List['IconScoreDeployInfo'] = self._get_deploy_infos(context)
+        paths: List[str] = [
+            get_score_deploy_path(context.score_root_path, deploy_info.score_address, deploy_info.current_tx_hash)
+            for deploy_info in deploy_infos
+        ]
+
+        compile_start: float = time.monotonic()
+        self._compile(paths)
+        load_start: float = time.monotonic()
+        loaded: int = self._load(context, deploy_infos)
+        end: float = time.monotonic()
+
+        stats = {
+            "scores": len(deploy_infos),
+            "loaded": loaded,
+            "failed": len(deploy_infos) - loaded,
+            "readTime": compile_start - start,
+            "compileTime": load_start - compile_start,
+            "loadTime": end - load_start,
+            "totalTime": end - start
+        }
+
+        if metrics is not None:
+            metrics.observe(Phase.SCORE_WARM_UP, end - start)
+            metrics.increase(Counter.WARMED_UP_SCORES, loaded)
+
+        Logger.info(tag=_TAG, msg=f"SCORE warm-up: {stats}")
+        return stats
+
+    def save(self, score_mapper: 'IconScoreMapper'):
+        """Saves the SCOREs used since iconservice started in order of recency
+
+        The SCOREs saved last time follow them
+        """
+        items: List[tuple] = [
+            (score_info.last_used, address) for address, score_info in score_mapper.items()
+            if score_info.last_used > 0
+        ]
+        items.sort(key=lambda x: x[0], reverse=True)
+
+        addresses: List['Address'] = [address for _, address in items]
+        used: set = set(addresses)
+        addresses.extend(address for address in self._load_recently_used() if address not in used)
+        if self._max_scores > 0:
+            addresses = addresses[:self._max_scores]
+
+        try:
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"scores": [str(address) for address in addresses]}, f)
+            os.replace(tmp_path, self._path)
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to save recently used SCOREs: {e}")
+
+    def _get_deploy_infos(self, context: 'IconScoreContext') -> List['IconScoreDeployInfo']:
+        """Returns the deploy info of the SCOREs to load
+
+        The SCOREs which have been loaded already such as builtin SCOREs are excluded
+        """
+        score_mapper: 'IconScoreMapper' = context.icon_score_mapper
+        deploy_infos: Dict['Address', 'IconScoreDeployInfo'] = {
+            deploy_info.score_address: deploy_info
+            for deploy_info in context.storage.deploy.iter_deploy_infos()
+            if deploy_info.deploy_state == DeployState.ACTIVE and deploy_info.score_address not in score_mapper
+        }
+
+        if self._max_scores <= 0:
+            return list(deploy_infos.values())
+
+        ret: List['IconScoreDeployInfo'] = []
+        for address in self._load_recently_used():
+            deploy_info: Optional['IconScoreDeployInfo'] = deploy_infos.pop(address, None)
+            if deploy_info is not None:
+                ret.append(deploy_info)
+        ret.extend(deploy_infos.values())
+
+        return ret[:self._max_scores]
+
+    def _load_recently_used(self) -> List['Address']:
+        try:
+            with open(self._path, "r") as f:
+                return [Address.from_string(address) for address in json.load(f)["scores"]]
+        except FileNotFoundError:
+            return []
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to load recently used SCOREs: {e}")
+            return []
+
+    def _compile(self, paths: List[str]):
+        # Deploy paths linking to the same package in ScorePackageStore are compiled once
+        paths: List[str] = sorted({os.path.realpath(path) for path in paths if os.path.isdir(path)})
+        if len(paths) == 0:
+            return
+
+        try:
+            if self._workers > 1 and len(paths) > 1:
+                # multiprocessing is imported only when warm-up is enabled to reduce the startup time
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor(max_workers=min(self._workers, len(paths))) as executor:
+                    results: List[bool] = list(executor.map(_compile_dir, paths))
+            else:
+                results: List[bool] = [_compile_dir(path) for path in paths]
+        except BaseException as e:
+            # Modules are compiled on import
+            Logger.warning(tag=_TAG, msg=f"Failed to compile SCOREs: {e}")
+            return
+
+        failed: int = results.count(False)
+        if failed > 0:
+            Logger.warning(tag=_TAG, msg=f"Failed to compile {failed} SCOREs")
+
+    @staticmethod
+    def _load(context: 'IconScoreContext', deploy_infos: List['IconScoreDeployInfo']) -> int:
+        """
+        :return: the number of SCOREs loaded
+        """
+        score_mapper: 'IconScoreMapper' = context.icon_score_mapper
+
+        # No SCORE is written during warm-up, so the caches are invalidated only once
+        importlib.invalidate_caches()
+
+        loaded: int = 0
+        for deploy_info in deploy_infos:
+            try:
+                score_info: 'IconScoreInfo' = IconScoreContextUtil.create_score_info(
+                    context, deploy_info.score_address, deploy_info.current_tx_hash, invalidate_caches=False)
+            except BaseException as e:
+                Logger.warning(tag=_TAG, msg=f"Failed to warm up a SCORE: {deploy_info.score_address} {e}")
+                continue
+
+            score_mapper[deploy_info.score_address] = score_info
+            loaded += 1
+
+        return loaded
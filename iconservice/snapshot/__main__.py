@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Exports or imports a state snapshot
+
+usage:
+    python -m iconservice.snapshot export -st .statedb -sc .score snapshot.bin
+    python -m iconservice.snapshot import -st .statedb -sc .score snapshot.bin
+
+iconservice has to be stopped on both sides.
+An interrupted import is resumed by running the same command again.
+"""
+
+import argparse
+import sys
+
+from . import SnapshotExporter, SnapshotImporter
+from ..base.exception import IconServiceBaseException
+from ..icon_constant import SNAPSHOT_CHUNK_SIZE
+
+SUCCESS_CODE = 0
+FAILURE_CODE = 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m iconservice.snapshot", description="iconservice state snapshot")
+    parser.add_argument("command", type=str, choices=["export", "import"])
+    parser.add_argument("path", type=str, help="snapshot file path")
+    parser.add_argument("-st", dest="state_db_root_path", type=str, default=".statedb",
+                        help="icon score state db root path  example : .statedb")
+    parser.add_argument("-sc", dest="score_root_path", type=str, default=".score",
+                        help="icon score root path  example : .score")
+    parser.add_argument("--chunk-size", dest="chunk_size", type=int, default=SNAPSHOT_CHUNK_SIZE,
+                        help="payload size of a chunk in bytes (export only)")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "export":
+            manifest = SnapshotExporter(args.state_db_root_path, args.score_root_path, args.chunk_size).run(args.path)
+        else:
+            manifest = SnapshotImporter(args.state_db_root_path, args.score_root_path).run(args.path)
+    # IconServiceBaseException derives from BaseException, so Exception does not cover it
+    except (IconServiceBaseException, Exception) as e:
+        print(f"Failed to {args.command} a snapshot: {e}", file=sys.stderr)
+        return FAILURE_CODE
+
+    print(f"blockHeight: {manifest['blockHeight']}\n"
+          f"blockHash: 0x{manifest['blockHash'].hex()}\n"
+          f"rootHash: 0x{manifest['rootHash'].hex()}\n"
+          f"sections: {manifest['sections']}")
+    return SUCCESS_CODE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = "SnapshotExporter"
+
+import os
+import time
+from typing import Optional, Iterable, Tuple, Dict
+
+from iconcommons.logger import Logger
+
+from .file import Section, SnapshotFileWriter
+from ..base.block import Block
+from ..base.exception import InvalidParamsException
+from ..database.db import KeyValueDatabase
+from ..deploy.score_package_store import ScorePackageStore
+from ..icon_constant import ICON_DEX_DB_NAME, IISS_DB, SNAPSHOT_LOG_TAG, SNAPSHOT_CHUNK_SIZE
+from ..iiss.reward_calc.storage import Storage as RewardCalcStorage
+from ..icx.storage import Storage as IcxStorage
+
+_TAG = SNAPSHOT_LOG_TAG
+
+# The files which mean that the last block has not been committed or rolled back completely
+# They are the same as IconServiceEngine.WAL_FILE and IconServiceEngine.ROLLBACK_METADATA_FILE
+_INCOMPLETE_STATE_FILES = ("block.wal", "ROLLBACK_METADATA")
+
+
+class SnapshotExporter(object):
+    """Streams the state of the last committed block into a snapshot file
+
+    A snapshot contains state db, current iiss_db and the files in score_root_path.
+    iconservice has to be stopped while exporting, as leveldb can be opened by only one process.
+    """
+
+    def __init__(self, state_db_root_path: str, score_root_path: str, chunk_size: int = SNAPSHOT_CHUNK_SIZE):
+        self._state_db_root_path = state_db_root_path
+        self._score_root_path = score_root_path
+        self._chunk_size = chunk_size
+
+        # section name: {"entries": the number of entries, "chunks": the number of chunks, "bytes": payload size}
+        self._stats: Dict[str, dict] = {}
+
+    def run(self, path: str) -> dict:
+        """Writes a snapshot file
+
+        The snapshot is written to a temporary file which is renamed to path when it is done
+
+        :param path: snapshot file path
+        :return: manifest
+        """
+        for filename in _INCOMPLETE_STATE_FILES:
+            if os.path.exists(os.path.join(self._state_db_root_path, filename)):
+                raise InvalidParamsException(f"The last block is not completed: {filename}")
+
+        state_db_path: str = os.path.join(self._state_db_root_path, ICON_DEX_DB_NAME)
+        if not os.path.isdir(state_db_path):
+            raise InvalidParamsException(f"State DB not found: {state_db_path}")
+
+        start: float = time.monotonic()
+        tmp_path = f"{path}.tmp"
+        state_db = KeyValueDatabase.from_path(state_db_path, create_if_missing=False)
+
+        try:
+            block_bytes: Optional[bytes] = state_db.get(IcxStorage.LAST_BLOCK_KEY)
+            if block_bytes is None:
+                raise InvalidParamsException("No committed block")
+            block = Block.from_bytes(block_bytes)
+
+            with open(tmp_path, "wb") as f:
+                writer = SnapshotFileWriter(f)
+                writer.write_header()
+
+                self._write_db(writer, Section.STATE, state_db)
+                self._write_iiss_db(writer)
+                self._write_score_files(writer)
+
+                manifest: dict = writer.write_manifest({
+                    "blockHeight": block.height,
+                    "blockHash": block.hash,
+                    "createdAt": int(time.time()),
+                    "sections": self._stats
+                })
+
+            os.replace(tmp_path, path)
+        finally:
+            state_db.close()
+
+        Logger.info(tag=_TAG, msg=f"Snapshot exported: path={path} block={block.height} "
+                                  f"rootHash={manifest['rootHash'].hex()} sections={self._stats} "
+                                  f"elapsed={time.monotonic() - start:.3f}s")
+        return manifest
+
+    def _write_iiss_db(self, writer: 'SnapshotFileWriter'):
+        path: str = os.path.join(self._state_db_root_path, IISS_DB, RewardCalcStorage.CURRENT_IISS_DB_NAME)
+        if not os.path.isdir(path):
+            return
+
+        iiss_db = KeyValueDatabase.from_path(path, create_if_missing=False)
+        try:
+            self._write_db(writer, Section.IISS, iiss_db)
+        finally:
+            iiss_db.close()
+
+    def _write_db(self, writer: 'SnapshotFileWriter', section: 'Section', db: 'KeyValueDatabase'):
+        self._write_entries(writer, section, ((key, value, len(key) + len(value)) for key, value in db.iterator()))
+
+    def _write_score_files(self, writer: 'SnapshotFileWriter'):
+        if os.path.isdir(self._score_root_path):
+            self._write_entries(writer, Section.SCORE, self._iter_score_file_pieces())
+
+    def _iter_score_file_pieces(self) -> Iterable[Tuple[str, int, bytes, int]]:
+        """Splits the files in score_root_path into pieces not larger than chunk size
+
+        :return: (relative path, offset, data, size)
+        """
+        # Deploy paths linking to ScorePackageStore are exported as directories
+        # and the store itself is not, so the snapshot does not depend on the store
+        for dir_path, dir_names, filenames in os.walk(self._score_root_path, followlinks=True):
+            if dir_path == self._score_root_path and ScorePackageStore.DIR_NAME in dir_names:
+                dir_names.remove(ScorePackageStore.DIR_NAME)
+            # Walk in order to make the same snapshot from the same state
+            dir_names.sort()
+
+            for filename in sorted(filenames):
+                path: str = os.path.join(dir_path, filename)
+                rel_path: str = os.path.relpath(path, self._score_root_path)
+
+                with open(path, "rb") as f:
+                    offset = 0
+                    while True:
+                        data: bytes = f.read(self._chunk_size)
+                        if offset > 0 and len(data) == 0:
+                            break
+
+                        yield rel_path, offset, data, len(rel_path) + len(data)
+                        offset += len(data)
+
+                        if len(data) < self._chunk_size:
+                            break
+
+    def _write_entries(self, writer: 'SnapshotFileWriter', section: 'Section', it: Iterable[tuple]):
+        """Writes entries in chunks of which payload is about chunk size
+
+        :param it: entries whose last item is the size of the entry
+        """
+        stats = {"entries": 0, "chunks": 0, "bytes": 0}
+        entries = []
+        size = 0
+
+        for entry in it:
+            entries.append(entry[:-1])
+            size += entry[-1]
+
+            if size >= self._chunk_size:
+                stats["bytes"] += writer.write_chunk(section, entries)
+                stats["chunks"] += 1
+                stats["entries"] += len(entries)
+                entries = []
+                size = 0
+
+        if len(entries) > 0:
+            stats["bytes"] += writer.write_chunk(section, entries)
+            stats["chunks"] += 1
+            stats["entries"] += len(entries)
+
+        self._stats[section.name.lower()] = stats
+        Logger.info(tag=_TAG, msg=f"Export {section.name}: {stats}")
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("Section", "SnapshotFileWriter", "SnapshotFileReader")
+
+import enum
+import hashlib
+import struct
+from typing import Optional, BinaryIO, List, Tuple
+
+import msgpack
+
+from ..base.exception import IllegalFormatException
+
+_MAGIC_KEY = b"ICSS"
+_VERSION = 0
+
+# magic key(4) | version(4)
+_HEADER_FORMAT = ">4sI"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+# section(1) | payload size(4)
+_CHUNK_HEADER_FORMAT = ">BI"
+_CHUNK_HEADER_SIZE = struct.calcsize(_CHUNK_HEADER_FORMAT)
+# manifest offset(8) | manifest size(4) | manifest hash(32) | magic key(4)
+_TRAILER_FORMAT = ">QI32s4s"
+_TRAILER_SIZE = struct.calcsize(_TRAILER_FORMAT)
+
+
+class Section(enum.IntEnum):
+    MANIFEST = 0
+    # Key-values in state db
+    STATE = 1
+    # Key-values in current iiss_db
+    IISS = 2
+    # Pieces of the files in score_root_path: [relative path, offset, data]
+    SCORE = 3
+
+
+def _hash(data: bytes) -> bytes:
+    return hashlib.sha3_256(data).digest()
+
+
+class SnapshotFileWriter(object):
+    """Writes a snapshot file
+
+    | header | chunk | chunk | ... | manifest chunk | trailer
+
+    chunk: section(1) | payload size(4) | payload(msgpack list of entries)
+
+    The manifest is written after all chunks with the offset, size and sha3_256 hash of each chunk,
+    so that a reader can verify and resume the chunks one by one.
+    The hash of the manifest is in the trailer at the end of the file.
+    """
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self._offset: int = 0
+        # [section, offset, size, hash]
+        self._chunks: List[list] = []
+
+    def write_header(self):
+        self._write(struct.pack(_HEADER_FORMAT, _MAGIC_KEY, _VERSION))
+
+    def write_chunk(self, section: 'Section', entries: list) -> int:
+        """
+        :return: the size of the payload
+        """
+        payload: bytes = msgpack.packb(entries, use_bin_type=True)
+        offset: int = self._offset
+
+        self._write(struct.pack(_CHUNK_HEADER_FORMAT, section, len(payload)))
+        self._write(payload)
+        self._chunks.append([section.value, offset, len(payload), _hash(payload)])
+
+        return len(payload)
+
+    def write_manifest(self, manifest: dict) -> dict:
+        """Writes a manifest with the chunk list and the trailer
+
+        :param manifest: snapshot information such as block height and hash
+        :return: the manifest written
+        """
+        manifest = dict(manifest)
+        manifest["version"] = _VERSION
+        manifest["chunks"] = self._chunks
+        manifest["rootHash"] = _hash(b"".join(chunk[3] for chunk in self._chunks))
+
+        payload: bytes = msgpack.packb(manifest, use_bin_type=True)
+        offset: int = self._offset
+        self._write(struct.pack(_CHUNK_HEADER_FORMAT, Section.MANIFEST, len(payload)))
+        self._write(payload)
+        self._write(struct.pack(_TRAILER_FORMAT, offset, len(payload), _hash(payload), _MAGIC_KEY))
+
+        return manifest
+
+    def _write(self, data: bytes):
+        self._offset += self._fp.write(data)
+
+
+class SnapshotFileReader(object):
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self._manifest: Optional[dict] = None
+
+    @property
+    def manifest(self) -> Optional[dict]:
+        return self._manifest
+
+    def read_manifest(self) -> dict:
+        """Reads and verifies the header, trailer and manifest
+
+        :return: manifest
+        """
+        fp = self._fp
+
+        fp.seek(0)
+        magic_key, version = struct.unpack(_HEADER_FORMAT, self._read(_HEADER_SIZE))
+        if magic_key != _MAGIC_KEY:
+            raise IllegalFormatException(f"Invalid magic key: {magic_key}")
+        if version != _VERSION:
+            raise IllegalFormatException(f"Invalid version: {version}")
+
+        fp.seek(-_TRAILER_SIZE, 2)
+        offset, size, manifest_hash, magic_key = struct.unpack(_TRAILER_FORMAT, self._read(_TRAILER_SIZE))
+        if magic_key != _MAGIC_KEY:
+            raise IllegalFormatException("Incomplete snapshot file")
+
+        section, payload = self._read_chunk_at(offset, size)
+        if section != Section.MANIFEST or _hash(payload) != manifest_hash:
+            raise IllegalFormatException("Invalid manifest")
+
+        manifest: dict = msgpack.unpackb(payload, raw=False)
+        root_hash: bytes = _hash(b"".join(chunk[3] for chunk in manifest["chunks"]))
+        if root_hash != manifest["rootHash"]:
+            raise IllegalFormatException(f"Invalid root hash: {manifest['rootHash'].hex()}")
+
+        self._manifest = manifest
+        return manifest
+
+    def read_chunk(self, index: int) -> Tuple['Section', list]:
+        """Reads the chunk at a given index in the manifest and verifies its hash
+
+        :return: (section, entries)
+        """
+        section, offset, size, chunk_hash = self._manifest["chunks"][index]
+
+        chunk_section, payload = self._read_chunk_at(offset, size)
+        if chunk_section != section or _hash(payload) != chunk_hash:
+            raise IllegalFormatException(f"Invalid chunk: index={index} offset={offset}")
+
+        return Section(section), msgpack.unpackb(payload, raw=False, use_list=False)
+
+    def _read_chunk_at(self, offset: int, size: int) -> Tuple[int, bytes]:
+        self._fp.seek(offset)
+        section, payload_size = struct.unpack(_CHUNK_HEADER_FORMAT, self._read(_CHUNK_HEADER_SIZE))
+        if payload_size != size:
+            raise IllegalFormatException(f"Invalid chunk size: offset={offset} {payload_size} != {size}")
+
+        return section, self._read(size)
+
+    def _read(self, size: int) -> bytes:
+        data: bytes = self._fp.read(size)
+        if len(data) != size:
+            raise IllegalFormatException(f"Out of data: {len(data)} != {size}")
+
+        return data
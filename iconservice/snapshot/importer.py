@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = "SnapshotImporter"
+
+import json
+import os
+import time
+from typing import Optional, Dict
+
+from iconcommons.logger import Logger
+
+from .file import Section, SnapshotFileReader
+from ..base.block import Block
+from ..base.exception import InvalidParamsException, IllegalFormatException
+from ..database.db import KeyValueDatabase
+from ..icon_constant import ICON_DEX_DB_NAME, IISS_DB, SNAPSHOT_LOG_TAG
+from ..iiss.reward_calc.storage import Storage as RewardCalcStorage
+from ..icx.storage import Storage as IcxStorage
+
+_TAG = SNAPSHOT_LOG_TAG
+
+
+class SnapshotImporter(object):
+    """Loads a snapshot file into empty state_db_root_path and score_root_path
+
+    Each chunk is verified with its hash in the manifest and written with one write batch.
+    The index of the next chunk is saved in a progress file after every chunk,
+    so that an interrupted import is resumed from there by running it again with the same snapshot.
+    Writing a chunk again is harmless as it has the same key-values and file pieces.
+    The progress file is removed when the last block in the imported state db is verified with the manifest.
+    """
+
+    PROGRESS_FILE = "SNAPSHOT_IMPORT"
+
+    def __init__(self, state_db_root_path: str, score_root_path: str):
+        self._state_db_root_path = state_db_root_path
+        self._score_root_path = score_root_path
+
+        self._dbs: Dict['Section', 'KeyValueDatabase'] = {}
+
+    @property
+    def progress_path(self) -> str:
+        return os.path.join(self._state_db_root_path, self.PROGRESS_FILE)
+
+    def run(self, path: str) -> dict:
+        """
+        :param path: snapshot file path
+        :return: manifest
+        """
+        start: float = time.monotonic()
+
+        with open(path, "rb") as f:
+            reader = SnapshotFileReader(f)
+            manifest: dict = reader.read_manifest()
+            root_hash: str = manifest["rootHash"].hex()
+
+            next_index: int = self._load_progress(root_hash)
+            chunks: int = len(manifest["chunks"])
+            Logger.info(tag=_TAG, msg=f"Snapshot import start: path={path} block={manifest['blockHeight']} "
+                                      f"rootHash={root_hash} chunks={next_index}/{chunks}")
+
+            try:
+                self._open_dbs()
+
+                for i in range(next_index, chunks):
+                    section, entries = reader.read_chunk(i)
+                    self._write_chunk(section, entries)
+                    self._save_progress(root_hash, i + 1)
+
+                self._verify(manifest)
+            finally:
+                self._close_dbs()
+
+        os.remove(self.progress_path)
+
+        Logger.info(tag=_TAG, msg=f"Snapshot import end: block={manifest['blockHeight']} "
+                                  f"elapsed={time.monotonic() - start:.3f}s")
+        return manifest
+
+    def _load_progress(self, root_hash: str) -> int:
+        """
+        :return: the index of the next chunk to import
+        """
+        try:
+            with open(self.progress_path, "r") as f:
+                progress: dict = json.load(f)
+        except FileNotFoundError:
+            progress = None
+
+        if progress is not None:
+            if progress["rootHash"] != root_hash:
+                raise InvalidParamsException(f"Another snapshot is being imported: {progress['rootHash']}")
+            return progress["next"]
+
+        # A new import is allowed only on an empty state
+        state_db_path: str = os.path.join(self._state_db_root_path, ICON_DEX_DB_NAME)
+        if os.path.exists(state_db_path):
+            raise InvalidParamsException(f"State DB already exists: {state_db_path}")
+
+        os.makedirs(self._state_db_root_path, exist_ok=True)
+        self._save_progress(root_hash, 0)
+        return 0
+
+    def _save_progress(self, root_hash: str, next_index: int):
+        tmp_path = f"{self.progress_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"rootHash": root_hash, "next": next_index}, f)
+
+        os.replace(tmp_path, self.progress_path)
+
+    def _open_dbs(self):
+        rc_data_path: str = os.path.join(self._state_db_root_path, IISS_DB)
+        os.makedirs(rc_data_path, exist_ok=True)
+
+        self._dbs[Section.STATE] = KeyValueDatabase.from_path(
+            os.path.join(self._state_db_root_path, ICON_DEX_DB_NAME), create_if_missing=True)
+        self._dbs[Section.IISS] = KeyValueDatabase.from_path(
+            os.path.join(rc_data_path, RewardCalcStorage.CURRENT_IISS_DB_NAME), create_if_missing=True)
+
+    def _close_dbs(self):
+        for db in self._dbs.values():
+            db.close()
+        self._dbs.clear()
+
+    def _write_chunk(self, section: 'Section', entries: tuple):
+        if section == Section.SCORE:
+            for rel_path, offset, data in entries:
+                self._write_score_file(rel_path, offset, data)
+        else:
+            self._dbs[section].write_batch(entries)
+
+    def _write_score_file(self, rel_path: str, offset: int, data: bytes):
+        path: str = os.path.normpath(os.path.join(self._score_root_path, rel_path))
+        if os.path.isabs(rel_path) or not path.startswith(os.path.normpath(self._score_root_path) + os.sep):
+            raise IllegalFormatException(f"Invalid SCORE file path: {rel_path}")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # The first piece truncates the file written by an interrupted import
+        with open(path, "wb" if offset == 0 else "r+b") as f:
+            f.seek(offset)
+            f.write(data)
+
+    def _verify(self, manifest: dict):
+        block_bytes: Optional[bytes] = self._dbs[Section.STATE].get(IcxStorage.LAST_BLOCK_KEY)
+        if block_bytes is None:
+            raise IllegalFormatException("No last block in snapshot")
+
+        block = Block.from_bytes(block_bytes)
+        if block.height != manifest["blockHeight"] or block.hash != manifest["blockHash"]:
+            raise IllegalFormatException(
+                f"Last block mismatch: "
+                f"{block.height}({block.hash.hex()}) != {manifest['blockHeight']}({manifest['blockHash'].hex()})")
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = "TxResultStream"
+
+import time
+from typing import TYPE_CHECKING, List, Callable
+
+from .base.type_converter_templates import ConstantKeys
+
+if TYPE_CHECKING:
+    from .base.block import Block
+    from .iconscore.icon_score_result import TransactionResult
+
+
+class TxResultStream(object):
+    """Sends the tx_results of a block in chunks while the block is invoked
+
+    A chunk is sent when chunk_size tx_results are collected
+    or chunk_interval milliseconds have passed since the last chunk.
+    The chunks are numbered from 0 so that the receiver can check their order and count
+    with the final INVOKE response.
+
+    chunk: {
+        "blockHeight": "0x1",
+        "blockHash": "...",
+        "sequence": "0x0",
+        "txResults": [tx_result, ...]  # the same format as txResults in INVOKE response
+    }
+    """
+
+    def __init__(self,
+                 block: 'Block',
+                 send: Callable[[dict], None],
+                 chunk_size: int,
+                 chunk_interval: int):
+        """
+        :param block: the block being invoked
+        :param send: called with each chunk
+        :param chunk_size: the maximum number of tx_results in a chunk
+        :param chunk_interval: the maximum interval between chunks in milliseconds
+        """
+        self._block_height: int = block.height
+        self._block_hash: bytes = block.hash
+        self._send = send
+        self._chunk_size: int = chunk_size
+        self._chunk_interval_s: float = chunk_interval / 1000
+
+        self._tx_results: List['TransactionResult'] = []
+        self._last_sent: float = time.monotonic()
+        self._sequence: int = 0
+        self._tx_result_count: int = 0
+
+    @property
+    def chunk_count(self) -> int:
+        return self._sequence
+
+    @property
+    def tx_result_count(self) -> int:
+        return self._tx_result_count
+
+    def append(self, tx_result: 'TransactionResult'):
+        self._tx_results.append(tx_result)
+
+        if len(self._tx_results) >= self._chunk_size \
+                or time.monotonic() - self._last_sent >= self._chunk_interval_s:
+            self.flush()
+
+    def flush(self):
+        """Send the tx_results which have not been sent yet
+        """
+        if len(self._tx_results) == 0:
+            return
+
+        chunk = {
+            ConstantKeys.BLOCK_HEIGHT: hex(self._block_height),
+            ConstantKeys.BLOCK_HASH: self._block_hash.hex(),
+            ConstantKeys.SEQUENCE: hex(self._sequence),
+            ConstantKeys.TX_RESULTS: [tx_result.to_response_dict() for tx_result in self._tx_results]
+        }
+        self._send(chunk)
+
+        self._sequence += 1
+        self._tx_result_count += len(self._tx_results)
+        self._tx_results = []
+        self._last_sent = time.monotonic()
@@ -144,3 +144,34 @@ class BytesToHexJSONEncoder(json.JSONEncoder):
             return bytes_to_hex(obj)
 
         return json.JSONEncoder.default(self, obj)
+
+
+class JSONLogMessage(object):
+    """Log message which is encoded to JSON only when it is logged
+
+    Encoding stops at max_size so that a large request or response for a block
+    does not take time and space in log files.
+    """
+    def __init__(self, prefix: str, value: Any, max_size: int):
+        self._prefix = prefix
+        self._value = value
+        self._max_size = max_size
+
+    def __str__(self) -> str:
+        chunks = []
+        size = 0
+
+        for chunk in json.JSONEncoder(default=self._default).iterencode(self._value):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self._max_size:
+                return f"{self._prefix}{''.join(chunks)[:self._max_size]}... (truncated)"
+
+        return f"{self._prefix}{''.join(chunks)}"
+
+    @staticmethod
+    def _default(obj: Any) -> str:
+        if isinstance(obj, bytes):
+            return bytes_to_hex(obj)
+
+        return str(obj)
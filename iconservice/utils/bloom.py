@@ -3,13 +3,24 @@
 #
 # changes
 #   hash function : keccak() -> sha3_256()
+#   filter is stored in a fixed 256-byte buffer instead of a big int
+#   bit positions of recently added values are cached
 
 from __future__ import absolute_import
 
+import functools
 import hashlib
 import numbers
 import operator
 
+# 2048 bits
+BLOOM_BYTE_SIZE = 256
+BLOOM_BYTE_ORDER = 'big'
+
+# The number of values of which bit positions are cached in a block
+# e.g. SCORE addresses and event signatures
+BLOOM_BITS_CACHE_SIZE = 4096
+
 
 def get_chunks_for_bloom(value_hash):
     yield value_hash[:2]
@@ -29,20 +40,59 @@ def get_bloom_bits(value):
         yield bloom_bits
 
 
-class BloomFilter(numbers.Number):
-    value = None
+@functools.lru_cache(maxsize=BLOOM_BITS_CACHE_SIZE)
+def get_bloom_bit_positions(value: bytes) -> tuple:
+    """Returns (byte index, bit mask) pairs in the big endian filter buffer for a given value
+
+    The result is the same as the one of get_bloom_bits()
+    """
+    value_hash = hashlib.sha3_256(value).digest()
+    positions = []
+
+    for i in range(0, 6, 2):
+        bit_index = ((value_hash[i] << 8) + value_hash[i + 1]) & 2047
+        positions.append((BLOOM_BYTE_SIZE - 1 - (bit_index >> 3), 1 << (bit_index & 7)))
+
+    return tuple(positions)
+
+
+def clear_bloom_bits_cache():
+    """Called at the beginning of a block not to keep bit positions of old values
+    """
+    get_bloom_bit_positions.cache_clear()
 
+
+class BloomFilter(numbers.Number):
     def __init__(self, value=0):
-        self.value = value
+        self._buf = bytearray(BLOOM_BYTE_SIZE)
+        if value:
+            self.value = value
+
+    @property
+    def value(self) -> int:
+        return int.from_bytes(self._buf, BLOOM_BYTE_ORDER)
+
+    @value.setter
+    def value(self, value: int):
+        self._buf[:] = value.to_bytes(BLOOM_BYTE_SIZE, BLOOM_BYTE_ORDER)
 
     def __int__(self):
         return self.value
 
+    def to_bytes(self) -> bytes:
+        """Returns 256-byte big endian representation
+
+        It is the same as int(bloom).to_bytes(256, "big")
+        """
+        return bytes(self._buf)
+
     def add(self, value):
         if not isinstance(value, bytes):
             raise TypeError("Value must be of type `bytes`")
-        for bloom_bits in get_bloom_bits(value):
-            self.value |= bloom_bits
+
+        buf = self._buf
+        for index, mask in get_bloom_bit_positions(value):
+            buf[index] |= mask
 
     def extend(self, iterable):
         for value in iterable:
@@ -57,10 +107,12 @@ class BloomFilter(numbers.Number):
     def __contains__(self, value):
         if not isinstance(value, bytes):
             raise TypeError("Value must be of type `bytes`")
+
+        buf = self._buf
         return all(
-            self.value & bloom_bits
-            for bloom_bits
-            in get_bloom_bits(value)
+            buf[index] & mask
+            for index, mask
+            in get_bloom_bit_positions(value)
         )
 
     def __index__(self):
@@ -91,4 +143,4 @@ class BloomFilter(numbers.Number):
         return self._icombine(other)
 
     def __iadd__(self, other):
-        return self._icombine(other)
\ No newline at end of file
+        return self._icombine(other)
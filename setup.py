@@ -18,7 +18,8 @@ extra_requires = {
         "pytest>=3.6",
         "pytest-cov>=2.5.1",
         "iconsdk",
-        "pytest-mock"
+        "pytest-mock",
+        "pytest-benchmark>=4.0"
     ]
 }
 
@@ -42,7 +43,8 @@ setup_options = {
     'python_requires': '>=3.7, <3.8',
     'entry_points': {
         'console_scripts': [
-            'iconservice=iconservice.icon_service_cli:main'
+            'iconservice=iconservice.icon_service_cli:main',
+            'icon_rc_simulator=iconservice.iiss.reward_calc.ipc.simulator:main'
         ],
     },
     'classifiers': [
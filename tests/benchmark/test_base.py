@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from iconservice.base.address import Address
+from iconservice.base.type_converter import TypeConverter
+from iconservice.base.type_converter_templates import ParamType
+from tests import create_address, create_block_hash, create_tx_hash
+
+SIGNATURE = "VAia7YZ2Ji6igKWzjR2YsGa2m53nKPrfK7uXYW78QLE+ATehAVZPC40szvAiA6NEU5gCYB4c4qaQzqDh2ugcHgA="
+TX_COUNT = 100
+
+
+def _make_transfer_tx(i: int) -> dict:
+    return {
+        "method": "icx_sendTransaction",
+        "params": {
+            "version": "0x3",
+            "from": str(create_address(data=f"from{i}".encode())),
+            "to": str(create_address(data=f"to{i}".encode())),
+            "value": hex(10 ** 18 + i),
+            "stepLimit": hex(10 ** 8),
+            "timestamp": hex(1_600_000_000_000_000 + i),
+            "nid": "0x1",
+            "nonce": hex(i),
+            "signature": SIGNATURE,
+            "txHash": create_tx_hash(f"tx{i}".encode()).hex()
+        }
+    }
+
+
+def _make_call_tx(i: int) -> dict:
+    tx: dict = _make_transfer_tx(i)
+    params: dict = tx["params"]
+    params["to"] = str(create_address(1, data=b"score"))
+    params["value"] = "0x0"
+    params["dataType"] = "call"
+    params["data"] = {
+        "method": "transfer",
+        "params": {
+            "_to": str(create_address(data=f"to{i}".encode())),
+            "_value": hex(i + 1),
+            "_data": "0x" + bytes(32).hex()
+        }
+    }
+    return tx
+
+
+@pytest.fixture(scope="module")
+def invoke_request() -> dict:
+    return {
+        "block": {
+            "blockHeight": hex(100),
+            "blockHash": create_block_hash(b"block").hex(),
+            "timestamp": hex(1_600_000_000_000_000),
+            "prevBlockHash": create_block_hash(b"prev_block").hex()
+        },
+        "isBlockEditable": "0x0",
+        "transactions": [
+            _make_transfer_tx(i) if i % 2 == 0 else _make_call_tx(i) for i in range(TX_COUNT)
+        ]
+    }
+
+
+@pytest.fixture(scope="module")
+def query_request() -> dict:
+    return {
+        "method": "icx_call",
+        "params": {
+            "from": str(create_address(data=b"from")),
+            "to": str(create_address(1, data=b"score")),
+            "dataType": "call",
+            "data": {
+                "method": "balanceOf",
+                "params": {"_owner": str(create_address(data=b"owner"))}
+            }
+        }
+    }
+
+
+@pytest.mark.benchmark(group="type_converter")
+def test_convert_invoke(benchmark, invoke_request):
+    ret = benchmark(TypeConverter.convert, invoke_request, ParamType.INVOKE)
+    assert len(ret["transactions"]) == TX_COUNT
+
+
+@pytest.mark.benchmark(group="type_converter")
+def test_convert_query(benchmark, query_request):
+    ret = benchmark(TypeConverter.convert, query_request, ParamType.QUERY)
+    assert isinstance(ret["params"]["to"], Address)
+
+
+@pytest.mark.benchmark(group="address")
+def test_address_from_string(benchmark):
+    addresses = [str(create_address(i % 2, data=i.to_bytes(4, "big"))) for i in range(TX_COUNT)]
+
+    def _run():
+        return [Address.from_string(address) for address in addresses]
+
+    ret = benchmark(_run)
+    assert str(ret[-1]) == addresses[-1]
+
+
+@pytest.mark.benchmark(group="address")
+def test_address_hash(benchmark):
+    addresses = [create_address(data=i.to_bytes(4, "big")) for i in range(TX_COUNT)]
+
+    def _run():
+        return {address: i for i, address in enumerate(addresses)}
+
+    ret = benchmark(_run)
+    assert len(ret) == TX_COUNT
+
+
+@pytest.mark.benchmark(group="address")
+def test_address_eq(benchmark):
+    addresses = [create_address(data=i.to_bytes(4, "big")) for i in range(TX_COUNT)]
+    others = [Address.from_string(str(address)) for address in addresses]
+
+    def _run():
+        return sum(1 for a, b in zip(addresses, others) if a == b)
+
+    ret = benchmark(_run)
+    assert ret == TX_COUNT
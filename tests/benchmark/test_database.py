@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from iconservice.database.batch import TransactionBatch, TransactionBatchValue, BlockBatch
+from iconservice.icon_constant import Revision
+from iconservice.icx.coin_part import CoinPart
+from iconservice.icx.stake_part import StakePart
+from iconservice.prep.data import PRep
+from tests import create_address, create_block_hash
+
+REVISION = Revision.LATEST.value
+KEY_COUNT = 1000
+
+
+@pytest.fixture(scope="module")
+def items() -> list:
+    return [
+        (create_block_hash(i.to_bytes(4, "big")), i.to_bytes(32, "big") if i % 10 else None)
+        for i in range(KEY_COUNT)
+    ]
+
+
+@pytest.mark.benchmark(group="batch")
+def test_transaction_batch_digest(benchmark, items):
+    tx_batch = TransactionBatch()
+    for i, (key, value) in enumerate(items):
+        tx_batch[key] = TransactionBatchValue(value, i % 3 != 0, 0)
+
+    ret = benchmark(tx_batch.digest)
+    assert len(ret) == 32
+
+
+@pytest.mark.benchmark(group="batch")
+def test_block_batch_digest(benchmark, items):
+    tx_batch = TransactionBatch()
+    for i, (key, value) in enumerate(items):
+        tx_batch[key] = TransactionBatchValue(value, i % 3 != 0, i)
+    block_batch = BlockBatch()
+    block_batch.update(tx_batch)
+
+    ret = benchmark(block_batch.digest)
+    assert ret == tx_batch.digest()
+
+
+@pytest.fixture(scope="module")
+def stake_part() -> 'StakePart':
+    part = StakePart(stake=10 ** 24, unstakes_info=[[10 ** 20, 1000], [10 ** 21, 2000]])
+    part.set_complete(True)
+    return part
+
+
+@pytest.fixture(scope="module")
+def prep() -> 'PRep':
+    return PRep(
+        create_address(data=b"prep"),
+        name="prep",
+        country="KOR",
+        city="Seoul",
+        email="prep@example.com",
+        website="https://example.com",
+        details="https://example.com/details",
+        p2p_endpoint="example.com:7100",
+        irep=50_000 * 10 ** 18,
+        irep_block_height=1000,
+        last_generate_block_height=2000,
+        stake=10 ** 24,
+        delegated=10 ** 25,
+        block_height=100,
+        tx_index=1,
+        total_blocks=10_000,
+        validated_blocks=9_999,
+        node_address=create_address(data=b"node")
+    )
+
+
+@pytest.mark.benchmark(group="msgpack_for_db")
+def test_coin_part_to_bytes(benchmark):
+    coin_part = CoinPart(balance=10 ** 24)
+    ret = benchmark(coin_part.to_bytes, REVISION)
+    assert CoinPart.from_bytes(ret) == coin_part
+
+
+@pytest.mark.benchmark(group="msgpack_for_db")
+def test_coin_part_from_bytes(benchmark):
+    coin_part = CoinPart(balance=10 ** 24)
+    ret = benchmark(CoinPart.from_bytes, coin_part.to_bytes(REVISION))
+    assert ret == coin_part
+
+
+@pytest.mark.benchmark(group="msgpack_for_db")
+def test_stake_part_to_bytes(benchmark, stake_part):
+    ret = benchmark(stake_part.to_bytes, REVISION)
+    part = StakePart.from_bytes(ret)
+    part.set_complete(True)
+    assert part.total_unstake == stake_part.total_unstake
+
+
+@pytest.mark.benchmark(group="msgpack_for_db")
+def test_stake_part_from_bytes(benchmark, stake_part):
+    data: bytes = stake_part.to_bytes(REVISION)
+    ret = benchmark(StakePart.from_bytes, data)
+    ret.set_complete(True)
+    assert ret.to_bytes(REVISION) == data
+
+
+@pytest.mark.benchmark(group="msgpack_for_db")
+def test_prep_to_bytes(benchmark, prep):
+    ret = benchmark(prep.to_bytes, REVISION)
+    assert PRep.from_bytes(ret).node_address == prep.node_address
+
+
+@pytest.mark.benchmark(group="msgpack_for_db")
+def test_prep_from_bytes(benchmark, prep):
+    ret = benchmark(PRep.from_bytes, prep.to_bytes(REVISION))
+    assert ret.address == prep.address
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.base.address import AddressPrefix
+from iconservice.database.db import ContextDatabase
+from iconservice.fee import FeeEngine, FeeStorage
+from iconservice.fee.deposit import Deposit
+from iconservice.fee.deposit_index import DepositIndexContainer
+from iconservice.fee.engine import BLOCKS_IN_ONE_MONTH
+from iconservice.icon_constant import IconScoreContextType
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.utils import ContextStorage
+from tests import create_address, create_tx_hash
+
+DEPOSIT_COUNT = 500
+CHARGE_COUNT = 50
+VIRTUAL_STEP = 10 ** 6
+DEPOSIT_AMOUNT = 5_000 * 10 ** 18
+STEP_PRICE = 10 ** 10
+BLOCK_HEIGHT = 100
+
+SCORE_ADDRESS = create_address(AddressPrefix.CONTRACT)
+
+
+def _create_context(db: dict, deposit_indices) -> 'IconScoreContext':
+    context_db = Mock(spec=ContextDatabase)
+    context_db.get = lambda _context, key: db.get(key)
+    context_db.put = lambda _context, key, value: db.__setitem__(key, value)
+    context_db.delete = lambda _context, key: db.pop(key)
+
+    context = IconScoreContext(IconScoreContextType.INVOKE)
+    context.storage = ContextStorage(deploy=None, fee=FeeStorage(context_db), icx=None,
+                                     iiss=None, prep=None, issue=None, rc=None, meta=None)
+    context.fee_sharing_proportion = 100
+    context.deposit_indices = deposit_indices
+    return context
+
+
+@pytest.fixture(scope="module", params=["virtual_step", "deposit"])
+def deposits(request):
+    """SCORE state with deposits made in the same block
+
+    They have the same expires, so the max expires is found again whenever a deposit runs out
+    """
+    engine = FeeEngine()
+    db = {}
+    context = _create_context(db, DepositIndexContainer())
+    virtual_step_used = VIRTUAL_STEP if request.param == "deposit" else 0
+
+    for _ in range(DEPOSIT_COUNT):
+        deposit = Deposit(create_tx_hash(), SCORE_ADDRESS, create_address(), DEPOSIT_AMOUNT, 0,
+                          0, BLOCKS_IN_ONE_MONTH, VIRTUAL_STEP, virtual_step_used)
+        engine._append_deposit(context, deposit)
+    context.deposit_indices.update_batch()
+
+    # The STEPs to use up virtual STEPs or available ICXs of a deposit
+    if request.param == "deposit":
+        # All virtual STEPs have been used
+        deposit_meta = context.storage.fee.get_deposit_meta(context, SCORE_ADDRESS)
+        deposit_meta.available_head_id_of_virtual_step = None
+        deposit_meta.expires_of_virtual_step = -1
+        context.storage.fee.put_deposit_meta(context, SCORE_ADDRESS, deposit_meta)
+
+        deposit = context.storage.fee.get_deposit(context, deposit.id)
+        used_step = (deposit.remaining_deposit - deposit.min_remaining_deposit) // STEP_PRICE
+    else:
+        used_step = VIRTUAL_STEP
+
+    return db, context.deposit_indices, used_step
+
+
+@pytest.mark.benchmark(group="fee_charge")
+def test_charge_fee_from_score(benchmark, deposits):
+    engine = FeeEngine()
+    db, deposit_indices, used_step = deposits
+
+    def _run():
+        # Deposit indices are inherited from the previous block
+        context = _create_context(db.copy(), deposit_indices.copy())
+        for _ in range(CHARGE_COUNT):
+            engine._charge_fee_from_score(context, SCORE_ADDRESS, STEP_PRICE, used_step, BLOCK_HEIGHT)
+        return context
+
+    context = benchmark(_run)
+    deposit_meta = context.storage.fee.get_deposit_meta(context, SCORE_ADDRESS)
+    assert deposit_meta.expires_of_virtual_step in (-1, BLOCKS_IN_ONE_MONTH)
+    assert deposit_meta.expires_of_deposit == BLOCKS_IN_ONE_MONTH
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.base.address import Address
+from iconservice.database.batch import TransactionBatch, BlockBatch
+from iconservice.icon_constant import IconScoreContextType, Revision
+from iconservice.iconscore.context.context import ContextContainer
+from iconservice.iconscore.db import IconScoreDatabase
+from iconservice.iconscore.icon_container_db import VarDB, DictDB, ArrayDB
+from iconservice.iconscore.icon_score_base import IconScoreBase, eventlog, external
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iconscore.icon_score_event_log import EventLogEmitter
+from iconservice.iconscore.icon_score_step import IconScoreStepCounter, StepType, get_input_data_size
+from iconservice.utils import ContextStorage
+from tests import create_address
+from tests.conftest import generate_inv_container
+
+COUNT = 100
+ADDRESSES = [create_address(data=i.to_bytes(4, "big")) for i in range(COUNT)]
+
+
+@pytest.fixture(scope="function")
+def invoke_context(context_db):
+    context = IconScoreContext(IconScoreContextType.INVOKE)
+    context._inv_container = generate_inv_container(False, Revision.LATEST.value)
+    context.tx_batch = TransactionBatch()
+    context.block_batch = BlockBatch()
+    context.event_logs = []
+    context.current_address = create_address(1, data=b"score")
+
+    ContextContainer._push_context(context)
+    yield context
+    ContextContainer._pop_context()
+
+
+@pytest.fixture(scope="function")
+def score_db(invoke_context, context_db):
+    return IconScoreDatabase(invoke_context.current_address, context_db)
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_score_db_put(benchmark, score_db):
+    keys = [address.to_bytes() for address in ADDRESSES]
+    value: bytes = (10 ** 20).to_bytes(32, "big")
+
+    def _run():
+        for key in keys:
+            score_db.put(key, value)
+
+    benchmark(_run)
+    assert score_db.get(keys[-1]) == value
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_score_db_get(benchmark, score_db):
+    keys = [address.to_bytes() for address in ADDRESSES]
+    for key in keys:
+        score_db.put(key, key)
+
+    def _run():
+        return [score_db.get(key) for key in keys]
+
+    ret = benchmark(_run)
+    assert ret == keys
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_var_db_set(benchmark, score_db):
+    var_db = VarDB("total_supply", score_db, value_type=int)
+
+    def _run():
+        for i in range(COUNT):
+            var_db.set(i)
+
+    benchmark(_run)
+    assert var_db.get() == COUNT - 1
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_var_db_get(benchmark, score_db):
+    var_db = VarDB("total_supply", score_db, value_type=int)
+    var_db.set(10 ** 20)
+
+    def _run():
+        return [var_db.get() for _ in range(COUNT)]
+
+    ret = benchmark(_run)
+    assert ret[-1] == 10 ** 20
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_dict_db_set(benchmark, score_db):
+    dict_db = DictDB("balances", score_db, value_type=int)
+
+    def _run():
+        for i, address in enumerate(ADDRESSES):
+            dict_db[address] = i
+
+    benchmark(_run)
+    assert dict_db[ADDRESSES[-1]] == COUNT - 1
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_dict_db_get(benchmark, score_db):
+    dict_db = DictDB("balances", score_db, value_type=int)
+    for i, address in enumerate(ADDRESSES):
+        dict_db[address] = i
+
+    def _run():
+        return [dict_db[address] for address in ADDRESSES]
+
+    ret = benchmark(_run)
+    assert ret == list(range(COUNT))
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_dict_db_depth2_get(benchmark, score_db):
+    dict_db = DictDB("allowances", score_db, depth=2, value_type=int)
+    owner = ADDRESSES[0]
+    for i, address in enumerate(ADDRESSES):
+        dict_db[owner][address] = i
+
+    def _run():
+        return [dict_db[owner][address] for address in ADDRESSES]
+
+    ret = benchmark(_run)
+    assert ret == list(range(COUNT))
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_array_db_put(benchmark, score_db):
+    def _run():
+        array_db = ArrayDB("holders", score_db, value_type=Address)
+        for address in ADDRESSES:
+            array_db.put(address)
+        return array_db
+
+    ret = benchmark(_run)
+    assert ret[-1] == ADDRESSES[-1]
+
+
+@pytest.mark.benchmark(group="score_db")
+def test_array_db_get(benchmark, score_db):
+    array_db = ArrayDB("holders", score_db, value_type=Address)
+    for address in ADDRESSES:
+        array_db.put(address)
+
+    def _run():
+        return [array_db[i] for i in range(COUNT)]
+
+    ret = benchmark(_run)
+    assert ret == ADDRESSES
+
+
+@pytest.mark.benchmark(group="event_log")
+def test_emit_event_log(benchmark, invoke_context):
+    score_address = invoke_context.current_address
+    signature = "Transfer(Address,Address,int,bytes)"
+
+    def _run():
+        invoke_context.event_logs.clear()
+        for i in range(COUNT - 1):
+            EventLogEmitter.emit_event_log(
+                invoke_context, score_address, signature, [ADDRESSES[i], ADDRESSES[i + 1], i, b"data"], 3)
+
+    benchmark(_run)
+    assert len(invoke_context.event_logs) == COUNT - 1
+
+
+@pytest.fixture(scope="module")
+def input_data() -> dict:
+    return {
+        "method": "setDelegation",
+        "params": {
+            "delegations": [
+                {"address": str(address), "value": hex(10 ** 18 + i)} for i, address in enumerate(ADDRESSES[:10])
+            ]
+        }
+    }
+
+
+@pytest.mark.benchmark(group="input_data_size")
+@pytest.mark.parametrize("revision", [Revision.TWO.value, Revision.LATEST.value])
+def test_get_input_data_size(benchmark, input_data, revision):
+    ret = benchmark(get_input_data_size, revision, input_data)
+    assert ret > 0
+
+
+# Step costs on mainnet
+STEP_COSTS = {
+    StepType.DEFAULT: 100_000,
+    StepType.CONTRACT_CALL: 25_000,
+    StepType.CONTRACT_CREATE: 1_000_000_000,
+    StepType.CONTRACT_UPDATE: 1_600_000_000,
+    StepType.CONTRACT_DESTRUCT: -70_000,
+    StepType.CONTRACT_SET: 30_000,
+    StepType.GET: 25,
+    StepType.SET: 320,
+    StepType.REPLACE: 80,
+    StepType.DELETE: -240,
+    StepType.INPUT: 200,
+    StepType.EVENT_LOG: 100,
+    StepType.API_CALL: 10_000
+}
+
+
+class AirdropScore(IconScoreBase):
+    def __init__(self, db: 'IconScoreDatabase'):
+        super().__init__(db)
+        self._balances = DictDB("balances", db, value_type=int)
+        self._holders = ArrayDB("holders", db, value_type=Address)
+
+    def on_install(self, **kwargs) -> None:
+        pass
+
+    def on_update(self, **kwargs) -> None:
+        pass
+
+    @eventlog(indexed=2)
+    def Transfer(self, _from: Address, _to: Address, _value: int):
+        pass
+
+    @external
+    def airdrop(self, value: int):
+        for address in ADDRESSES:
+            if self._balances[address] == 0:
+                self._holders.put(address)
+            self._balances[address] += value
+            self.Transfer(self.address, address, value)
+
+        # Only the first half of holders are kept
+        while len(self._holders) > COUNT // 2:
+            self._holders.pop()
+
+
+@pytest.fixture(scope="function")
+def airdrop_score(invoke_context, context_db):
+    invoke_context.storage = ContextStorage(deploy=Mock(get_deploy_info=Mock(return_value=None)))
+    return AirdropScore(IconScoreDatabase(invoke_context.current_address, context_db))
+
+
+@pytest.mark.benchmark(group="step")
+def test_storage_heavy_score_method(benchmark, invoke_context, airdrop_score):
+    """Steps are charged on every DB access and event log in the method"""
+
+    def _run():
+        invoke_context.tx_batch.clear()
+        invoke_context.event_logs.clear()
+        invoke_context.step_counter = IconScoreStepCounter(10 ** 10, STEP_COSTS, 2_500_000_000)
+        airdrop_score.airdrop(10 ** 18)
+        return invoke_context.step_counter.step_used
+
+    step_used = benchmark(_run)
+    assert step_used == 1_494_515
+    assert len(invoke_context.event_logs) == COUNT
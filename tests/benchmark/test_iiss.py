@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from collections import OrderedDict
+from typing import Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.base.block import Block
+from iconservice.base.message import Message
+from iconservice.icon_constant import IconScoreContextType, Revision
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.icx.coin_part import CoinPart
+from iconservice.icx.delegation_part import DelegationPart
+from iconservice.icx.icx_account import Account
+from iconservice.icx.stake_part import StakePart
+from iconservice.iiss.engine import Engine as IISSEngine
+from iconservice.prep.data import PRep, PRepContainer
+from iconservice.prep.engine import Engine as PRepEngine
+from iconservice.utils import ContextStorage
+from tests import create_address, create_block_hash
+
+PREP_COUNT = 100
+# The number of delegation targets of a setDelegation tx
+TARGET_COUNT = 100
+# The targets of which delegated amounts are changed by the tx
+CHANGED_TARGET_COUNT = 10
+DELEGATED = 10 ** 18
+
+SENDER = create_address(data=b"sender")
+PREP_ADDRESSES = [create_address(data=i.to_bytes(4, "big")) for i in range(PREP_COUNT)]
+
+
+def _create_account(address: 'Address', delegated_amount: int, delegations: list = None) -> 'Account':
+    return Account(address, 0, Revision.IISS.value,
+                   coin_part=CoinPart(balance=10 ** 18),
+                   stake_part=StakePart(stake=TARGET_COUNT * DELEGATED * 2),
+                   delegation_part=DelegationPart(delegated_amount, delegations))
+
+
+@pytest.fixture
+def accounts() -> Dict['Address', 'Account']:
+    """The sender delegating DELEGATED to every P-Rep, which are read from state db by setDelegation
+    """
+    accounts = {address: _create_account(address, DELEGATED) for address in PREP_ADDRESSES}
+    accounts[SENDER] = _create_account(SENDER, 0, [(address, DELEGATED) for address in PREP_ADDRESSES])
+    return accounts
+
+
+def _create_context(revision: int, accounts: Dict['Address', 'Account']) -> 'IconScoreContext':
+    preps = PRepContainer()
+    for i, address in enumerate(PREP_ADDRESSES):
+        preps.add(PRep(address, delegated=DELEGATED, block_height=i, tx_index=0))
+    preps.freeze()
+
+    # Accounts are copied on every read as they are deserialized from state db
+    icx_storage = Mock()
+    icx_storage.get_account = lambda _context, address, _intent=None: copy.deepcopy(accounts[address])
+    icx_storage.put_account = lambda _context, _account: None
+
+    context = IconScoreContext(IconScoreContextType.INVOKE)
+    context._inv_container = Mock(revision_code=revision)
+    context._preps = preps.copy(mutable=True)
+    context._tx_dirty_preps = OrderedDict()
+    context._prep_address_converter = Mock()
+    context.msg = Message(SENDER, 0)
+    context.block = Block(1, create_block_hash(), 0, create_block_hash(), 0)
+    context.rc_block_batch = []
+    context.storage = ContextStorage(deploy=None, fee=None, icx=icx_storage, iiss=None,
+                                     prep=Mock(), issue=None, meta=None, rc=Mock(), inv=None)
+    return context
+
+
+def _replace_one_by_one(self, new_preps):
+    for new_prep in new_preps:
+        self.replace(new_prep)
+
+
+@pytest.mark.benchmark(group="set_delegation")
+@pytest.mark.parametrize("optimized", [False, True])
+def test_set_delegation(benchmark, mocker, accounts, optimized):
+    """A setDelegation tx with TARGET_COUNT targets and its dirty P-Reps applied to PRepContainer
+
+    Without the optimization, every target is loaded and passed to PRepContainer.replace() one by one
+    as it was before Revision.OPTIMIZE_DIRTY_PREP_UPDATE
+    """
+    if optimized:
+        revision: int = Revision.CHANGE_MAX_DELEGATIONS_TO_100.value
+    else:
+        revision: int = Revision.FIX_TOTAL_ELECTED_PREP_DELEGATED.value
+        mocker.patch.object(IISSEngine, "get_max_delegations_by_revision", return_value=TARGET_COUNT)
+        mocker.patch.object(PRepContainer, "replace_all", _replace_one_by_one)
+
+    iiss_engine = IISSEngine()
+    iiss_engine.add_listener(PRepEngine())
+
+    delegations: List[dict] = [
+        {"address": address, "value": DELEGATED * 2 if i < CHANGED_TARGET_COUNT else DELEGATED}
+        for i, address in enumerate(PREP_ADDRESSES[:TARGET_COUNT])
+    ]
+
+    def _setup():
+        return (_create_context(revision, accounts),), {}
+
+    def _run(context: 'IconScoreContext'):
+        iiss_engine.handle_set_delegation(context, delegations)
+        context.update_dirty_prep_batch()
+        return context
+
+    context = benchmark.pedantic(_run, setup=_setup, rounds=100)
+
+    assert context.preps.total_delegated == DELEGATED * (PREP_COUNT + CHANGED_TARGET_COUNT)
+    orders = [prep.order() for prep in context.preps]
+    assert orders == sorted(orders)
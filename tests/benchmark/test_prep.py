@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from iconservice.prep.data import PRep
+from iconservice.prep.data.sorted_list import SortedList
+from tests import create_address
+
+PREP_COUNT = 1000
+NEW_PREP_COUNT = 100
+
+
+def _create_preps(start: int, count: int, rand: 'random.Random') -> list:
+    return [
+        PRep(create_address(data=i.to_bytes(4, "big")),
+             delegated=rand.randint(0, 10 ** 6) * 10 ** 18,
+             block_height=i,
+             tx_index=0)
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture(scope="function")
+def preps() -> 'SortedList':
+    rand = random.Random(0)
+    return SortedList(sorted(_create_preps(0, PREP_COUNT, rand), key=lambda x: x.order()))
+
+
+@pytest.mark.benchmark(group="sorted_list")
+def test_sorted_list_add(benchmark, preps):
+    new_preps = _create_preps(PREP_COUNT, NEW_PREP_COUNT, random.Random(1))
+
+    def _run():
+        sorted_list = SortedList(preps)
+        for prep in new_preps:
+            sorted_list.add(prep)
+        return sorted_list
+
+    ret = benchmark(_run)
+    assert len(ret) == PREP_COUNT + NEW_PREP_COUNT
+
+
+@pytest.mark.benchmark(group="sorted_list")
+def test_sorted_list_reorder(benchmark, preps):
+    sorted_list = SortedList(preps)
+    rand = random.Random(2)
+    targets = [sorted_list[rand.randrange(PREP_COUNT)] for _ in range(NEW_PREP_COUNT)]
+
+    def _run():
+        # Delegation changes in a block
+        for prep in targets:
+            prep.delegated = rand.randint(0, 10 ** 6) * 10 ** 18
+            sorted_list.reorder(prep)
+
+    benchmark(_run)
+    orders = [prep.order() for prep in sorted_list]
+    assert orders == sorted(orders)
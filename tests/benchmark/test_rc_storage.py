@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.icon_constant import Revision, RC_DB_VERSION_2
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iiss.reward_calc import RewardCalcStorage
+from iconservice.iiss.reward_calc.data_creator import DataCreator
+from iconservice.iiss.reward_calc.msg_data import TxData, TxType, PRepsData
+from iconservice.prep.data.term import PRepSnapshot
+from tests import create_address
+
+TX_COUNT = 1_000_000
+# iiss_db for the normal test run which does not measure benchmarks
+SMALL_TX_COUNT = 1000
+PREP_COUNT = 100
+UNREGISTERED_PREP_COUNT = 10
+BLOCK_HEIGHT = 1
+BATCH_SIZE = 10_000
+
+
+@pytest.fixture(scope="module")
+def iiss_db_path(request, tmp_path_factory) -> str:
+    """current_db with a PRepsData and TX_COUNT delegation txs among which a few P-Reps are unregistered
+    """
+    tx_count: int = SMALL_TX_COUNT if request.config.option.benchmark_disable else TX_COUNT
+    path: str = str(tmp_path_factory.mktemp("rc_data"))
+
+    preps: List[PRepSnapshot] = [
+        PRepSnapshot(create_address(data=i.to_bytes(4, "big")), 10 ** 24 + i) for i in range(PREP_COUNT)
+    ]
+    prep_data = DataCreator.create_prep_data(BLOCK_HEIGHT, sum(p.delegated for p in preps), preps)
+    header = DataCreator.create_header(RC_DB_VERSION_2, BLOCK_HEIGHT, Revision.DECENTRALIZATION.value)
+
+    db = RewardCalcStorage.create_current_db(path)
+    batch: List[Tuple[bytes, bytes]] = [
+        (header.make_key(), header.make_value()),
+        (prep_data.make_key(), prep_data.make_value())
+    ]
+    unregister_interval: int = tx_count // UNREGISTERED_PREP_COUNT
+
+    for i in range(tx_count):
+        if i % unregister_interval == 0:
+            prep: 'PRepSnapshot' = preps[i // unregister_interval]
+            tx = DataCreator.create_tx(prep.address, BLOCK_HEIGHT, DataCreator.create_tx_prep_unreg())
+            batch.append(RewardCalcStorage.make_unregistered_prep_index(tx, i))
+        else:
+            infos: list = [
+                DataCreator.create_delegation_info(preps[(i + j) % PREP_COUNT].address, 10 ** 18)
+                for j in range(i % 10 + 1)
+            ]
+            tx = DataCreator.create_tx(create_address(data=i.to_bytes(4, "big")), BLOCK_HEIGHT,
+                                       DataCreator.create_tx_delegation(infos))
+        batch.append((tx.make_key(i), tx.make_value()))
+
+        if len(batch) >= BATCH_SIZE:
+            db.write_batch(batch)
+            batch.clear()
+
+    batch.append((RewardCalcStorage.KEY_FOR_UNREGISTERED_PREP_INDEX,
+                  RewardCalcStorage._make_unregistered_prep_index_marker()))
+    db.write_batch(batch)
+    db.close()
+
+    return path
+
+
+@pytest.fixture
+def rc_storage(iiss_db_path):
+    context = Mock(spec=IconScoreContext, revision=Revision.DECENTRALIZATION.value)
+
+    storage = RewardCalcStorage()
+    storage.open(context, iiss_db_path)
+    yield storage
+    storage.close()
+
+
+def _expected_snapshot() -> int:
+    return sum(10 ** 24 + i for i in range(UNREGISTERED_PREP_COUNT, PREP_COUNT))
+
+
+@pytest.mark.benchmark(group="rc_storage")
+def test_get_total_elected_prep_delegated_snapshot(benchmark, rc_storage):
+    ret = benchmark(rc_storage.get_total_elected_prep_delegated_snapshot)
+    assert ret == _expected_snapshot()
+
+
+def _get_total_elected_prep_delegated_snapshot_by_scan(storage: 'RewardCalcStorage') -> int:
+    """get_total_elected_prep_delegated_snapshot before the index, which deserializes every tx in current_db
+    """
+    db = storage.key_value_db
+
+    unreg_preps = set()
+    for _, v in db.get_sub_db(TxData.PREFIX).iterator():
+        data: 'TxData' = TxData.from_bytes(v)
+        if data.type == TxType.PREP_UNREGISTER:
+            unreg_preps.add(data.address)
+
+    preps = None
+    for k, v in db.get_sub_db(PRepsData.PREFIX).iterator():
+        preps = PRepsData.from_bytes(k, v).prep_list
+        break
+
+    return sum(info.value for info in preps if info.address not in unreg_preps)
+
+
+@pytest.mark.benchmark(group="rc_storage")
+def test_get_total_elected_prep_delegated_snapshot_by_scan(benchmark, rc_storage):
+    ret = benchmark.pedantic(_get_total_elected_prep_delegated_snapshot_by_scan, args=(rc_storage,), rounds=1)
+    assert ret == _expected_snapshot()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+
+from iconservice.base.block import Block
+from iconservice.database.db import KeyValueDatabase
+from iconservice.database.wal import WriteAheadLogReader
+from iconservice.icon_constant import Revision
+from iconservice.iiss.reward_calc.storage import Storage as RewardCalcStorage
+from iconservice.rollback.backup_manager import BackupManager
+from iconservice.rollback.rollback_manager import RollbackManager
+
+# Blocks to rollback for the normal test run which does not measure benchmarks
+SMALL_BLOCK_COUNT = 10
+START_BLOCK_HEIGHT = 100
+KEY_COUNT = 200
+# 20% of the keys in each block are updated again and again by the other blocks
+HOT_KEY_COUNT = KEY_COUNT // 5
+HOT_KEY_POOL_SIZE = 1000
+SEGMENT_SIZE = 100
+
+
+def _make_key(name: bytes, index: int) -> bytes:
+    return hashlib.sha3_256(name + index.to_bytes(8, "big")).digest()
+
+
+def _make_value(block_height: int, index: int) -> bytes:
+    return hashlib.sha3_256(block_height.to_bytes(8, "big")).digest() + index.to_bytes(32, "big")
+
+
+HOT_KEYS: List[bytes] = [_make_key(b"hot", i) for i in range(HOT_KEY_POOL_SIZE)]
+
+
+def _create_block_batch(block_height: int) -> Dict[bytes, bytes]:
+    block_batch = OrderedDict()
+    for i in range(KEY_COUNT):
+        if i < HOT_KEY_COUNT:
+            key: bytes = HOT_KEYS[(block_height * HOT_KEY_COUNT + i) % HOT_KEY_POOL_SIZE]
+        else:
+            key: bytes = _make_key(block_height.to_bytes(8, "big"), i)
+        block_batch[key] = _make_value(block_height, i)
+
+    return block_batch
+
+
+def _create_block(block_height: int) -> 'Block':
+    return Block(block_height=block_height,
+                 block_hash=hashlib.sha3_256(block_height.to_bytes(8, "big")).digest(),
+                 timestamp=0,
+                 prev_hash=hashlib.sha3_256((block_height - 1).to_bytes(8, "big")).digest(),
+                 cumulative_fee=0)
+
+
+@pytest.fixture(scope="module")
+def create_backups(tmp_path_factory) -> Callable[..., Tuple[str, str, str, int]]:
+    """Returns a function which commits block_count blocks to a new state_db backing up each of them
+
+    The function returns the paths of state_db, rc_data and backups and the total size of backups.
+    The blocks are committed only once for the same arguments
+    """
+    paths: Dict[tuple, Tuple[str, str, str, int]] = {}
+
+    def _create_backups(block_count: int,
+                        compression: str = "",
+                        segment_size: int = 0) -> Tuple[str, str, str, int]:
+        args = block_count, compression, segment_size
+        if args in paths:
+            return paths[args]
+
+        path: str = str(tmp_path_factory.mktemp("rollback"))
+        state_db_path: str = os.path.join(path, "statedb")
+        rc_data_path: str = os.path.join(path, "iiss")
+        backup_root_path: str = os.path.join(path, "backup")
+        os.mkdir(rc_data_path)
+        os.mkdir(backup_root_path)
+
+        state_db = KeyValueDatabase.from_path(state_db_path, create_if_missing=True)
+        rc_db = RewardCalcStorage.create_current_db(rc_data_path)
+        state_db.write_batch([(key, _make_value(0, i)) for i, key in enumerate(HOT_KEYS)])
+
+        backup_manager = BackupManager(backup_root_path, rc_data_path, compression, segment_size)
+        backup_size = 0
+        for block_height in range(START_BLOCK_HEIGHT, START_BLOCK_HEIGHT + block_count):
+            block_batch: Dict[bytes, bytes] = _create_block_batch(block_height)
+            backup_manager.run(icx_db=state_db,
+                               rc_db=rc_db,
+                               revision=Revision.DECENTRALIZATION.value,
+                               prev_block=_create_block(block_height),
+                               block_batch=block_batch,
+                               iiss_wal=OrderedDict().items(),
+                               is_calc_period_start_block=False,
+                               instant_block_hash=_create_block(block_height + 1).hash)
+            backup_size += backup_manager.last_backup_size
+            state_db.write_batch(block_batch.items())
+
+        state_db.close()
+        rc_db.close()
+
+        paths[args] = state_db_path, rc_data_path, backup_root_path, backup_size
+        return paths[args]
+
+    return _create_backups
+
+
+_open = WriteAheadLogReader.open
+
+
+def _open_without_mmap(self, path: str, use_mmap: bool = False):
+    return _open(self, path)
+
+
+def _write_batch_one_by_one(it, batch: dict):
+    for key, value in it:
+        batch[key] = value
+
+
+def _commit_batch_unsorted(batch: dict, db: 'KeyValueDatabase'):
+    db.write_batch(batch.items())
+
+
+@pytest.mark.benchmark(group="rollback")
+@pytest.mark.parametrize("optimized", [False, True])
+@pytest.mark.parametrize("block_count", [1000, 10_000])
+def test_rollback(benchmark, request, mocker, create_backups, block_count, optimized):
+    """Rollback of block_count blocks with KEY_COUNT state_db keys each and no term change
+
+    Without the optimization, backup files are read in chunks, merged record by record
+    and committed in the order of the merged batch
+    """
+    if request.config.option.benchmark_disable:
+        block_count = SMALL_BLOCK_COUNT
+
+    if not optimized:
+        mocker.patch.object(WriteAheadLogReader, "open", _open_without_mmap)
+        mocker.patch.object(RollbackManager, "_write_batch", staticmethod(_write_batch_one_by_one))
+        mocker.patch.object(RollbackManager, "_commit_batch", staticmethod(_commit_batch_unsorted))
+
+    state_db_path, rc_data_path, backup_root_path, _ = create_backups(block_count)
+    _run_rollback(benchmark, state_db_path, rc_data_path, backup_root_path, block_count)
+
+
+@pytest.mark.benchmark(group="rollback_backup_format")
+@pytest.mark.parametrize("compression,segment_size", [("", 0), ("zlib", 0), ("", SEGMENT_SIZE)],
+                         ids=["wal_v1", "zlib", "segment"])
+def test_rollback_backup_format(benchmark, request, create_backups, compression, segment_size):
+    """Rollback of 1000 blocks backed up in each format and the bytes written per block
+
+    wal_v1 is the uncompressed WAL file per block, zlib is the compressed WAL file version 2 per block
+    and segment is the uncompressed WAL appended to a file per SEGMENT_SIZE blocks
+    """
+    block_count: int = SMALL_BLOCK_COUNT if request.config.option.benchmark_disable else 1000
+
+    state_db_path, rc_data_path, backup_root_path, backup_size = \
+        create_backups(block_count, compression, segment_size)
+    benchmark.extra_info["bytes_per_block"] = backup_size // block_count
+    benchmark.extra_info["backup_files"] = len(os.listdir(backup_root_path))
+
+    _run_rollback(benchmark, state_db_path, rc_data_path, backup_root_path, block_count)
+
+
+def _run_rollback(benchmark, state_db_path: str, rc_data_path: str, backup_root_path: str, block_count: int):
+    state_db = KeyValueDatabase.from_path(state_db_path)
+
+    # Rollback only restores the state in backup files, so it can be run again and again
+    rollback_manager = RollbackManager(backup_root_path, rc_data_path, state_db)
+    benchmark.pedantic(rollback_manager.run,
+                       args=(START_BLOCK_HEIGHT + block_count, START_BLOCK_HEIGHT, START_BLOCK_HEIGHT),
+                       rounds=3)
+
+    for i, key in enumerate(HOT_KEYS):
+        assert state_db.get(key) == _make_value(0, i)
+    for block_height in range(START_BLOCK_HEIGHT, START_BLOCK_HEIGHT + block_count):
+        assert state_db.get(_make_key(block_height.to_bytes(8, "big"), KEY_COUNT - 1)) is None
+    state_db.close()
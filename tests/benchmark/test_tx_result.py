@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from typing import List
+
+import msgpack
+import pytest
+
+from iconservice.base.block import Block
+from iconservice.base.transaction import Transaction
+from iconservice.icon_constant import INVOKE_LOG_MAX_SIZE
+from iconservice.icon_inner_service import MakeResponse
+from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.utils import to_camel_case, BytesToHexJSONEncoder, JSONLogMessage
+from iconservice.utils.bloom import BloomFilter
+from tests import create_address, create_block_hash, create_tx_hash
+
+TX_COUNT = 5000
+# tx_results for the normal test run which does not measure benchmarks
+SMALL_TX_COUNT = 100
+
+SCORE_ADDRESS = create_address(1, data=b"score")
+
+
+def _create_tx_results(tx_count: int) -> List['TransactionResult']:
+    """tx_results of token transfers emitting Transfer and Approval event logs
+    """
+    block = Block(1, create_block_hash(b"block"), 1_600_000_000_000_000, create_block_hash(b"prev"), 0)
+    tx_results = []
+
+    for i in range(tx_count):
+        sender = create_address(data=i.to_bytes(4, "big"))
+        receiver = create_address(data=(i + 1).to_bytes(4, "big"))
+        tx = Transaction(create_tx_hash(i.to_bytes(4, "big")), i, sender, SCORE_ADDRESS, 0, 0)
+        event_logs = [
+            EventLog(SCORE_ADDRESS, ["Transfer(Address,Address,int,bytes)", sender, receiver, i], [b"data"]),
+            EventLog(SCORE_ADDRESS, ["Approval(Address,Address,int)", sender, receiver], [i])
+        ]
+        tx_results.append(TransactionResult(tx, block, SCORE_ADDRESS, step_used=100_000, step_price=10 ** 10,
+                                            cumulative_step_used=100_000 * (i + 1), event_logs=event_logs,
+                                            logs_bloom=BloomFilter(), status=TransactionResult.SUCCESS))
+
+    return tx_results
+
+
+def _build_response_with_make_response(tx_results: List['TransactionResult']) -> dict:
+    """INVOKE response built before TransactionResult.to_response_dict()
+    """
+    results = {
+        "txResults": [tx_result.to_dict(to_camel_case) for tx_result in tx_results],
+        "stateRootHash": create_block_hash().hex(),
+        "addedTransactions": {}
+    }
+    response = MakeResponse.make_response(results)
+    json.dumps(response, cls=BytesToHexJSONEncoder)
+    return response
+
+
+def _build_response(tx_results: List['TransactionResult']) -> dict:
+    results = {
+        "stateRootHash": create_block_hash().hex(),
+        "addedTransactions": {}
+    }
+    response = {"txResults": [tx_result.to_response_dict() for tx_result in tx_results],
+                **MakeResponse.make_response(results)}
+    str(JSONLogMessage("INVOKE Response: ", response, INVOKE_LOG_MAX_SIZE))
+    return response
+
+
+def _build_packed_response(tx_results: List['TransactionResult']) -> dict:
+    response = _build_response(tx_results)
+    response["txResults"] = msgpack.packb(response["txResults"], use_bin_type=True)
+    return response
+
+
+@pytest.mark.benchmark(group="invoke_response")
+@pytest.mark.parametrize("build", [_build_response_with_make_response, _build_response, _build_packed_response],
+                         ids=["make_response", "to_response_dict", "msgpack"])
+def test_build_invoke_response(benchmark, request, build):
+    """INVOKE response for a block with TX_COUNT txs emitting 2 event logs each and its log message
+    """
+    tx_count: int = SMALL_TX_COUNT if request.config.option.benchmark_disable else TX_COUNT
+
+    # MakeResponse converts the event logs in tx_results in place, so they are made for every round
+    def _setup():
+        return (_create_tx_results(tx_count),), {}
+
+    response = benchmark.pedantic(build, setup=_setup, rounds=5)
+
+    tx_results = response["txResults"]
+    if isinstance(tx_results, bytes):
+        tx_results = msgpack.unpackb(tx_results, raw=False)
+    assert tx_results == [tx_result.to_response_dict() for tx_result in _create_tx_results(tx_count)]
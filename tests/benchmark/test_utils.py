@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import operator
+
+import pytest
+
+from iconservice.icon_service_engine import IconServiceEngine, _clear_logs_bloom_cache
+from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.utils.bloom import BloomFilter, clear_bloom_bits_cache
+from iconservice.utils.hashing.merkle_tree import MerkleTree
+from tests import create_address, create_tx_hash
+
+COUNT = 100
+TX_COUNT_IN_BLOCK = 1000
+EVENT_LOG_COUNT_IN_TX = 10
+
+
+@pytest.fixture(scope="module")
+def bloom_values() -> list:
+    # Like the event logs of token transfers: a few SCORE addresses and signatures, many accounts
+    values = []
+    for i in range(COUNT):
+        values.append(b"\xff" + create_address(1, data=(i % 3).to_bytes(1, "big")).to_bytes())
+        values.append(b"\x00" + b"Transfer(Address,Address,int,bytes)")
+        values.append(b"\x01" + create_address(data=i.to_bytes(4, "big")).to_bytes())
+    return values
+
+
+@pytest.mark.benchmark(group="bloom")
+def test_bloom_add(benchmark, bloom_values):
+    def _run():
+        # Bit positions are cached during a block
+        clear_bloom_bits_cache()
+        bloom = BloomFilter()
+        for value in bloom_values:
+            bloom.add(value)
+        return bloom
+
+    ret = benchmark(_run)
+    assert all(value in ret for value in bloom_values)
+
+
+@pytest.fixture(scope="module")
+def block_event_logs() -> list:
+    """Event logs of the txs in a block: 10k token transfers among 3 SCOREs and 1000 accounts
+    """
+    scores = [create_address(1, data=i.to_bytes(1, "big")) for i in range(3)]
+    accounts = [create_address(data=i.to_bytes(4, "big")) for i in range(1000)]
+
+    block_event_logs = []
+    for i in range(TX_COUNT_IN_BLOCK):
+        event_logs = []
+        for j in range(EVENT_LOG_COUNT_IN_TX):
+            indexed = ["Transfer(Address,Address,int,bytes)", accounts[i % 1000], accounts[(i + j) % 1000], i * j]
+            event_logs.append(EventLog(scores[j % 3], indexed, [b"data"]))
+        block_event_logs.append(event_logs)
+    return block_event_logs
+
+
+@pytest.mark.benchmark(group="bloom")
+def test_block_logs_bloom(benchmark, block_event_logs):
+    """Logs blooms of the txs in a block, their 256-byte encodings and the block logs bloom
+    """
+    def _run():
+        # Caches are cleared at the beginning of a block
+        _clear_logs_bloom_cache()
+        # The block logs bloom is accumulated as int and converted to BloomFilter once as in invoke()
+        block_logs_bloom_value = 0
+        for event_logs in block_event_logs:
+            logs_bloom = IconServiceEngine._generate_logs_bloom(event_logs)
+            logs_bloom.to_bytes()
+            block_logs_bloom_value |= int(logs_bloom)
+        return BloomFilter(block_logs_bloom_value)
+
+    ret = benchmark(_run)
+    assert ret.value == functools.reduce(
+        operator.or_, (int(IconServiceEngine._generate_logs_bloom(logs)) for logs in block_event_logs))
+
+
+@pytest.mark.benchmark(group="bloom")
+def test_block_logs_bloom_or(benchmark, block_event_logs):
+    """OR-ing the logs blooms of the txs in a block into a BloomFilter one by one, which converts its buffer
+    to int and back for every tx
+    """
+    logs_blooms = [IconServiceEngine._generate_logs_bloom(event_logs) for event_logs in block_event_logs]
+
+    def _run():
+        block_logs_bloom = BloomFilter()
+        for logs_bloom in logs_blooms:
+            block_logs_bloom |= logs_bloom
+        return block_logs_bloom
+
+    benchmark(_run)
+
+
+@pytest.mark.benchmark(group="bloom")
+def test_block_logs_bloom_or_as_int(benchmark, block_event_logs):
+    logs_blooms = [IconServiceEngine._generate_logs_bloom(event_logs) for event_logs in block_event_logs]
+
+    def _run():
+        value = 0
+        for logs_bloom in logs_blooms:
+            value |= int(logs_bloom)
+        return BloomFilter(value)
+
+    benchmark(_run)
+
+
+@pytest.mark.benchmark(group="merkle_tree")
+@pytest.mark.parametrize("leaf_count", [COUNT, 1000])
+def test_merkle_tree_make_tree(benchmark, leaf_count):
+    leaves = [create_tx_hash(i.to_bytes(4, "big")) for i in range(leaf_count)]
+
+    def _run():
+        tree = MerkleTree()
+        tree.add_leaf(leaves)
+        tree.make_tree()
+        return tree.get_merkle_root()
+
+    ret = benchmark(_run)
+    assert len(ret) == 32
@@ -114,3 +114,9 @@ def set_default_context_storage_and_engine():
 
 def pytest_configure(config):
     start_testing()
+
+    # Benchmarks under tests/benchmark are run once without timing in the normal test run.
+    # Use --benchmark-only or --benchmark-enable to measure them
+    option = config.option
+    if hasattr(option, "benchmark_disable") and not (option.benchmark_only or option.benchmark_enable):
+        option.benchmark_disable = True
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from unittest.mock import patch
+
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+
+class TestIissDBFinalizer(TestIISSBase):
+    def setUp(self):
+        super().setUp()
+        self.init_decentralized()
+
+    def test_calculate_before_next_block(self):
+        self.make_blocks_to_end_calculation()
+
+        ipc_messages = []
+        calculate = RewardCalcProxy.calculate
+
+        def _calculate(proxy, path, block_height):
+            # iiss_db takes a while to be finalized in background
+            time.sleep(0.5)
+            ipc_messages.append("calculate")
+            calculate(proxy, path, block_height)
+
+        def _claim_iscore(*_args):
+            ipc_messages.append("claim")
+            return 0, self._block_height
+
+        # The next block is invoked right after the start block of a calc period is committed
+        self._commit = self.icon_service_engine.commit
+
+        with patch.object(RewardCalcProxy, "calculate", _calculate), \
+                patch.object(RewardCalcProxy, "claim_iscore", side_effect=_claim_iscore):
+            self.make_blocks(self._block_height + 1)
+            self.assertTrue(self.icon_service_engine._iiss_db_finalizer.running)
+
+            self.claim_iscore(self._admin)
+
+        self.assertEqual(["calculate", "claim"], ipc_messages)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice.icon_constant import RPCMethod
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.metrics import StartupPhase
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+
+class TestStartup(TestIISSBase):
+    def setUp(self):
+        super().setUp()
+        self.init_decentralized()
+
+    def _restart(self):
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        self._mock_ipc()
+        self.icon_service_engine.open(self._config)
+
+    def test_restart(self):
+        term: dict = self.get_prep_term()
+        main_preps: dict = self.get_main_prep_list()
+        prep_count: int = IconScoreContext.engine.prep.preps.size()
+
+        self._restart()
+
+        # P-Reps loaded in another thread are the same as before
+        self.assertEqual(prep_count, IconScoreContext.engine.prep.preps.size())
+        self.assertEqual(term, self.get_prep_term())
+        self.assertEqual(main_preps, self.get_main_prep_list())
+        self.assertIn(IconScoreContext.engine.prep, IconScoreContext.engine.iiss._listeners)
+
+        startup: dict = self._query({}, RPCMethod.ISE_GET_METRICS)["startup"]
+        for phase in (StartupPhase.OPEN_DB, StartupPhase.RECOVER_DBS, StartupPhase.LOAD_LAST_BLOCK,
+                      StartupPhase.OPEN_STORAGES, StartupPhase.LAUNCH_RC, StartupPhase.OPEN_ENGINES,
+                      StartupPhase.LOAD_PREPS, StartupPhase.LOAD_BUILTIN_SCORES, StartupPhase.LOAD_INV,
+                      StartupPhase.OPEN):
+            self.assertIn(phase, startup)
+        self.assertLessEqual(startup[StartupPhase.LOAD_PREPS], startup[StartupPhase.OPEN])
+        # The reward calculator is mocked and hello() is not called
+        self.assertNotIn(StartupPhase.READY, startup)
+
+        # Blocks are invoked as before
+        self.make_blocks(self._block_height + 1)
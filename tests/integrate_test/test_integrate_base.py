@@ -181,7 +181,7 @@ class TestIntegrateBase(TestCase):
             block,
             [tx]
         )
-        self.icon_service_engine.commit(block.height, block.hash, block.hash)
+        self._commit(block.height, block.hash, block.hash)
         self._block_height += 1
         self._prev_block_hash = block_hash
 
@@ -330,14 +330,19 @@ class TestIntegrateBase(TestCase):
 
         return block, self.get_hash_list_from_tx_list(tx_list)
 
+    def _commit(self, block_height: int, instant_block_hash: bytes, block_hash: bytes):
+        self.icon_service_engine.commit(block_height, instant_block_hash, block_hash)
+        # Mocked reward calculator expects CALCULATE to be done on commit
+        self.icon_service_engine._iiss_db_finalizer.wait()
+
     def _write_precommit_state(self, block: 'Block'):
-        self.icon_service_engine.commit(block.height, block.hash, block.hash)
+        self._commit(block.height, block.hash, block.hash)
         self._block_height += 1
         assert block.height == self._block_height
         self._prev_block_hash = block.hash
 
     def _write_precommit_state_in_leader(self, block_height: int, old_block_hash: bytes, new_block_hash: bytes):
-        self.icon_service_engine.commit(block_height, old_block_hash, new_block_hash)
+        self._commit(block_height, old_block_hash, new_block_hash)
         self._block_height += 1
         assert block_height == self._block_height
         self._prev_block_hash = new_block_hash
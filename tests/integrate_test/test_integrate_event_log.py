@@ -20,6 +20,11 @@
 from typing import TYPE_CHECKING, List
 
 from iconservice.base.address import SYSTEM_SCORE_ADDRESS
+from iconservice.base.exception import InvalidParamsException
+from iconservice.base.type_converter_templates import ConstantKeys
+from iconservice.icon_constant import ConfigKey, RPCMethod
+from iconservice.iconscore.icon_score_event_log import EventLogEmitter
+from iconservice.utils.bloom import BloomFilter
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 if TYPE_CHECKING:
@@ -373,3 +378,80 @@ class TestIntegrateEventLog(TestIntegrateBase):
         event_log = tx_results[0].event_logs
         self.assertEqual(event_log[0].data[0], "A")
         self.assertEqual(event_log[1].data[0], "C")
+
+    def test_block_logs_bloom(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_event_log_scores",
+                                                                  score_name="sample_event_log_score",
+                                                                  from_=self._accounts[0],
+                                                                  to_=SYSTEM_SCORE_ADDRESS)
+        score_address = tx_results[0].score_address
+
+        tx_list = [
+            self.create_score_call_tx(from_=self._accounts[0],
+                                      to_=score_address,
+                                      func_name="call_valid_event_log",
+                                      params={"value1": f"test{i}", "value2": "test2", "value3": "test3"})
+            for i in range(3)
+        ]
+        block, _ = self.make_and_req_block(tx_list)
+        precommit_data = self.icon_service_engine._precommit_data_manager.get(block.hash)
+        self._write_precommit_state(block)
+
+        expected = BloomFilter()
+        for tx_result in precommit_data.block_result:
+            expected |= tx_result.logs_bloom
+
+        self.assertEqual(expected.to_bytes(), precommit_data.logs_bloom.to_bytes())
+
+        for i in range(3):
+            self.assertIn(EventLogEmitter.get_ordered_bytes(1, f"test{i}"), precommit_data.logs_bloom)
+
+
+class TestIntegrateEventLogStore(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.EVENT_LOG_STORE: True}
+
+    def test_ise_get_event_logs(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_event_log_scores",
+                                                                  score_name="sample_event_log_score",
+                                                                  from_=self._accounts[0],
+                                                                  to_=SYSTEM_SCORE_ADDRESS)
+        score_address = tx_results[0].score_address
+        event = "NormalEventLog(str,str,str)"
+
+        tx_results = self.process_confirm_block_tx([
+            self.create_score_call_tx(from_=self._accounts[0],
+                                      to_=score_address,
+                                      func_name="call_valid_event_log",
+                                      params={"value1": f"test{i % 2}", "value2": "test2", "value3": "test3"})
+            for i in range(4)
+        ])
+        block_height: int = self._block_height
+        self.icon_service_engine._event_log_store.wait()
+
+        params = {
+            ConstantKeys.FROM_BLOCK: 0,
+            ConstantKeys.TO_BLOCK: block_height,
+            ConstantKeys.SCORE_ADDRESS: score_address,
+            ConstantKeys.EVENT: event,
+            ConstantKeys.ARG: "test1"
+        }
+        event_logs: List[dict] = self._query(params, RPCMethod.ISE_GET_EVENT_LOGS)
+        self.assertEqual([tx_results[i].tx_hash for i in (1, 3)], [e["txHash"] for e in event_logs])
+        for event_log in event_logs:
+            self.assertEqual(block_height, event_log["blockHeight"])
+            self.assertEqual([event, "test1", "test2"], event_log["indexed"])
+            self.assertEqual(["test3"], event_log["data"])
+
+        # Without SCORE address, blocks are looked up with logs bloom
+        del params[ConstantKeys.SCORE_ADDRESS], params[ConstantKeys.ARG]
+        event_logs = self._query(params, RPCMethod.ISE_GET_EVENT_LOGS)
+        self.assertEqual([tx_result.tx_hash for tx_result in tx_results], [e["txHash"] for e in event_logs])
+
+        status: dict = self._query({"filter": ["eventLogStore"]}, RPCMethod.ISE_GET_STATUS)
+        self.assertEqual(block_height, status["eventLogStore"]["lastBlockHeight"])
+
+    def test_ise_get_event_logs_without_block_range(self):
+        for params in (None, {}, {ConstantKeys.FROM_BLOCK: 0}, {ConstantKeys.TO_BLOCK: 0}):
+            with self.assertRaises(InvalidParamsException):
+                self._query(params, RPCMethod.ISE_GET_EVENT_LOGS)
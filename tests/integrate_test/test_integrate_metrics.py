@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice.base.type_converter_templates import ConstantKeys
+from iconservice.icon_constant import ConfigKey, RPCMethod, ICX_IN_LOOP, Revision
+from iconservice.metrics import Phase, Counter
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateMetrics(TestIntegrateBase):
+    def _get_counts(self) -> dict:
+        metrics: dict = self._query({}, RPCMethod.ISE_GET_METRICS)
+        return {phase: value["count"] for phase, value in metrics["phases"].items()}
+
+    def test_ise_get_metrics(self):
+        # WAL, backup, rc_db and RC IPC are used since IISS
+        self.update_governance()
+        self.set_revision(Revision.IISS.value)
+        prev: dict = self._get_counts()
+
+        tx_list = [
+            self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[i], value=ICX_IN_LOOP)
+            for i in range(3)
+        ]
+        self.process_confirm_block_tx(tx_list)
+        # Insufficient balance
+        self.transfer_icx(from_=self._accounts[10], to_=self._accounts[11], value=ICX_IN_LOOP,
+                          disable_pre_validate=True, expected_status=False)
+
+        counts: dict = self._get_counts()
+        blocks: int = 2
+        for phase in (Phase.INVOKE, Phase.BEFORE_TX, Phase.AFTER_TX, Phase.PRECOMMIT,
+                      Phase.COMMIT, Phase.WAL_WRITE, Phase.BACKUP, Phase.RC_DB_WRITE,
+                      Phase.STATE_DB_WRITE, Phase.RC_IPC):
+            self.assertEqual(prev[phase] + blocks, counts[phase], phase)
+
+        # The write-ahead log is flushed several times in a commit
+        self.assertGreaterEqual(counts[Phase.FSYNC] - prev[Phase.FSYNC], blocks)
+
+        txs: int = 4
+        for phase in (Phase.TX, Phase.TX_BATCH_UPDATE):
+            self.assertEqual(prev[phase] + txs, counts[phase], phase)
+        # The failed transaction does not reach the fee charge and the execution
+        for phase in (Phase.TX_PRE_VALIDATION, Phase.TX_FEE_CHARGE, Phase.TX_EXECUTION):
+            self.assertGreaterEqual(counts[phase] - prev[phase], 3, phase)
+
+        metrics: dict = self._query({}, RPCMethod.ISE_GET_METRICS)
+        self.assertTrue(metrics["enable"])
+        self.assertEqual(1, metrics["counters"][Counter.FAILED_TRANSACTIONS])
+        invoke: dict = metrics["phases"][Phase.INVOKE]
+        self.assertEqual(invoke["count"], invoke["buckets"][-1])
+        self.assertLessEqual(invoke["max"], invoke["sum"])
+
+    def test_ise_get_metrics_with_filter(self):
+        metrics: dict = self._query({ConstantKeys.FILTER: [Phase.INVOKE, Phase.COMMIT]}, RPCMethod.ISE_GET_METRICS)
+        self.assertEqual({Phase.INVOKE, Phase.COMMIT}, set(metrics["phases"]))
+        self.assertEqual(set(Counter.ALL), set(metrics["counters"]))
+
+
+class TestIntegrateMetricsDisabled(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.METRICS: {ConfigKey.ENABLE: False}}
+
+    def test_ise_get_metrics(self):
+        self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+
+        metrics: dict = self._query({}, RPCMethod.ISE_GET_METRICS)
+        self.assertFalse(metrics["enable"])
+        for value in metrics["phases"].values():
+            self.assertEqual(0, value["count"])
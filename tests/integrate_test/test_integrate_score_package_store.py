@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import TYPE_CHECKING, List
+from unittest.mock import patch
+
+from iconservice.base.address import SYSTEM_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.deploy.score_package_store import ScorePackageStore
+from iconservice.icon_constant import IconServiceFlag, Revision
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.score_package_validator import ScorePackageValidator
+from iconservice.iconscore.utils import get_score_deploy_path
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScorePackageStore(TestIntegrateBase):
+    def setUp(self):
+        super().setUp()
+        self.update_governance()
+        self.set_revision(Revision.LATEST.value)
+        self.score_call(from_=self._admin,
+                        to_=GOVERNANCE_SCORE_ADDRESS,
+                        func_name="updateServiceConfig",
+                        params={"serviceFlag": hex(IconServiceFlag.SCORE_PACKAGE_VALIDATOR)})
+
+    def _deploy_token(self, count: int) -> List['TransactionResult']:
+        tx_list: list = [
+            self.create_deploy_score_tx(score_root="sample_deploy_scores",
+                                        score_name="install/sample_token",
+                                        from_=self._accounts[0],
+                                        to_=SYSTEM_SCORE_ADDRESS,
+                                        deploy_params={"init_supply": hex(1000), "decimal": "0x12"})
+            for _ in range(count)
+        ]
+        return self.process_confirm_block_tx(tx_list)
+
+    def _get_deploy_path(self, tx_result: 'TransactionResult') -> str:
+        return get_score_deploy_path(os.path.abspath(self._score_root_path), tx_result.score_address,
+                                     tx_result.tx_hash)
+
+    def _get_balance(self, score_address: 'Address') -> int:
+        return self.query_score(from_=None,
+                                to_=score_address,
+                                func_name="balance_of",
+                                params={"addr_from": str(self._accounts[0].address)})
+
+    def test_deploy_same_package(self):
+        with patch.object(ScorePackageValidator, "execute", wraps=ScorePackageValidator.execute) as execute:
+            tx_results: List['TransactionResult'] = self._deploy_token(count=2)
+
+        # The second one is neither extracted nor validated again
+        execute.assert_called_once()
+        paths: List[str] = [self._get_deploy_path(tx_result) for tx_result in tx_results]
+        for path in paths:
+            self.assertTrue(os.path.islink(path))
+        self.assertEqual(os.path.realpath(paths[0]), os.path.realpath(paths[1]))
+
+        for tx_result in tx_results:
+            self.assertEqual(1000 * 10 ** 18, self._get_balance(tx_result.score_address))
+
+    def test_restart(self):
+        tx_results: List['TransactionResult'] = self._deploy_token(count=1)
+
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        self._mock_ipc()
+        self.icon_service_engine.open(self._config)
+
+        self.assertEqual(1000 * 10 ** 18, self._get_balance(tx_results[0].score_address))
+
+        # The verdict is kept in the store
+        with patch.object(ScorePackageValidator, "execute", wraps=ScorePackageValidator.execute) as execute:
+            tx_results: List['TransactionResult'] = self._deploy_token(count=1)
+        execute.assert_not_called()
+        self.assertEqual(1000 * 10 ** 18, self._get_balance(tx_results[0].score_address))
+
+    def test_import_white_list_changed(self):
+        tx1: dict = self.create_deploy_score_tx(score_root="sample_scores",
+                                                score_name="sample_score_using_import_os",
+                                                from_=self._accounts[0],
+                                                to_=SYSTEM_SCORE_ADDRESS)
+        tx2: dict = self.create_score_call_tx(from_=self._admin,
+                                              to_=GOVERNANCE_SCORE_ADDRESS,
+                                              func_name="addImportWhiteList",
+                                              params={"importStmt": "{'os': []}"})
+        tx3: dict = self.create_deploy_score_tx(score_root="sample_scores",
+                                                score_name="sample_score_using_import_os",
+                                                from_=self._accounts[0],
+                                                to_=SYSTEM_SCORE_ADDRESS)
+        tx4: dict = self.create_score_call_tx(from_=self._admin,
+                                              to_=GOVERNANCE_SCORE_ADDRESS,
+                                              func_name="removeImportWhiteList",
+                                              params={"importStmt": "{'os': []}"})
+        tx5: dict = self.create_deploy_score_tx(score_root="sample_scores",
+                                                score_name="sample_score_using_import_os",
+                                                from_=self._accounts[0],
+                                                to_=SYSTEM_SCORE_ADDRESS)
+
+        prev_block, hash_list = self.make_and_req_block([tx1, tx2, tx3, tx4, tx5])
+        self._write_precommit_state(prev_block)
+        tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
+
+        # A failed validation is not kept and the verdict depends on the import white list
+        self.assertEqual([int(False), int(True), int(True), int(True), int(False)],
+                         [tx_result.status for tx_result in tx_results])
+
+        # All of them share one package in the store
+        store_path: str = os.path.join(os.path.abspath(self._score_root_path), ScorePackageStore.DIR_NAME)
+        packages: List[str] = [name for name in os.listdir(store_path) if name != ScorePackageStore.VERDICTS_FILE]
+        self.assertEqual(1, len(packages))
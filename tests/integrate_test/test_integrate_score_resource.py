@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from typing import TYPE_CHECKING, List
+
+from iconservice.base.address import SYSTEM_SCORE_ADDRESS
+from iconservice.base.exception import InvalidRequestException, InvalidParamsException
+from iconservice.base.type_converter_templates import ConstantKeys
+from iconservice.icon_constant import ConfigKey, RPCMethod, ICX_IN_LOOP
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScoreResource(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {
+            ConfigKey.SCORE_RESOURCE: {
+                ConfigKey.ENABLE: True,
+                ConfigKey.SCORE_RESOURCE_RECENT_BLOCKS: 2,
+                ConfigKey.SCORE_RESOURCE_DUMP_PATH: self._get_dump_path()
+            }
+        }
+
+    def _get_dump_path(self) -> str:
+        return os.path.join(self._state_db_root_path, "score_resource.jsonl")
+
+    def _deploy_scores(self) -> ('Address', 'Address'):
+        tx1: dict = self.create_deploy_score_tx(score_root="sample_internal_call_scores",
+                                                score_name="sample_score",
+                                                from_=self._accounts[0],
+                                                to_=SYSTEM_SCORE_ADDRESS,
+                                                deploy_params={'value': hex(ICX_IN_LOOP)})
+        tx2: dict = self.create_deploy_score_tx(score_root="sample_internal_call_scores",
+                                                score_name="sample_link_score",
+                                                from_=self._accounts[0],
+                                                to_=SYSTEM_SCORE_ADDRESS)
+        tx_results: List['TransactionResult'] = self.process_confirm_block_tx([tx1, tx2])
+        score_address: 'Address' = tx_results[0].score_address
+        link_score_address: 'Address' = tx_results[1].score_address
+
+        self.score_call(from_=self._accounts[0],
+                        to_=link_score_address,
+                        func_name="add_score_func",
+                        params={"score_addr": str(score_address)})
+
+        return score_address, link_score_address
+
+    def _get_usage(self, usages: dict, score_address: 'Address', method: str) -> dict:
+        for usage in usages["scores"]:
+            if usage["scoreAddress"] == score_address and usage["method"] == method:
+                return usage
+        self.fail(f"Usage not found: {score_address} {method}")
+
+    def test_debug_get_score_resources(self):
+        score_address, link_score_address = self._deploy_scores()
+
+        self.score_call(from_=self._accounts[0],
+                        to_=link_score_address,
+                        func_name="set_value",
+                        params={"value": hex(2 * ICX_IN_LOOP)})
+        block_height: int = self._block_height
+
+        usages: dict = self._query({ConstantKeys.BLOCK_HEIGHT: block_height}, RPCMethod.DEBUG_GET_SCORE_RESOURCES)
+        self.assertEqual(block_height, usages["blockHeight"])
+        self.assertEqual(2, len(usages["scores"]))
+
+        # set_value of link_score calls set_value of sample_score
+        outer: dict = self._get_usage(usages, link_score_address, "set_value")
+        inner: dict = self._get_usage(usages, score_address, "set_value")
+        for usage in (outer, inner):
+            self.assertEqual(1, usage["calls"])
+            self.assertEqual(1, usage["eventLogs"])
+            self.assertLessEqual(usage["exclusiveTime"], usage["inclusiveTime"])
+            self.assertLessEqual(usage["exclusiveSteps"], usage["inclusiveSteps"])
+        self.assertGreaterEqual(outer["inclusiveTime"], inner["inclusiveTime"])
+        self.assertEqual(outer["exclusiveSteps"] + inner["inclusiveSteps"], outer["inclusiveSteps"])
+        self.assertEqual(inner["exclusiveSteps"], inner["inclusiveSteps"])
+
+        # link_score reads the address of sample_score and sample_score writes the value
+        self.assertEqual((1, 0), (outer["dbGets"], outer["dbPuts"]))
+        self.assertEqual(1, inner["dbPuts"])
+        self.assertGreater(inner["dbPutBytes"], 0)
+
+        # The sum of committed blocks filtered by a SCORE
+        usages = self._query({ConstantKeys.SCORE_ADDRESS: score_address}, RPCMethod.DEBUG_GET_SCORE_RESOURCES)
+        self.assertEqual(self._block_height + 1, usages["blocks"])
+        self.assertEqual({"on_install", "set_value"}, {usage["method"] for usage in usages["scores"]})
+
+        # Only recent blocks are kept
+        with self.assertRaises(InvalidParamsException):
+            self._query({ConstantKeys.BLOCK_HEIGHT: block_height - 2}, RPCMethod.DEBUG_GET_SCORE_RESOURCES)
+
+        with open(self._get_dump_path()) as f:
+            lines: List[dict] = [json.loads(line) for line in f]
+        self.assertEqual(list(range(self._block_height + 1)), [line["blockHeight"] for line in lines])
+        self.assertEqual(2, len(lines[-1]["scores"]))
+
+
+class TestIntegrateScoreResourceDisabled(TestIntegrateBase):
+    def test_debug_get_score_resources(self):
+        with self.assertRaises(InvalidRequestException):
+            self._query({}, RPCMethod.DEBUG_GET_SCORE_RESOURCES)
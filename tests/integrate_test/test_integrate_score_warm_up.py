@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import TYPE_CHECKING, List
+
+from iconservice.base.address import SYSTEM_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey, RPCMethod, Revision
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.metrics import Counter, Phase
+from iconservice.score_loader.icon_score_warm_up import IconScoreWarmUp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScoreWarmUp(TestIntegrateBase):
+    MAX_SCORES = 0
+
+    def _make_init_config(self) -> dict:
+        return {
+            ConfigKey.SCORE_WARM_UP: {
+                ConfigKey.ENABLE: True,
+                ConfigKey.SCORE_WARM_UP_MAX_SCORES: self.MAX_SCORES,
+                ConfigKey.SCORE_WARM_UP_WORKERS: 2
+            }
+        }
+
+    def setUp(self):
+        super().setUp()
+        self.update_governance()
+        self.set_revision(Revision.LATEST.value)
+
+        tx_list: list = [
+            self.create_deploy_score_tx(score_root="sample_deploy_scores",
+                                        score_name=score_name,
+                                        from_=self._accounts[0],
+                                        to_=SYSTEM_SCORE_ADDRESS,
+                                        deploy_params=params)
+            for score_name, params in (
+                ("install/sample_token", {"init_supply": hex(1000), "decimal": "0x12"}),
+                ("install/sample_score", {"value": hex(100)}),
+                ("install/sample_token", {"init_supply": hex(2000), "decimal": "0x12"}),
+            )
+        ]
+        tx_results: List['TransactionResult'] = self.process_confirm_block_tx(tx_list)
+        self.scores: List['Address'] = [tx_result.score_address for tx_result in tx_results]
+
+    def _restart(self):
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        self._mock_ipc()
+        self.icon_service_engine.open(self._config)
+
+    def _get_warmed_up_scores(self) -> int:
+        metrics: dict = self._query({}, RPCMethod.ISE_GET_METRICS)
+        self.assertEqual(1, metrics["phases"][Phase.SCORE_WARM_UP]["count"])
+        return metrics["counters"][Counter.WARMED_UP_SCORES]
+
+    def test_warm_up(self):
+        self._restart()
+
+        self.assertEqual(3, self._get_warmed_up_scores())
+        for address in self.scores:
+            self.assertIn(address, IconScoreContext.icon_score_mapper)
+
+        self.assertEqual(100, self.query_score(from_=None, to_=self.scores[1], func_name="get_value"))
+        self.assertEqual(2000 * 10 ** 18, self.query_score(from_=None,
+                                                           to_=self.scores[2],
+                                                           func_name="balance_of",
+                                                           params={"addr_from": str(self._accounts[0].address)}))
+
+
+class TestIntegrateScoreWarmUpMaxScores(TestIntegrateScoreWarmUp):
+    MAX_SCORES = 2
+
+    def test_warm_up(self):
+        # The most recently used SCOREs are loaded
+        self.query_score(from_=None, to_=self.scores[2], func_name="total_supply")
+        self.query_score(from_=None, to_=self.scores[1], func_name="get_value")
+        self._restart()
+
+        self.assertTrue(os.path.isfile(os.path.join(self._state_db_root_path, IconScoreWarmUp.FILE_NAME)))
+        self.assertEqual(2, self._get_warmed_up_scores())
+        self.assertNotIn(self.scores[0], IconScoreContext.icon_score_mapper)
+        self.assertIn(self.scores[1], IconScoreContext.icon_score_mapper)
+        self.assertIn(self.scores[2], IconScoreContext.icon_score_mapper)
+
+        # The SCOREs which have not been loaded are loaded on the first call
+        self.assertEqual(1000 * 10 ** 18, self.query_score(from_=None, to_=self.scores[0], func_name="total_supply"))
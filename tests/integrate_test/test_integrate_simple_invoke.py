@@ -17,9 +17,12 @@
 """IconScoreEngine testcase
 """
 
+import functools
+
 from iconservice.base.address import MalformedAddress
 from iconservice.base.exception import ExceptionCode, InvalidParamsException
 from iconservice.icon_constant import ICX_IN_LOOP
+from iconservice.icon_service_engine import IconServiceEngine
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 
@@ -75,6 +78,19 @@ class TestIntegrateSimpleInvoke(TestIntegrateBase):
         self.assertEqual(value1 - value2, self.get_balance(self._accounts[0]))
         self.assertEqual(value2, self.get_balance(self._accounts[1]))
 
+    def test_invoke_with_on_tx_result(self):
+        tx_list = [
+            self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[i], value=ICX_IN_LOOP)
+            for i in range(3)
+        ]
+
+        streamed_tx_results = []
+        self.icon_service_engine.invoke = functools.partial(
+            IconServiceEngine.invoke, self.icon_service_engine, on_tx_result=streamed_tx_results.append)
+
+        tx_results = self.process_confirm_block_tx(tx_list)
+        self.assertEqual(tx_results, streamed_tx_results)
+
     def test_make_invalid_block_height(self):
         value1 = 1 * ICX_IN_LOOP
 
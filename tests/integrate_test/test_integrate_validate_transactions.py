@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine.validate_transactions testcase
+"""
+
+from typing import List, Optional
+
+from iconservice.base.address import Address
+from iconservice.base.exception import IconServiceBaseException, OutOfBalanceException, InvalidRequestException
+from iconservice.icon_constant import ICX_IN_LOOP
+from tests import create_address
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateValidateTransactions(TestIntegrateBase):
+
+    def _make_origin_request(self, tx: dict) -> dict:
+        return {'params': self.make_origin_params(tx['params'])}
+
+    def _validate_one_by_one(self, txs: List[dict]) -> List[Optional[BaseException]]:
+        errors = []
+        for tx in txs:
+            try:
+                self.icon_service_engine.validate_transaction(tx, self._make_origin_request(tx))
+                errors.append(None)
+            except (IconServiceBaseException, Exception) as e:
+                errors.append(e)
+
+        return errors
+
+    def test_validate_transactions(self):
+        self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+
+        inactive_score: 'Address' = create_address(1)
+        txs: List[dict] = []
+        for _ in range(3):
+            txs.append(self.create_transfer_icx_tx(self._admin, self._accounts[1], ICX_IN_LOOP,
+                                                   disable_pre_validate=True))
+            txs.append(self.create_transfer_icx_tx(self._accounts[0], self._accounts[1], ICX_IN_LOOP * 2,
+                                                   disable_pre_validate=True))
+            txs.append(self.create_transfer_icx_tx(self._accounts[2], self._accounts[1], 1,
+                                                   disable_pre_validate=True))
+            txs.append(self.create_transfer_icx_tx(self._admin, inactive_score, 1,
+                                                   disable_pre_validate=True))
+
+        origin_requests: List[dict] = [self._make_origin_request(tx) for tx in txs]
+        errors: List[Optional[BaseException]] = self.icon_service_engine.validate_transactions(txs, origin_requests)
+        expected_errors: List[Optional[BaseException]] = self._validate_one_by_one(txs)
+
+        self.assertEqual(len(txs), len(errors))
+        for error, expected_error in zip(errors, expected_errors):
+            self.assertEqual(type(expected_error), type(error))
+            self.assertEqual(str(expected_error), str(error))
+
+        for i in range(0, len(txs), 4):
+            self.assertIsNone(errors[i])
+            self.assertIsInstance(errors[i + 1], OutOfBalanceException)
+            self.assertIsInstance(errors[i + 2], OutOfBalanceException)
+            self.assertIsInstance(errors[i + 3], InvalidRequestException)
+
+    def test_validate_transactions_with_new_block(self):
+        tx: dict = self.create_transfer_icx_tx(self._accounts[0], self._accounts[1], 1,
+                                               disable_pre_validate=True)
+        origin_request: dict = self._make_origin_request(tx)
+
+        errors = self.icon_service_engine.validate_transactions([tx], [origin_request])
+        self.assertIsInstance(errors[0], OutOfBalanceException)
+
+        # The balances cached in the previous batch are not used
+        self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+        errors = self.icon_service_engine.validate_transactions([tx], [origin_request])
+        self.assertEqual([None], errors)
@@ -20,9 +20,9 @@ import unittest
 import pytest
 
 from iconservice.base.block import Block
-from iconservice.base.exception import IllegalFormatException
+from iconservice.base.exception import IllegalFormatException, InvalidParamsException
 from iconservice.database.wal import (
-    _MAGIC_KEY, _FILE_VERSION, _OFFSET_VERSION, _HEADER_SIZE,
+    _MAGIC_KEY, _FILE_VERSION, _FILE_VERSION_ZLIB, _OFFSET_VERSION, _HEADER_SIZE,
     WriteAheadLogReader, WriteAheadLogWriter, WALogable, WALState
 )
 from iconservice.icon_constant import Revision
@@ -92,27 +92,112 @@ class TestWriteAheadLog(unittest.TestCase):
         writer.write_state(state, add=False)
         writer.close()
 
+        for use_mmap in (False, True):
+            reader = WriteAheadLogReader()
+            reader.open(self.path, use_mmap)
+            assert reader.magic_key == _MAGIC_KEY
+            assert reader.version == _FILE_VERSION
+            assert reader.revision == revision
+            assert reader.state == state
+            assert reader.log_count == log_count
+            assert reader.block == self.block
+            assert reader.instant_block_hash == instant_block_hash
+
+            for i in range(len(self.log_data)):
+                data = {}
+
+                for key, value in reader.get_iterator(i):
+                    data[key] = value
+
+                assert data == self.log_data[i]
+                assert id(data) != id(self.log_data[i])
+
+            reader.close()
+
+    def test_read_large_log_with_mmap(self):
+        log_data = {os.urandom(32): os.urandom(100) for _ in range(1000)}
+
+        writer = WriteAheadLogWriter(Revision.IISS.value, 1, self.block, create_block_hash())
+        writer.open(self.path)
+        writer.write_walogable(WALogableData(log_data))
+        writer.close()
+
+        for use_mmap in (False, True):
+            reader = WriteAheadLogReader()
+            reader.open(self.path, use_mmap)
+            assert dict(reader.get_iterator(0)) == log_data
+            reader.close()
+
+        # Truncate the log
+        with open(self.path, "rb+") as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+
         reader = WriteAheadLogReader()
-        reader.open(self.path)
-        assert reader.magic_key == _MAGIC_KEY
-        assert reader.version == _FILE_VERSION
-        assert reader.revision == revision
-        assert reader.state == state
-        assert reader.log_count == log_count
-        assert reader.block == self.block
-        assert reader.instant_block_hash == instant_block_hash
+        reader.open(self.path, use_mmap=True)
+        with pytest.raises(IllegalFormatException):
+            reader.get_iterator(0)
+        reader.close()
 
-        for i in range(len(self.log_data)):
-            data = {}
+    def test_compressed_log(self):
+        log_data = {os.urandom(32): os.urandom(16) * 8 for _ in range(1000)}
+        log_data[b"deleted"] = None
 
-            for key, value in reader.get_iterator(i):
-                data[key] = value
+        writer = WriteAheadLogWriter(Revision.IISS.value, 1, self.block, create_block_hash())
+        writer.open(self.path)
+        writer.write_walogable(WALogableData(log_data))
+        writer.close()
+        size: int = os.path.getsize(self.path)
 
-            assert data == self.log_data[i]
-            assert id(data) != id(self.log_data[i])
+        writer = WriteAheadLogWriter(Revision.IISS.value, 1, self.block, create_block_hash(), compression="zlib")
+        writer.open(self.path)
+        writer.write_walogable(WALogableData(log_data))
+        writer.close()
+        assert os.path.getsize(self.path) < size
+
+        for use_mmap in (False, True):
+            reader = WriteAheadLogReader()
+            reader.open(self.path, use_mmap)
+            assert reader.version == _FILE_VERSION_ZLIB
+            assert reader.block == self.block
+            assert dict(reader.get_iterator(0)) == log_data
+            reader.close()
+
+        with open(self.path, "rb") as f:
+            reader = WriteAheadLogReader()
+            reader.open_bytes(f.read())
+            assert dict(reader.get_iterator(0)) == log_data
+            reader.close()
+
+        # Corrupt the compressed log
+        with open(self.path, "rb+") as f:
+            f.seek(-16, os.SEEK_END)
+            f.write(b"\x00" * 16)
+
+        for use_mmap in (False, True):
+            reader = WriteAheadLogReader()
+            reader.open(self.path, use_mmap)
+            with pytest.raises(IllegalFormatException):
+                dict(reader.get_iterator(0))
+            reader.close()
+
+    def test_in_memory_log(self):
+        writer = WriteAheadLogWriter(Revision.IISS.value, 2, self.block, create_block_hash(), compression="zlib")
+        writer.open_memory()
+        for log_data in self.log_data:
+            writer.write_walogable(WALogableData(log_data))
+        data: bytes = writer.getvalue()
+        writer.close()
 
+        reader = WriteAheadLogReader()
+        reader.open_bytes(data)
+        for i, log_data in enumerate(self.log_data):
+            assert dict(reader.get_iterator(i)) == log_data
         reader.close()
 
+    def test_invalid_compression(self):
+        with pytest.raises(InvalidParamsException):
+            WriteAheadLogWriter(Revision.IISS.value, 1, self.block, create_block_hash(), compression="zstd")
+
     def test_invalid_magic_key(self):
         revision = Revision.IISS.value
         log_count = 2
@@ -22,6 +22,8 @@ from hypothesis import (
 
 from iconservice.utils.bloom import (
     BloomFilter,
+    clear_bloom_bits_cache,
+    get_bloom_bits,
 )
 
 
@@ -231,4 +233,33 @@ def test_icon_bloom():
 
     # check bloom filter has key value
     item = keys[0] + str(0)
-    assert item.encode() in b2
\ No newline at end of file
+    assert item.encode() in b2
+
+
+@given(log_entries)
+@settings(max_examples=500)
+def test_bloom_filter_is_the_same_as_big_int_bloom(log_entries):
+    expected = 0
+    bloom = BloomFilter()
+
+    for address, topics in log_entries:
+        for value in itertools.chain([address], topics):
+            for bloom_bits in get_bloom_bits(value):
+                expected |= bloom_bits
+            bloom.add(value)
+
+    assert int(bloom) == expected
+    assert bloom.to_bytes() == expected.to_bytes(256, "big")
+    assert BloomFilter(expected).to_bytes() == bloom.to_bytes()
+
+
+def test_combining_filters_as_block_bloom():
+    tx_blooms = [BloomFilter.from_iterable([b'score', i.to_bytes(1, "big")]) for i in range(10)]
+
+    clear_bloom_bits_cache()
+    block_bloom = BloomFilter()
+    for tx_bloom in tx_blooms:
+        block_bloom |= tx_bloom
+
+    assert block_bloom.to_bytes() == BloomFilter.from_iterable(
+        [b'score'] + [i.to_bytes(1, "big") for i in range(10)]).to_bytes()
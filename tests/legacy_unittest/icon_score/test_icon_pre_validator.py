@@ -667,3 +667,26 @@ class TestTransactionValidator(unittest.TestCase):
         self.validator._is_score_active = Mock(return_value=False)
         self.assertTrue(self.validator._is_inactive_score(self.context, address))
         self.validator._is_score_active.assert_called_once_with(self.context, address)
+
+    def test_batch(self):
+        balance = 100
+        IconScoreContext.engine.icx.get_balance = Mock(return_value=balance)
+        self.validator._is_score_active = Mock(return_value=False)
+        _from = create_address()
+        score_address = create_address(1)
+
+        with self.validator.batch():
+            for _ in range(3):
+                self.validator._check_balance(self.context, _from, 50, 10)
+                with self.assertRaises(OutOfBalanceException):
+                    self.validator._check_balance(self.context, _from, 100, 10)
+                self.assertTrue(self.validator._is_inactive_score(self.context, score_address))
+
+        IconScoreContext.engine.icx.get_balance.assert_called_once_with(self.context, _from)
+        self.validator._is_score_active.assert_called_once_with(self.context, score_address)
+
+        # The cache is not used out of the batch
+        self.validator._check_balance(self.context, _from, 50, 10)
+        self.validator._is_inactive_score(self.context, score_address)
+        self.assertEqual(2, IconScoreContext.engine.icx.get_balance.call_count)
+        self.assertEqual(2, self.validator._is_score_active.call_count)
@@ -284,3 +284,42 @@ def test_replace(create_prep_container):
 
     old_prep = preps.replace(new_prep)
     assert old_prep is None
+
+
+def test_replace_all(create_prep_container):
+    size: int = 20
+    preps: 'PRepContainer' = create_prep_container(size)
+    expected_preps: 'PRepContainer' = preps.copy(mutable=True)
+    preps = preps.copy(mutable=True)
+
+    new_preps = []
+    for index in (3, 10, 11, 15):
+        new_prep: 'PRep' = preps.get_by_index(index).copy()
+        new_prep.delegated = random.randint(0, 1000)
+        new_preps.append(new_prep)
+
+    new_prep: 'PRep' = preps.get_by_index(0).copy()
+    new_prep.status = PRepStatus.UNREGISTERED
+    new_preps.append(new_prep)
+
+    # The same P-Rep which is already contained
+    new_preps.append(preps.get_by_index(5))
+
+    for new_prep in new_preps:
+        expected_preps.replace(new_prep)
+
+    preps.replace_all(new_preps)
+    assert preps.is_dirty()
+    assert preps.total_delegated == expected_preps.total_delegated
+    assert preps.size(active_prep_only=True) == expected_preps.size(active_prep_only=True) == size - 1
+    assert preps.size(active_prep_only=False) == expected_preps.size(active_prep_only=False) == size
+
+    for i in range(size - 1):
+        assert id(preps.get_by_index(i)) == id(expected_preps.get_by_index(i))
+
+    for new_prep in new_preps:
+        assert id(preps.get_by_address(new_prep.address)) == id(new_prep)
+
+    preps.freeze()
+    with pytest.raises(AccessDeniedException):
+        preps.replace_all(new_preps)
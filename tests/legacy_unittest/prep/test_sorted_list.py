@@ -233,4 +233,23 @@ def test_append(create_sorted_list):
     with pytest.raises(ValueError):
         last_item: SortedItem = items[len(items) - 1]
         item = SortedItem(value=last_item.value - 1)
-        items.append(item)
\ No newline at end of file
+        items.append(item)
+
+def test_merge(create_sorted_list):
+    for size in (0, 1, 99, 100):
+        items = create_sorted_list(size)
+        expected_items = SortedList(items)
+
+        new_items = [SortedItem(random.randint(-100, 100)) for _ in range(size // 2 + 1)]
+        # Items which have the same orders as existing ones
+        new_items.extend(copy.copy(item) for item in items[:3])
+
+        for item in new_items:
+            expected_items.add(item)
+
+        items.merge(new_items)
+        assert len(items) == len(expected_items)
+        check_sorted_list(items)
+
+        for item, expected_item in zip(items, expected_items):
+            assert id(item) == id(expected_item)
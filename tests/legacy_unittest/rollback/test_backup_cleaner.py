@@ -17,6 +17,7 @@ import os
 import random
 import shutil
 import unittest
+import unittest.mock
 
 from iconservice.icon_constant import BACKUP_FILES
 from iconservice.rollback import get_backup_filename
@@ -254,3 +255,77 @@ class TestBackupCleaner(unittest.TestCase):
         for filename in filenames:
             path = os.path.join(backup_root_path, filename)
             assert os.path.isfile(path)
+
+    def test_run_on_commit_with_index(self):
+        backup_root_path: str = self.backup_root_path
+        backup_cleaner = BackupCleaner(backup_root_path, backup_files=10, batch_size=1)
+
+        _create_dummy_backup_files(backup_root_path, 81, 100)
+        ret = backup_cleaner.run_on_init(current_block_height=101)
+        assert ret == 10
+        assert backup_cleaner.get_status()["indexed"] == 10
+
+        # put_on_commit() is not called for block 102 ~ 104 as if their jobs were dropped from the queue
+        _create_dummy_backup_files(backup_root_path, 101, 104)
+        backup_cleaner.put_on_commit(current_block_height=105)
+
+        # The dropped blocks are indexed and all stale backup files are removed at once
+        _check_if_backup_files_exists(backup_root_path, 81, 94, expected=False)
+        _check_if_backup_files_exists(backup_root_path, 95, 104, expected=True)
+        assert backup_cleaner.get_status()["indexed"] == 10
+
+        # Removed backup files are dropped from the index
+        ret = backup_cleaner.run(start_block_height=103, end_block_height=104)
+        assert ret == 2
+        assert backup_cleaner.get_status()["indexed"] == 8
+
+    def test_run_in_background(self):
+        backup_root_path: str = self.backup_root_path
+        backup_cleaner = BackupCleaner(backup_root_path, backup_files=10, batch_size=3)
+        _create_dummy_backup_files(backup_root_path, 81, 100)
+
+        backup_cleaner.start()
+        backup_cleaner.put_on_init(current_block_height=101)
+        for block_height in range(101, 106):
+            _create_dummy_backup_files(backup_root_path, block_height, block_height)
+            backup_cleaner.put_on_commit(current_block_height=block_height + 1)
+        backup_cleaner.close()
+
+        # Block 91 ~ 93 are removed in a batch and block 94 ~ 95 wait for the next batch
+        _check_if_backup_files_exists(backup_root_path, 81, 93, expected=False)
+        _check_if_backup_files_exists(backup_root_path, 94, 105, expected=True)
+
+        status: dict = backup_cleaner.get_status()
+        assert status["running"] is False
+        assert status["queued"] == 0
+        assert status["removed"] == 13
+        assert status["dropped"] == 0
+
+    def test_run_on_init_with_saved_index(self):
+        backup_root_path: str = self.backup_root_path
+        backup_cleaner = BackupCleaner(backup_root_path, backup_files=10)
+
+        _create_dummy_backup_files(backup_root_path, 81, 100)
+        backup_cleaner.run_on_init(current_block_height=101)
+        _create_dummy_backup_files(backup_root_path, 101, 101)
+        backup_cleaner.run_on_commit(current_block_height=102)
+        backup_cleaner.close()
+        index_path: str = os.path.join(backup_root_path, BackupCleaner.INDEX_FILENAME)
+        assert os.path.isfile(index_path)
+
+        # Backups written after close() are found by the index without scanning the backup directory
+        _create_dummy_backup_files(backup_root_path, 102, 104)
+        backup_cleaner = BackupCleaner(backup_root_path, backup_files=10)
+        with unittest.mock.patch("os.scandir", side_effect=AssertionError("scandir")):
+            ret = backup_cleaner.run_on_init(current_block_height=105)
+        assert ret == 3
+
+        _check_if_backup_files_exists(backup_root_path, 81, 94, expected=False)
+        _check_if_backup_files_exists(backup_root_path, 95, 104, expected=True)
+        assert backup_cleaner.get_status()["indexed"] == 10
+
+        # The index is removed on loading, so the directory is scanned if iconservice is not closed normally
+        assert not os.path.exists(index_path)
+        _create_dummy_backup_files(backup_root_path, 81, 84)
+        ret = BackupCleaner(backup_root_path, backup_files=10).run_on_init(current_block_height=105)
+        assert ret == 4
@@ -147,6 +147,62 @@ class TestBackupManager(unittest.TestCase):
         self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
         self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
 
+    def test_run_with_multiple_blocks(self):
+        self._run_with_multiple_blocks(self.backup_manager)
+
+    def test_run_with_compressed_segments(self):
+        backup_manager = BackupManager(
+            backup_root_path=self.backup_root_path,
+            rc_data_path=self.rc_data_path,
+            compression="zlib",
+            segment_size=2
+        )
+        self._run_with_multiple_blocks(backup_manager)
+
+        # Blocks 100 and 101 are in a segment and block 102 is in the next one
+        assert sorted(os.listdir(self.backup_root_path)) == ["0000000100.seg", "0000000102.seg"]
+
+    def _run_with_multiple_blocks(self, backup_manager: 'BackupManager'):
+        instant_block_hash: bytes = hashlib.sha3_256(b"instant_block_hash").digest()
+        revision = Revision.DECENTRALIZATION.value
+        rollback_block_height = 100
+        block_batches = [
+            OrderedDict([(b"key0", b"new value0"), (b"key3", b"value3")]),
+            OrderedDict([(b"key0", None), (b"key1", b"new value1"), (b"key4", b"value4")]),
+            OrderedDict([(b"key0", b"value0"), (b"key3", None), (b"key2", None)]),
+        ]
+
+        for i, block_batch in enumerate(block_batches):
+            block_height: int = rollback_block_height + i
+            prev_block = Block(
+                block_height=block_height,
+                block_hash=hashlib.sha3_256(block_height.to_bytes(8, "big")).digest(),
+                timestamp=0,
+                prev_hash=hashlib.sha3_256(b"prev_hash").digest(),
+                cumulative_fee=0
+            )
+            backup_manager.run(icx_db=self.state_db,
+                               rc_db=self.rc_db,
+                               revision=revision,
+                               prev_block=prev_block,
+                               block_batch=block_batch,
+                               iiss_wal=OrderedDict().items(),
+                               is_calc_period_start_block=False,
+                               instant_block_hash=instant_block_hash)
+            assert backup_manager.last_backup_size > 0
+            self.state_db.write_batch(block_batch.items())
+
+        self.rc_db.close()
+        self.rc_db = None
+
+        self.rollback_manager.run(
+            last_block_height=rollback_block_height + len(block_batches),
+            rollback_block_height=rollback_block_height,
+            term_start_block_height=rollback_block_height - 1)
+
+        self.rc_db = _create_rc_db(self.rc_data_path)
+        self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
+
     @staticmethod
     def _commit_state_db(db: 'KeyValueDatabase', block_batch: OrderedDict):
         db.write_batch(block_batch.items())
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import unittest
+
+from iconservice.rollback import check_backup_exists
+from iconservice.rollback.backup_cleaner import BackupCleaner
+from iconservice.rollback.segment import (
+    BackupSegment, BackupSegments, get_segment_filename, get_segment_start_block_height, is_segment_filename
+)
+
+
+def _create_segment(backup_root_path: str, start_block_height: int, end_block_height: int) -> 'BackupSegment':
+    path: str = os.path.join(backup_root_path, get_segment_filename(start_block_height))
+    segment = BackupSegment(path)
+
+    for block_height in range(start_block_height, end_block_height + 1):
+        segment.append(block_height, _get_dummy_backup(block_height))
+
+    return segment
+
+
+def _get_dummy_backup(block_height: int) -> bytes:
+    return f"backup-{block_height}".encode() * (block_height % 3 + 1)
+
+
+class TestBackupSegment(unittest.TestCase):
+    def setUp(self) -> None:
+        backup_root_path = os.path.join(os.path.dirname(__file__), "segment")
+
+        shutil.rmtree(backup_root_path, ignore_errors=True)
+        os.mkdir(backup_root_path)
+
+        self.backup_root_path = backup_root_path
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.backup_root_path, ignore_errors=True)
+
+    def test_functions(self):
+        assert get_segment_filename(100) == "0000000100.seg"
+        assert is_segment_filename("0000000100.seg")
+        assert not is_segment_filename("0000000100.bak")
+        assert not is_segment_filename("100.seg")
+
+        assert get_segment_start_block_height(0, 10) == 0
+        assert get_segment_start_block_height(109, 10) == 100
+        assert get_segment_start_block_height(110, 10) == 110
+
+    def test_append_and_read(self):
+        segment = _create_segment(self.backup_root_path, 100, 109)
+
+        index, end = segment.read_index()
+        assert sorted(index) == list(range(100, 110))
+        assert end == os.path.getsize(segment.path)
+
+        for block_height in range(100, 110):
+            assert segment.read(block_height) == _get_dummy_backup(block_height)
+            assert segment.read(block_height, index) == _get_dummy_backup(block_height)
+        assert segment.read(110) is None
+
+        # The last record wins
+        segment.append(105, b"new backup")
+        assert segment.read(105) == b"new backup"
+
+    def test_append_after_incomplete_record(self):
+        segment = _create_segment(self.backup_root_path, 100, 102)
+        size: int = os.path.getsize(segment.path)
+
+        # A crash leaves an incomplete record
+        with open(segment.path, "r+b") as f:
+            f.truncate(size - 1)
+
+        index, end = segment.read_index()
+        assert sorted(index) == [100, 101]
+
+        ret: int = segment.append(102, _get_dummy_backup(102))
+        assert end + ret == size
+        assert segment.read(102) == _get_dummy_backup(102)
+
+    def test_remove(self):
+        segment = _create_segment(self.backup_root_path, 100, 109)
+
+        assert segment.remove(200, 300) == 0
+        assert segment.remove(95, 102) == 3
+        assert segment.remove(108, 120) == 2
+
+        index, _ = segment.read_index()
+        assert sorted(index) == list(range(103, 108))
+        for block_height in range(103, 108):
+            assert segment.read(block_height) == _get_dummy_backup(block_height)
+
+        # The segment file is removed with its last backup
+        assert segment.remove(0, 200) == 5
+        assert not os.path.exists(segment.path)
+
+    def test_segments(self):
+        _create_segment(self.backup_root_path, 90, 99)
+        _create_segment(self.backup_root_path, 100, 104)
+
+        segments = BackupSegments(self.backup_root_path)
+        for block_height in range(90, 105):
+            assert segments.contains(block_height)
+            assert segments.read(block_height) == _get_dummy_backup(block_height)
+
+        for block_height in (89, 105):
+            assert not segments.contains(block_height)
+            assert segments.read(block_height) is None
+
+        assert check_backup_exists(self.backup_root_path, current_block_height=105, rollback_block_height=90)
+        assert not check_backup_exists(self.backup_root_path, current_block_height=106, rollback_block_height=90)
+        assert not check_backup_exists(self.backup_root_path, current_block_height=105, rollback_block_height=89)
+
+    def test_backup_cleaner(self):
+        backup_cleaner = BackupCleaner(self.backup_root_path, backup_files=10, segment_size=10)
+        for start_block_height in range(0, 50, 10):
+            _create_segment(self.backup_root_path, start_block_height, start_block_height + 9)
+
+        # Remove the backups older than 35 and the ones from 45 which are not committed
+        ret = backup_cleaner.run_on_init(current_block_height=45)
+        assert ret == 35 + 5
+        assert sorted(os.listdir(self.backup_root_path)) == ["0000000030.seg", "0000000040.seg"]
+
+        segments = BackupSegments(self.backup_root_path)
+        for block_height in range(35, 45):
+            assert segments.contains(block_height)
+
+        # A segment file is removed when all of its backups become stale
+        segment = BackupSegment(os.path.join(self.backup_root_path, get_segment_filename(40)))
+        for block_height in range(45, 49):
+            segment.append(block_height, _get_dummy_backup(block_height))
+            backup_cleaner.run_on_commit(current_block_height=block_height + 1)
+            assert os.path.exists(os.path.join(self.backup_root_path, get_segment_filename(30)))
+
+        # Block 39, the last one in the segment file 30, is out of the latest 10 blocks
+        segment.append(49, _get_dummy_backup(49))
+        backup_cleaner.run_on_commit(current_block_height=50)
+        assert sorted(os.listdir(self.backup_root_path)) == ["0000000040.seg"]
+
+        # Remove the backups in a given range
+        ret = backup_cleaner.run(start_block_height=40, end_block_height=44)
+        assert ret == 5
+        segments = BackupSegments(self.backup_root_path)
+        assert not segments.contains(44)
+        assert segments.contains(45)
@@ -27,6 +27,7 @@ from iconservice.database.db import ContextDatabase
 from iconservice.deploy import DeployStorage
 from iconservice.deploy.storage import IconScoreDeployInfo
 from iconservice.fee import FeeEngine, FeeStorage
+from iconservice.fee.deposit_index import DepositIndexContainer
 from iconservice.fee.engine import VirtualStepCalculator, FIXED_TERM
 from iconservice.icon_constant import IconScoreContextType, DeployState
 from iconservice.iconscore.icon_score_context import IconScoreContext
@@ -1160,3 +1161,42 @@ class TestFeeEngine(unittest.TestCase):
 
             self._engine.add_deposit(
                 context, tx_hash, self._sender, self._score_address, amount, block_height, term)
+
+
+class TestFeeEngineWithDepositIndex(TestFeeEngine):
+    """Runs the same tests with the deposit index which is used on invoke"""
+
+    def setUp(self):
+        super().setUp()
+        self._deposit_indices = DepositIndexContainer()
+
+    def get_context(self):
+        context = super().get_context()
+        context.deposit_indices = self._deposit_indices
+        return context
+
+    def test_deposit_index_is_maintained(self):
+        context = self.get_context()
+        block_height = 1000
+        deposits = [
+            (os.urandom(32), 100, 150, 10000, 100),
+            (os.urandom(32), 120, 260, 10000, 100),
+            (os.urandom(32), 140, 200, 10000, 100),
+            (os.urandom(32), 160, 300, 10000, 100),
+        ]
+        self._set_up_deposits(context, deposits)
+
+        def assert_index():
+            deposit_meta = self.fee_storage.get_deposit_meta(context, self._score_address)
+            index = self._deposit_indices.get(self._score_address)
+            expected = [(d.id, d.expires) for d in self._engine._deposit_generator(context, deposit_meta.head_id)]
+            self.assertEqual([deposit_id for deposit_id, _ in expected], list(index))
+            for i, (deposit_id, _) in enumerate(expected):
+                self.assertEqual(max(expires for _, expires in expected[i:]), index.get_max_expires(deposit_id))
+
+        assert_index()
+        self._engine._charge_fee_from_score(context, self._score_address, 1, 250, 180)
+        assert_index()
+        for deposit_id in (deposits[2][0], deposits[0][0], deposits[3][0]):
+            self._engine.withdraw_deposit(context, self._sender, deposit_id, block_height)
+            assert_index()
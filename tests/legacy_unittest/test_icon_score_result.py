@@ -35,6 +35,7 @@ from iconservice.iconscore.icon_score_base import IconScoreBase, eventlog, \
     external
 from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType
 from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_result import TransactionResult
 from iconservice.utils import to_camel_case
 from iconservice.utils.bloom import BloomFilter
 from tests import create_tx_hash, create_address, \
@@ -278,3 +279,34 @@ class SampleScore(IconScoreBase):
     @external
     def empty(self):
         pass
+
+    def test_to_response_dict(self):
+        block = Block(123, hashlib.sha3_256(b'block').digest(), 1, None, 0)
+        from_ = Address.from_data(AddressPrefix.EOA, b'from')
+        score_address = Address.from_data(AddressPrefix.CONTRACT, b'to')
+        tx = Transaction(os.urandom(32), 3, from_, score_address, 0)
+
+        for status in (TransactionResult.SUCCESS, TransactionResult.FAILURE):
+            tx_result = TransactionResult(tx, block, score_address, step_used=100, step_price=10,
+                                          cumulative_step_used=1000, status=status)
+            tx_result.event_logs = [
+                EventLog(score_address,
+                         ['Event(bytes,Address)', b'indexed', from_],
+                         [True, 1234, 'str', None, b'test'])
+            ]
+            tx_result.logs_bloom = BloomFilter()
+            tx_result.logs_bloom.add(b'1')
+            tx_result.step_used_details = {from_: 60, score_address: 40}
+            tx_result.failure = TransactionResult.Failure(32000, 'error')
+            tx_result.traces = []
+
+            response: dict = tx_result.to_response_dict()
+
+            # Event logs are not modified
+            self.assertEqual(b'indexed', tx_result.event_logs[0].indexed[1])
+            self.assertEqual(1234, tx_result.event_logs[0].data[1])
+
+            expected: dict = TypeConverter.convert_type_reverse(tx_result.to_dict(to_camel_case))
+            self.assertEqual(expected, response)
+            self.assertEqual(list(expected), list(response))
+            self.assertEqual(status == TransactionResult.FAILURE, 'failure' in response)
@@ -27,6 +27,7 @@ from iconservice.base.transaction import Transaction
 from iconservice.base.type_converter import TypeConverter
 from iconservice.deploy import engine as isde
 from iconservice.deploy.icon_score_deployer import IconScoreDeployer
+from iconservice.deploy.score_package_store import ScorePackageStore
 from iconservice.deploy.storage import IconScoreDeployTXParams, IconScoreDeployInfo, Storage
 from iconservice.icon_constant import DeployType, IconScoreContextType, Revision
 from iconservice.icon_constant import IconServiceFlag
@@ -368,6 +369,7 @@ class TestWriteScoreToScoreDeployPath:
         mocker.patch("iconservice.deploy.engine.get_score_deploy_path", return_value=score_deploy_path)
         mocker.patch.object(os.path, "join", return_value=score_path)
         mocker.patch.object(IconScoreContext, "revision", PropertyMock(return_value=revision))
+        mocker.patch.object(IconScoreContext, "score_package_store", None)
 
     @pytest.mark.parametrize('revision', [revision.value for revision in Revision if revision.value >= 3])
     def test_write_score_to_score_deploy_path_revision_ge3(self, mock_engine, context, mocker, revision):
@@ -383,6 +385,19 @@ class TestWriteScoreToScoreDeployPath:
         IconScoreDeployer.deploy.assert_called_with(self.score_deploy_path, None, revision)
         mocker.stopall()
 
+    @pytest.mark.parametrize('revision', [revision.value for revision in Revision if revision.value >= 3])
+    def test_write_score_to_score_deploy_path_with_store(self, mock_engine, context, mocker, revision):
+        self.set_test(mocker, self.score_path, self.score_deploy_path, revision)
+        store = Mock(spec=ScorePackageStore)
+        mocker.patch.object(IconScoreContext, "score_package_store", store)
+
+        mock_engine._write_score_to_score_deploy_path(context, GOVERNANCE_SCORE_ADDRESS, context.tx.hash, b"content")
+
+        isde.remove_path.assert_called_with(self.score_path)
+        store.link.assert_called_with(self.score_deploy_path, b"content", revision)
+        IconScoreDeployer.deploy.assert_not_called()
+        mocker.stopall()
+
     def test_write_score_to_score_deploy_path_revision_2(self, mock_engine, context, mocker):
         self.set_test(mocker, self.score_path, self.score_deploy_path, 2)
 
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from iconservice.base.exception import InvalidPackageException
+from iconservice.deploy.icon_score_deployer import IconScoreDeployer
+from iconservice.deploy.score_package_store import ScorePackageStore
+from iconservice.deploy.utils import remove_path
+from iconservice.icon_constant import Revision
+from iconservice.utils import sha3_256
+
+REVISION = Revision.LATEST.value
+WHITELIST = {"iconservice": ["*"], "os": ["path"]}
+
+
+def _make_package(value: int) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("token/package.json", json.dumps({"version": "0.0.1", "main_module": "token",
+                                                      "main_score": "Token"}))
+        zf.writestr("token/token.py", f"VALUE = {value}\n")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScorePackageStore(str(tmp_path))
+    store.open()
+    yield store
+    store.close()
+
+
+def _deploy_path(tmp_path, name: str) -> str:
+    return os.path.join(str(tmp_path), "score", f"0x{name}")
+
+
+def test_link(store, tmp_path, mocker):
+    content: bytes = _make_package(1)
+    deploy = mocker.spy(IconScoreDeployer, "deploy")
+
+    path1: str = _deploy_path(tmp_path, "01")
+    path2: str = _deploy_path(tmp_path, "02")
+    content_hash: str = store.link(path1, content, REVISION)
+    assert store.link(path2, content, REVISION) == content_hash
+    assert content_hash == sha3_256(content).hex()
+
+    # Extracted only once
+    assert deploy.call_count == 1
+    for path in (path1, path2):
+        assert os.path.islink(path)
+        assert not os.path.isabs(os.readlink(path))
+        assert store.get_content_hash(path) == content_hash
+        with open(os.path.join(path, "token.py")) as f:
+            assert f.read() == "VALUE = 1\n"
+
+    # Linking again replaces the link
+    content_hash2: str = store.link(path1, _make_package(2), REVISION)
+    assert content_hash2 != content_hash
+    assert store.get_content_hash(path1) == content_hash2
+    assert store.get_content_hash(path2) == content_hash
+
+    # Only the link is removed
+    remove_path(path1)
+    assert not os.path.lexists(path1)
+    assert os.path.isdir(os.path.join(store.path, content_hash2))
+
+
+def test_get_content_hash_not_in_store(store, tmp_path):
+    path: str = _deploy_path(tmp_path, "01")
+    IconScoreDeployer.deploy(path, _make_package(1), REVISION)
+    assert store.get_content_hash(path) is None
+
+    other: str = _deploy_path(tmp_path, "02")
+    os.symlink(path, other, target_is_directory=True)
+    assert store.get_content_hash(other) is None
+
+    assert store.get_content_hash(_deploy_path(tmp_path, "03")) is None
+
+
+def test_link_invalid_package(store, tmp_path):
+    path: str = _deploy_path(tmp_path, "01")
+    with pytest.raises(InvalidPackageException):
+        store.link(path, b"invalid", REVISION)
+
+    # Nothing is left in the store
+    assert os.listdir(store.path) == []
+    assert not os.path.lexists(path)
+
+
+def test_verdicts(store, tmp_path):
+    content_hash: str = store.link(_deploy_path(tmp_path, "01"), _make_package(1), REVISION)
+    assert not store.is_validated(content_hash, WHITELIST)
+
+    store.set_validated(content_hash, WHITELIST)
+    assert store.is_validated(content_hash, WHITELIST)
+    # The order of whitelist items does not matter
+    assert store.is_validated(content_hash, {"os": ["path"], "iconservice": ["*"]})
+    assert not store.is_validated(content_hash, {"iconservice": ["*"]})
+    assert not store.is_validated(content_hash, {"iconservice": ["*"], "os": ["path", "sep"]})
+
+    # Verdicts are kept after reopen
+    store.close()
+    store.open()
+    assert store.is_validated(content_hash, WHITELIST)
+
+
+def test_verdicts_of_another_version(store, tmp_path):
+    content_hash: str = sha3_256(_make_package(1)).hex()
+    store.set_validated(content_hash, WHITELIST)
+
+    other = ScorePackageStore(str(tmp_path))
+    other._validator_version = "0.0.0-py3.0"
+    other.open()
+    assert not other.is_validated(content_hash, WHITELIST)
+
+
+def test_open_removes_incomplete_packages(tmp_path):
+    store = ScorePackageStore(str(tmp_path))
+    tmp_package_path: str = os.path.join(store.path, f"{ScorePackageStore._TMP_PREFIX}abcd")
+    os.makedirs(os.path.join(tmp_package_path, "sub"))
+
+    store.open()
+    assert not os.path.exists(tmp_package_path)
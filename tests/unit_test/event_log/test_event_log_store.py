@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import shutil
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.block import Block
+from iconservice.base.exception import InvalidParamsException, InvalidRequestException
+from iconservice.event_log import EventLogStore
+from iconservice.iconscore.icon_score_event_log import EventLog, EventLogEmitter
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.utils.bloom import BloomFilter
+
+TRANSFER = "Transfer(Address,Address,int)"
+APPROVAL = "Approval(Address,Address,int)"
+
+SCORES = [Address.from_data(AddressPrefix.CONTRACT, f"score{i}".encode()) for i in range(2)]
+USERS = [Address.from_data(AddressPrefix.EOA, f"user{i}".encode()) for i in range(3)]
+
+BLOCKS = 10
+
+
+def _create_block(height: int) -> 'Block':
+    block_hash: bytes = hashlib.sha3_256(height.to_bytes(8, "big")).digest()
+    return Block(height, block_hash, height * 1_000_000, None, 0)
+
+
+def _create_tx_results(block: 'Block') -> List['TransactionResult']:
+    """Every block has a base tx without event logs and two txs emitting Transfer and Approval
+    """
+    tx_results = []
+
+    for tx_index in range(3):
+        tx = Mock(hash=hashlib.sha3_256(block.hash + tx_index.to_bytes(4, "big")).digest(), index=tx_index)
+        tx_result = TransactionResult(tx, block)
+
+        if tx_index > 0:
+            score_address = SCORES[tx_index % 2]
+            sender = USERS[block.height % len(USERS)]
+            event_logs = [
+                EventLog(score_address, [TRANSFER, sender, USERS[0], block.height], []),
+                EventLog(score_address, [APPROVAL, sender, USERS[1]], [block.height])
+            ]
+            tx_result.event_logs = event_logs
+            tx_result.logs_bloom = _make_bloom(event_logs)
+        else:
+            tx_result.event_logs = []
+
+        tx_results.append(tx_result)
+
+    return tx_results
+
+
+def _make_bloom(event_logs: List['EventLog']) -> 'BloomFilter':
+    bloom = BloomFilter()
+    for event_log in event_logs:
+        bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+        for i, indexed_item in enumerate(event_log.indexed):
+            bloom.add(EventLogEmitter.get_ordered_bytes(i, indexed_item))
+    return bloom
+
+
+def _put_blocks(store: 'EventLogStore', start: int, end: int):
+    for height in range(start, end):
+        block = _create_block(height)
+        tx_results = _create_tx_results(block)
+
+        logs_bloom = BloomFilter()
+        for tx_result in tx_results:
+            if tx_result.logs_bloom is not None:
+                logs_bloom |= tx_result.logs_bloom
+
+        store.put(block, tx_results, logs_bloom)
+
+    store.wait()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return os.path.join(str(tmp_path), EventLogStore.DIR_NAME)
+
+
+@pytest.fixture
+def store(path):
+    store = EventLogStore(path, segment_size=1024)
+    store.open(-1)
+    _put_blocks(store, 0, BLOCKS)
+    yield store
+    store.close()
+
+
+def _positions(event_logs: List[dict]) -> list:
+    return [(e["blockHeight"], e["txIndex"], e["logIndex"]) for e in event_logs]
+
+
+def test_put(store, path):
+    assert store.last_block_height == BLOCKS - 1
+
+    status: dict = store.get_status()
+    assert status["lastBlockHeight"] == BLOCKS - 1
+    assert status["segments"] > 1
+    assert not status["pending"]
+
+    event_logs: List[dict] = store.get_event_logs(0, BLOCKS - 1)
+    assert len(event_logs) == BLOCKS * 4
+
+    event_log: dict = event_logs[0]
+    block = _create_block(0)
+    tx_result = _create_tx_results(block)[1]
+    assert event_log == {
+        "blockHeight": 0,
+        "blockHash": block.hash,
+        "txIndex": 1,
+        "txHash": tx_result.tx_hash,
+        "logIndex": 0,
+        "scoreAddress": SCORES[1],
+        "indexed": [TRANSFER, USERS[0], USERS[0], 0],
+        "data": []
+    }
+
+
+def test_put_same_block_twice(store):
+    _put_blocks(store, BLOCKS - 1, BLOCKS)
+    assert len(store.get_event_logs(BLOCKS - 1, BLOCKS - 1)) == 4
+
+
+@pytest.mark.parametrize("score_address,event,arg,expected", [
+    (SCORES[0], None, None, [(h, 2, i) for h in range(2, 6) for i in range(2)]),
+    (SCORES[0], TRANSFER, None, [(h, 2, 0) for h in range(2, 6)]),
+    (SCORES[1], APPROVAL, str(USERS[1]), [(h, 1, 1) for h in (4,)]),
+    (None, APPROVAL, None, [(h, t, 1) for h in range(2, 6) for t in (1, 2)]),
+    (None, None, None, [(h, t, i) for h in range(2, 6) for t in (1, 2) for i in range(2)]),
+])
+def test_get_event_logs(store, score_address, event, arg, expected):
+    event_logs = store.get_event_logs(2, 5, score_address=score_address, event=event, arg=arg)
+    assert _positions(event_logs) == expected
+
+
+@pytest.mark.parametrize("event,arg,pruned", [
+    (TRANSFER, None, False),
+    (APPROVAL, str(USERS[1]), True),
+    (APPROVAL, str(USERS[2]), True),
+    # arg which does not fit the type in the event signature is not looked up in logs bloom
+    (TRANSFER, "0x1", False),
+])
+def test_get_event_logs_with_bloom(store, mocker, event, arg, pruned):
+    # Both paths return the same event logs for the same filter
+    expected = []
+    for score_address in SCORES:
+        expected.extend(store.get_event_logs(0, BLOCKS - 1, score_address=score_address, event=event, arg=arg))
+    expected.sort(key=lambda e: (e["blockHeight"], e["txIndex"], e["logIndex"]))
+
+    read_record = mocker.spy(store, "_read_record")
+    event_logs = store.get_event_logs(0, BLOCKS - 1, event=event, arg=arg)
+    assert event_logs == expected
+
+    # Blocks are skipped with logs bloom including arg
+    read_blocks: int = len({e["blockHeight"] for e in expected}) if pruned else BLOCKS
+    assert read_record.call_count == read_blocks
+
+
+def test_get_event_logs_after_last_block(store):
+    with pytest.raises(InvalidRequestException):
+        store.get_event_logs(0, BLOCKS)
+
+
+def test_get_event_logs_with_limit(store):
+    event_logs = store.get_event_logs(0, BLOCKS - 1, score_address=SCORES[1], limit=3)
+    assert _positions(event_logs) == [(0, 1, 0), (0, 1, 1), (1, 1, 0)]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"from_block": -1, "to_block": 1},
+    {"from_block": 2, "to_block": 1},
+    {"from_block": 0, "to_block": 1, "limit": 0},
+    {"from_block": 0, "to_block": 1, "arg": str(USERS[0])},
+])
+def test_get_event_logs_with_invalid_params(store, kwargs):
+    with pytest.raises(InvalidParamsException):
+        store.get_event_logs(**kwargs)
+
+
+def test_rollback(store):
+    store.rollback(4)
+    assert store.last_block_height == 4
+    assert _positions(store.get_event_logs(0, 4, score_address=SCORES[0], event=TRANSFER)) == \
+        [(h, 2, 0) for h in range(5)]
+    with pytest.raises(InvalidRequestException):
+        store.get_event_logs(0, BLOCKS - 1)
+
+    # Blocks after rollback are written again
+    _put_blocks(store, 5, BLOCKS)
+    assert len(store.get_event_logs(0, BLOCKS - 1)) == BLOCKS * 4
+
+
+def test_open_with_uncommitted_blocks(store, path):
+    store.close()
+
+    store = EventLogStore(path, segment_size=1024)
+    store.open(6)
+    assert store.last_block_height == 6
+    assert len(store.get_event_logs(0, 6)) == 7 * 4
+    store.close()
+
+
+def test_rebuild_index(store, path):
+    expected: List[dict] = store.get_event_logs(0, BLOCKS - 1)
+    store.close()
+
+    # Append an incomplete record
+    segment_path: str = sorted(p for p in os.listdir(path) if p.endswith(".seg"))[-1]
+    with open(os.path.join(path, segment_path), "ab") as f:
+        f.write(b"\x00\x00\x01\x00garbage")
+
+    # Index db is rebuilt from segment files
+    shutil.rmtree(os.path.join(path, EventLogStore.INDEX_DB_NAME))
+
+    store = EventLogStore(path, segment_size=1024)
+    store.open(BLOCKS - 1)
+    assert store.last_block_height == BLOCKS - 1
+    assert store.get_event_logs(0, BLOCKS - 1) == expected
+    assert store.get_event_logs(0, BLOCKS - 1, score_address=SCORES[1], event=APPROVAL) == \
+        [e for e in expected if e["scoreAddress"] == SCORES[1] and e["indexed"][0] == APPROVAL]
+
+    _put_blocks(store, BLOCKS, BLOCKS + 1)
+    assert store.last_block_height == BLOCKS
+    store.close()
+
+
+def test_put_tx_results_without_logs_bloom(path):
+    """The logs bloom of a base tx is None before Revision.ADD_LOGS_BLOOM_ON_BASE_TX
+    """
+    store = EventLogStore(path)
+    store.open(-1)
+
+    block = _create_block(0)
+    tx_results = _create_tx_results(block)
+    for tx_result in tx_results:
+        tx_result.logs_bloom = None
+
+    store.put(block, tx_results, BloomFilter())
+    store.wait()
+
+    assert len(store.get_event_logs(0, 0, event=APPROVAL)) == 2
+    store.close()
+
+
+def test_missing_blocks(store, path):
+    _put_blocks(store, BLOCKS + 2, BLOCKS + 3)
+    assert store.last_block_height == BLOCKS + 2
+    assert store.get_status()["gaps"] == [[BLOCKS, BLOCKS + 1]]
+
+    # Queries over the missing blocks are rejected instead of returning incomplete results
+    with pytest.raises(InvalidRequestException):
+        store.get_event_logs(0, BLOCKS + 2)
+    assert len(store.get_event_logs(BLOCKS + 2, BLOCKS + 2)) == 4
+
+    # Gaps are kept after reopening the store
+    store.close()
+    store = EventLogStore(path, segment_size=1024)
+    store.open(BLOCKS + 2)
+    assert store.get_status()["gaps"] == [[BLOCKS, BLOCKS + 1]]
+
+    # and removed by rollback
+    store.rollback(BLOCKS)
+    assert store.get_status()["gaps"] == [[BLOCKS, BLOCKS]]
+    store.rollback(BLOCKS - 1)
+    assert store.get_status()["gaps"] == []
+    assert len(store.get_event_logs(0, BLOCKS - 1)) == BLOCKS * 4
+    store.close()
+
+
+def _fail(write_index, count: int):
+    """Makes _write_index fail count times and then succeed
+    """
+    def side_effect(*args):
+        nonlocal count
+        if count > 0:
+            count -= 1
+            raise IOError("disk full")
+        return write_index(*args)
+
+    return side_effect
+
+
+def test_failed_write(store, mocker):
+    write_index = store._write_index
+    mocker.patch.object(store, "_write_index", side_effect=IOError("disk full"))
+    _put_blocks(store, BLOCKS, BLOCKS + 1)
+    assert store.last_block_height == BLOCKS - 1
+
+    # The failed block is written again before the next block
+    mocker.patch.object(store, "_write_index", side_effect=write_index)
+    _put_blocks(store, BLOCKS + 1, BLOCKS + 2)
+    assert store.last_block_height == BLOCKS + 1
+    assert store.get_status()["gaps"] == []
+    assert _positions(store.get_event_logs(BLOCKS, BLOCKS + 1, score_address=SCORES[0], event=TRANSFER)) == \
+        [(BLOCKS, 2, 0), (BLOCKS + 1, 2, 0)]
+
+    store.rebuild_index()
+    assert len(store.get_event_logs(0, BLOCKS + 1)) == (BLOCKS + 2) * 4
+
+
+def test_failed_write_twice(store, mocker):
+    write_index = store._write_index
+    mocker.patch.object(store, "_write_index", side_effect=_fail(write_index, 2))
+    _put_blocks(store, BLOCKS, BLOCKS + 2)
+
+    # The record of the block failed twice is dropped and the next blocks are written
+    assert store.last_block_height == BLOCKS + 1
+    assert store.get_status()["gaps"] == [[BLOCKS, BLOCKS]]
+
+    with pytest.raises(InvalidRequestException):
+        store.get_event_logs(BLOCKS - 1, BLOCKS + 1)
+    assert _positions(store.get_event_logs(BLOCKS + 1, BLOCKS + 1, score_address=SCORES[0], event=TRANSFER)) == \
+        [(BLOCKS + 1, 2, 0)]
+
+    # Segment files have no record of the failed block
+    mocker.patch.object(store, "_write_index", side_effect=write_index)
+    store.rebuild_index()
+    assert len(store.get_event_logs(0, BLOCKS - 1)) == BLOCKS * 4
+    assert len(store.get_event_logs(BLOCKS + 1, BLOCKS + 1)) == 4
+    assert store.get_status()["gaps"] == [[BLOCKS, BLOCKS]]
+
+
+def test_failed_write_on_close(store, path, mocker):
+    write_index = store._write_index
+    mocker.patch.object(store, "_write_index", side_effect=_fail(write_index, 1))
+    _put_blocks(store, BLOCKS, BLOCKS + 1)
+
+    # The failed block is written again on close
+    store.close()
+    store = EventLogStore(path, segment_size=1024)
+    store.open(BLOCKS)
+    assert store.last_block_height == BLOCKS
+    assert len(store.get_event_logs(0, BLOCKS)) == (BLOCKS + 1) * 4
+    store.close()
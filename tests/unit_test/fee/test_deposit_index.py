@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+from iconservice.base.address import AddressPrefix
+from iconservice.fee.deposit_index import DepositIndex, DepositIndexContainer
+from tests import create_address, create_tx_hash
+
+
+def _assert_index(index: 'DepositIndex', deposits: list):
+    """Compares the index with the linear search over (deposit_id, expires) list"""
+    assert list(index) == [deposit_id for deposit_id, _ in deposits]
+    assert len(index) == len(deposits)
+
+    for i, (deposit_id, _) in enumerate(deposits):
+        assert index.get_max_expires(deposit_id) == max(expires for _, expires in deposits[i:])
+
+        for block_height in (0, 50, 100, 150, 200):
+            expected = next((d for d, expires in deposits[i:] if block_height < expires), None)
+            assert index.get_next_unexpired(deposit_id, block_height) == expected
+
+    assert index.get_max_expires(None) == -1
+    assert index.get_next_unexpired(None, 0) is None
+
+
+def test_from_deposits():
+    deposits = [(create_tx_hash(), expires) for expires in (100, 180, 150, 250, 200)]
+    _assert_index(DepositIndex.from_deposits(deposits), deposits)
+    _assert_index(DepositIndex.from_deposits([]), [])
+
+
+def test_append_and_remove():
+    rand = random.Random(0)
+    index = DepositIndex()
+    deposits = []
+
+    for _ in range(300):
+        if len(deposits) > 0 and rand.random() < 0.4:
+            deposit_id, _ = deposits.pop(rand.randrange(len(deposits)))
+            index.remove(deposit_id)
+            assert deposit_id not in index
+        else:
+            deposit = (create_tx_hash(), rand.randint(1, 250))
+            deposits.append(deposit)
+            index.append(*deposit)
+            assert deposit[0] in index
+
+        if rand.random() < 0.2:
+            _assert_index(index, deposits)
+
+    _assert_index(index, deposits)
+
+
+def test_copy():
+    deposits = [(create_tx_hash(), expires) for expires in (100, 200, 150)]
+    index = DepositIndex.from_deposits(deposits)
+
+    copied = index.copy()
+    copied.remove(deposits[1][0])
+    copied.append(create_tx_hash(), 120)
+
+    _assert_index(index, deposits)
+    assert copied.get_max_expires(deposits[0][0]) == 150
+
+
+def test_container():
+    score_address = create_address(AddressPrefix.CONTRACT)
+    deposit_id = create_tx_hash()
+
+    container = DepositIndexContainer()
+    container.put(score_address, DepositIndex.from_deposits([(deposit_id, 100)]))
+    container.update_batch()
+    committed = container.get(score_address)
+
+    # Changes in a transaction are discarded on failure
+    container.get_mutable(score_address).append(create_tx_hash(), 200)
+    assert container.get(score_address).get_max_expires(deposit_id) == 200
+    container.clear_batch()
+    assert container.get(score_address) is committed
+    assert committed.get_max_expires(deposit_id) == 100
+
+    # A container for the next block shares the indices without modifying them
+    next_container = container.copy()
+    next_container.get_mutable(score_address).remove(deposit_id)
+    next_container.update_batch()
+    assert len(next_container.get(score_address)) == 0
+    assert container.get(score_address) is committed
+    assert len(committed) == 1
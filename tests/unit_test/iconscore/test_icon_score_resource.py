@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+
+import pytest
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.block import Block
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iconscore.icon_score_resource import (
+    ScoreResourceTracker, ScoreResourceAccountant, track_score_call
+)
+from tests import create_block_hash
+
+SCORE1 = Address.from_data(AddressPrefix.CONTRACT, b"score1")
+SCORE2 = Address.from_data(AddressPrefix.CONTRACT, b"score2")
+
+
+class _StepCounter(object):
+    def __init__(self):
+        self.step_used = 0
+
+
+def _get_usage(tracker: 'ScoreResourceTracker', address: 'Address', method: str) -> dict:
+    return tracker.usages[(address, method)].to_dict()
+
+
+class TestScoreResourceTracker:
+    def test_nested_calls(self):
+        tracker = ScoreResourceTracker()
+        step_counter = _StepCounter()
+
+        with tracker.call(SCORE1, "outer", step_counter):
+            step_counter.step_used += 100
+            tracker.on_db_get(b"12345")
+            tracker.on_db_get(None)
+
+            with tracker.call(SCORE2, "inner", step_counter):
+                time.sleep(0.01)
+                step_counter.step_used += 50
+                tracker.on_db_put(b"123")
+                tracker.on_db_delete()
+                tracker.on_event_log()
+
+            tracker.on_event_log()
+
+        outer: dict = _get_usage(tracker, SCORE1, "outer")
+        inner: dict = _get_usage(tracker, SCORE2, "inner")
+
+        assert outer["calls"] == inner["calls"] == 1
+        assert inner["inclusiveTime"] >= 10_000
+        assert inner["exclusiveTime"] == inner["inclusiveTime"]
+        assert outer["inclusiveTime"] >= inner["inclusiveTime"]
+        assert outer["exclusiveTime"] < inner["inclusiveTime"]
+        assert (outer["inclusiveSteps"], outer["exclusiveSteps"]) == (150, 100)
+        assert (inner["inclusiveSteps"], inner["exclusiveSteps"]) == (50, 50)
+
+        assert (outer["dbGets"], outer["dbGetBytes"], outer["dbPuts"], outer["eventLogs"]) == (2, 5, 0, 1)
+        assert (inner["dbGets"], inner["dbPuts"], inner["dbPutBytes"], inner["dbDeletes"]) == (0, 1, 3, 1)
+        assert inner["eventLogs"] == 1
+
+    def test_exception(self):
+        tracker = ScoreResourceTracker()
+
+        with pytest.raises(ValueError):
+            with tracker.call(SCORE1, "outer"):
+                with tracker.call(SCORE1, "outer"):
+                    raise ValueError()
+
+        assert _get_usage(tracker, SCORE1, "outer")["calls"] == 2
+        # No frame remains
+        tracker.on_event_log()
+        assert _get_usage(tracker, SCORE1, "outer")["eventLogs"] == 0
+
+    def test_merge_and_to_list(self):
+        tracker1 = ScoreResourceTracker()
+        with tracker1.call(SCORE1, "a"):
+            tracker1.on_event_log()
+
+        tracker2 = ScoreResourceTracker()
+        with tracker2.call(SCORE1, "a"):
+            tracker2.on_event_log()
+        with tracker2.call(SCORE2, "b"):
+            time.sleep(0.01)
+
+        tracker1.merge(tracker2)
+        usages = tracker1.to_list()
+        assert [(SCORE2, "b"), (SCORE1, "a")] == [(usage["scoreAddress"], usage["method"]) for usage in usages]
+        assert (usages[1]["calls"], usages[1]["eventLogs"]) == (2, 2)
+
+        assert [SCORE1] == [usage["scoreAddress"] for usage in tracker1.to_list(SCORE1)]
+
+
+def test_track_score_call():
+    context = IconScoreContext()
+    with track_score_call(context, SCORE1, "a"):
+        pass
+
+    context.resource_tracker = ScoreResourceTracker()
+    context.step_counter = _StepCounter()
+    with track_score_call(context, SCORE1, "a"):
+        context.step_counter.step_used += 10
+    assert _get_usage(context.resource_tracker, SCORE1, "a")["inclusiveSteps"] == 10
+
+
+class TestScoreResourceAccountant:
+    @staticmethod
+    def _make_block(height: int) -> 'Block':
+        return Block(height, create_block_hash(), 0, create_block_hash(), 0)
+
+    @staticmethod
+    def _make_tracker(method: str) -> 'ScoreResourceTracker':
+        tracker = ScoreResourceTracker()
+        with tracker.call(SCORE1, method):
+            tracker.on_db_put(b"1")
+        return tracker
+
+    def test_commit(self, tmp_path):
+        dump_path = str(tmp_path / "dump" / "score_resource.jsonl")
+        accountant = ScoreResourceAccountant(recent_blocks=2, dump_path=dump_path)
+        blocks = [self._make_block(i) for i in range(3)]
+        for block in blocks:
+            accountant.commit(block, self._make_tracker("a"))
+
+        total: dict = accountant.get_usages()
+        assert total["blocks"] == 3
+        assert (total["scores"][0]["calls"], total["scores"][0]["dbPuts"]) == (3, 3)
+
+        usages: dict = accountant.get_usages(block_height=2)
+        assert (usages["blockHeight"], usages["blockHash"]) == (2, blocks[2].hash)
+        assert usages["scores"][0]["calls"] == 1
+        assert accountant.get_usages(block_height=2, score_address=SCORE2)["scores"] == []
+        with pytest.raises(KeyError):
+            accountant.get_usages(block_height=0)
+
+        accountant.rollback(1)
+        with pytest.raises(KeyError):
+            accountant.get_usages(block_height=2)
+        assert accountant.get_usages(block_height=1)["blockHeight"] == 1
+
+        with open(dump_path) as f:
+            lines = [json.loads(line) for line in f]
+        assert [0, 1, 2] == [line["blockHeight"] for line in lines]
+        assert lines[0]["blockHash"] == blocks[0].hash.hex()
+        assert lines[0]["scores"][0]["scoreAddress"] == str(SCORE1)
+
+    def test_dump_failure(self, tmp_path):
+        accountant = ScoreResourceAccountant(dump_path=str(tmp_path))
+        accountant.commit(self._make_block(0), self._make_tracker("a"))
+        assert accountant.get_usages()["blocks"] == 1
@@ -256,7 +256,7 @@ class TestIconScoreStepCounter:
     @pytest.fixture
     def mock_step_counter(self):
         counter = IconScoreStepCounter(step_price=mock.ANY,
-                                       step_costs=mock.ANY,
+                                       step_costs=mock.MagicMock(),
                                        step_limit=mock.ANY,
                                        step_trace_flag=mock.ANY)
         return counter
@@ -341,3 +341,47 @@ class TestIconScoreStepCounter:
                                                                         step=step)
             mock_step_counter_for_consume_step._trace_step.assert_called_once_with(step_type, step)
             assert step_used == expected_step_used
+
+    STEP_COSTS = {
+        StepType.DEFAULT: 100_000,
+        StepType.GET: 25,
+        StepType.SET: 320,
+        StepType.REPLACE: 80,
+        StepType.DELETE: -240,
+        StepType.EVENT_LOG: 100,
+    }
+
+    @pytest.mark.parametrize("step_trace_flag", [False, True])
+    @pytest.mark.parametrize("step_type, method_name", [
+        (StepType.GET, "apply_get_step"),
+        (StepType.SET, "apply_set_step"),
+        (StepType.REPLACE, "apply_replace_step"),
+        (StepType.DELETE, "apply_delete_step"),
+        (StepType.EVENT_LOG, "apply_event_log_step"),
+    ])
+    def test_apply_step_with_resolved_cost(self, step_type, method_name, step_trace_flag):
+        counter = IconScoreStepCounter(10 ** 10, self.STEP_COSTS, 1_000_000, step_trace_flag)
+        expected = IconScoreStepCounter(10 ** 10, self.STEP_COSTS, 1_000_000, step_trace_flag)
+        counter.consume_step(StepType.DEFAULT, 100_000)
+        expected.consume_step(StepType.DEFAULT, 100_000)
+
+        for size in (0, 1, 33, 1000):
+            assert getattr(counter, method_name)(size) == expected.apply_step(step_type, size)
+            assert counter.step_used == expected.step_used
+            assert counter.max_step_used == expected.max_step_used
+
+        if step_trace_flag:
+            assert str(counter.step_tracer) == str(expected.step_tracer)
+        else:
+            assert counter.step_tracer is None
+
+    def test_apply_step_with_resolved_cost_out_of_step(self):
+        counter = IconScoreStepCounter(10 ** 10, self.STEP_COSTS, 1000, False)
+        counter.apply_set_step(3)
+
+        with pytest.raises(OutOfStepException) as e:
+            counter.apply_event_log_step(1)
+
+        assert e.value.args == (1000, 960, 100, StepType.EVENT_LOG)
+        assert counter.step_used == 100_000
+        assert counter.max_step_used == 1060
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.database.db import KeyValueDatabase
+from iconservice.iiss.reward_calc import RewardCalcStorage
+from iconservice.iiss.reward_calc.finalizer import IissDBFinalizer
+from iconservice.iiss.reward_calc.msg_data import make_block_produce_info_key
+from iconservice.iiss.reward_calc.storage import RewardCalcDBInfo
+
+CALC_END_BLOCK_HEIGHT = 100
+TIMEOUT = 5
+
+
+@pytest.fixture
+def rc_data_path(tmp_path):
+    return str(tmp_path)
+
+
+@pytest.fixture
+def current_db(rc_data_path):
+    db: 'KeyValueDatabase' = RewardCalcStorage.create_current_db(rc_data_path)
+    db.put(make_block_produce_info_key(CALC_END_BLOCK_HEIGHT), b"block_produce_info")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def standby_db_info(rc_data_path) -> 'RewardCalcDBInfo':
+    path: str = os.path.join(rc_data_path, RewardCalcStorage.get_standby_rc_db_name(CALC_END_BLOCK_HEIGHT))
+    db = KeyValueDatabase.from_path(path)
+    for i in range(10):
+        db.put(b"TX" + i.to_bytes(8, "big"), os.urandom(32))
+    db.close()
+
+    return RewardCalcDBInfo(path, CALC_END_BLOCK_HEIGHT)
+
+
+@pytest.fixture
+def finalizer():
+    finalizer = IissDBFinalizer()
+    yield finalizer
+    finalizer.close()
+
+
+def test_finalize_iiss_db(current_db, standby_db_info):
+    progress = []
+    RewardCalcStorage.finalize_iiss_db(
+        CALC_END_BLOCK_HEIGHT, current_db, standby_db_info.path, lambda *args: progress.append(args))
+
+    bp_key: bytes = make_block_produce_info_key(CALC_END_BLOCK_HEIGHT)
+    assert current_db.get(bp_key) is None
+
+    db = KeyValueDatabase.from_path(standby_db_info.path, create_if_missing=False)
+    assert db.get(bp_key) == b"block_produce_info"
+    db.close()
+
+    total: int = len(RewardCalcStorage.COMPACTION_KEY_PREFIXES) + 1
+    assert progress == [(i, total) for i in range(1, total + 1)]
+
+
+def test_run(rc_data_path, current_db, standby_db_info, finalizer):
+    assert finalizer.get_status()["state"] == "idle"
+
+    on_finalized = Mock()
+    finalizer.run(standby_db_info, current_db, on_finalized)
+    finalizer.wait()
+
+    iiss_db_path: str = os.path.join(rc_data_path, RewardCalcStorage.get_iiss_rc_db_name(CALC_END_BLOCK_HEIGHT))
+    on_finalized.assert_called_once_with(iiss_db_path, CALC_END_BLOCK_HEIGHT)
+    assert os.path.isdir(iiss_db_path)
+    assert not os.path.exists(standby_db_info.path)
+
+    status: dict = finalizer.get_status()
+    assert status["state"] == "done"
+    assert status["blockHeight"] == CALC_END_BLOCK_HEIGHT
+    assert status["stage"] is None
+    assert status["count"] == 1
+    assert status["compaction"]["done"] == status["compaction"]["total"] > 0
+    assert set(status["durations"]) == {
+        IissDBFinalizer.STAGE_FINALIZE, IissDBFinalizer.STAGE_RENAME, IissDBFinalizer.STAGE_CALCULATE}
+
+
+def test_run_in_background(current_db, standby_db_info, finalizer):
+    event = threading.Event()
+
+    def on_finalized(_iiss_db_path: str, _block_height: int):
+        assert event.wait(TIMEOUT)
+
+    finalizer.run(standby_db_info, current_db, on_finalized)
+
+    assert finalizer.running
+    status: dict = finalizer.get_status()
+    assert status["state"] == "running"
+
+    event.set()
+    finalizer.wait()
+    assert not finalizer.running
+
+
+def test_run_failure(current_db, standby_db_info, finalizer):
+    on_finalized = Mock(side_effect=RuntimeError("CALCULATE failure"))
+    finalizer.run(standby_db_info, current_db, on_finalized)
+
+    # The failure is raised on every barrier until iconservice is restarted
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            finalizer.wait()
+
+    status: dict = finalizer.get_status()
+    assert status["state"] == "failed"
+    assert status["stage"] == IissDBFinalizer.STAGE_CALCULATE
+    assert status["count"] == 0
@@ -602,12 +602,79 @@ class TestIissEngine:
             else:
                 assert account.delegated_amount == cached_accounts[address][1]
 
+    @pytest.mark.parametrize("revision,updated_account_count", [
+        (Revision.DECENTRALIZATION.value, 13),
+        (Revision.OPTIMIZE_DIRTY_PREP_UPDATE.value, 8),
+    ])
+    def test_handle_set_delegation_with_unchanged_delegations(self, revision, updated_account_count):
+        """Test case
+        old_delegations: 1 ~ 10 delegated amount
+        new_delegations: 1 ~ 5 (unchanged), 11 ~ 12 delegated amount
+        """
+        context = Mock()
+        context.revision = revision
+        context.msg = Message(SENDER_ADDRESS, 0)
+        context.storage.icx.get_account = Mock(side_effect=get_account)
+
+        new_delegations = []
+        for i in (1, 2, 3, 4, 5, 11, 12):
+            new_delegations.append({"address": Address.from_prefix_and_int(AddressPrefix.EOA, i), "value": i})
+
+        listener = Mock(spec=IISSEngineListener)
+        engine = IISSEngine()
+        engine.add_listener(listener)
+        engine.handle_set_delegation(context, new_delegations)
+
+        updated_accounts: List['Account'] = listener.on_set_delegation.call_args[0][1]
+        assert len(updated_accounts) == updated_account_count
+        assert len(context.storage.icx.get_account.call_args_list) == updated_account_count
+
+        # Unchanged accounts are not written to stateDB
+        put_accounts = [call_args[0][1] for call_args in context.storage.icx.put_account.call_args_list]
+        assert [account.address for account in put_accounts] == \
+            [Address.from_prefix_and_int(AddressPrefix.EOA, i) for i in (0, 6, 7, 8, 9, 10, 11, 12)]
+
+        if revision >= Revision.OPTIMIZE_DIRTY_PREP_UPDATE.value:
+            assert updated_accounts == put_accounts
+
+        for account in updated_accounts:
+            value: int = int.from_bytes(account.address.body, "big")
+            if value == 0:
+                assert account.delegations_amount == sum(range(1, 6)) + 11 + 12
+            elif 6 <= value <= 10:
+                assert account.delegated_amount == 0
+            else:
+                assert account.delegated_amount == value
+
     def test_invoke(self):
         context = Mock(revision=Revision.IISS.value - 1)
         engine = IISSEngine()
         with pytest.raises(InvalidParamsException):
             engine.invoke(context, "stake", {})
 
+    def test_handle_query_iscore_with_cache(self):
+        address = Address.from_prefix_and_int(AddressPrefix.EOA, 1)
+        context = Mock(tx=None, block=None)
+        engine = IISSEngine()
+        engine._reward_calc_proxy = Mock()
+        engine._reward_calc_proxy.query_iscore = Mock(return_value=(5_000, 100))
+
+        for _ in range(3):
+            data = engine.handle_query_iscore(context, address)
+            assert data == {"iscore": 5_000, "estimatedICX": 5, "blockHeight": 100}
+        assert engine._reward_calc_proxy.query_iscore.call_count == 1
+
+        status = engine.get_iscore_cache_status()
+        assert status["hits"] == 2
+        assert status["misses"] == 1
+
+        # Cache is invalidated after a calculation is done
+        engine._iscore_cache.clear()
+        engine._reward_calc_proxy.query_iscore = Mock(return_value=(7_000, 200))
+        data = engine.handle_query_iscore(context, address)
+        assert data["iscore"] == 7_000
+        assert data["blockHeight"] == 200
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice.iiss.iscore_cache import IScoreCache
+from tests import create_address
+
+
+class TestIScoreCache:
+    def test_get_and_put(self):
+        cache = IScoreCache(max_size=2)
+        addresses = [create_address() for _ in range(3)]
+
+        for i, address in enumerate(addresses):
+            assert cache.get(address) is None
+            cache.put(cache.generation, address, i, 100)
+
+        # The least recently used address is evicted
+        assert cache.get(addresses[0]) is None
+        assert cache.get(addresses[1]) == (1, 100)
+        assert cache.get(addresses[2]) == (2, 100)
+
+        status = cache.get_status()
+        assert status["size"] == 2
+        assert status["hits"] == 2
+        assert status["misses"] == 4
+        assert status["hitRatio"] == 2 / 6
+
+    def test_put_after_invalidation(self):
+        cache = IScoreCache()
+        address = create_address()
+
+        generation: int = cache.generation
+        cache.clear()
+        cache.put(generation, address, 1000, 100)
+        assert cache.get(address) is None
+
+    def test_claim(self):
+        cache = IScoreCache()
+        address = create_address()
+        other = create_address()
+        cache.put(cache.generation, address, 1000, 100)
+        cache.put(cache.generation, other, 2000, 100)
+
+        cache.on_claim(address)
+        assert cache.get(address) is None
+        assert cache.get(other) == (2000, 100)
+
+        # Not cached until the block containing the claim is committed
+        cache.put(cache.generation, address, 1000, 100)
+        assert cache.get(address) is None
+
+        cache.on_commit()
+        cache.put(cache.generation, address, 0, 100)
+        assert cache.get(address) == (0, 100)
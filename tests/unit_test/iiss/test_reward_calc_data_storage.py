@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import os
+from typing import List, Tuple
 from unittest.mock import Mock
 
 import pytest
@@ -27,6 +28,7 @@ from iconservice.iiss.reward_calc import RewardCalcStorage
 from iconservice.iiss.reward_calc.data_creator import *
 from iconservice.iiss.reward_calc.msg_data import TxType
 from iconservice.iiss.reward_calc.storage import get_rc_version
+from iconservice.prep.data.term import PRepSnapshot
 from iconservice.utils import sha3_256
 from iconservice.utils.msgpack_for_db import MsgPackForDB
 from tests import create_address
@@ -273,3 +275,108 @@ class TestRcDataStorage:
         actual_i_score, _, _ = rc_data_storage.get_calc_response_from_rc()
 
         assert actual_i_score == expected_i_score
+
+
+@pytest.fixture
+def rc_storage_on_disk(context, tmp_path, mocker):
+    mocker.patch.object(RewardCalcStorage, '_supplement_db')
+    # Check the real paths instead of mock_os_path_exists
+    os.path.exists.side_effect = lambda path: os.path.isdir(path) or os.path.isfile(path)
+    context.revision = Revision.DECENTRALIZATION.value
+
+    storage = RewardCalcStorage()
+    storage.open(context, str(tmp_path))
+    yield storage
+    storage.close()
+
+
+def _create_preps_and_txs(preps_count: int, unregistered_count: int) -> Tuple[list, list]:
+    preps: List[PRepSnapshot] = [PRepSnapshot(create_address(), 100 + i) for i in range(preps_count)]
+    prep_data = DataCreator.create_prep_data(DUMMY_BLOCK_HEIGHT, sum(p.delegated for p in preps), preps)
+
+    txs: list = [DataCreator.create_tx(create_address(), DUMMY_BLOCK_HEIGHT, DataCreator.create_tx_prep_reg())]
+    for prep in preps[:unregistered_count]:
+        txs.append(DataCreator.create_tx(prep.address, DUMMY_BLOCK_HEIGHT, DataCreator.create_tx_prep_unreg()))
+
+    return [prep_data, *txs], preps
+
+
+class TestUnregisteredPRepIndex:
+    def test_commit(self, rc_storage_on_disk, mocker):
+        iiss_data_list, preps = _create_preps_and_txs(preps_count=5, unregistered_count=2)
+        rc_storage_on_disk.commit(IissWAL(iiss_data_list, -1))
+
+        assert rc_storage_on_disk.get_unregistered_preps() == {prep.address for prep in preps[:2]}
+        assert rc_storage_on_disk.get_first_preps().prep_list[0].address == preps[0].address
+
+        # TxData is not scanned any more
+        mocker.patch.object(TxData, "from_bytes", side_effect=AssertionError)
+        expected: int = sum(prep.delegated for prep in preps[2:])
+        assert rc_storage_on_disk.get_total_elected_prep_delegated_snapshot() == expected
+
+    def test_put_data_directly(self, rc_storage_on_disk):
+        _, preps = _create_preps_and_txs(preps_count=1, unregistered_count=0)
+        tx = DataCreator.create_tx(preps[0].address, DUMMY_BLOCK_HEIGHT, DataCreator.create_tx_prep_unreg())
+        rc_storage_on_disk.put_data_directly(tx, tx_index=0)
+
+        assert rc_storage_on_disk.get_unregistered_preps() == {preps[0].address}
+
+    def test_build_index_lazily(self, context, rc_storage_on_disk, tmp_path):
+        # current_db made by previous version which has no index
+        iiss_data_list, preps = _create_preps_and_txs(preps_count=3, unregistered_count=1)
+        db: 'KeyValueDatabase' = rc_storage_on_disk.key_value_db
+        for i, tx in enumerate(iiss_data_list[1:]):
+            db.put(tx.make_key(i), tx.make_value())
+        db.delete(RewardCalcStorage.KEY_FOR_UNREGISTERED_PREP_INDEX)
+        rc_storage_on_disk.close()
+
+        rc_storage_on_disk.open(context, str(tmp_path))
+        assert rc_storage_on_disk.key_value_db.get(RewardCalcStorage.KEY_FOR_UNREGISTERED_PREP_INDEX) is None
+
+        assert rc_storage_on_disk.get_unregistered_preps() == {preps[0].address}
+        assert rc_storage_on_disk.key_value_db.get(RewardCalcStorage.KEY_FOR_UNREGISTERED_PREP_INDEX) is not None
+
+    def test_rollback_with_built_index(self, context, rc_storage_on_disk):
+        iiss_data_list, preps = _create_preps_and_txs(preps_count=3, unregistered_count=2)
+        db: 'KeyValueDatabase' = rc_storage_on_disk.key_value_db
+        for i, tx in enumerate(iiss_data_list[1:]):
+            db.put(tx.make_key(i), tx.make_value())
+        db.delete(RewardCalcStorage.KEY_FOR_UNREGISTERED_PREP_INDEX)
+        assert rc_storage_on_disk.get_unregistered_preps() == {prep.address for prep in preps[:2]}
+
+        # A backup restores the txs but not the index built by scanning them
+        db.delete(iiss_data_list[-1].make_key(len(iiss_data_list) - 2))
+        rc_storage_on_disk.close()
+        rc_storage_on_disk.rollback(context, DUMMY_BLOCK_HEIGHT, b"")
+
+        assert rc_storage_on_disk.get_unregistered_preps() == {preps[0].address}
+
+    def test_rollback_with_maintained_index(self, context, rc_storage_on_disk):
+        iiss_data_list, preps = _create_preps_and_txs(preps_count=3, unregistered_count=2)
+        rc_storage_on_disk.commit(IissWAL(iiss_data_list, -1))
+        marker: bytes = rc_storage_on_disk.key_value_db.get(RewardCalcStorage.KEY_FOR_UNREGISTERED_PREP_INDEX)
+
+        rc_storage_on_disk.close()
+        rc_storage_on_disk.rollback(context, DUMMY_BLOCK_HEIGHT, b"")
+
+        db: 'KeyValueDatabase' = rc_storage_on_disk.key_value_db
+        assert db.get(RewardCalcStorage.KEY_FOR_UNREGISTERED_PREP_INDEX) == marker
+        assert rc_storage_on_disk.get_unregistered_preps() == {prep.address for prep in preps[:2]}
+
+    def test_index_is_not_sent_to_rc(self, rc_storage_on_disk):
+        iiss_data_list, preps = _create_preps_and_txs(preps_count=3, unregistered_count=2)
+        rc_storage_on_disk.commit(IissWAL(iiss_data_list, -1))
+        rc_storage_on_disk.get_unregistered_preps()
+
+        standby_db_info = rc_storage_on_disk.replace_db(DUMMY_BLOCK_HEIGHT)
+        assert rc_storage_on_disk.get_unregistered_preps() == set()
+
+        RewardCalcStorage.finalize_iiss_db(DUMMY_BLOCK_HEIGHT, rc_storage_on_disk.key_value_db, standby_db_info.path)
+
+        db = KeyValueDatabase.from_path(standby_db_info.path, create_if_missing=False)
+        keys: list = [key for key, _ in db.iterator()]
+        db.close()
+
+        assert len(keys) == len(iiss_data_list) + 1
+        assert all(key.startswith((PRepsData.PREFIX, TxData.PREFIX)) or
+                   key == RewardCalcStorage.KEY_FOR_GETTING_LAST_TRANSACTION_INDEX for key in keys)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+from iconservice.database.db import KeyValueDatabase
+from iconservice.icon_constant import RC_DB_VERSION_2, RCCalculateResult, ISCORE_EXCHANGE_RATE, IISS_ANNUAL_BLOCK
+from iconservice.iiss.reward_calc.data_creator import DataCreator
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from iconservice.iiss.reward_calc.ipc.simulator import RewardCalcSimulator, IScoreCalculator
+from iconservice.utils import icx_to_loop
+from tests import create_address, create_block_hash, create_tx_hash
+
+TIMEOUT = 5
+CALC_END_BLOCK_HEIGHT = 100
+REWARD_REP = 10_000
+
+# Integration tests replace RewardCalcProxy methods with mocks at class level.
+# Keep the original ones which are captured on collection to restore them
+_PROXY_METHODS = {
+    name: value for name, value in vars(RewardCalcProxy).items() if callable(value)
+}
+
+
+async def _wait(future):
+    return await future
+
+
+@pytest.fixture
+def root_path():
+    # Keep unix domain socket path short
+    path: str = tempfile.mkdtemp(prefix="rcs")
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def iiss_db(root_path):
+    def func(delegations: list) -> str:
+        path: str = os.path.join(root_path, "iiss_rc_db")
+        db = KeyValueDatabase.from_path(path)
+
+        header = DataCreator.create_header(RC_DB_VERSION_2, CALC_END_BLOCK_HEIGHT, 0)
+        db.put(header.make_key(), header.make_value())
+        gv = DataCreator.create_gv_variable(RC_DB_VERSION_2, 0, 0, REWARD_REP, 22, 100)
+        db.put(gv.make_key(), gv.make_value())
+
+        for i, (address, block_height, value) in enumerate(delegations):
+            info = DataCreator.create_delegation_info(create_address(), value)
+            tx = DataCreator.create_tx(address, block_height, DataCreator.create_tx_delegation([info]))
+            db.put(tx.make_key(i), tx.make_value())
+
+        db.close()
+        return path
+
+    return func
+
+
+@pytest.fixture
+def rc(root_path, monkeypatch):
+    for name, value in _PROXY_METHODS.items():
+        monkeypatch.setattr(RewardCalcProxy, name, value)
+
+    sock_path: str = os.path.join(root_path, "iiss.sock")
+    calc_done = []
+    calc_done_event = threading.Event()
+
+    def calc_done_callback(response):
+        calc_done.append(response)
+        calc_done_event.set()
+
+    # RewardCalcProxy.open() takes the current event loop, which is restored after the test
+    prev_loop = asyncio.get_event_loop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    proxy = RewardCalcProxy(icon_rc_path="", ipc_timeout=TIMEOUT, calc_done_callback=calc_done_callback)
+    proxy.open(sock_path)
+    proxy._ipc_server.start()
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    simulator = RewardCalcSimulator()
+    simulator.start(sock_path, timeout=TIMEOUT)
+    asyncio.run_coroutine_threadsafe(_wait(proxy.get_ready_future()), loop).result(TIMEOUT)
+
+    yield proxy, simulator, calc_done, calc_done_event
+
+    loop.call_soon_threadsafe(proxy.stop)
+    simulator.stop()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(TIMEOUT)
+    proxy.close()
+    loop.close()
+    asyncio.set_event_loop(prev_loop)
+
+
+def test_iscore_calculator(iiss_db):
+    address = create_address()
+    amount: int = icx_to_loop(100)
+    path: str = iiss_db([(address, 1, amount)])
+
+    iscores = IScoreCalculator().run(path, CALC_END_BLOCK_HEIGHT)
+
+    blocks: int = CALC_END_BLOCK_HEIGHT
+    expected: int = amount * REWARD_REP * blocks * ISCORE_EXCHANGE_RATE // (IISS_ANNUAL_BLOCK * 10_000)
+    assert iscores == {address: expected}
+
+
+def test_version_and_blocks(rc):
+    proxy, simulator, _, _ = rc
+
+    assert proxy.is_reward_calculator_ready()
+    assert proxy.get_version() == 1
+
+    block_hash: bytes = create_block_hash()
+    assert proxy.start_block(1, block_hash) == (1, block_hash)
+    assert proxy.commit_block(True, 1, block_hash) == (True, 1, block_hash)
+    assert simulator.block_height == 1
+
+
+def test_calculate_and_claim(rc, iiss_db):
+    proxy, simulator, calc_done, calc_done_event = rc
+    address = create_address()
+    path: str = iiss_db([(address, 1, icx_to_loop(1_000))])
+
+    assert proxy.calculate(path, CALC_END_BLOCK_HEIGHT) == RCCalculateResult.SUCCESS
+    assert calc_done_event.wait(TIMEOUT)
+    assert calc_done[0].success
+    assert calc_done[0].block_height == CALC_END_BLOCK_HEIGHT
+
+    iscore, _ = proxy.query_iscore(address, None, None)
+    assert iscore == calc_done[0].iscore > 0
+
+    status, block_height, issued, state_hash = proxy.query_calculate_result(CALC_END_BLOCK_HEIGHT)
+    assert status == RCCalculateResult.SUCCESS
+    assert issued == iscore
+    assert state_hash == calc_done[0].state_hash
+
+    block_height, block_hash, tx_hash = CALC_END_BLOCK_HEIGHT + 2, create_block_hash(), create_tx_hash()
+    claimed, _ = proxy.claim_iscore(address, block_height, block_hash, 0, tx_hash)
+    assert claimed == iscore - iscore % ISCORE_EXCHANGE_RATE
+
+    proxy.commit_claim(True, address, block_height, block_hash, 0, tx_hash)
+    proxy.commit_block(True, block_height, block_hash)
+    assert proxy.query_iscore(address, None, None)[0] == iscore % ISCORE_EXCHANGE_RATE
+
+    # Rollback restores the claimed I-Score
+    rollback_hash: bytes = create_block_hash()
+    assert proxy.rollback(block_height - 1, rollback_hash) == (True, block_height - 1, rollback_hash)
+    assert proxy.query_iscore(address, None, None)[0] == iscore
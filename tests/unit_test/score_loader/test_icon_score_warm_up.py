@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.base.address import AddressPrefix
+from iconservice.deploy.storage import IconScoreDeployInfo
+from iconservice.icon_constant import DeployState
+from iconservice.iconscore.icon_score_mapper import IconScoreMapper
+from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+from iconservice.score_loader.icon_score_warm_up import IconScoreWarmUp
+from tests import create_address, create_tx_hash
+
+SCORES = [create_address(AddressPrefix.CONTRACT) for _ in range(4)]
+OWNER = create_address()
+
+
+def _create_deploy_info(address, state: 'DeployState' = DeployState.ACTIVE) -> 'IconScoreDeployInfo':
+    return IconScoreDeployInfo(address, state, OWNER, create_tx_hash(), create_tx_hash())
+
+
+def _create_score_info(address, last_used: float) -> 'IconScoreInfo':
+    score_info = IconScoreInfo(Mock, Mock(address=address), create_tx_hash())
+    score_info.last_used = last_used
+    return score_info
+
+
+@pytest.fixture
+def context():
+    context = Mock()
+    context.icon_score_mapper = IconScoreMapper()
+    context.storage.deploy.iter_deploy_infos.return_value = [
+        _create_deploy_info(SCORES[0]),
+        _create_deploy_info(SCORES[1], DeployState.INACTIVE),
+        _create_deploy_info(SCORES[2]),
+        _create_deploy_info(SCORES[3]),
+    ]
+    return context
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    return str(tmp_path / IconScoreWarmUp.FILE_NAME)
+
+
+def _get_addresses(warm_up: 'IconScoreWarmUp', context) -> list:
+    return [deploy_info.score_address for deploy_info in warm_up._get_deploy_infos(context)]
+
+
+def test_get_deploy_infos(context, path):
+    # Inactive and already loaded SCOREs are excluded
+    context.icon_score_mapper[SCORES[0]] = _create_score_info(SCORES[0], 0)
+    assert _get_addresses(IconScoreWarmUp(path), context) == [SCORES[2], SCORES[3]]
+
+    # Recently used SCOREs come first
+    with open(path, "w") as f:
+        json.dump({"scores": [str(SCORES[3]), str(SCORES[1])]}, f)
+    assert _get_addresses(IconScoreWarmUp(path, max_scores=1), context) == [SCORES[3]]
+    assert _get_addresses(IconScoreWarmUp(path, max_scores=5), context) == [SCORES[3], SCORES[2]]
+
+
+def test_save(context, path):
+    with open(path, "w") as f:
+        json.dump({"scores": [str(SCORES[3]), str(SCORES[1])]}, f)
+
+    score_mapper = IconScoreMapper()
+    score_mapper[SCORES[0]] = _create_score_info(SCORES[0], 1.0)
+    score_mapper[SCORES[1]] = _create_score_info(SCORES[1], 2.0)
+    score_mapper[SCORES[2]] = _create_score_info(SCORES[2], 0)
+
+    IconScoreWarmUp(path, max_scores=3).save(score_mapper)
+    assert IconScoreWarmUp(path)._load_recently_used() == [SCORES[1], SCORES[0], SCORES[3]]
+
+
+def test_load_recently_used_broken_file(path):
+    with open(path, "w") as f:
+        f.write("{")
+    assert IconScoreWarmUp(path)._load_recently_used() == []
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import sys
+from typing import Dict
+
+import pytest
+
+from iconservice.base.block import Block
+from iconservice.base.exception import InvalidParamsException, IllegalFormatException
+from iconservice.database.db import KeyValueDatabase
+from iconservice.deploy.score_package_store import ScorePackageStore
+from iconservice.icon_constant import ICON_DEX_DB_NAME, IISS_DB, Revision
+from iconservice.icx.storage import Storage as IcxStorage
+from iconservice.iiss.reward_calc.storage import Storage as RewardCalcStorage
+from iconservice.snapshot import SnapshotExporter, SnapshotImporter, Section
+from iconservice.snapshot.__main__ import main, FAILURE_CODE
+
+CHUNK_SIZE = 1024
+
+BLOCK = Block(100, hashlib.sha3_256(b"block").digest(), 1_000_000, hashlib.sha3_256(b"prev").digest(), 0)
+
+SCORE_FILES = {
+    os.path.join("cx01", "0x01", "package.json"): b'{"version": "0.0.1"}',
+    os.path.join("cx01", "0x01", "__init__.py"): b"",
+    os.path.join("cx02", "0x02", "score.py"): os.urandom(CHUNK_SIZE * 3 + 1),
+}
+
+
+def _read_db(path: str) -> Dict[bytes, bytes]:
+    db = KeyValueDatabase.from_path(path, create_if_missing=False)
+    ret = dict(db.iterator())
+    db.close()
+    return ret
+
+
+def _read_files(root_path: str) -> Dict[str, bytes]:
+    ret = {}
+    for dir_path, _, filenames in os.walk(root_path):
+        for filename in filenames:
+            path = os.path.join(dir_path, filename)
+            with open(path, "rb") as f:
+                ret[os.path.relpath(path, root_path)] = f.read()
+    return ret
+
+
+@pytest.fixture
+def source(tmp_path):
+    state_db_root_path = str(tmp_path / "src" / "statedb")
+    score_root_path = str(tmp_path / "src" / "score")
+    os.makedirs(os.path.join(state_db_root_path, IISS_DB))
+
+    state_db = KeyValueDatabase.from_path(os.path.join(state_db_root_path, ICON_DEX_DB_NAME))
+    state_db.write_batch((os.urandom(32), os.urandom(i % 100 + 1)) for i in range(500))
+    state_db.put(IcxStorage.LAST_BLOCK_KEY, BLOCK.to_bytes(Revision.IISS.value))
+    state_db.close()
+
+    iiss_db = RewardCalcStorage.create_current_db(os.path.join(state_db_root_path, IISS_DB))
+    iiss_db.write_batch((os.urandom(20), os.urandom(40)) for _ in range(50))
+    iiss_db.close()
+
+    for rel_path, data in SCORE_FILES.items():
+        path = os.path.join(score_root_path, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    return state_db_root_path, score_root_path
+
+
+@pytest.fixture
+def snapshot(tmp_path, source) -> str:
+    path = str(tmp_path / "snapshot.bin")
+    SnapshotExporter(*source, chunk_size=CHUNK_SIZE).run(path)
+    return path
+
+
+def _check_imported(source: tuple, state_db_root_path: str, score_root_path: str):
+    src_state_db_root_path, src_score_root_path = source
+    for db_path in (ICON_DEX_DB_NAME, os.path.join(IISS_DB, RewardCalcStorage.CURRENT_IISS_DB_NAME)):
+        assert _read_db(os.path.join(state_db_root_path, db_path)) == \
+               _read_db(os.path.join(src_state_db_root_path, db_path))
+
+    assert _read_files(score_root_path) == SCORE_FILES
+    assert not os.path.exists(os.path.join(state_db_root_path, SnapshotImporter.PROGRESS_FILE))
+
+
+def test_export_and_import(tmp_path, source):
+    path = str(tmp_path / "snapshot.bin")
+    manifest = SnapshotExporter(*source, chunk_size=CHUNK_SIZE).run(path)
+
+    assert manifest["blockHeight"] == BLOCK.height
+    assert manifest["blockHash"] == BLOCK.hash
+    assert manifest["sections"]["state"]["entries"] == 501
+    assert manifest["sections"]["iiss"]["entries"] == 50
+    assert manifest["sections"]["score"]["entries"] == 2 + 4
+    assert len(manifest["chunks"]) == sum(section["chunks"] for section in manifest["sections"].values())
+    assert not os.path.exists(f"{path}.tmp")
+
+    # The same state makes the same snapshot
+    manifest2 = SnapshotExporter(*source, chunk_size=CHUNK_SIZE).run(str(tmp_path / "snapshot2.bin"))
+    assert manifest2["rootHash"] == manifest["rootHash"]
+
+    state_db_root_path = str(tmp_path / "dst" / "statedb")
+    score_root_path = str(tmp_path / "dst" / "score")
+    imported = SnapshotImporter(state_db_root_path, score_root_path).run(path)
+    assert imported["rootHash"] == manifest["rootHash"]
+
+    _check_imported(source, state_db_root_path, score_root_path)
+
+
+def test_export_score_package_store(tmp_path, source):
+    manifest = SnapshotExporter(*source, chunk_size=CHUNK_SIZE).run(str(tmp_path / "snapshot.bin"))
+
+    # Move a deploy path to the store and link to it
+    _, score_root_path = source
+    deploy_path = os.path.join(score_root_path, "cx02", "0x02")
+    store_path = os.path.join(score_root_path, ScorePackageStore.DIR_NAME)
+    os.makedirs(store_path)
+    os.rename(deploy_path, os.path.join(store_path, "abcd"))
+    os.symlink(os.path.join("..", ScorePackageStore.DIR_NAME, "abcd"), deploy_path, target_is_directory=True)
+
+    path = str(tmp_path / "snapshot2.bin")
+    manifest2 = SnapshotExporter(*source, chunk_size=CHUNK_SIZE).run(path)
+    assert manifest2["rootHash"] == manifest["rootHash"]
+
+    state_db_root_path = str(tmp_path / "dst" / "statedb")
+    score_root_path = str(tmp_path / "dst" / "score")
+    SnapshotImporter(state_db_root_path, score_root_path).run(path)
+    _check_imported(source, state_db_root_path, score_root_path)
+
+
+def test_resume_import(tmp_path, source, snapshot):
+    state_db_root_path = str(tmp_path / "dst" / "statedb")
+    score_root_path = str(tmp_path / "dst" / "score")
+
+    class InterruptedImporter(SnapshotImporter):
+        chunks = 0
+
+        def _write_chunk(self, section: 'Section', entries: tuple):
+            # Interrupted in the middle of SCORE files
+            if section == Section.SCORE and self.chunks > 0:
+                raise KeyboardInterrupt
+            super()._write_chunk(section, entries)
+            self.chunks += 1
+
+    with pytest.raises(KeyboardInterrupt):
+        InterruptedImporter(state_db_root_path, score_root_path).run(snapshot)
+    assert os.path.exists(os.path.join(state_db_root_path, SnapshotImporter.PROGRESS_FILE))
+
+    # A partially imported state is not overwritten by another snapshot
+    other_snapshot = str(tmp_path / "other.bin")
+    SnapshotExporter(*source, chunk_size=CHUNK_SIZE * 2).run(other_snapshot)
+    with pytest.raises(InvalidParamsException):
+        SnapshotImporter(state_db_root_path, score_root_path).run(other_snapshot)
+
+    SnapshotImporter(state_db_root_path, score_root_path).run(snapshot)
+    _check_imported(source, state_db_root_path, score_root_path)
+
+    # Imported state is not overwritten
+    with pytest.raises(InvalidParamsException):
+        SnapshotImporter(state_db_root_path, score_root_path).run(snapshot)
+
+
+def test_import_corrupted_snapshot(tmp_path, snapshot):
+    with open(snapshot, "r+b") as f:
+        f.seek(100)
+        data = f.read(1)
+        f.seek(100)
+        f.write(bytes([data[0] ^ 0xff]))
+
+    state_db_root_path = str(tmp_path / "dst" / "statedb")
+    with pytest.raises(IllegalFormatException):
+        SnapshotImporter(state_db_root_path, str(tmp_path / "dst" / "score")).run(snapshot)
+
+
+def test_import_incomplete_snapshot(tmp_path, snapshot):
+    with open(snapshot, "r+b") as f:
+        f.truncate(os.path.getsize(snapshot) - 1)
+
+    with pytest.raises(IllegalFormatException):
+        SnapshotImporter(str(tmp_path / "dst" / "statedb"), str(tmp_path / "dst" / "score")).run(snapshot)
+
+
+def test_main_with_incomplete_snapshot(tmp_path, snapshot, mocker, capsys):
+    with open(snapshot, "r+b") as f:
+        f.truncate(os.path.getsize(snapshot) - 1)
+
+    argv = ["snapshot", "import", snapshot,
+            "-st", str(tmp_path / "dst" / "statedb"), "-sc", str(tmp_path / "dst" / "score")]
+    mocker.patch.object(sys, "argv", argv)
+
+    # IllegalFormatException is reported instead of a traceback
+    assert main() == FAILURE_CODE
+    assert "Failed to import a snapshot" in capsys.readouterr().err
+
+
+def test_export_incomplete_block(tmp_path, source):
+    state_db_root_path, score_root_path = source
+    open(os.path.join(state_db_root_path, "block.wal"), "wb").close()
+
+    path = str(tmp_path / "snapshot.bin")
+    with pytest.raises(InvalidParamsException):
+        SnapshotExporter(state_db_root_path, score_root_path).run(path)
+    assert not os.path.exists(path)
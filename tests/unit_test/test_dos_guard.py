@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
 import time
 
 import pytest
@@ -43,3 +44,143 @@ class TestDoSGuard:
         # have to no raise
         print(11)
         dos_guard.run(_from=_from)
+
+    def test_sliding_window(self, mocker):
+        reset_time = 10
+        threshold = 10
+        ban_time = 100
+        cur_time = 1000.0
+        mocker.patch("iconservice.dosguard.now", side_effect=lambda: cur_time)
+
+        dos_guard = DoSGuard(reset_time, threshold, ban_time)
+        _from: str = str(create_address())
+
+        # A burst at the end of a window is not followed by another burst at the beginning of the next one
+        cur_time += reset_time - 0.1
+        for _ in range(threshold):
+            dos_guard.run(_from=_from)
+
+        _other: str = str(create_address())
+        cur_time += 0.2
+        dos_guard.run(_from=_other)
+        for _ in range(threshold - 1):
+            dos_guard.run(_from=_other)
+
+        with pytest.raises(Exception):
+            dos_guard.run(_from=_other)
+
+        # Tokens are refilled at threshold / reset_time per second
+        cur_time += 1
+        dos_guard.run(_from=_from)
+        with pytest.raises(Exception):
+            dos_guard.run(_from=_from)
+
+        # Banned values are rejected until ban_time passes after their last request
+        cur_time += ban_time / 2
+        with pytest.raises(Exception):
+            dos_guard.run(_from=_from)
+        cur_time += ban_time / 2 + 1
+        with pytest.raises(Exception):
+            dos_guard.run(_from=_from)
+        cur_time += ban_time + 1
+        for _ in range(threshold):
+            dos_guard.run(_from=_from)
+
+        status: dict = dos_guard.get_status()
+        assert list(status) == ["FROM_ON_TX"]
+        assert status["FROM_ON_TX"]["bans"] == 2
+        assert status["FROM_ON_TX"]["rejected"] == 4
+        assert status["FROM_ON_TX"]["banned"] == 1
+
+    def test_score_and_method(self):
+        score_threshold = 5
+        method_threshold = 3
+        dos_guard = DoSGuard(10, 100, 100, score_threshold=score_threshold, method_threshold=method_threshold)
+        score_address: str = str(create_address(1))
+
+        for _ in range(method_threshold):
+            dos_guard.run(_from=str(create_address()), to=score_address, method="transfer")
+        with pytest.raises(Exception) as e:
+            dos_guard.run(_from=str(create_address()), to=score_address, method="transfer")
+        assert "METHOD_ON_TX" in str(e.value)
+
+        # The rejected request has not taken a token of the SCORE
+        for _ in range(score_threshold - method_threshold):
+            dos_guard.run(_from=str(create_address()), to=score_address, method="balanceOf")
+        with pytest.raises(Exception) as e:
+            dos_guard.run(_from=str(create_address()), to=score_address, method="balanceOf")
+        assert "TO_ON_TX" in str(e.value)
+
+        # EOA destinations are not limited
+        eoa: str = str(create_address())
+        for _ in range(score_threshold + 1):
+            dos_guard.run(_from=str(create_address()), to=eoa)
+
+    def test_max_entries(self):
+        max_entries = 10
+        dos_guard = DoSGuard(10, 1, 100, max_entries=max_entries)
+
+        for _ in range(max_entries * 2):
+            _from: str = str(create_address())
+            dos_guard.run(_from=_from)
+            with pytest.raises(Exception):
+                dos_guard.run(_from=_from)
+
+        status: dict = dos_guard.get_status()["FROM_ON_TX"]
+        assert status["entries"] <= max_entries
+        assert status["banned"] == max_entries
+        assert status["evicted"] == max_entries
+
+    def test_run_batch(self):
+        threshold = 2
+        dos_guard = DoSGuard(10, 100, 100, method_threshold=threshold)
+        score_address: str = str(create_address(1))
+        params_list = [
+            {
+                "from": str(create_address()),
+                "to": score_address,
+                "dataType": "call",
+                "data": {"method": "transfer"}
+            }
+            for _ in range(threshold + 1)
+        ]
+        params_list.append({"from": str(create_address()), "to": score_address})
+
+        errors = dos_guard.run_batch(params_list)
+        assert errors[:threshold] == [None] * threshold
+        assert isinstance(errors[threshold], Exception)
+        assert errors[-1] is None
+
+    def test_run_with_params(self):
+        dos_guard = DoSGuard(10, 100, 100, score_threshold=1)
+        params = {"from": str(create_address()), "to": str(create_address(1)), "dataType": "call",
+                  "data": {"method": "transfer"}}
+
+        dos_guard.run_with_params(params)
+        with pytest.raises(Exception) as e:
+            dos_guard.run_with_params(params)
+        assert "TO_ON_TX" in str(e.value)
+
+    def test_run_from_threads(self):
+        threshold = 1000
+        dos_guard = DoSGuard(10 ** 6, threshold, 100, max_entries=10)
+        _from: str = str(create_address())
+        errors = []
+
+        def _run():
+            for _ in range(threshold // 4):
+                try:
+                    dos_guard.run(_from=_from)
+                    dos_guard.run_batch([{"from": str(create_address())}])
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=_run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        with pytest.raises(Exception):
+            dos_guard.run(_from=_from)
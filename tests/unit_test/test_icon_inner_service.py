@@ -15,18 +15,28 @@
 # limitations under the License.
 import asyncio
 import threading
+import time
 from unittest.mock import Mock
 
+import msgpack
 import pytest
 from iconcommons import IconConfig
 
-from iconservice.base.exception import FatalException, InvalidBaseTransactionException, IconServiceBaseException
+from iconservice.base.block import Block
+from iconservice.base.exception import FatalException, InvalidBaseTransactionException, IconServiceBaseException, \
+    ExceptionCode, OutOfBalanceException
+from iconservice.base.transaction import Transaction
+from iconservice.base.type_converter import TypeConverter
 from iconservice.base.type_converter_templates import ConstantKeys
-from iconservice.icon_constant import RPCMethod, ENABLE_THREAD_FLAG
+from iconservice.dosguard import DoSGuard
+from iconservice.icon_constant import RPCMethod, ENABLE_THREAD_FLAG, RESPONSE_FORMAT_MSGPACK, ConfigKey
 from iconservice.icon_inner_service import IconScoreInnerTask
 from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_result import TransactionResult
 from iconservice.iconscore.icon_score_step import OutOfStepException
-from tests import create_block_hash
+from iconservice.metrics import StartupPhase, StartupTimer
+from iconservice.utils import to_camel_case
+from tests import create_block_hash, create_tx_hash, create_address
 
 
 @pytest.fixture(params=[ENABLE_THREAD_FLAG, ~ENABLE_THREAD_FLAG])
@@ -231,3 +241,219 @@ class TestIconInnerService:
         assert status_requests[0] != call_thread_id
         assert status_requests[0] != estimate_thread_id
         assert call_thread_id != estimate_thread_id
+
+    @pytest.mark.parametrize("response_format", [None, RESPONSE_FORMAT_MSGPACK])
+    def test_invoke_response_format(self, inner_task, dummy_invoke_request, response_format):
+        dummy_invoke_request[ConstantKeys.IS_BLOCK_EDITABLE] = hex(0)
+        if response_format is not None:
+            dummy_invoke_request[ConstantKeys.RESPONSE_FORMAT] = response_format
+
+        block = Block(0, create_block_hash(), 0, None, 0)
+        tx = Transaction(create_tx_hash(), 0, create_address(), create_address(), 0)
+        tx_result = TransactionResult(tx, block, step_used=10, status=TransactionResult.SUCCESS)
+        state_root_hash: bytes = create_block_hash()
+        inner_task._icon_service_engine.invoke = Mock(return_value=([tx_result], state_root_hash, {}, None, False))
+        loop = asyncio.get_event_loop()
+
+        # Act
+        response = loop.run_until_complete(inner_task.invoke(dummy_invoke_request))
+
+        tx_results = response["txResults"]
+        if response_format == RESPONSE_FORMAT_MSGPACK:
+            tx_results = msgpack.unpackb(tx_results, raw=False)
+        assert tx_results == [TypeConverter.convert_type_reverse(tx_result.to_dict(to_camel_case))]
+        assert response["stateRootHash"] == state_root_hash.hex()
+        assert response["addedTransactions"] == {}
+
+    def test_invoke_with_stream(self, inner_task, dummy_invoke_request):
+        dummy_invoke_request[ConstantKeys.IS_BLOCK_EDITABLE] = hex(0)
+        dummy_invoke_request[ConstantKeys.STREAM] = hex(1)
+
+        inner_task._conf = {
+            ConfigKey.INVOKE_STREAM: {
+                ConfigKey.ENABLE: True,
+                ConfigKey.CHUNK_SIZE: 2,
+                ConfigKey.CHUNK_INTERVAL: 1000
+            }
+        }
+        inner_task._invoke_stream_stub = Mock()
+        chunks = []
+        inner_task._send_tx_results = chunks.append
+
+        block = Block(0, create_block_hash(), 0, None, 0)
+        tx_results = [
+            TransactionResult(Transaction(create_tx_hash(), i), block, status=TransactionResult.SUCCESS)
+            for i in range(5)
+        ]
+        state_root_hash: bytes = create_block_hash()
+
+        def mocked_invoke(*args, on_tx_result=None, **kwargs):
+            for tx_result in tx_results:
+                on_tx_result(tx_result)
+            return tx_results, state_root_hash, {}, None, False
+
+        inner_task._icon_service_engine.invoke = mocked_invoke
+        loop = asyncio.get_event_loop()
+
+        # Act
+        response = loop.run_until_complete(inner_task.invoke(dummy_invoke_request))
+
+        assert "txResults" not in response
+        assert response[ConstantKeys.TX_RESULT_COUNT] == hex(5)
+        assert response[ConstantKeys.CHUNK_COUNT] == hex(3)
+        assert response["stateRootHash"] == state_root_hash.hex()
+        assert [len(chunk["txResults"]) for chunk in chunks] == [2, 2, 1]
+        assert [tx_result for chunk in chunks for tx_result in chunk["txResults"]] == \
+            [tx_result.to_response_dict() for tx_result in tx_results]
+
+    @pytest.mark.parametrize("fail", [False, True])
+    def test_invoke_with_stream_sent(self, inner_task, dummy_invoke_request, fail):
+        dummy_invoke_request[ConstantKeys.IS_BLOCK_EDITABLE] = hex(0)
+        dummy_invoke_request[ConstantKeys.STREAM] = hex(1)
+
+        inner_task._conf = {
+            ConfigKey.INVOKE_STREAM: {
+                ConfigKey.ENABLE: True,
+                ConfigKey.CHUNK_SIZE: 2,
+                ConfigKey.CHUNK_INTERVAL: 1000
+            }
+        }
+        loop = asyncio.get_event_loop()
+        inner_task._loop = loop
+        chunks = []
+
+        async def tx_results(chunk: dict):
+            await asyncio.sleep(0.01)
+            if fail and chunk["sequence"] == hex(1):
+                raise ConnectionError("closed")
+            chunks.append(chunk)
+
+        inner_task._invoke_stream_stub = Mock()
+        inner_task._invoke_stream_stub.async_task.return_value.tx_results = tx_results
+
+        block = Block(0, create_block_hash(), 0, None, 0)
+        tx_results = [
+            TransactionResult(Transaction(create_tx_hash(), i), block, status=TransactionResult.SUCCESS)
+            for i in range(5)
+        ]
+
+        def mocked_invoke(*args, on_tx_result=None, **kwargs):
+            for tx_result in tx_results:
+                on_tx_result(tx_result)
+            return tx_results, create_block_hash(), {}, None, False
+
+        inner_task._icon_service_engine.invoke = mocked_invoke
+
+        # Act
+        response = loop.run_until_complete(inner_task.invoke(dummy_invoke_request))
+
+        # All chunks are sent before the response
+        assert len(inner_task._tx_result_futures) == 0
+        if fail:
+            assert len(chunks) == 2
+            assert response["error"]["code"] == 32000 + ExceptionCode.SYSTEM_ERROR
+        else:
+            assert len(chunks) == 3
+            assert response[ConstantKeys.CHUNK_COUNT] == hex(3)
+
+    def test_validate_transactions(self, inner_task):
+        from_ = create_address()
+        requests = [
+            {
+                "method": "icx_sendTransaction",
+                "params": {"from": str(from_), "to": str(create_address()), "value": hex(i)}
+            }
+            for i in range(3)
+        ]
+        inner_task._icon_service_engine.dos_guard = DoSGuard(reset_time=5, threshold=10, ban_time=300)
+        inner_task._icon_service_engine.validate_transactions = Mock(
+            return_value=[None, OutOfBalanceException("Out of balance"), Exception("exception")])
+        loop = asyncio.get_event_loop()
+
+        responses = loop.run_until_complete(inner_task.validate_transactions(requests))
+
+        converted_requests, origin_requests = inner_task._icon_service_engine.validate_transactions.call_args[0]
+        assert [request["params"]["from"] for request in converted_requests] == [from_] * 3
+        assert origin_requests == requests
+        assert responses == [
+            hex(ExceptionCode.OK),
+            {"error": {"code": 32000 + ExceptionCode.OUT_OF_BALANCE, "message": "Out of balance"}},
+            {"error": {"code": 32000 + ExceptionCode.SYSTEM_ERROR, "message": "exception"}}
+        ]
+
+    def test_validate_transactions_with_dos_guard(self, inner_task):
+        threshold = 3
+        requests = [
+            {
+                "method": "icx_sendTransaction",
+                "params": {"from": str(create_address()), "to": str(create_address()), "value": hex(0)}
+            }
+        ] * (threshold + 2)
+        inner_task._icon_service_engine.dos_guard = DoSGuard(reset_time=5, threshold=threshold, ban_time=300)
+        inner_task._icon_service_engine.validate_transactions = Mock(
+            side_effect=lambda converted_requests, _origin_requests: [None] * len(converted_requests))
+        loop = asyncio.get_event_loop()
+
+        responses = loop.run_until_complete(inner_task.validate_transactions(requests))
+
+        converted_requests, _ = inner_task._icon_service_engine.validate_transactions.call_args[0]
+        assert len(converted_requests) == threshold
+        assert responses[:threshold] == [hex(ExceptionCode.OK)] * threshold
+        for response in responses[threshold:]:
+            assert response["error"]["code"] == 32000 + ExceptionCode.SYSTEM_ERROR
+            assert "Too many requests" in response["error"]["message"]
+
+    def test_profile(self, inner_task, dummy_invoke_request, tmp_path):
+        log_dir = tmp_path / "log"
+        inner_task._conf = {ConfigKey.LOG: {ConfigKey.LOG_FILE_PATH: str(log_dir / "iconservice.log")}}
+        state_root_hash: bytes = create_block_hash()
+
+        def mocked_invoke(*args, **kwargs):
+            deadline = time.monotonic() + 0.05
+            while time.monotonic() < deadline:
+                pass
+            return [], state_root_hash, {}, None, False
+
+        inner_task._icon_service_engine.invoke = mocked_invoke
+        loop = asyncio.get_event_loop()
+
+        response = loop.run_until_complete(inner_task.profile({"command": "start", "interval": hex(1)}))
+        assert response["enable"] == hex(True)
+        assert response["blocks"] == hex(1)
+
+        loop.run_until_complete(inner_task.invoke(dummy_invoke_request))
+
+        # The profiler stops after the given number of blocks
+        response = loop.run_until_complete(inner_task.profile({"command": "status"}))
+        assert response["enable"] == hex(False)
+        assert response["written"] == hex(1)
+
+        paths = list((log_dir / "profile").iterdir())
+        assert len(paths) == 1
+        assert paths[0].name.startswith("0-")
+        assert "mocked_invoke" in paths[0].read_text()
+
+        response = loop.run_until_complete(inner_task.profile({"command": "unknown"}))
+        assert response["error"]["code"] == 32000 + ExceptionCode.INVALID_PARAMETER
+        response = loop.run_until_complete(inner_task.profile({"command": "start", "blocks": hex(0)}))
+        assert response["error"]["code"] == 32000 + ExceptionCode.INVALID_PARAMETER
+
+    def test_hello(self, inner_task):
+        inner_task._conf = {ConfigKey.INVOKE_STREAM: {ConfigKey.ENABLE: False}}
+        startup_timer = StartupTimer()
+        inner_task._icon_service_engine.startup_timer = startup_timer
+        inner_task._icon_service_engine.hello.return_value = {}
+
+        loop = asyncio.get_event_loop()
+        ready_future = loop.create_future()
+        inner_task._icon_service_engine.get_ready_future.return_value = ready_future
+        hello = asyncio.ensure_future(inner_task.hello())
+
+        # Not ready until the reward calculator gets ready
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert not hello.done()
+        assert startup_timer.get(StartupPhase.READY) is None
+
+        ready_future.set_result(None)
+        assert loop.run_until_complete(hello) == {}
+        assert startup_timer.get(StartupPhase.READY) > 0
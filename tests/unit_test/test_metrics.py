@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from iconservice.metrics import Phase, Counter, Histogram, Metrics, MetricsExporter, StartupPhase, StartupTimer
+
+
+def _get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestHistogram:
+    def test_observe(self):
+        histogram = Histogram([10, 100, 1000])
+
+        # 5us, 10us, 50us, 2ms
+        for duration in (0.000005, 0.00001, 0.00005, 0.002):
+            histogram.observe(duration)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == 5 + 10 + 50 + 2000
+        assert snapshot["max"] == 2000
+        # Cumulative and the last one is the number of all values
+        assert snapshot["buckets"] == [2, 3, 3, 4]
+
+    def test_snapshot_empty(self):
+        snapshot = Histogram([10, 100]).snapshot()
+        assert snapshot == {"count": 0, "sum": 0, "max": 0, "buckets": [0, 0, 0]}
+
+
+class TestMetrics:
+    def test_measure(self):
+        metrics = Metrics()
+
+        with metrics.measure(Phase.INVOKE):
+            pass
+        with pytest.raises(ValueError):
+            with metrics.measure(Phase.INVOKE):
+                raise ValueError()
+        metrics.observe(Phase.COMMIT, 0.5)
+        metrics.increase(Counter.ROLLBACKS)
+        metrics.increase(Counter.FAILED_TRANSACTIONS, 3)
+
+        ret = metrics.get_metrics()
+        assert ret["enable"]
+        assert set(ret["phases"]) == set(Phase.ALL)
+        assert ret["phases"][Phase.INVOKE]["count"] == 2
+        assert ret["phases"][Phase.COMMIT]["sum"] == 500_000
+        assert ret["phases"][Phase.TX]["count"] == 0
+        assert ret["counters"][Counter.ROLLBACKS] == 1
+        assert ret["counters"][Counter.FAILED_TRANSACTIONS] == 3
+        assert ret["counters"][Counter.ALREADY_INVOKED_BLOCKS] == 0
+        assert len(ret["phases"][Phase.INVOKE]["buckets"]) == len(ret["bounds"]) + 1
+
+    def test_disabled(self):
+        metrics = Metrics(enable=False)
+
+        with metrics.measure(Phase.INVOKE):
+            pass
+        metrics.observe(Phase.COMMIT, 0.5)
+        metrics.increase(Counter.ROLLBACKS)
+
+        ret = metrics.get_metrics()
+        assert not ret["enable"]
+        for phase in Phase.ALL:
+            assert ret["phases"][phase]["count"] == 0
+        for counter in Counter.ALL:
+            assert ret["counters"][counter] == 0
+
+    def test_get_metrics_with_filter(self):
+        metrics = Metrics()
+        ret = metrics.get_metrics([Phase.INVOKE, Phase.COMMIT, "unknown"])
+        assert set(ret["phases"]) == {Phase.INVOKE, Phase.COMMIT}
+
+    def test_to_prometheus(self):
+        metrics = Metrics()
+        metrics.observe(Phase.INVOKE, 0.00002)
+        metrics.observe(Phase.INVOKE, 3)
+        metrics.increase(Counter.ROLLBACKS)
+
+        lines = metrics.to_prometheus().splitlines()
+        assert "# TYPE iconservice_phase_duration_seconds histogram" in lines
+        assert 'iconservice_phase_duration_seconds_bucket{phase="invoke",le="0.00001"} 0' in lines
+        assert 'iconservice_phase_duration_seconds_bucket{phase="invoke",le="0.000025"} 1' in lines
+        assert 'iconservice_phase_duration_seconds_bucket{phase="invoke",le="2.5"} 1' in lines
+        assert 'iconservice_phase_duration_seconds_bucket{phase="invoke",le="5"} 2' in lines
+        assert 'iconservice_phase_duration_seconds_bucket{phase="invoke",le="+Inf"} 2' in lines
+        assert 'iconservice_phase_duration_seconds_sum{phase="invoke"} 3.00002' in lines
+        assert 'iconservice_phase_duration_seconds_count{phase="invoke"} 2' in lines
+        assert 'iconservice_phase_duration_seconds_count{phase="commit"} 0' in lines
+        assert "# TYPE iconservice_rollbacks_total counter" in lines
+        assert "iconservice_rollbacks_total 1" in lines
+        assert "iconservice_failed_transactions_total 0" in lines
+
+    def test_startup(self):
+        startup_timer = StartupTimer()
+        startup_timer.observe(StartupPhase.OPEN, 1.5)
+        startup_timer.observe(StartupPhase.OPEN_DB, 0.25)
+        metrics = Metrics(enable=False, startup_timer=startup_timer)
+
+        # Startup phases are exported even if metrics are disabled
+        assert metrics.get_metrics()["startup"] == {StartupPhase.OPEN_DB: 250_000, StartupPhase.OPEN: 1_500_000}
+        lines = metrics.to_prometheus().splitlines()
+        assert 'iconservice_startup_phase_duration_seconds{phase="openDb"} 0.25' in lines
+        assert 'iconservice_startup_phase_duration_seconds{phase="open"} 1.5' in lines
+
+        assert Metrics().get_metrics()["startup"] == {}
+
+
+class TestStartupTimer:
+    def test_measure(self):
+        startup_timer = StartupTimer()
+        assert startup_timer.get(StartupPhase.LOAD_PREPS) is None
+
+        def load_preps():
+            with startup_timer.measure(StartupPhase.LOAD_PREPS):
+                pass
+
+        thread = threading.Thread(target=load_preps)
+        thread.start()
+        with startup_timer.measure(StartupPhase.LOAD_BUILTIN_SCORES):
+            thread.join()
+
+        assert startup_timer.get(StartupPhase.LOAD_PREPS) >= 0
+        # Phases are in the order of StartupPhase.ALL
+        assert list(startup_timer.to_dict()) == [StartupPhase.LOAD_PREPS, StartupPhase.LOAD_BUILTIN_SCORES]
+
+    def test_mark(self):
+        startup_timer = StartupTimer()
+        startup_timer.mark(StartupPhase.READY)
+        ready: float = startup_timer.get(StartupPhase.READY)
+        assert ready >= 0
+
+        # Only the first one is recorded
+        startup_timer.mark(StartupPhase.READY)
+        assert startup_timer.get(StartupPhase.READY) == ready
+
+
+class TestMetricsExporter:
+    @pytest.fixture
+    def metrics(self):
+        metrics = Metrics()
+        metrics.observe(Phase.COMMIT, 0.001)
+        return metrics
+
+    def test_write_file(self, metrics, tmp_path):
+        path = str(tmp_path / "metrics.prom")
+        exporter = MetricsExporter(metrics, file_path=path, interval=60)
+        exporter.start()
+        exporter.stop()
+
+        # The file is written on stop even before the interval passes
+        with open(path) as f:
+            assert f.read() == metrics.to_prometheus()
+        assert not (tmp_path / "metrics.prom.tmp").exists()
+
+    def test_http_endpoint(self, metrics):
+        exporter = MetricsExporter(metrics, port=_get_free_port())
+        exporter.start()
+        try:
+            url = f"http://127.0.0.1:{exporter.port}"
+            with urllib.request.urlopen(f"{url}/metrics") as response:
+                assert response.status == 200
+                assert response.read().decode() == metrics.to_prometheus()
+
+            with pytest.raises(urllib.error.HTTPError) as e:
+                urllib.request.urlopen(f"{url}/unknown")
+            assert e.value.code == 404
+        finally:
+            exporter.stop()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from iconservice.base.block import Block
+from iconservice.base.exception import InvalidParamsException
+from iconservice.sampling_profiler import SamplingProfiler
+from tests import create_block_hash
+
+
+def _busy_loop(seconds: float):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+def _make_block(height: int) -> 'Block':
+    return Block(height, create_block_hash(), 0, create_block_hash(), 0)
+
+
+@pytest.fixture
+def profiler():
+    profiler = SamplingProfiler()
+    yield profiler
+    profiler.stop()
+
+
+def _read_profiles(tmp_path) -> dict:
+    profile_dir = tmp_path / SamplingProfiler.DIR_NAME
+    if not profile_dir.exists():
+        return {}
+    return {path.name: path.read_text() for path in profile_dir.iterdir()}
+
+
+def test_disabled(profiler, tmp_path):
+    with profiler.profile(_make_block(0)):
+        pass
+
+    assert not profiler.enable
+    assert profiler._thread is None
+    assert _read_profiles(tmp_path) == {}
+
+
+def test_blocks(profiler, tmp_path):
+    profiler.start(str(tmp_path), blocks=2, interval_ms=1)
+    assert profiler.enable
+
+    blocks = [_make_block(i) for i in range(3)]
+    for block in blocks:
+        with profiler.profile(block):
+            _busy_loop(0.05)
+
+    assert not profiler.enable
+    assert profiler.get_status()["written"] == 2
+
+    profiles: dict = _read_profiles(tmp_path)
+    assert len(profiles) == 2
+    for block in blocks[:2]:
+        name: str = next(name for name in profiles if name.startswith(f"{block.height}-{block.hash.hex()[:8]}-"))
+        lines = profiles[name].splitlines()
+        assert len(lines) > 0
+        for line in lines:
+            # Collapsed stack format: "root;...;leaf count"
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert ";" in stack
+        assert any("_busy_loop (" in line for line in lines)
+
+
+def test_threshold(profiler, tmp_path):
+    profiler.start(str(tmp_path), blocks=0, threshold_ms=30, interval_ms=1)
+
+    with profiler.profile(_make_block(0)):
+        pass
+    with profiler.profile(_make_block(1)):
+        _busy_loop(0.05)
+
+    profiles: dict = _read_profiles(tmp_path)
+    assert [name.split("-")[0] for name in profiles] == ["1"]
+
+    # No limit on the number of blocks
+    assert profiler.enable
+    profiler.stop()
+    assert not profiler.enable
+
+
+def test_profile_other_thread(profiler, tmp_path):
+    """Only the thread which invokes a block is sampled
+    """
+    stop_event = threading.Event()
+
+    def _spin():
+        while not stop_event.is_set():
+            pass
+
+    thread = threading.Thread(target=_spin)
+    thread.start()
+    try:
+        profiler.start(str(tmp_path), interval_ms=1)
+        with profiler.profile(_make_block(0)):
+            _busy_loop(0.05)
+    finally:
+        stop_event.set()
+        thread.join()
+
+    text: str = "".join(_read_profiles(tmp_path).values())
+    assert "_busy_loop (" in text
+    assert "_spin (" not in text
+
+
+def test_stop_with_long_interval(profiler, tmp_path):
+    profiler.start(str(tmp_path), blocks=0, threshold_ms=1, interval_ms=60_000)
+    thread = profiler._thread
+    with profiler.profile(_make_block(0)):
+        _busy_loop(0.05)
+
+    # The sampler thread waiting for the next sample exits on stop() without waiting for the interval
+    start = time.monotonic()
+    profiler.stop()
+    assert time.monotonic() - start < SamplingProfiler.JOIN_TIMEOUT
+    assert not thread.is_alive()
+    assert profiler.get_status()["written"] == 1
+
+
+@pytest.mark.parametrize("blocks,threshold_ms,interval_ms", [(-1, 0, 5), (1, -1, 5), (1, 0, 0), (0, 0, 5)])
+def test_invalid_params(profiler, tmp_path, blocks, threshold_ms, interval_ms):
+    with pytest.raises(InvalidParamsException):
+        profiler.start(str(tmp_path), blocks=blocks, threshold_ms=threshold_ms, interval_ms=interval_ms)
+    assert not profiler.enable
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+import pytest
+
+from iconservice.base.block import Block
+from iconservice.base.transaction import Transaction
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.tx_result_stream import TxResultStream
+from tests import create_block_hash, create_tx_hash
+
+CHUNK_SIZE = 3
+CHUNK_INTERVAL = 50
+
+
+@pytest.fixture
+def block():
+    return Block(10, create_block_hash(), 0, create_block_hash(), 0)
+
+
+@pytest.fixture
+def tx_results(block):
+    return [
+        TransactionResult(Transaction(create_tx_hash(), i), block, status=TransactionResult.SUCCESS)
+        for i in range(7)
+    ]
+
+
+@pytest.fixture
+def monotonic(mocker):
+    return mocker.patch("iconservice.tx_result_stream.time.monotonic", return_value=0.0)
+
+
+def test_append_with_chunk_size(block, tx_results, monotonic):
+    send = Mock()
+    stream = TxResultStream(block, send, CHUNK_SIZE, CHUNK_INTERVAL)
+
+    for tx_result in tx_results:
+        stream.append(tx_result)
+    assert send.call_count == 2
+
+    stream.flush()
+    assert send.call_count == 3
+    assert stream.chunk_count == 3
+    assert stream.tx_result_count == len(tx_results)
+
+    chunks = [call[0][0] for call in send.call_args_list]
+    for i, chunk in enumerate(chunks):
+        assert chunk["blockHeight"] == hex(block.height)
+        assert chunk["blockHash"] == block.hash.hex()
+        assert chunk["sequence"] == hex(i)
+    assert [tx_result for chunk in chunks for tx_result in chunk["txResults"]] == \
+        [tx_result.to_response_dict() for tx_result in tx_results]
+
+    # Nothing is sent if there is no tx_result left
+    stream.flush()
+    assert send.call_count == 3
+
+
+def test_append_with_chunk_interval(block, tx_results, monotonic):
+    send = Mock()
+    stream = TxResultStream(block, send, CHUNK_SIZE, CHUNK_INTERVAL)
+
+    stream.append(tx_results[0])
+    send.assert_not_called()
+
+    monotonic.return_value = CHUNK_INTERVAL / 1000
+    stream.append(tx_results[1])
+    send.assert_called_once()
+    assert len(send.call_args[0][0]["txResults"]) == 2
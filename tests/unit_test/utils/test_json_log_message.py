@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from iconservice.base.address import Address
+from iconservice.utils import JSONLogMessage
+
+
+def test_json_log_message():
+    address = Address.from_string(f"hx{'1' * 40}")
+    value = {"txHash": b"\x01\x02", "to": address, "values": [1, "a", None]}
+    message = JSONLogMessage("INVOKE: ", value, 1024)
+
+    expected = {"txHash": "0x0102", "to": str(address), "values": [1, "a", None]}
+    assert str(message) == f"INVOKE: {json.dumps(expected)}"
+
+
+def test_json_log_message_truncated():
+    value = {"txResults": [{"status": "0x1"}] * 10_000}
+    message = JSONLogMessage("INVOKE: ", value, 100)
+
+    text = str(message)
+    assert text.startswith('INVOKE: {"txResults": [{"status": "0x1"}')
+    assert text.endswith("... (truncated)")
+    assert len(text) == len("INVOKE: ") + 100 + len("... (truncated)")
@@ -0,0 +1,33 @@
+import argparse
+from argparse import ArgumentParser
+
+from tools.block_replay.commands.compare import Compare
+from tools.block_replay.commands.generate import Generate
+from tools.block_replay.commands.run import Run
+from tools.block_replay.commands.startup import Startup
+
+
+def get_parser() -> 'ArgumentParser':
+    parser = argparse.ArgumentParser(prog="block_replay", description="Offline block replay benchmark")
+    common_parser = _get_common_parser()
+    _set_sub_parser(parser, common_parser)
+    return parser
+
+
+def _get_common_parser() -> 'ArgumentParser':
+    common_parser = argparse.ArgumentParser(add_help=False)
+    common_parser.add_argument("-v", "--verbose",
+                               dest="verbose",
+                               help="Print the details such as failed transactions",
+                               action='store_true',
+                               default=False)
+
+    return common_parser
+
+
+def _set_sub_parser(parser, common_parser):
+    sub_parser = parser.add_subparsers(description="", help="")
+    Generate.add_command(sub_parser, common_parser=common_parser)
+    Run.add_command(sub_parser, common_parser=common_parser)
+    Compare.add_command(sub_parser, common_parser=common_parser)
+    Startup.add_command(sub_parser, common_parser=common_parser)
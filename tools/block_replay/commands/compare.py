@@ -0,0 +1,60 @@
+from typing import Optional, Tuple
+
+from tools.block_replay.report.report import Report, PERCENTILES
+
+
+class Compare:
+    NAME = "compare"
+    HELP_MSG = "Compare the state root hashes and performance of two reports"
+
+    @classmethod
+    def _get_parents(cls, common_parser) -> list:
+        parents: list = []
+        if common_parser is not None:
+            parents.append(common_parser)
+        return parents
+
+    @classmethod
+    def add_command(cls, sub_parser, *, common_parser=None):
+        parents: list = cls._get_parents(common_parser)
+        compare_parser = sub_parser.add_parser(cls.NAME, parents=parents, help=Compare.HELP_MSG)
+        compare_parser.add_argument("path", nargs=2, type=str, help="Report file paths: base and target")
+        compare_parser.set_defaults(func=cls.run)
+
+    @classmethod
+    def run(cls, args):
+        base: 'Report' = Report.load(args.path[0])
+        target: 'Report' = Report.load(args.path[1])
+
+        print(f"iconservice: {base.version} -> {target.version}")
+        print(f"TPS: {base.tps:.1f} -> {target.tps:.1f} ({cls._format_change(base.tps, target.tps)})")
+
+        columns = tuple(f"p{p}" for p in PERCENTILES)
+        print("{:<12}".format("phase(ms)") + "".join("{:>28}".format(column) for column in columns))
+        for phase, stats in base.phases.items():
+            target_stats: Optional[dict] = target.phases.get(phase)
+            if target_stats is None:
+                continue
+
+            values = []
+            for column in columns:
+                change: str = cls._format_change(stats[column], target_stats[column])
+                values.append(f"{stats[column]:.3f} -> {target_stats[column]:.3f} ({change})")
+            print("{:<12}".format(phase) + "".join("{:>28}".format(value) for value in values))
+
+        if base.failures != target.failures:
+            print(f"Failures: {base.failures} -> {target.failures}")
+
+        mismatch: Optional[Tuple[list, Optional[list]]] = base.find_state_root_mismatch(target)
+        if mismatch is None and len(base.state_root_hashes) == len(target.state_root_hashes):
+            print(f"State root hashes: {len(base.state_root_hashes)} blocks matched")
+        else:
+            if mismatch is None:
+                mismatch = None, target.state_root_hashes[len(base.state_root_hashes)]
+            raise Exception(f"State root hash mismatch: [height, hash, state root hash] {mismatch[0]} != {mismatch[1]}")
+
+    @staticmethod
+    def _format_change(base: float, target: float) -> str:
+        if base == 0:
+            return "n/a"
+        return f"{(target - base) / base * 100:+.1f}%"
@@ -0,0 +1,57 @@
+from iconservice.icon_constant import Revision
+from tools.block_replay.workload.generator import WorkloadGenerator, DEFAULT_GOVERNANCE_PATH, DEFAULT_TOKEN_PATH
+from tools.block_replay.workload.workload_file import write_requests
+
+
+class Generate:
+    NAME = "generate"
+    HELP_MSG = "Generate the blocks of a synthetic workload into a file"
+
+    @classmethod
+    def _get_parents(cls, common_parser) -> list:
+        parents: list = []
+        if common_parser is not None:
+            parents.append(common_parser)
+        return parents
+
+    @classmethod
+    def add_command(cls, sub_parser, *, common_parser=None):
+        parents: list = cls._get_parents(common_parser)
+        generate_parser = sub_parser.add_parser(cls.NAME, parents=parents, help=Generate.HELP_MSG)
+        generate_parser.add_argument("path", type=str, help="Output file path")
+        cls.add_workload_arguments(generate_parser)
+        generate_parser.set_defaults(func=cls.run)
+
+    @classmethod
+    def add_workload_arguments(cls, parser, required: bool = True):
+        parser.add_argument("-w", "--workload",
+                            dest="workloads",
+                            nargs="+",
+                            choices=WorkloadGenerator.WORKLOADS,
+                            required=required,
+                            help="Transactions mixed at random")
+        parser.add_argument("-b", "--blocks", type=int, default=100, help="The number of blocks to measure")
+        parser.add_argument("-t", "--txs", type=int, default=100, help="The number of transactions in a block")
+        parser.add_argument("-a", "--accounts", type=int, default=1000, help="The number of accounts")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+        parser.add_argument("--revision", type=int, default=Revision.LATEST.value, help="Revision")
+        parser.add_argument("--governance", type=str, default=DEFAULT_GOVERNANCE_PATH,
+                            help="Governance SCORE package which supports setRevision")
+        parser.add_argument("--token", type=str, default=DEFAULT_TOKEN_PATH,
+                            help="Token SCORE package for token and deploy workloads")
+
+    @classmethod
+    def create_generator(cls, args) -> 'WorkloadGenerator':
+        return WorkloadGenerator(args.workloads,
+                                 blocks=args.blocks,
+                                 txs=args.txs,
+                                 accounts=args.accounts,
+                                 seed=args.seed,
+                                 revision=args.revision,
+                                 governance_path=args.governance,
+                                 token_path=args.token)
+
+    @classmethod
+    def run(cls, args):
+        count: int = write_requests(args.path, cls.create_generator(args).run())
+        print(f"{count} blocks have been written to {args.path}")
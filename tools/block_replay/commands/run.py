@@ -0,0 +1,117 @@
+import copy
+import os
+import shutil
+import tempfile
+import time
+from typing import Iterable
+
+from iconcommons.icon_config import IconConfig
+from iconcommons.logger import Logger
+
+from iconservice.icon_config import default_icon_config
+from iconservice.icon_constant import ConfigKey
+from tools.block_replay.commands.generate import Generate
+from tools.block_replay.replayer.replayer import Replayer
+from tools.block_replay.report.report import Report
+from tools.block_replay.workload.generator import ADMIN
+from tools.block_replay.workload.workload_file import read_requests
+
+
+class Run:
+    NAME = "run"
+    HELP_MSG = "Replay blocks against a scratch state DB and report throughput, latencies and state root hashes"
+
+    @classmethod
+    def _get_parents(cls, common_parser) -> list:
+        parents: list = []
+        if common_parser is not None:
+            parents.append(common_parser)
+        return parents
+
+    @classmethod
+    def add_command(cls, sub_parser, *, common_parser=None):
+        parents: list = cls._get_parents(common_parser)
+        run_parser = sub_parser.add_parser(cls.NAME, parents=parents, help=Run.HELP_MSG)
+        run_parser.add_argument("path", type=str, nargs="?", default=None,
+                                help="Block file path. A synthetic workload is generated without it")
+        Generate.add_workload_arguments(run_parser, required=False)
+        run_parser.add_argument("-c", "--config", type=str, default="", help="iconservice configuration file path")
+        run_parser.add_argument("-o", "--output", type=str, default=None, help="Report file path")
+        run_parser.add_argument("--work-dir", type=str, default=None,
+                                help="Directory for state DB and SCOREs, which is removed after the run if not given")
+        run_parser.add_argument("--calc-period", type=int, default=None,
+                                help="I-Score calculation and term period in blocks")
+        run_parser.add_argument("--rc-latency", type=float, default=0.0,
+                                help="Seconds for the simulated reward calculator to wait before replying")
+        run_parser.add_argument("--log-level", type=str, default="warning", help="Log level of iconservice")
+        run_parser.set_defaults(func=cls.run)
+
+    @classmethod
+    def run(cls, args):
+        if args.path is None and args.workloads is None:
+            raise Exception("Either block file path or --workload is required")
+
+        work_dir: str = args.work_dir if args.work_dir else tempfile.mkdtemp(prefix="block_replay_")
+        conf: dict = cls._make_config(args, work_dir)
+        Logger.load_config(conf)
+
+        if args.path is None:
+            requests: Iterable[dict] = Generate.create_generator(args).run()
+            workload = {
+                "workloads": args.workloads,
+                "blocks": args.blocks,
+                "txs": args.txs,
+                "accounts": args.accounts,
+                "seed": args.seed,
+                "revision": args.revision
+            }
+        else:
+            requests: Iterable[dict] = read_requests(args.path)
+            workload = {"path": args.path}
+
+        replayer = Replayer(conf, rc_latency=args.rc_latency, verbose=args.verbose)
+        start: float = time.monotonic()
+        try:
+            replayer.open()
+            report: 'Report' = replayer.run(requests)
+        finally:
+            replayer.close()
+            if not args.work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        workload["elapsed"] = time.monotonic() - start
+        report.workload = workload
+        report.print()
+
+        if args.output:
+            report.save(args.output)
+
+    @classmethod
+    def _make_config(cls, args, work_dir: str) -> dict:
+        conf = IconConfig(args.config, copy.deepcopy(default_icon_config))
+        conf.update_conf({
+            ConfigKey.BUILTIN_SCORE_OWNER: str(ADMIN),
+            ConfigKey.LOG: {
+                ConfigKey.LOG_LEVEL: args.log_level,
+                "outputType": "console"
+            }
+        })
+        if args.calc_period is not None:
+            conf.update_conf({
+                ConfigKey.IISS_CALCULATE_PERIOD: args.calc_period,
+                ConfigKey.TERM_PERIOD: args.calc_period
+            })
+        conf.load()
+
+        # The state is always made from scratch in work_dir
+        conf.update_conf({
+            ConfigKey.SCORE_ROOT_PATH: os.path.join(work_dir, ".score"),
+            ConfigKey.STATE_DB_ROOT_PATH: os.path.join(work_dir, ".statedb"),
+            # The unix domain socket path for the reward calculator is made of it
+            ConfigKey.AMQP_KEY: f"block_replay_{os.getpid()}",
+            ConfigKey.LOG: {
+                ConfigKey.LOG_FILE_PATH: os.path.join(work_dir, "log", "iconservice.log")
+            }
+        })
+
+        return conf
@@ -0,0 +1,125 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from iconcommons.logger import Logger
+
+from iconservice.metrics import StartupPhase
+from tools.block_replay.commands.run import Run
+from tools.block_replay.replayer.replayer import Replayer
+
+# Interpreter start and imports before IconServiceEngine.open()
+BOOT = "boot"
+# From the process start until the engine is ready to invoke a block
+TIME_TO_READY = "timeToReady"
+
+_RESULT_PREFIX = "STARTUP_RESULT "
+
+
+class Startup:
+    NAME = "startup"
+    HELP_MSG = "Measure the time to open the state made by run --work-dir until it is ready to invoke a block"
+
+    @classmethod
+    def _get_parents(cls, common_parser) -> list:
+        parents: list = []
+        if common_parser is not None:
+            parents.append(common_parser)
+        return parents
+
+    @classmethod
+    def add_command(cls, sub_parser, *, common_parser=None):
+        parents: list = cls._get_parents(common_parser)
+        startup_parser = sub_parser.add_parser(cls.NAME, parents=parents, help=Startup.HELP_MSG)
+        startup_parser.add_argument("work_dir", type=str, help="Directory given to run --work-dir")
+        startup_parser.add_argument("-c", "--config", type=str, default="",
+                                    help="iconservice configuration file path")
+        startup_parser.add_argument("-n", "--repeat", type=int, default=5,
+                                    help="The number of processes to start")
+        startup_parser.add_argument("--target", type=float, default=1.0,
+                                    help="Target time to ready in seconds")
+        startup_parser.add_argument("--calc-period", type=int, default=None,
+                                    help="I-Score calculation and term period in blocks")
+        startup_parser.add_argument("--log-level", type=str, default="warning", help="Log level of iconservice")
+        startup_parser.add_argument("--once", action="store_true", default=False, help=argparse.SUPPRESS)
+        startup_parser.set_defaults(func=cls.run)
+
+    @classmethod
+    def run(cls, args):
+        if not os.path.isdir(os.path.join(args.work_dir, ".statedb")):
+            raise Exception(f"No state DB in {args.work_dir}: make it with run --work-dir first")
+
+        if args.once:
+            cls._run_once(args)
+            return
+
+        samples: Dict[str, List[float]] = {}
+        for _ in range(args.repeat):
+            for phase, duration in cls._start_process(args).items():
+                samples.setdefault(phase, []).append(duration)
+
+        cls._print(samples, args.repeat)
+
+        time_to_ready: float = statistics.median(samples[TIME_TO_READY])
+        passed: bool = time_to_ready <= args.target
+        print(f"Target: time to ready <= {args.target * 1000:.1f}ms: {'PASS' if passed else 'FAIL'}")
+        if not passed:
+            raise Exception(f"Time to ready {time_to_ready * 1000:.1f}ms exceeds the target")
+
+    @classmethod
+    def _start_process(cls, args) -> Dict[str, float]:
+        """Starts a process which opens the state and returns the duration of each phase in seconds
+        """
+        command: List[str] = [
+            sys.executable, "-m", "tools.block_replay", cls.NAME, args.work_dir, "--once",
+            "--log-level", args.log_level
+        ]
+        if args.config:
+            command.extend(("-c", args.config))
+        if args.calc_period is not None:
+            command.extend(("--calc-period", str(args.calc_period)))
+
+        spawned: float = time.time()
+        output: str = subprocess.run(command, stdout=subprocess.PIPE, check=True).stdout.decode()
+        lines: List[str] = [line for line in output.splitlines() if line.startswith(_RESULT_PREFIX)]
+        if len(lines) == 0:
+            raise Exception(f"No result from the process: {output}")
+
+        result: dict = json.loads(lines[-1][len(_RESULT_PREFIX):])
+        boot: float = result["start"] - spawned
+        durations: Dict[str, float] = {BOOT: boot}
+        durations.update((phase, duration / 1_000_000) for phase, duration in result["phases"].items())
+        durations[TIME_TO_READY] = boot + durations[StartupPhase.READY]
+
+        return durations
+
+    @classmethod
+    def _run_once(cls, args):
+        conf: dict = Run._make_config(args, args.work_dir)
+        Logger.load_config(conf)
+
+        start: float = time.time()
+        replayer = Replayer(conf)
+        try:
+            replayer.open()
+            phases: Dict[str, int] = replayer.startup_timer.to_dict()
+        finally:
+            replayer.close()
+
+        print(f"{_RESULT_PREFIX}{json.dumps({'start': start, 'phases': phases})}", flush=True)
+
+    @staticmethod
+    def _print(samples: Dict[str, List[float]], repeat: int):
+        print(f"Processes = {repeat}")
+        print("{:<20}{:>10}{:>10}{:>10}".format("phase(ms)", "median", "min", "max"))
+        for phase in (BOOT,) + StartupPhase.ALL + (TIME_TO_READY,):
+            values: List[float] = samples.get(phase)
+            if not values:
+                continue
+            print("{:<20}{:>10.1f}{:>10.1f}{:>10.1f}".format(
+                phase, statistics.median(values) * 1000, min(values) * 1000, max(values) * 1000))
@@ -0,0 +1,91 @@
+import functools
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Callable
+
+CONVERT = "convert"
+INVOKE = "invoke"
+BEFORE_TX = "before_tx"
+INVOKE_LOOP = "invoke_loop"
+AFTER_TX = "after_tx"
+COMMIT = "commit"
+WAL = "wal"
+BACKUP = "backup"
+RC_WRITE = "rc_write"
+STATE_WRITE = "state_write"
+
+PHASES = (CONVERT, INVOKE, BEFORE_TX, INVOKE_LOOP, AFTER_TX, COMMIT, WAL, BACKUP, RC_WRITE, STATE_WRITE)
+
+
+class PhaseTimer(object):
+    """Measures the time spent in each phase of invoke and commit per block
+
+    The phases inside IconServiceEngine are measured by wrapping its methods on the instance.
+    invoke_loop is the time between the end of before_tx and the start of after_tx.
+    """
+
+    def __init__(self):
+        # phase -> the elapsed time of each block in seconds
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._block: Dict[str, float] = {}
+        self._before_tx_end: float = 0.0
+
+    @property
+    def samples(self) -> Dict[str, List[float]]:
+        return self._samples
+
+    def install(self, engine):
+        """Wraps the methods of a given IconServiceEngine which has been opened
+        """
+        self._wrap(engine, "_before_transaction_process", BEFORE_TX)
+        self._wrap(engine, "_after_transaction_process", AFTER_TX)
+        self._wrap(engine, "_process_wal", WAL)
+        self._wrap(engine, "_process_iiss_commit", RC_WRITE)
+        self._wrap(engine, "_process_state_commit", STATE_WRITE)
+        self._wrap(engine._backup_manager, "run", BACKUP)
+
+    def _wrap(self, obj, name: str, phase: str):
+        func: Callable = getattr(obj, name)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start: float = time.perf_counter()
+            if phase == AFTER_TX:
+                self._add(INVOKE_LOOP, start - self._before_tx_end)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end: float = time.perf_counter()
+                self._add(phase, end - start)
+                if phase == BEFORE_TX:
+                    self._before_tx_end = end
+
+        setattr(obj, name, wrapper)
+
+    @contextmanager
+    def measure(self, phase: str):
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(phase, time.perf_counter() - start)
+
+    def _add(self, phase: str, elapsed: float):
+        self._block[phase] = self._block.get(phase, 0.0) + elapsed
+
+    def start_block(self):
+        self._block.clear()
+
+    def end_block(self, measured: bool = True) -> Dict[str, float]:
+        """
+        :param measured: whether to keep the elapsed times of the current block
+        :return: the elapsed time of each phase in the current block
+        """
+        block: Dict[str, float] = dict(self._block)
+        if measured:
+            for phase, elapsed in block.items():
+                self._samples[phase].append(elapsed)
+
+        self._block.clear()
+        return block
@@ -0,0 +1,136 @@
+import asyncio
+import os
+import threading
+from typing import Iterable, Optional, List
+
+from iconservice.base.block import Block
+from iconservice.base.type_converter import TypeConverter
+from iconservice.base.type_converter_templates import ParamType
+from iconservice.icon_config import ConfigKey
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from iconservice.iiss.reward_calc.ipc.simulator import RewardCalcSimulator
+from iconservice.metrics import StartupPhase, StartupTimer
+from tools.block_replay.replayer.phase_timer import PhaseTimer, CONVERT, INVOKE, COMMIT
+from tools.block_replay.report.report import Report
+from tools.block_replay.workload.generator import SETUP_KEY
+
+
+async def _wait(future):
+    return await future
+
+
+class Replayer(object):
+    """Drives open -> invoke -> commit of IconServiceEngine in-process
+
+    The reward calculator is replaced with RewardCalcSimulator which speaks the same IPC protocol
+    over the unix domain socket, so the IPC messages to the reward calculator are included in the measurement.
+    """
+
+    def __init__(self, conf: dict, rc_latency: float = 0.0, verbose: bool = False):
+        """
+        :param conf: iconservice configuration
+        :param rc_latency: seconds for the simulated reward calculator to wait before replying to each request
+        :param verbose: print the failure of each transaction
+        """
+        self._conf = conf
+        self._timeout: float = conf[ConfigKey.IPC_TIMEOUT]
+        self._verbose = verbose
+
+        self._engine: Optional['IconServiceEngine'] = None
+        self._simulator = RewardCalcSimulator(latency=rc_latency)
+        self._sock_path: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._timer = PhaseTimer()
+
+    @property
+    def startup_timer(self) -> 'StartupTimer':
+        return self._engine.startup_timer
+
+    def open(self):
+        # RewardCalcProxy opens IPCServer on the event loop of the current thread
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        def start_reward_calc(_proxy, log_dir: str, sock_path: str, iiss_db_path: str, icon_rc_monitor: bool):
+            self._sock_path = sock_path
+            self._simulator.start(sock_path, timeout=self._timeout)
+
+        origin = RewardCalcProxy.start_reward_calc
+        RewardCalcProxy.start_reward_calc = start_reward_calc
+        try:
+            self._engine = IconServiceEngine()
+            self._engine.open(self._conf)
+        finally:
+            RewardCalcProxy.start_reward_calc = origin
+
+        self._thread = threading.Thread(target=self._loop.run_forever, name="BlockReplayLoop", daemon=True)
+        self._thread.start()
+
+        asyncio.run_coroutine_threadsafe(_wait(self._engine.get_ready_future()), self._loop).result(self._timeout)
+        self._engine.hello()
+        self._engine.startup_timer.mark(StartupPhase.READY)
+
+        self._timer.install(self._engine)
+
+    def close(self):
+        # Close the engine with the event loop running to finish the IPC messages in progress
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = None
+
+        self._simulator.stop()
+
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(self._timeout)
+            self._thread = None
+            self._loop.close()
+
+        if self._sock_path is not None and os.path.exists(self._sock_path):
+            os.remove(self._sock_path)
+
+    def run(self, requests: Iterable[dict]) -> 'Report':
+        """
+        :param requests: the invoke requests of blocks in the same format as loopchain sends
+        :return: report
+        """
+        report = Report()
+
+        for request in requests:
+            setup: bool = request.pop(SETUP_KEY, False)
+            self._timer.start_block()
+
+            with self._timer.measure(CONVERT):
+                params: dict = TypeConverter.convert(request, ParamType.INVOKE)
+                block: 'Block' = Block.from_dict(params["block"])
+
+            with self._timer.measure(INVOKE):
+                tx_results, state_root_hash, _, _, _ = self._engine.invoke(
+                    block=block,
+                    tx_requests=params["transactions"],
+                    prev_block_generator=params.get("prevBlockGenerator"),
+                    prev_block_validators=params.get("prevBlockValidators"),
+                    prev_block_votes=params.get("prevBlockVotes"),
+                    is_block_editable=params.get("isBlockEditable", False))
+
+            with self._timer.measure(COMMIT):
+                self._engine.commit(block.height, block.hash, block.hash)
+
+            self._timer.end_block(measured=not setup)
+
+            failures: List[str] = [
+                f"txHash=0x{tx_result.tx_hash.hex()} code={tx_result.failure.code} {tx_result.failure.message}"
+                for tx_result in tx_results if tx_result.status == 0
+            ]
+            if setup and len(failures) > 0:
+                raise Exception(f"Failed to set up a workload: block={block.height} {failures[0]}")
+            if self._verbose:
+                for failure in failures:
+                    print(f"Failure: block={block.height} {failure}")
+
+            report.add_block(block, state_root_hash, len(tx_results), len(failures), measured=not setup)
+
+        report.set_samples(self._timer.samples)
+        return report
@@ -0,0 +1,135 @@
+import json
+import math
+import time
+from typing import List, Dict, Optional, Tuple
+
+from iconservice import __version__
+from iconservice.base.block import Block
+from tools.block_replay.replayer.phase_timer import PHASES, CONVERT, INVOKE, COMMIT
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values: List[float], p: int) -> float:
+    """Nearest-rank percentile of values sorted in ascending order
+    """
+    if len(values) == 0:
+        return 0.0
+
+    rank: int = max(1, math.ceil(p / 100 * len(values)))
+    return values[rank - 1]
+
+
+def summarize(samples: List[float]) -> dict:
+    """
+    :param samples: elapsed times in seconds
+    :return: statistics in milliseconds
+    """
+    values: List[float] = sorted(samples)
+    ret = {
+        "count": len(values),
+        "total": sum(values) * 1000,
+        "mean": sum(values) / len(values) * 1000 if len(values) > 0 else 0.0,
+    }
+    for p in PERCENTILES:
+        ret[f"p{p}"] = percentile(values, p) * 1000
+    ret["max"] = values[-1] * 1000 if len(values) > 0 else 0.0
+
+    return ret
+
+
+class Report(object):
+    """Throughput, per-phase latencies per block and state root hashes of a replay
+    """
+
+    def __init__(self):
+        self.version: str = __version__
+        self.created_at: int = int(time.time())
+        self.workload: dict = {}
+        # the number of blocks and transactions which are measured
+        self.blocks: int = 0
+        self.transactions: int = 0
+        self.failures: int = 0
+        # tx/s based on the sum of convert, invoke and commit times
+        self.tps: float = 0.0
+        self.phases: Dict[str, dict] = {}
+        # [[block height, block hash, state root hash], ...] of all blocks including setup blocks
+        self.state_root_hashes: List[list] = []
+
+    def add_block(self, block: 'Block', state_root_hash: bytes, transactions: int, failures: int, measured: bool):
+        self.state_root_hashes.append([block.height, f"0x{block.hash.hex()}", f"0x{state_root_hash.hex()}"])
+
+        if measured:
+            self.blocks += 1
+            self.transactions += transactions
+            self.failures += failures
+
+    def set_samples(self, samples: Dict[str, List[float]]):
+        self.phases = {phase: summarize(samples[phase]) for phase in PHASES if phase in samples}
+
+        elapsed: float = sum(self.phases[phase]["total"] for phase in (CONVERT, INVOKE, COMMIT)
+                             if phase in self.phases) / 1000
+        self.tps = self.transactions / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "createdAt": self.created_at,
+            "workload": self.workload,
+            "blocks": self.blocks,
+            "transactions": self.transactions,
+            "failures": self.failures,
+            "tps": self.tps,
+            "phases": self.phases,
+            "stateRootHashes": self.state_root_hashes
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Report':
+        report = Report()
+        report.version = data["version"]
+        report.created_at = data["createdAt"]
+        report.workload = data["workload"]
+        report.blocks = data["blocks"]
+        report.transactions = data["transactions"]
+        report.failures = data["failures"]
+        report.tps = data["tps"]
+        report.phases = data["phases"]
+        report.state_root_hashes = data["stateRootHashes"]
+        return report
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'Report':
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+    @property
+    def last_state_root_hash(self) -> Optional[str]:
+        return self.state_root_hashes[-1][2] if len(self.state_root_hashes) > 0 else None
+
+    def find_state_root_mismatch(self, other: 'Report') -> Optional[Tuple[list, Optional[list]]]:
+        """
+        :return: the first mismatched (this block, other block), None if all state root hashes are the same
+        """
+        for i, item in enumerate(self.state_root_hashes):
+            if i >= len(other.state_root_hashes):
+                return item, None
+            if item != other.state_root_hashes[i]:
+                return item, other.state_root_hashes[i]
+
+        return None
+
+    def print(self):
+        print(f"iconservice {self.version}")
+        print(f"Blocks = {self.blocks}, Transactions = {self.transactions}, Failures = {self.failures}")
+        print(f"TPS = {self.tps:.1f} tx/s")
+        print(f"Last state root hash = {self.last_state_root_hash}")
+
+        columns = ("mean",) + tuple(f"p{p}" for p in PERCENTILES) + ("max",)
+        print("{:<12}".format("phase(ms)") + "".join("{:>10}".format(column) for column in columns))
+        for phase, stats in self.phases.items():
+            print("{:<12}".format(phase) + "".join("{:>10.3f}".format(stats[column]) for column in columns))
@@ -0,0 +1,297 @@
+import io
+import os
+import random
+import zipfile
+from typing import List, Iterator, Optional, Dict
+
+from iconservice.base.address import (
+    Address, AddressPrefix, SYSTEM_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS, generate_score_address
+)
+from iconservice.icon_constant import Revision
+from iconservice.iiss.engine import Method as IISSMethod
+from iconservice.utils import sha3_256, icx_to_loop
+
+_SAMPLES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "tests", "integrate_test", "samples")
+
+DEFAULT_GOVERNANCE_PATH = os.path.normpath(
+    os.path.join(_SAMPLES_PATH, "sample_builtin", "latest_version", "governance"))
+DEFAULT_TOKEN_PATH = os.path.normpath(
+    os.path.join(_SAMPLES_PATH, "sample_deploy_scores", "install", "sample_token"))
+
+# Key to mark the blocks which prepare a workload. They are processed but not measured
+SETUP_KEY = "setup"
+
+TOTAL_SUPPLY = icx_to_loop(800_460_000)
+# 2020-09-13 12:26:40 UTC
+_START_TIMESTAMP = 1_600_000_000_000_000
+_BLOCK_INTERVAL = 2_000_000
+_SIGNATURE = "VAia7YZ2Ji6igKWzjR2YsGa2m53nKPrfK7uXYW78QLE+ATehAVZPC40szvAiA6NEU5gCYB4c4qaQzqDh2ugcHgA="
+
+_STEP_LIMIT = 10 ** 8
+_DEPLOY_STEP_LIMIT = 10 ** 12
+_TOKEN_SUPPLY = 10 ** 9
+_TOKEN_DECIMAL = 18
+
+
+def _create_address(name: str) -> 'Address':
+    return Address.from_data(AddressPrefix.EOA, name.encode())
+
+
+# The owner of builtin SCOREs which has the total supply on genesis
+ADMIN: 'Address' = _create_address("block_replay_admin")
+
+
+def zip_score(path: str) -> bytes:
+    """Compresses a SCORE package directory into a zip to deploy
+    """
+    buf = io.BytesIO()
+    parent_path: str = os.path.dirname(os.path.normpath(path))
+
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for root, dir_names, filenames in os.walk(path):
+            dir_names[:] = sorted(name for name in dir_names if name != "__pycache__" and not name.startswith("."))
+            for filename in sorted(filenames):
+                if filename.startswith("."):
+                    continue
+                full_path: str = os.path.join(root, filename)
+                # Fixed date_time makes the same zip from the same package
+                info = zipfile.ZipInfo(os.path.relpath(full_path, parent_path), date_time=(2020, 1, 1, 0, 0, 0))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with open(full_path, "rb") as f:
+                    zf.writestr(info, f.read())
+
+    return buf.getvalue()
+
+
+class WorkloadGenerator(object):
+    """Generates the invoke requests of synthetic blocks in the same format as loopchain sends
+
+    The same arguments make the same blocks, so state root hashes can be compared between runs.
+    A workload is prepared in setup blocks:
+    genesis, updating governance SCORE, setting revision, distributing ICX, deploying a token and staking.
+    """
+
+    TRANSFER = "transfer"
+    TOKEN = "token"
+    DELEGATION = "delegation"
+    CLAIM = "claim"
+    DEPLOY = "deploy"
+
+    WORKLOADS = (TRANSFER, TOKEN, DELEGATION, CLAIM, DEPLOY)
+
+    def __init__(self,
+                 workloads: List[str],
+                 blocks: int,
+                 txs: int,
+                 accounts: int = 1000,
+                 seed: int = 0,
+                 revision: int = Revision.LATEST.value,
+                 governance_path: str = DEFAULT_GOVERNANCE_PATH,
+                 token_path: str = DEFAULT_TOKEN_PATH):
+        """
+        :param workloads: the kinds of transactions which are mixed at random
+        :param blocks: the number of blocks to measure
+        :param txs: the number of transactions in a block
+        :param accounts: the number of accounts which send and receive transactions
+        :param seed: random seed
+        :param revision: revision set before the workload
+        :param governance_path: governance SCORE package which supports setRevision
+        :param token_path: token SCORE package which is used for token and deploy workloads
+        """
+        for workload in workloads:
+            if workload not in self.WORKLOADS:
+                raise ValueError(f"Invalid workload: {workload}")
+        if len(workloads) == 0:
+            raise ValueError("No workload")
+
+        self._workloads = workloads
+        self._blocks = blocks
+        self._txs = txs
+        self._seed = seed
+        self._revision = revision
+        self._governance_path = governance_path
+        self._token_path = token_path
+
+        self._random = random.Random(seed)
+        self._accounts: List['Address'] = [_create_address(f"block_replay_{i}") for i in range(accounts)]
+        self._genesis: 'Address' = _create_address("block_replay_genesis")
+        self._fee_treasury: 'Address' = _create_address("block_replay_fee_treasury")
+
+        self._block_height: int = -1
+        self._prev_block_hash: Optional[bytes] = None
+        self._txs_in_block: List[dict] = []
+        self._token_data: Optional[str] = None
+        self._token: Optional['Address'] = None
+
+    @property
+    def _timestamp(self) -> int:
+        # Transactions in a block have different timestamps which make different SCORE addresses
+        return _START_TIMESTAMP + (self._block_height + 1) * _BLOCK_INTERVAL + len(self._txs_in_block)
+
+    def run(self) -> Iterator[dict]:
+        yield from self._setup()
+
+        for _ in range(self._blocks):
+            for _ in range(self._txs):
+                workload: str = self._random.choice(self._workloads)
+                getattr(self, f"_add_{workload}_tx")()
+            yield self._make_block()
+
+    def _setup(self) -> Iterator[dict]:
+        yield self._make_genesis_block()
+
+        self._deploy(ADMIN, GOVERNANCE_SCORE_ADDRESS, self._governance_path, {})
+        yield self._make_block(setup=True)
+
+        self._add_call_tx(ADMIN, GOVERNANCE_SCORE_ADDRESS, "setRevision",
+                          {"code": hex(self._revision), "name": f"1.1.{self._revision}"})
+        yield self._make_block(setup=True)
+
+        balance: int = TOTAL_SUPPLY // (len(self._accounts) * 2)
+        for account in self._accounts:
+            self._add_tx(ADMIN, account, value=balance)
+            if len(self._txs_in_block) >= self._txs:
+                yield self._make_block(setup=True)
+        if len(self._txs_in_block) > 0:
+            yield self._make_block(setup=True)
+
+        if self.TOKEN in self._workloads:
+            self._token = self._deploy(ADMIN, SYSTEM_SCORE_ADDRESS, self._token_path,
+                                       {"init_supply": hex(_TOKEN_SUPPLY), "decimal": hex(_TOKEN_DECIMAL)})
+            yield self._make_block(setup=True)
+
+            value: int = _TOKEN_SUPPLY * 10 ** _TOKEN_DECIMAL // (len(self._accounts) * 2)
+            for account in self._accounts:
+                self._add_call_tx(ADMIN, self._token, "transfer", {"addr_to": str(account), "value": hex(value)})
+                if len(self._txs_in_block) >= self._txs:
+                    yield self._make_block(setup=True)
+            if len(self._txs_in_block) > 0:
+                yield self._make_block(setup=True)
+
+        if self.DELEGATION in self._workloads or self.CLAIM in self._workloads:
+            for account in self._accounts:
+                self._add_call_tx(account, SYSTEM_SCORE_ADDRESS, IISSMethod.SET_STAKE, {"value": hex(balance // 2)})
+                if len(self._txs_in_block) >= self._txs:
+                    yield self._make_block(setup=True)
+            if len(self._txs_in_block) > 0:
+                yield self._make_block(setup=True)
+
+    def _add_transfer_tx(self):
+        from_, to = self._random.sample(self._accounts, 2)
+        self._add_tx(from_, to, value=self._random.randint(1, icx_to_loop(1)))
+
+    def _add_token_tx(self):
+        from_, to = self._random.sample(self._accounts, 2)
+        self._add_call_tx(from_, self._token, "transfer",
+                          {"addr_to": str(to), "value": hex(self._random.randint(1, 10 ** _TOKEN_DECIMAL))})
+
+    def _add_delegation_tx(self):
+        from_ = self._random.choice(self._accounts)
+        delegations = [
+            {"address": str(address), "value": hex(self._random.randint(1, icx_to_loop(1)))}
+            for address in self._random.sample(self._accounts, self._random.randint(1, 3))
+        ]
+        self._add_call_tx(from_, SYSTEM_SCORE_ADDRESS, IISSMethod.SET_DELEGATION, {"delegations": delegations})
+
+    def _add_claim_tx(self):
+        self._add_call_tx(self._random.choice(self._accounts), SYSTEM_SCORE_ADDRESS, IISSMethod.CLAIM_ISCORE, {})
+
+    def _add_deploy_tx(self):
+        self._deploy(self._random.choice(self._accounts), SYSTEM_SCORE_ADDRESS, self._token_path,
+                     {"init_supply": hex(_TOKEN_SUPPLY), "decimal": hex(_TOKEN_DECIMAL)})
+
+    def _deploy(self, from_: 'Address', to: 'Address', path: str, params: dict) -> 'Address':
+        """
+        :return: the address of the SCORE to deploy
+        """
+        if path == self._token_path:
+            # Token SCORE is deployed many times
+            if self._token_data is None:
+                self._token_data = f"0x{zip_score(path).hex()}"
+            content: str = self._token_data
+        else:
+            content: str = f"0x{zip_score(path).hex()}"
+
+        timestamp: int = self._timestamp
+        self._add_tx(from_, to, data_type="deploy",
+                     data={"contentType": "application/zip", "content": content, "params": params},
+                     step_limit=_DEPLOY_STEP_LIMIT)
+
+        return generate_score_address(from_, timestamp) if to == SYSTEM_SCORE_ADDRESS else to
+
+    def _add_call_tx(self, from_: 'Address', to: 'Address', method: str, params: dict):
+        self._add_tx(from_, to, data_type="call", data={"method": method, "params": params})
+
+    def _add_tx(self,
+                from_: 'Address',
+                to: 'Address',
+                value: int = 0,
+                data_type: Optional[str] = None,
+                data: Optional[dict] = None,
+                step_limit: int = _STEP_LIMIT):
+        params: Dict[str, object] = {
+            "version": "0x3",
+            "from": str(from_),
+            "to": str(to),
+            "value": hex(value),
+            "stepLimit": hex(step_limit),
+            "timestamp": hex(self._timestamp),
+            "nid": "0x1",
+            "nonce": "0x0",
+            "signature": _SIGNATURE,
+            "txHash": self._make_hash(f"tx_{self._block_height + 1}_{len(self._txs_in_block)}")
+        }
+        if data_type is not None:
+            params["dataType"] = data_type
+            params["data"] = data
+
+        self._txs_in_block.append({"method": "icx_sendTransaction", "params": params})
+
+    def _make_genesis_block(self) -> dict:
+        tx = {
+            "method": "icx_sendTransaction",
+            "params": {
+                "txHash": self._make_hash("tx_0_0"),
+                "version": "0x3",
+                "timestamp": hex(self._timestamp)
+            },
+            "genesisData": {
+                "accounts": [
+                    {"name": "genesis", "address": str(self._genesis), "balance": "0x0"},
+                    {"name": "fee_treasury", "address": str(self._fee_treasury), "balance": "0x0"},
+                    {"name": "admin", "address": str(ADMIN), "balance": hex(TOTAL_SUPPLY)}
+                ]
+            }
+        }
+        self._txs_in_block.append(tx)
+        return self._make_block(setup=True)
+
+    def _make_block(self, setup: bool = False) -> dict:
+        timestamp: int = _START_TIMESTAMP + (self._block_height + 1) * _BLOCK_INTERVAL
+        self._block_height += 1
+        block_hash: str = self._make_hash(f"block_{self._block_height}")
+
+        block = {
+            "blockHeight": hex(self._block_height),
+            "blockHash": block_hash,
+            "timestamp": hex(timestamp),
+        }
+        if self._prev_block_hash is not None:
+            block["prevBlockHash"] = self._prev_block_hash
+
+        request = {
+            "block": block,
+            "isBlockEditable": "0x0",
+            "transactions": self._txs_in_block
+        }
+        if setup:
+            request[SETUP_KEY] = True
+
+        self._prev_block_hash = block_hash
+        self._txs_in_block = []
+
+        return request
+
+    def _make_hash(self, name: str) -> str:
+        return sha3_256(f"{self._seed}_{name}".encode()).hex()
@@ -0,0 +1,35 @@
+import json
+from typing import Iterable, Iterator
+
+
+def write_requests(path: str, requests: Iterable[dict]) -> int:
+    """Writes invoke requests in JSON lines
+
+    :return: the number of requests
+    """
+    count = 0
+    with open(path, "w") as f:
+        for request in requests:
+            f.write(json.dumps(request, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+
+    return count
+
+
+def read_requests(path: str) -> Iterator[dict]:
+    """Reads invoke requests from a file which has a JSON list of them or one of them in each line
+    """
+    with open(path, "r") as f:
+        first: str = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == "[":
+            yield from json.load(f)
+            return
+
+        for line in f:
+            if line.strip():
+                yield json.loads(line)